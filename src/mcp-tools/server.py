@@ -4,442 +4,5306 @@ KayraDeniz Electron App için Basit JSON-RPC Server
 Dosya işlemleri ve kod üretimi için gerekli tools
 GitHub entegrasyonu ve kod agent sistemi
 """
+import ast
+import atexit
+import base64
+import hashlib
+import heapq
 import json
+import keyword
+import mmap
+import multiprocessing
 import os
+import pstats
+import random
+import re
+import shlex
+import sqlite3
+import struct
 import sys
 import subprocess
-from typing import Any, Callable, Dict, List, Optional, cast
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, cast
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class _FairRWLock:
+    """Tek bir yol için FIFO sıralı okuyucu/yazıcı kilidi"""
 
-class KayradenizToolServer:
     def __init__(self):
-        self.github_token: Optional[str] = None
-        self.github_api_base: str = "https://api.github.com"
-        self.git_user_name: Optional[str] = None
-        self.git_user_email: Optional[str] = None
-        
-        self.tools: Dict[str, Callable[[Dict[str, Any]], str]] = {
-            "hello_world": self.hello_world,
-            "create_file": self.create_file,
-            "read_file": self.read_file,
-            "list_files": self.list_files,
-            "write_code": self.write_code,
-            "generate_project_structure": self.generate_project_structure,
-            "set_github_token": self.set_github_token,
-            "github_clone": self.github_clone,
-            "github_status": self.github_status,
-            "github_commit": self.github_commit,
-            "github_push": self.github_push,
-            "github_create_repo": self.github_create_repo,
-            "github_search_code": self.github_search_code,
-            "github_create_gist": self.github_create_gist,
-            "github_create_issue": self.github_create_issue,
-            "git_init": self.git_init,
-            "git_add": self.git_add,
-            "git_commit": self.git_commit,
-            "git_push": self.git_push,
-            "git_pull": self.git_pull,
-            "git_branch": self.git_branch,
-            "code_agent_analyze": self.code_agent_analyze,
-            "code_agent_edit": self.code_agent_edit,
-            "code_agent_refactor": self.code_agent_refactor
+        self._cond = threading.Condition()
+        self._queue: Deque[List[Any]] = deque()  # [mode, granted]
+        self._readers = 0
+        self._writer = False
+
+    def acquire(self, mode: str, timeout: Optional[float] = None) -> None:
+        with self._cond:
+            ticket: List[Any] = [mode, False]
+            self._queue.append(ticket)
+            self._grant()
+            if not self._cond.wait_for(lambda: ticket[1], timeout=timeout):
+                self._queue.remove(ticket)
+                # Sıradan çıkan bekleyici arkadakileri tutmasın
+                self._grant()
+                raise TimeoutError(f"Kilit zaman aşımı ({mode})")
+
+    def release(self, mode: str) -> None:
+        with self._cond:
+            if mode == "write":
+                self._writer = False
+            else:
+                self._readers -= 1
+            self._grant()
+
+    def _grant(self) -> None:
+        # Sıranın başından itibaren uyumlu bekleyicilere izin ver; yazıcı
+        # sıradaysa arkasındaki okuyucular onu geçemez.
+        granted = False
+        while self._queue:
+            ticket = self._queue[0]
+            if ticket[0] == "write":
+                if self._writer or self._readers:
+                    break
+                self._writer = True
+            else:
+                if self._writer:
+                    break
+                self._readers += 1
+            ticket[1] = True
+            self._queue.popleft()
+            granted = True
+            if ticket[0] == "write":
+                break
+        if granted:
+            self._cond.notify_all()
+
+
+class PathLockManager:
+    """Yol bazlı okuyucu/yazıcı kilitleri - farklı yollar paralel çalışır"""
+
+    def __init__(self):
+        self._registry_lock = threading.Lock()
+        self._locks: Dict[str, List[Any]] = {}  # key -> [_FairRWLock, refcount]
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        return os.path.normcase(os.path.realpath(os.path.abspath(path)))
+
+    def _checkout(self, key: str) -> _FairRWLock:
+        with self._registry_lock:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = [_FairRWLock(), 0]
+                self._locks[key] = entry
+            entry[1] += 1
+            return cast(_FairRWLock, entry[0])
+
+    def _checkin(self, key: str) -> None:
+        with self._registry_lock:
+            entry = self._locks.get(key)
+            if entry is not None:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del self._locks[key]
+
+    @contextmanager
+    def locked(self, paths: Iterable[str], mode: str = "write",
+               timeout: Optional[float] = None) -> Iterator[None]:
+        """Yolları sabit (sıralı) düzende kilitle; çoklu yol kilitleri deadlock üretmez"""
+        keys = sorted({self.normalize(path) for path in paths})
+        acquired: List[Tuple[str, _FairRWLock]] = []
+        try:
+            for key in keys:
+                lock = self._checkout(key)
+                try:
+                    lock.acquire(mode, timeout=timeout)
+                except BaseException:
+                    self._checkin(key)
+                    raise
+                acquired.append((key, lock))
+            yield
+        finally:
+            for key, lock in reversed(acquired):
+                lock.release(mode)
+                self._checkin(key)
+
+    def read(self, *paths: str) -> Any:
+        return self.locked(paths, "read")
+
+    def write(self, *paths: str) -> Any:
+        return self.locked(paths, "write")
+
+    def active_paths(self) -> List[str]:
+        with self._registry_lock:
+            return sorted(self._locks)
+
+
+class GitCatFileProcess:
+    """Uzun ömürlü `git cat-file --batch` / `--batch-check` süreci"""
+
+    def __init__(self, repo_root: str, check_only: bool = False):
+        self.repo_root = repo_root
+        self.check_only = check_only
+        mode = "--batch-check" if check_only else "--batch"
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", mode],
+            cwd=repo_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _read_exact(self, size: int) -> bytes:
+        stdout = cast(Any, self.proc.stdout)
+        chunks: List[bytes] = []
+        remaining = size
+        while remaining > 0:
+            chunk = stdout.read(remaining)
+            if not chunk:
+                raise RuntimeError("cat-file süreci beklenmedik şekilde kapandı")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def request(self, spec: str) -> Optional[Dict[str, Any]]:
+        """Nesneyi oku; bulunamazsa None döner"""
+        if "\n" in spec:
+            raise ValueError("Nesne adı satır sonu içeremez")
+        stdin = cast(Any, self.proc.stdin)
+        stdout = cast(Any, self.proc.stdout)
+        stdin.write(spec.encode("utf-8") + b"\n")
+        stdin.flush()
+        header = stdout.readline()
+        if not header:
+            raise RuntimeError("cat-file süreci beklenmedik şekilde kapandı")
+        parts = header.rstrip(b"\n").split(b" ")
+        if parts[-1] in (b"missing", b"ambiguous"):
+            return None
+        oid, obj_type, size = parts[0].decode("ascii"), parts[1].decode("ascii"), int(parts[2])
+        data: Optional[bytes] = None
+        if not self.check_only:
+            data = self._read_exact(size + 1)[:-1]
+        return {"oid": oid, "type": obj_type, "size": size, "data": data}
+
+    def close(self) -> None:
+        try:
+            if self.proc.stdin:
+                self.proc.stdin.close()
+            self.proc.wait(timeout=2)
+        except Exception:
+            self.proc.kill()
+
+
+class GitCatFilePool:
+    """Repository başına kalıcı cat-file süreç havuzu"""
+
+    def __init__(self, max_per_repo: int = 2):
+        self.max_per_repo = max_per_repo
+        self._cond = threading.Condition()
+        self._idle: Dict[Tuple[str, bool], List[GitCatFileProcess]] = {}
+        self._counts: Dict[Tuple[str, bool], int] = {}
+        self.spawned = 0
+
+    @contextmanager
+    def worker(self, repo_root: str, check_only: bool = False) -> Iterator[GitCatFileProcess]:
+        key = (repo_root, check_only)
+        with self._cond:
+            while True:
+                idle = self._idle.setdefault(key, [])
+                while idle and not idle[-1].alive():
+                    idle.pop().close()
+                    self._counts[key] -= 1
+                if idle:
+                    proc = idle.pop()
+                    break
+                if self._counts.get(key, 0) < self.max_per_repo:
+                    self._counts[key] = self._counts.get(key, 0) + 1
+                    try:
+                        proc = GitCatFileProcess(repo_root, check_only)
+                    except Exception:
+                        self._counts[key] -= 1
+                        raise
+                    self.spawned += 1
+                    break
+                self._cond.wait()
+        healthy = False
+        try:
+            yield proc
+            healthy = True
+        finally:
+            with self._cond:
+                if healthy and proc.alive():
+                    self._idle.setdefault(key, []).append(proc)
+                else:
+                    # Protokol yarıda kaldıysa süreç tekrar kullanılamaz
+                    proc.close()
+                    self._counts[key] -= 1
+                self._cond.notify()
+
+    def read(self, repo_root: str, spec: str) -> Optional[Dict[str, Any]]:
+        with self.worker(repo_root) as proc:
+            return proc.request(spec)
+
+    def check(self, repo_root: str, spec: str) -> Optional[Dict[str, Any]]:
+        with self.worker(repo_root, check_only=True) as proc:
+            return proc.request(spec)
+
+    def close_all(self) -> None:
+        with self._cond:
+            for procs in self._idle.values():
+                for proc in procs:
+                    proc.close()
+            self._idle.clear()
+            self._counts.clear()
+
+
+class GitStatusService:
+    """porcelain=v2 status cache'i - .git/index/HEAD değişince veya yazma olunca geçersizleşir"""
+
+    def __init__(self, max_age: float = 2.0):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._generations: Dict[str, int] = {}
+        self._repo_flags: Dict[str, List[str]] = {}
+        self._git_dirs: Dict[str, str] = {}
+        self._git_version: Optional[Tuple[int, ...]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def git_dir(self, repo_root: str) -> str:
+        git_dir = self._git_dirs.get(repo_root)
+        if git_dir is None:
+            candidate = os.path.join(repo_root, ".git")
+            if os.path.isdir(candidate):
+                git_dir = candidate
+            else:
+                # Worktree/submodule: .git bir dosya olabilir
+                result = subprocess.run(["git", "rev-parse", "--absolute-git-dir"], cwd=repo_root,
+                                        capture_output=True, text=True)
+                if result.returncode != 0:
+                    raise ValueError(f"Git repository değil: {repo_root}")
+                git_dir = result.stdout.strip()
+            self._git_dirs[repo_root] = git_dir
+        return git_dir
+
+    def notify_write(self, path: str) -> None:
+        """Çalışma ağacı değişiklik akışı: tool'ların yazdığı yollar cache'i geçersiz kılar"""
+        full_path = os.path.normcase(os.path.abspath(path))
+        with self._lock:
+            for root in self._cache:
+                if full_path.startswith(os.path.normcase(root) + os.sep):
+                    self._generations[root] = self._generations.get(root, 0) + 1
+
+    def _signature(self, repo_root: str) -> Tuple[Any, ...]:
+        git_dir = self.git_dir(repo_root)
+        parts: List[Any] = [self._generations.get(repo_root, 0)]
+        for name in ("index", "HEAD"):
+            try:
+                st = os.stat(os.path.join(git_dir, name))
+                parts.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                parts.append(None)
+        return tuple(parts)
+
+    def _version(self) -> Tuple[int, ...]:
+        if self._git_version is None:
+            result = subprocess.run(["git", "version"], capture_output=True, text=True)
+            numbers: List[int] = []
+            for piece in result.stdout.split()[-1].split(".")[:3] if result.stdout else []:
+                if not piece.isdigit():
+                    break
+                numbers.append(int(piece))
+            self._git_version = tuple(numbers)
+        return self._git_version
+
+    def _flags(self, repo_root: str) -> List[str]:
+        """Untracked cache her zaman, yerleşik fsmonitor destekleniyorsa açılır"""
+        flags = self._repo_flags.get(repo_root)
+        if flags is None:
+            flags = ["-c", "core.untrackedCache=true"]
+            if sys.platform in ("win32", "darwin") and self._version() >= (2, 37):
+                configured = subprocess.run(["git", "config", "--get", "core.fsmonitor"], cwd=repo_root,
+                                            capture_output=True, text=True)
+                # Kullanıcının kendi fsmonitor hook'u varsa dokunma
+                if configured.returncode != 0:
+                    flags += ["-c", "core.fsmonitor=true"]
+            self._repo_flags[repo_root] = flags
+        return flags
+
+    @staticmethod
+    def parse_porcelain_v2(output: bytes) -> Dict[str, Any]:
+        """`git status --porcelain=v2 -z --branch` çıktısını yapılandırılmış girdilere çevir"""
+        branch: Dict[str, Any] = {}
+        entries: List[Dict[str, Any]] = []
+        records = output.split(b"\0")
+        i = 0
+        while i < len(records):
+            record = records[i].decode("utf-8", errors="surrogateescape")
+            i += 1
+            if not record:
+                continue
+            kind = record[0]
+            if kind == "#":
+                key, _, value = record[2:].partition(" ")
+                if key == "branch.ab":
+                    ahead, behind = value.split(" ")
+                    branch["ahead"], branch["behind"] = int(ahead), abs(int(behind))
+                else:
+                    branch[key[len("branch."):]] = value
+            elif kind == "1":
+                fields = record.split(" ", 8)
+                entries.append({"kind": "changed", "xy": fields[1], "submodule": fields[2], "path": fields[8]})
+            elif kind == "2":
+                fields = record.split(" ", 9)
+                orig_path = records[i].decode("utf-8", errors="surrogateescape") if i < len(records) else ""
+                i += 1
+                entries.append({"kind": "renamed", "xy": fields[1], "submodule": fields[2],
+                                "score": fields[8], "path": fields[9], "orig_path": orig_path})
+            elif kind == "u":
+                fields = record.split(" ", 10)
+                entries.append({"kind": "unmerged", "xy": fields[1], "submodule": fields[2], "path": fields[10]})
+            elif kind == "?":
+                entries.append({"kind": "untracked", "xy": "??", "path": record[2:]})
+            elif kind == "!":
+                entries.append({"kind": "ignored", "xy": "!!", "path": record[2:]})
+        return {"branch": branch, "entries": entries}
+
+    def status(self, repo_root: str, refresh: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            cached = self._cache.get(repo_root)
+        signature = self._signature(repo_root)
+        if (cached and not refresh and cached["signature"] == signature
+                and time.monotonic() - cached["checked_at"] < self.max_age):
+            self.hits += 1
+            return dict(cached["status"], cached=True)
+
+        self.misses += 1
+        # --no-optional-locks: status index'i stat bilgisiyle yeniden yazmasın; yazsaydı
+        # index imzası her çağrıda değişir ve cache hiç isabet etmezdi
+        cmd = ["git", "--no-optional-locks"] + self._flags(repo_root) + [
+            "status", "--porcelain=v2", "-z", "--branch"]
+        result = subprocess.run(cmd, cwd=repo_root, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode("utf-8", errors="replace").strip())
+        status = self.parse_porcelain_v2(result.stdout)
+        # Komut çalışırken index değiştiyse sonucu cache'leme
+        if self._signature(repo_root) == signature:
+            with self._lock:
+                self._cache[repo_root] = {"signature": signature, "checked_at": time.monotonic(),
+                                          "status": status}
+        return dict(status, cached=False)
+
+
+class GitObjectUnsupported(Exception):
+    """Saf Python okuyucunun desteklemediği durum - git CLI'a geri düşülür"""
+
+
+class GitObjectDatabase:
+    """Loose object + packfile (.idx v2, mmap) okuyucu, OFS/REF delta çözümlemeli"""
+
+    TYPE_NAMES = {1: "commit", 2: "tree", 3: "blob", 4: "tag"}
+    OFS_DELTA = 6
+    REF_DELTA = 7
+
+    def __init__(self, git_dir: str, delta_cache_bytes: int = 32 * 1024 * 1024):
+        self.git_dir = git_dir
+        self.common_dir = self._read_common_dir(git_dir)
+        self._check_format()
+        self.object_dirs = self._object_dirs(os.path.join(self.common_dir, "objects"))
+        self._lock = threading.RLock()
+        self._packs: List[Dict[str, Any]] = []
+        self._packs_signature: Optional[Tuple[Any, ...]] = None
+        self._delta_cache: "OrderedDict[Tuple[str, int], Tuple[str, bytes]]" = OrderedDict()
+        self._delta_cache_size = 0
+        self.delta_cache_bytes = delta_cache_bytes
+
+    @staticmethod
+    def _read_common_dir(git_dir: str) -> str:
+        commondir_file = os.path.join(git_dir, "commondir")
+        if os.path.isfile(commondir_file):
+            with open(commondir_file, "r", encoding="utf-8") as f:
+                common = f.read().strip()
+            return os.path.normpath(os.path.join(git_dir, common))
+        return git_dir
+
+    def _check_format(self) -> None:
+        config_path = os.path.join(self.common_dir, "config")
+        try:
+            with open(config_path, "r", encoding="utf-8", errors="replace") as f:
+                config = f.read().lower()
+        except OSError:
+            return
+        if "objectformat" in config and "sha256" in config:
+            raise GitObjectUnsupported("SHA-256 repository")
+        if "refstorage" in config and "reftable" in config:
+            raise GitObjectUnsupported("reftable ref deposu")
+
+    @staticmethod
+    def _object_dirs(objects_dir: str) -> List[str]:
+        dirs = [objects_dir]
+        alternates = os.path.join(objects_dir, "info", "alternates")
+        if os.path.isfile(alternates):
+            with open(alternates, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        dirs.append(os.path.normpath(os.path.join(objects_dir, line)))
+        return dirs
+
+    def close(self) -> None:
+        with self._lock:
+            for pack in self._packs:
+                for key in ("idx_map", "pack_map"):
+                    if pack.get(key) is not None:
+                        pack[key].close()
+                for key in ("idx_file", "pack_file"):
+                    if pack.get(key) is not None:
+                        pack[key].close()
+            self._packs = []
+            self._packs_signature = None
+
+    # --- Pack yönetimi ---
+
+    def _pack_dirs_signature(self) -> Tuple[Any, ...]:
+        signature: List[Any] = []
+        for objects_dir in self.object_dirs:
+            try:
+                signature.append(os.stat(os.path.join(objects_dir, "pack")).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _load_packs(self, force: bool = False) -> List[Dict[str, Any]]:
+        with self._lock:
+            signature = self._pack_dirs_signature()
+            if not force and self._packs_signature == signature:
+                return self._packs
+            self.close()
+            for objects_dir in self.object_dirs:
+                pack_dir = os.path.join(objects_dir, "pack")
+                if not os.path.isdir(pack_dir):
+                    continue
+                for name in sorted(os.listdir(pack_dir)):
+                    if name.endswith(".idx") and os.path.isfile(os.path.join(pack_dir, name[:-4] + ".pack")):
+                        self._packs.append(self._open_pack(os.path.join(pack_dir, name[:-4])))
+            self._packs_signature = signature
+            return self._packs
+
+    @staticmethod
+    def _open_pack(base_path: str) -> Dict[str, Any]:
+        idx_file = open(base_path + ".idx", "rb")
+        idx_map = mmap.mmap(idx_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if idx_map[:4] != b"\xfftOc" or struct.unpack(">I", idx_map[4:8])[0] != 2:
+            idx_map.close()
+            idx_file.close()
+            raise GitObjectUnsupported(f"Desteklenmeyen idx sürümü: {base_path}.idx")
+        fanout = struct.unpack(">256I", idx_map[8:8 + 1024])
+        count = fanout[255]
+        sha_start = 8 + 1024
+        crc_start = sha_start + 20 * count
+        offset_start = crc_start + 4 * count
+        return {
+            "path": base_path,
+            "idx_file": idx_file,
+            "idx_map": idx_map,
+            "pack_file": None,
+            "pack_map": None,
+            "fanout": fanout,
+            "count": count,
+            "sha_start": sha_start,
+            "offset_start": offset_start,
+            "large_offset_start": offset_start + 4 * count,
         }
 
     @staticmethod
-    def _get_required_str(args: Dict[str, Any], key: str) -> str:
-        value = args.get(key)
+    def _pack_map(pack: Dict[str, Any]) -> Any:
+        if pack["pack_map"] is None:
+            pack_file = open(pack["path"] + ".pack", "rb")
+            pack["pack_file"] = pack_file
+            pack["pack_map"] = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return pack["pack_map"]
+
+    @staticmethod
+    def _idx_range(pack: Dict[str, Any], first_byte: int) -> Tuple[int, int]:
+        fanout = pack["fanout"]
+        return (fanout[first_byte - 1] if first_byte > 0 else 0), fanout[first_byte]
+
+    @classmethod
+    def _idx_find(cls, pack: Dict[str, Any], sha: bytes) -> Optional[int]:
+        """Fanout + ikili arama ile nesnenin pack offset'ini bul"""
+        idx_map = pack["idx_map"]
+        sha_start = pack["sha_start"]
+        lo, hi = cls._idx_range(pack, sha[0])
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = idx_map[sha_start + 20 * mid:sha_start + 20 * mid + 20]
+            if current < sha:
+                lo = mid + 1
+            elif current > sha:
+                hi = mid
+            else:
+                return cls._idx_offset(pack, mid)
+        return None
+
+    @staticmethod
+    def _idx_offset(pack: Dict[str, Any], position: int) -> int:
+        idx_map = pack["idx_map"]
+        start = pack["offset_start"] + 4 * position
+        offset = struct.unpack(">I", idx_map[start:start + 4])[0]
+        if offset & 0x80000000:
+            large = pack["large_offset_start"] + 8 * (offset & 0x7FFFFFFF)
+            offset = struct.unpack(">Q", idx_map[large:large + 8])[0]
+        return offset
+
+    def _idx_prefix(self, pack: Dict[str, Any], prefix: str) -> List[str]:
+        idx_map = pack["idx_map"]
+        sha_start = pack["sha_start"]
+        lo, hi = self._idx_range(pack, int(prefix[:2], 16))
+        low_key = bytes.fromhex(prefix.ljust(40, "0"))
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if idx_map[sha_start + 20 * mid:sha_start + 20 * mid + 20] < low_key:
+                lo = mid + 1
+            else:
+                hi = mid
+        matches: List[str] = []
+        _, end = self._idx_range(pack, int(prefix[:2], 16))
+        while lo < end and len(matches) < 2:
+            candidate = idx_map[sha_start + 20 * lo:sha_start + 20 * lo + 20].hex()
+            if not candidate.startswith(prefix):
+                break
+            matches.append(candidate)
+            lo += 1
+        return matches
+
+    # --- Nesne okuma ---
+
+    def _read_loose(self, oid: str, header_only: bool = False) -> Optional[Tuple[str, int, bytes]]:
+        for objects_dir in self.object_dirs:
+            path = os.path.join(objects_dir, oid[:2], oid[2:])
+            try:
+                with open(path, "rb") as f:
+                    compressed = f.read()
+            except OSError:
+                continue
+            decompressor = zlib.decompressobj()
+            raw = decompressor.decompress(compressed, 64) if header_only else zlib.decompress(compressed)
+            header, _, body = raw.partition(b"\0")
+            obj_type, size = header.decode("ascii").split(" ")
+            return obj_type, int(size), body
+        return None
+
+    @staticmethod
+    def _inflate(pack_map: Any, pos: int, size: int, limit: Optional[int] = None) -> bytes:
+        decompressor = zlib.decompressobj()
+        chunks: List[bytes] = []
+        produced = 0
+        # Sıkıştırılmış veri genelde açılmış boyuttan küçüktür; tek okumada biter
+        step = 4096 if limit is not None else max(size + 64, 4096)
+        while not decompressor.eof:
+            chunk = pack_map[pos:pos + step]
+            if not chunk:
+                raise GitObjectUnsupported("Bozuk pack verisi")
+            pos += len(chunk)
+            out = decompressor.decompress(chunk, limit or 0)
+            chunks.append(out)
+            produced += len(out)
+            if limit is not None and produced >= limit:
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _read_pack_header(pack_map: Any, offset: int) -> Tuple[int, int, int]:
+        byte = pack_map[offset]
+        obj_type = (byte >> 4) & 0x7
+        size = byte & 0x0F
+        shift = 4
+        pos = offset + 1
+        while byte & 0x80:
+            byte = pack_map[pos]
+            size |= (byte & 0x7F) << shift
+            shift += 7
+            pos += 1
+        return obj_type, size, pos
+
+    @staticmethod
+    def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+        value = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value, pos
+
+    @classmethod
+    def apply_delta(cls, base: bytes, delta: bytes) -> bytes:
+        """Git delta talimatlarını (copy/insert) taban nesneye uygula"""
+        source_size, pos = cls._read_varint(delta, 0)
+        target_size, pos = cls._read_varint(delta, pos)
+        if source_size != len(base):
+            raise GitObjectUnsupported("Delta taban boyutu uyuşmuyor")
+        out = bytearray()
+        delta_len = len(delta)
+        while pos < delta_len:
+            opcode = delta[pos]
+            pos += 1
+            if opcode & 0x80:
+                copy_offset = 0
+                copy_size = 0
+                for bit in range(4):
+                    if opcode & (1 << bit):
+                        copy_offset |= delta[pos] << (8 * bit)
+                        pos += 1
+                for bit in range(3):
+                    if opcode & (1 << (4 + bit)):
+                        copy_size |= delta[pos] << (8 * bit)
+                        pos += 1
+                if copy_size == 0:
+                    copy_size = 0x10000
+                out += base[copy_offset:copy_offset + copy_size]
+            elif opcode:
+                out += delta[pos:pos + opcode]
+                pos += opcode
+            else:
+                raise GitObjectUnsupported("Geçersiz delta talimatı")
+        if len(out) != target_size:
+            raise GitObjectUnsupported("Delta hedef boyutu uyuşmuyor")
+        return bytes(out)
+
+    def _cache_get(self, key: Tuple[str, int]) -> Optional[Tuple[str, bytes]]:
+        with self._lock:
+            entry = self._delta_cache.get(key)
+            if entry is not None:
+                self._delta_cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key: Tuple[str, int], value: Tuple[str, bytes]) -> None:
+        size = len(value[1])
+        if size > self.delta_cache_bytes // 4:
+            return
+        with self._lock:
+            if key in self._delta_cache:
+                return
+            self._delta_cache[key] = value
+            self._delta_cache_size += size
+            while self._delta_cache_size > self.delta_cache_bytes:
+                _, (_, evicted) = self._delta_cache.popitem(last=False)
+                self._delta_cache_size -= len(evicted)
+
+    def _read_packed(self, pack: Dict[str, Any], offset: int) -> Tuple[str, bytes]:
+        """Delta zincirini iteratif olarak çöz (derin zincirlerde recursion yok)"""
+        pack_map = self._pack_map(pack)
+        # (pack yolu, offset, delta): REF_DELTA başka pack'e atlayabildiği için yol girdiyle saklanır
+        chain: List[Tuple[str, int, bytes]] = []
+        current_pack, current_offset = pack, offset
+        while True:
+            cached = self._cache_get((current_pack["path"], current_offset))
+            if cached is not None:
+                base_type, base_data = cached
+                break
+            obj_type, size, pos = self._read_pack_header(pack_map, current_offset)
+            if obj_type in self.TYPE_NAMES:
+                base_type = self.TYPE_NAMES[obj_type]
+                base_data = self._inflate(pack_map, pos, size)
+                break
+            if obj_type == self.OFS_DELTA:
+                byte = pack_map[pos]
+                pos += 1
+                base_distance = byte & 0x7F
+                while byte & 0x80:
+                    byte = pack_map[pos]
+                    pos += 1
+                    base_distance = ((base_distance + 1) << 7) | (byte & 0x7F)
+                chain.append((current_pack["path"], current_offset, self._inflate(pack_map, pos, size)))
+                current_offset -= base_distance
+            elif obj_type == self.REF_DELTA:
+                base_oid = pack_map[pos:pos + 20]
+                chain.append((current_pack["path"], current_offset, self._inflate(pack_map, pos + 20, size)))
+                located = self._locate_packed(base_oid)
+                if located is None:
+                    raise GitObjectUnsupported("REF_DELTA tabanı pack dışında")
+                current_pack, current_offset = located
+                pack_map = self._pack_map(current_pack)
+            else:
+                raise GitObjectUnsupported(f"Bilinmeyen pack nesne tipi: {obj_type}")
+
+        data = base_data
+        for delta_pack_path, delta_offset, delta in reversed(chain):
+            data = self.apply_delta(data, delta)
+            # Ara tabanlar da cache'lenir: aynı zinciri paylaşan nesneler hızlanır
+            self._cache_put((delta_pack_path, delta_offset), (base_type, data))
+        return base_type, data
+
+    def _packed_type(self, pack: Dict[str, Any], offset: int) -> str:
+        """Delta zincirini yalnızca başlıkları okuyarak izle ve taban tipini bul (inflate yok)"""
+        current_pack, current_offset = pack, offset
+        while True:
+            cached = self._cache_get((current_pack["path"], current_offset))
+            if cached is not None:
+                return cached[0]
+            pack_map = self._pack_map(current_pack)
+            obj_type, _, pos = self._read_pack_header(pack_map, current_offset)
+            if obj_type in self.TYPE_NAMES:
+                return self.TYPE_NAMES[obj_type]
+            if obj_type == self.OFS_DELTA:
+                byte = pack_map[pos]
+                pos += 1
+                base_distance = byte & 0x7F
+                while byte & 0x80:
+                    byte = pack_map[pos]
+                    pos += 1
+                    base_distance = ((base_distance + 1) << 7) | (byte & 0x7F)
+                current_offset -= base_distance
+            elif obj_type == self.REF_DELTA:
+                located = self._locate_packed(pack_map[pos:pos + 20])
+                if located is None:
+                    raise GitObjectUnsupported("REF_DELTA tabanı pack dışında")
+                current_pack, current_offset = located
+            else:
+                raise GitObjectUnsupported(f"Bilinmeyen pack nesne tipi: {obj_type}")
+
+    def _locate_packed(self, sha: bytes) -> Optional[Tuple[Dict[str, Any], int]]:
+        for pack in self._load_packs():
+            offset = self._idx_find(pack, sha)
+            if offset is not None:
+                return pack, offset
+        return None
+
+    def read(self, oid: str) -> Tuple[str, bytes]:
+        """Nesneyi (tip, veri) olarak oku"""
+        loose = self._read_loose(oid)
+        if loose is not None:
+            return loose[0], loose[2]
+        sha = bytes.fromhex(oid)
+        located = self._locate_packed(sha)
+        if located is None:
+            # gc/repack sonrası yeni pack olabilir
+            self._load_packs(force=True)
+            located = self._locate_packed(sha)
+        if located is None:
+            raise GitObjectUnsupported(f"Nesne bulunamadı (promisor/alternate olabilir): {oid}")
+        return self._read_packed(*located)
+
+    def header(self, oid: str) -> Tuple[str, int]:
+        """Tip ve boyut - delta nesnelerde yalnızca delta başlığı açılır, zincir uygulanmaz"""
+        loose = self._read_loose(oid, header_only=True)
+        if loose is not None:
+            return loose[0], loose[1]
+        located = self._locate_packed(bytes.fromhex(oid))
+        if located is None:
+            obj_type, data = self.read(oid)
+            return obj_type, len(data)
+        pack, offset = located
+        pack_map = self._pack_map(pack)
+        obj_type, size, pos = self._read_pack_header(pack_map, offset)
+        if obj_type in self.TYPE_NAMES:
+            return self.TYPE_NAMES[obj_type], size
+        if obj_type == self.OFS_DELTA:
+            while pack_map[pos] & 0x80:
+                pos += 1
+            pos += 1
+        else:
+            pos += 20
+        delta_head = self._inflate(pack_map, pos, size, limit=20)
+        _, delta_pos = self._read_varint(delta_head, 0)
+        target_size, _ = self._read_varint(delta_head, delta_pos)
+        return self._packed_type(pack, offset), target_size
+
+    # --- Ref'ler ---
+
+    def packed_refs(self) -> Dict[str, str]:
+        refs: Dict[str, str] = {}
+        path = os.path.join(self.common_dir, "packed-refs")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(("#", "^")) or not line.strip():
+                        continue
+                    oid, _, name = line.strip().partition(" ")
+                    refs[name] = oid
+        except OSError:
+            pass
+        return refs
+
+    def _read_ref_file(self, name: str) -> Optional[str]:
+        base = self.git_dir if name == "HEAD" or not name.startswith("refs/") else self.common_dir
+        try:
+            with open(os.path.join(base, name), "r", encoding="utf-8") as f:
+                return f.read().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def read_ref(self, name: str, depth: int = 0) -> Optional[str]:
+        """Sembolik ref'leri takip ederek oid döndür"""
+        if depth > 10:
+            raise GitObjectUnsupported("Sembolik ref döngüsü")
+        value = self._read_ref_file(name)
         if value is None:
-            raise ValueError(f"Missing required argument: {key}")
-        return str(value)
+            return self.packed_refs().get(name)
+        if value.startswith("ref: "):
+            return self.read_ref(value[5:], depth + 1)
+        return value
+
+    def symbolic_ref(self, name: str = "HEAD") -> Optional[str]:
+        value = self._read_ref_file(name)
+        if value and value.startswith("ref: "):
+            return value[5:]
+        return None
+
+    def list_refs(self, prefix: str = "refs/") -> Dict[str, str]:
+        refs = {name: oid for name, oid in self.packed_refs().items() if name.startswith(prefix)}
+        refs_root = os.path.join(self.common_dir, "refs")
+        for dirpath, _, filenames in os.walk(refs_root):
+            for filename in filenames:
+                full = os.path.join(dirpath, filename)
+                name = "refs/" + os.path.relpath(full, refs_root).replace(os.sep, "/")
+                if not name.startswith(prefix):
+                    continue
+                value = self._read_ref_file(name)
+                if value and not value.startswith("ref: "):
+                    refs[name] = value
+                elif value:
+                    target = self.read_ref(value[5:])
+                    if target:
+                        refs[name] = target
+        return refs
+
+    # --- Revizyon çözümleme ---
+
+    def _resolve_abbrev(self, prefix: str) -> Optional[str]:
+        matches: set = set()
+        for objects_dir in self.object_dirs:
+            fan_dir = os.path.join(objects_dir, prefix[:2])
+            if os.path.isdir(fan_dir):
+                for name in os.listdir(fan_dir):
+                    if (prefix[:2] + name).startswith(prefix):
+                        matches.add(prefix[:2] + name)
+        for pack in self._load_packs():
+            matches.update(self._idx_prefix(pack, prefix))
+        if len(matches) > 1:
+            raise GitObjectUnsupported(f"Belirsiz kısa oid: {prefix}")
+        return next(iter(matches)) if matches else None
+
+    def resolve_name(self, name: str) -> Optional[str]:
+        lowered = name.lower()
+        if len(name) == 40 and all(c in "0123456789abcdef" for c in lowered):
+            return lowered
+        for candidate in (name, f"refs/{name}", f"refs/tags/{name}", f"refs/heads/{name}",
+                          f"refs/remotes/{name}", f"refs/remotes/{name}/HEAD"):
+            oid = self.read_ref(candidate)
+            if oid:
+                return oid
+        if 4 <= len(name) < 40 and all(c in "0123456789abcdef" for c in lowered):
+            return self._resolve_abbrev(lowered)
+        return None
+
+    def peel(self, oid: str, target_type: str) -> str:
+        """Tag'leri açıp hedef tipe indir; boş target_type ('^{}') yalnızca tag'leri açar"""
+        obj_type, data = self.read(oid)
+        while obj_type == "tag":
+            oid = data.split(b"\n", 1)[0].split(b" ")[1].decode("ascii")
+            obj_type, data = self.read(oid)
+        if obj_type == target_type or not target_type:
+            return oid
+        if obj_type == "commit" and target_type == "tree":
+            return self.parse_commit(data)["tree"]
+        raise GitObjectUnsupported(f"{oid} {target_type} tipine indirgenemez")
+
+    def resolve_revision(self, revision: str) -> Optional[str]:
+        """`isim`, `~N`, `^N`, `^{tree}`, `^{commit}` ve `^{}` (yalnızca tag açma) sözdizimini çöz"""
+        match = re.match(r"^([^~^:@{}\s]+)((?:~\d*|\^\d*|\^\{\w*\})*)$", revision)
+        if not match:
+            raise GitObjectUnsupported(f"Desteklenmeyen revizyon sözdizimi: {revision}")
+        oid = self.resolve_name(match.group(1))
+        if oid is None:
+            return None
+        for op in re.findall(r"~\d*|\^\{\w*\}|\^\d*", match.group(2)):
+            if op.startswith("^{"):
+                oid = self.peel(oid, op[2:-1])
+                continue
+            oid = self.peel(oid, "commit")
+            count = int(op[1:]) if len(op) > 1 else 1
+            if op.startswith("~"):
+                for _ in range(count):
+                    parents = self.parse_commit(self.read(oid)[1])["parents"]
+                    if not parents:
+                        return None
+                    oid = parents[0]
+            elif count:
+                parents = self.parse_commit(self.read(oid)[1])["parents"]
+                if len(parents) < count:
+                    return None
+                oid = parents[count - 1]
+        return oid
 
     @staticmethod
-    def _get_optional_str(args: Dict[str, Any], key: str) -> Optional[str]:
-        value = args.get(key)
-        return str(value) if value is not None else None
+    def parse_commit(data: bytes) -> Dict[str, Any]:
+        headers, _, message = data.partition(b"\n\n")
+        commit: Dict[str, Any] = {"parents": [], "message": message.decode("utf-8", errors="replace")}
+        for line in headers.split(b"\n"):
+            if line.startswith(b" "):
+                continue  # çok satırlı başlık devamı (gpgsig)
+            key, _, value = line.partition(b" ")
+            if key == b"parent":
+                commit["parents"].append(value.decode("ascii"))
+            elif key in (b"tree", b"author", b"committer"):
+                commit[key.decode("ascii")] = value.decode("utf-8", errors="replace")
+        return commit
 
     @staticmethod
-    def _get_bool(args: Dict[str, Any], key: str, default: bool) -> bool:
-        return bool(args.get(key, default))
+    def parse_tree(data: bytes, oid_len: int = 20) -> List[Dict[str, str]]:
+        """Binary tree nesnesini (mode SP name NUL oid) çözümle"""
+        entries: List[Dict[str, str]] = []
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            mode = data[pos:space].decode("ascii")
+            name = data[space + 1:nul].decode("utf-8", errors="replace")
+            oid = data[nul + 1:nul + 1 + oid_len].hex()
+            pos = nul + 1 + oid_len
+            if mode == "40000":
+                mode, obj_type = "040000", "tree"
+            elif mode == "160000":
+                obj_type = "commit"
+            else:
+                obj_type = "blob"
+            entries.append({"mode": mode, "type": obj_type, "oid": oid, "name": name})
+        return entries
+
+    def read_spec(self, spec: str) -> Optional[Dict[str, Any]]:
+        """cat-file sözdizimi (`rev`, `rev:path`, `rev^{tree}`) ile nesne oku"""
+        revision, has_path, path = spec.partition(":")
+        if not revision:
+            raise GitObjectUnsupported("Index (':path') okuma desteklenmiyor")
+        oid = self.resolve_revision(revision)
+        if oid is None:
+            return None
+        if has_path:
+            oid = self.peel(oid, "tree")
+            for part in [p for p in path.split("/") if p]:
+                obj_type, data = self.read(oid)
+                if obj_type != "tree":
+                    return None
+                entry = next((e for e in self.parse_tree(data) if e["name"] == part), None)
+                if entry is None:
+                    return None
+                if entry["type"] == "commit":
+                    raise GitObjectUnsupported("Submodule içeriği okunamaz")
+                oid = entry["oid"]
+        obj_type, data = self.read(oid)
+        return {"oid": oid, "type": obj_type, "size": len(data), "data": data}
+
+    def iter_commits(self, start_oids: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Commit grafiğini (ziyaret edilenleri tekrar etmeden) dolaş"""
+        pending = list(start_oids)
+        seen: set = set()
+        while pending:
+            oid = pending.pop()
+            if oid in seen:
+                continue
+            seen.add(oid)
+            obj_type, data = self.read(oid)
+            if obj_type != "commit":
+                continue
+            commit = self.parse_commit(data)
+            yield oid, commit
+            pending.extend(reversed(commit["parents"]))
+
+
+class GitRepoInfoCache:
+    """HEAD/ref/config mtime'larına göre tembel yenilenen repository meta verisi"""
+
+    def __init__(self, max_walk: int = 200000):
+        self.max_walk = max_walk
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._ahead_behind: "OrderedDict[Tuple[str, str], Tuple[int, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
 
     @staticmethod
-    def _resolve_path(path: str, working_directory: Optional[str]) -> str:
-        if working_directory and not os.path.isabs(path):
-            return os.path.join(working_directory, path)
-        return path
+    def signature(odb: GitObjectDatabase) -> Tuple[Any, ...]:
+        parts: List[Any] = []
+        for base, name in ((odb.git_dir, "HEAD"), (odb.common_dir, "packed-refs"), (odb.common_dir, "config")):
+            try:
+                st = os.stat(os.path.join(base, name))
+                parts.append((name, st.st_mtime_ns, st.st_size))
+            except OSError:
+                parts.append((name, None))
+        # Ref güncellemeleri lock dosyası + rename ile yapılır; dizin mtime'ı değişir
+        for dirpath, dirnames, _ in os.walk(os.path.join(odb.common_dir, "refs")):
+            dirnames.sort()
+            try:
+                parts.append((dirpath, os.stat(dirpath).st_mtime_ns))
+            except OSError:
+                parts.append((dirpath, None))
+        return tuple(parts)
+
+    @staticmethod
+    def parse_config(path: str) -> Dict[str, Dict[str, str]]:
+        """Basit git config ayrıştırıcı: {'remote.origin': {'url': ...}}"""
+        sections: Dict[str, Dict[str, str]] = {}
+        current: Optional[Dict[str, str]] = None
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return sections
+        for raw_line in lines:
+            line = raw_line.strip()
+            if not line or line[0] in "#;":
+                continue
+            header = re.match(r'^\[\s*([\w.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]', line)
+            if header:
+                name = header.group(1).lower()
+                if header.group(2) is not None:
+                    name += "." + header.group(2).replace('\\"', '"').replace("\\\\", "\\")
+                current = sections.setdefault(name, {})
+                continue
+            if current is None:
+                continue
+            key, has_value, value = line.partition("=")
+            value = re.sub(r"\s+[#;].*$", "", value.strip()) if has_value else "true"
+            current[key.strip().lower()] = value.strip().strip('"')
+        return sections
 
     @staticmethod
-    def _run_subprocess(cmd: List[str], cwd: Optional[str] = None) -> subprocess.CompletedProcess[str]:
-        return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    def _commit_time(commit: Dict[str, Any]) -> int:
+        committer = str(commit.get("committer", ""))
+        match = re.search(r"> (\d+) [+-]\d{4}$", committer)
+        return int(match.group(1)) if match else 0
 
-    def get_tool_descriptions(self) -> Dict[str, Dict[str, Any]]:
-        """Tools açıklamaları"""
-        return {
-            "hello_world": {
-                "name": "hello_world",
-                "description": "Test amaçlı basit merhaba mesajı",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "message": {
+    def ahead_behind(self, odb: GitObjectDatabase, local: str, upstream: str) -> Tuple[int, int]:
+        """left/right boyama ile ahead/behind say (git rev-list --left-right --count gibi)"""
+        key = (local, upstream)
+        with self._lock:
+            cached = self._ahead_behind.get(key)
+        if cached is not None:
+            return cached
+
+        LEFT, RIGHT = 1, 2
+        flags: Dict[str, int] = {}
+        commits: Dict[str, Dict[str, Any]] = {}
+        expanded: Set[str] = set()
+        heap: List[Tuple[int, str]] = []
+
+        def push(oid: str, flag: int) -> None:
+            pending = [oid]
+            while pending:
+                current = pending.pop()
+                previous = flags.get(current, 0)
+                if previous | flag == previous:
+                    continue
+                flags[current] = previous | flag
+                if current in expanded:
+                    # Aynı saniyedeki commit'ler atalarından sonra yürünebilir:
+                    # geç gelen bayrak zaten yürünmüş atalara hemen taşınır
+                    pending.extend(commits[current]["parents"])
+                    continue
+                if current not in commits:
+                    obj_type, data = odb.read(current)
+                    if obj_type != "commit":
+                        raise GitObjectUnsupported(f"{current} commit değil")
+                    commits[current] = odb.parse_commit(data)
+                heapq.heappush(heap, (-self._commit_time(commits[current]), current))
+
+        push(local, LEFT)
+        push(upstream, RIGHT)
+        walked = 0
+        last_key = -(1 << 62)
+        # Kuyrukta sadece iki taraftan da erişilen (bayat) commit kalınca dur; yürünen
+        # en eski commit ile aynı saniyedekiler onun çocuğu olabileceğinden yine yürünür
+        while heap and (heap[0][0] <= last_key or any(flags[oid] != LEFT | RIGHT for _, oid in heap)):
+            last_key, oid = heapq.heappop(heap)
+            if oid in expanded:
+                continue
+            expanded.add(oid)
+            walked += 1
+            if walked > self.max_walk:
+                raise GitObjectUnsupported("ahead/behind yürüyüş sınırı aşıldı")
+            for parent in commits[oid]["parents"]:
+                push(parent, flags[oid])
+
+        ahead = sum(1 for flag in flags.values() if flag == LEFT)
+        behind = sum(1 for flag in flags.values() if flag == RIGHT)
+        with self._lock:
+            self._ahead_behind[key] = (ahead, behind)
+            while len(self._ahead_behind) > 1024:
+                self._ahead_behind.popitem(last=False)
+        return ahead, behind
+
+    def info(self, odb: GitObjectDatabase) -> Dict[str, Any]:
+        signature = self.signature(odb)
+        with self._lock:
+            cached = self._cache.get(odb.git_dir)
+        if cached and cached["signature"] == signature:
+            self.hits += 1
+            return dict(cached["info"], cached=True)
+
+        self.misses += 1
+        config = self.parse_config(os.path.join(odb.common_dir, "config"))
+        head_ref = odb.symbolic_ref("HEAD")
+        head_oid = odb.read_ref("HEAD")
+        refs = odb.list_refs("refs/")
+
+        remotes: Dict[str, Dict[str, str]] = {}
+        for section, values in config.items():
+            if section.startswith("remote."):
+                remotes[section[len("remote."):]] = {
+                    "url": values.get("url", ""),
+                    "fetch": values.get("fetch", ""),
+                }
+
+        branches: List[Dict[str, Any]] = []
+        for name, oid in sorted(refs.items()):
+            if not name.startswith("refs/heads/"):
+                continue
+            short = name[len("refs/heads/"):]
+            branch: Dict[str, Any] = {"name": short, "oid": oid, "current": name == head_ref}
+            branch_config = config.get(f"branch.{short}", {})
+            remote, merge = branch_config.get("remote"), branch_config.get("merge")
+            if remote and merge and merge.startswith("refs/heads/"):
+                upstream_ref = f"refs/remotes/{remote}/{merge[len('refs/heads/'):]}"
+                branch["upstream"] = upstream_ref[len("refs/remotes/"):]
+                branch["upstream_oid"] = refs.get(upstream_ref)
+            branches.append(branch)
+
+        info: Dict[str, Any] = {
+            "head": {
+                "branch": head_ref[len("refs/heads/"):] if head_ref and head_ref.startswith("refs/heads/") else None,
+                "oid": head_oid,
+                "detached": head_ref is None,
+            },
+            "branches": branches,
+            "remote_branches": sorted(
+                name[len("refs/remotes/"):] for name in refs if name.startswith("refs/remotes/")
+            ),
+            "remotes": remotes,
+            "tags_count": sum(1 for name in refs if name.startswith("refs/tags/")),
+        }
+        with self._lock:
+            self._cache[odb.git_dir] = {"signature": signature, "info": info}
+        return dict(info, cached=False)
+
+
+class GitHubHTTPCache:
+    """GitHub REST GET yanıtları için diskte ETag/Last-Modified cache'i
+
+    304 yanıtları GitHub rate limit'inden düşülmez; gövde cache'ten sunulur.
+    Toplam boyut max_bytes'ı aşınca en eski erişilen kayıtlar silinir (LRU).
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        # Bağlantı ilk kullanımda açılır; cache hiç kullanılmazsa dosya oluşmaz
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT,"
+                " status INTEGER, headers TEXT, body BLOB, size INTEGER, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(token: str, url: str, accept: str) -> str:
+        # Yanıtlar kullanıcıya özel olabilir (Vary: Authorization); token özeti anahtara girer
+        token_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+        return hashlib.sha256(f"{token_digest}\n{accept}\n{url}".encode("utf-8")).hexdigest()
+
+    def validators(self, key: str) -> Dict[str, str]:
+        with self._lock:
+            row = self._db().execute(
+                "SELECT etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return {}
+        headers: Dict[str, str] = {}
+        if row[0]:
+            headers["If-None-Match"] = row[0]
+        if row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def load(self, key: str, response: requests.Response) -> Optional[requests.Response]:
+        """304 yanıtını cache'teki tam yanıtla değiştir"""
+        with self._lock:
+            db = self._db()
+            row = db.execute("SELECT status, headers, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+            db.commit()
+            self.hits += 1
+        cached = requests.Response()
+        cached.status_code = int(row[0])
+        cached.headers = CaseInsensitiveDict(json.loads(row[1]))
+        # Güncel rate limit başlıkları 304 yanıtından gelir
+        for name, value in response.headers.items():
+            if name.lower().startswith("x-ratelimit-"):
+                cached.headers[name] = value
+        cached._content = bytes(row[2])
+        cached.url = response.url
+        cached.request = response.request
+        cached.encoding = "utf-8"
+        setattr(cached, "from_cache", True)
+        return cached
+
+    def store(self, key: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                return
+            body = response.content
+            if len(body) > self.max_bytes:
+                return
+            headers = {name: value for name, value in response.headers.items()
+                       if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.url, etag, last_modified, response.status_code,
+                 json.dumps(headers), sqlite3.Binary(body), len(body), time.time()),
+            )
+            self._evict(db)
+            db.commit()
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        total = int(db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        for key, size in db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.evictions += 1
+            total -= int(size)
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, stored = 0, 0
+            if self._conn is not None or os.path.exists(self.path):
+                entries, stored = self._db().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "entries": int(entries),
+                "stored_bytes": int(stored),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM responses")
+            db.commit()
+            db.execute("VACUUM")
+
+
+class GitHubRateLimitWait(Exception):
+    """Rate limit bekleme süresi max_wait'i aşıyor"""
+
+    def __init__(self, bucket: str, wait_seconds: float):
+        self.bucket = bucket
+        self.wait_seconds = wait_seconds
+        super().__init__(
+            f"GitHub '{bucket}' rate limit doldu; tahmini bekleme {int(wait_seconds + 0.999)} sn. "
+            "Daha sonra tekrar deneyin."
+        )
+
+
+class GitHubRateLimiter:
+    """X-RateLimit başlıklarına göre bucket başına istek zamanlayıcısı
+
+    Bekleyen istekler bucket içinde önceliğe (interactive > bulk), sonra
+    geliş sırasına göre çıkar. Kalan kota azaldığında istekler reset anına
+    kadar eşit aralıklarla dağıtılır.
+    """
+
+    PRIORITIES = {"interactive": 0, "bulk": 1}
+    LOW_WATER_RATIO = 0.1
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._buckets: Dict[str, Dict[str, float]] = {}
+        self._waiting: List[Tuple[int, int, str]] = []
+        self._seq = 0
+
+    @staticmethod
+    def bucket_for(path: str) -> str:
+        """API yolunu (api_base'e göre) GitHub rate limit kaynağına eşle"""
+        path = "/" + path.split("?", 1)[0].lstrip("/")
+        if path.startswith("/search/code"):
+            return "code_search"
+        if path.startswith("/search/"):
+            return "search"
+        if path.startswith("/graphql"):
+            return "graphql"
+        return "core"
+
+    def _delay(self, bucket: str, now: float) -> float:
+        state = self._buckets.get(bucket)
+        if state is None:
+            return 0.0
+        blocked_until = state.get("blocked_until", 0.0)
+        if blocked_until > now:
+            return blocked_until - now
+        reset = state.get("reset", 0.0)
+        if reset <= now or "remaining" not in state:
+            # Pencere yenilendi; ilk yanıt gerçek değerleri getirir
+            return 0.0
+        remaining = state["remaining"]
+        if remaining <= 0:
+            return reset - now
+        if remaining <= state.get("limit", 0.0) * self.LOW_WATER_RATIO:
+            return max(0.0, state.get("next_slot", 0.0) - now)
+        return 0.0
+
+    def _reserve(self, bucket: str, now: float) -> None:
+        state = self._buckets.get(bucket)
+        if state is None or "remaining" not in state or state.get("reset", 0.0) <= now:
+            return
+        state["remaining"] -= 1
+        remaining = state["remaining"]
+        if 0 < remaining <= state.get("limit", 0.0) * self.LOW_WATER_RATIO:
+            state["next_slot"] = now + (state["reset"] - now) / (remaining + 1)
+
+    def acquire(self, bucket: str, priority: str = "interactive", max_wait: float = 30.0) -> float:
+        """Sıra gelene kadar bekle; beklenen süre max_wait'i aşarsa GitHubRateLimitWait"""
+        with self._cond:
+            self._seq += 1
+            ticket = (self.PRIORITIES.get(priority, 1), self._seq, bucket)
+            self._waiting.append(ticket)
+            started = self._clock()
+            try:
+                while True:
+                    now = self._clock()
+                    waited = now - started
+                    delay = self._delay(bucket, now)
+                    head = min(entry for entry in self._waiting if entry[2] == bucket)
+                    if head == ticket and delay <= 0:
+                        self._reserve(bucket, now)
+                        return waited
+                    if waited + delay > max_wait:
+                        raise GitHubRateLimitWait(bucket, delay)
+                    timeout = delay if head == ticket else max_wait - waited
+                    self._cond.wait(max(0.01, min(timeout, max_wait - waited)))
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+
+    def update(self, bucket: str, headers: Any) -> None:
+        """Yanıt başlıklarından bucket durumunu güncelle"""
+        resource = headers.get("X-RateLimit-Resource") or bucket
+        try:
+            limit = float(headers["X-RateLimit-Limit"])
+            remaining = float(headers["X-RateLimit-Remaining"])
+            reset = float(headers["X-RateLimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._cond:
+            state = self._buckets.setdefault(resource, {})
+            if state.get("reset") == reset and "remaining" in state:
+                # Aynı pencerede yanıtlar sırasız gelebilir; yerel rezervasyonlar korunur
+                remaining = min(remaining, state["remaining"])
+            state.update(limit=limit, remaining=remaining, reset=reset)
+            self._cond.notify_all()
+
+    def block(self, bucket: str, seconds: float) -> None:
+        """İkincil rate limit: bucket'ı Retry-After süresince durdur"""
+        with self._cond:
+            state = self._buckets.setdefault(bucket, {})
+            state["blocked_until"] = max(state.get("blocked_until", 0.0), self._clock() + seconds)
+            self._cond.notify_all()
+
+    def is_low(self, bucket: str) -> bool:
+        """Bucket kısıtlı mı: bekleme gerekiyor, kuyrukta istek var ya da kota alt eşikte"""
+        with self._cond:
+            now = self._clock()
+            if self._delay(bucket, now) > 0 or any(entry[2] == bucket for entry in self._waiting):
+                return True
+            state = self._buckets.get(bucket)
+            if state is None or "remaining" not in state or state.get("reset", 0.0) <= now:
+                return False
+            return state["remaining"] <= state.get("limit", 0.0) * self.LOW_WATER_RATIO
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            now = self._clock()
+            return {
+                bucket: {
+                    "limit": int(state.get("limit", 0)),
+                    "remaining": int(state.get("remaining", 0)),
+                    "reset_in": max(0, int(state.get("reset", now) - now)),
+                    "expected_wait": round(self._delay(bucket, now), 2),
+                    "waiting": sum(1 for entry in self._waiting if entry[2] == bucket),
+                }
+                for bucket, state in self._buckets.items()
+            }
+
+
+class GitHubSession:
+    """Token başına tek, keep-alive bağlantı havuzlu GitHub HTTP oturumu
+
+    5xx yanıtlarında ve ikincil rate limit (403/429) durumlarında jitter'lı
+    üstel geri çekilme ile yeniden dener.
+    """
+
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(self, token: str, api_base: str = "https://api.github.com",
+                 timeout: Tuple[float, float] = (5.0, 30.0), max_retries: int = 4,
+                 backoff_base: float = 0.5, backoff_cap: float = 30.0,
+                 sleep: Callable[[float], None] = time.sleep,
+                 cache: Optional[GitHubHTTPCache] = None,
+                 limiter: Optional[GitHubRateLimiter] = None, max_wait: float = 30.0):
+        self.token = token
+        self.cache = cache
+        self.limiter = limiter
+        self.max_wait = max_wait
+        self.api_base = api_base.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._sleep = sleep
+        self.retries = 0
+        self.session = requests.Session()
+        # Retry mantığı burada; adapter sadece havuzlama yapar
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "KayraDeniz-MCP",
+        })
+
+    def url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.api_base}/{path.lstrip('/')}"
+
+    def _backoff_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.backoff_cap)
+        # Full jitter: aynı anda düşen istekler aynı anda geri dönmesin
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def is_secondary_rate_limit(response: requests.Response) -> bool:
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        if "Retry-After" in response.headers:
+            return True
+        return "secondary rate limit" in response.text.lower()
+
+    def request(self, method: str, path: str, priority: str = "interactive",
+                max_wait: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        cache_key: Optional[str] = None
+        if self.cache is not None and method == "GET" and not kwargs.get("stream"):
+            headers = dict(kwargs.get("headers") or {})
+            prepared_url = requests.Request("GET", self.url(path), params=kwargs.get("params")).prepare().url or ""
+            accept = headers.get("Accept", str(self.session.headers.get("Accept", "")))
+            cache_key = self.cache.make_key(self.token, prepared_url, accept)
+            headers.update(self.cache.validators(cache_key))
+            kwargs["headers"] = headers
+        response = self._send(method, path, priority, self.max_wait if max_wait is None else max_wait, **kwargs)
+        if cache_key is not None and self.cache is not None:
+            if response.status_code == 304:
+                cached = self.cache.load(cache_key, response)
+                if cached is not None:
+                    return cached
+            elif response.status_code == 200:
+                self.cache.store(cache_key, response)
+        return response
+
+    @staticmethod
+    def is_primary_rate_limit(response: requests.Response) -> bool:
+        return response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0"
+
+    def _send(self, method: str, path: str, priority: str, max_wait: float,
+              **kwargs: Any) -> requests.Response:
+        idempotent = method in self.IDEMPOTENT_METHODS
+        url = self.url(path)
+        bucket = GitHubRateLimiter.bucket_for(url[len(self.api_base):] if url.startswith(self.api_base) else path)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire(bucket, priority, max_wait)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # Gönderilmiş olabilecek POST'lar tekrar edilmez; bağlantı kurulamadıysa güvenli
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                self._sleep(self._backoff_delay(attempt))
+            else:
+                if self.limiter is not None:
+                    self.limiter.update(bucket, response.headers)
+                primary = self.limiter is not None and self.is_primary_rate_limit(response)
+                secondary = self.is_secondary_rate_limit(response) and not primary
+                retryable = primary or secondary or (
+                    idempotent and response.status_code in self.RETRY_STATUSES
+                )
+                if not retryable or attempt >= self.max_retries:
+                    return response
+                response.close()
+                # Birincil limitte bucket reset anına kadar kapalıdır; bekleme acquire içinde yapılır
+                if secondary and self.limiter is not None:
+                    self.limiter.block(bucket, self._backoff_delay(attempt, response))
+                elif not primary:
+                    self._sleep(self._backoff_delay(attempt, response))
+            attempt += 1
+            self.retries += 1
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class GitHubGraphQLClient:
+    """Birden çok mantıksal okumayı tek aliaslı GraphQL sorgusunda birleştirir
+
+    Desteklenen okumalar: repo (meta veri), issues (açık issue'lar), commits
+    (branch geçmişi). Sayfalı okumalar sonraki turlarda kendi cursor'larıyla
+    tekrar sorguya eklenir; sonuçlar her okumanın kendi kaydına toplanır.
+    """
+
+    PAGE_SIZE = 50
+    _REPO_FIELDS = (
+        "nameWithOwner description url stargazerCount forkCount isPrivate isArchived "
+        "pushedAt primaryLanguage { name } defaultBranchRef { name } "
+        "openIssues: issues(states: OPEN) { totalCount }"
+    )
+    _ISSUE_FIELDS = "number title url state createdAt author { login }"
+    _COMMIT_FIELDS = "oid messageHeadline committedDate url author { name }"
+
+    def __init__(self, session: GitHubSession, max_aliases: int = 10):
+        self.session = session
+        self.max_aliases = max_aliases
+        self.round_trips = 0
+
+    def execute(self, query: str, variables: Dict[str, Any], priority: str = "interactive") -> Dict[str, Any]:
+        response = self.session.post("/graphql", json={"query": query, "variables": variables}, priority=priority)
+        self.round_trips += 1
+        if response.status_code != 200:
+            raise RuntimeError(f"GraphQL hatası: {response.status_code} - {response.text[:200]}")
+        return cast(Dict[str, Any], response.json())
+
+    @classmethod
+    def _selection(cls, read: Dict[str, Any], index: int) -> Tuple[str, List[str]]:
+        """Okuma için alias seçimi ve değişken tanımları"""
+        alias = f"r{index}"
+        declarations = [f"$o{index}: String!", f"$n{index}: String!"]
+        kind = read["type"]
+        if kind == "repo":
+            body = cls._REPO_FIELDS
+        elif kind == "issues":
+            declarations += [f"$f{index}: Int!", f"$a{index}: String"]
+            body = (
+                f"issues(first: $f{index}, after: $a{index}, states: [OPEN], "
+                "orderBy: {field: CREATED_AT, direction: DESC}) "
+                f"{{ totalCount pageInfo {{ hasNextPage endCursor }} nodes {{ {cls._ISSUE_FIELDS} }} }}"
+            )
+        else:
+            declarations += [f"$f{index}: Int!", f"$a{index}: String", f"$b{index}: String!"]
+            body = (
+                f"object(expression: $b{index}) {{ ... on Commit {{ history(first: $f{index}, after: $a{index}) "
+                f"{{ totalCount pageInfo {{ hasNextPage endCursor }} nodes {{ {cls._COMMIT_FIELDS} }} }} }} }}"
+            )
+        return f"{alias}: repository(owner: $o{index}, name: $n{index}) {{ {body} }}", declarations
+
+    @staticmethod
+    def _connection(kind: str, node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if kind == "issues":
+            return cast(Optional[Dict[str, Any]], node.get("issues"))
+        target = node.get("object")
+        if not isinstance(target, dict):
+            return None
+        return cast(Optional[Dict[str, Any]], cast(Dict[str, Any], target).get("history"))
+
+    def batch(self, reads: List[Dict[str, Any]], priority: str = "interactive") -> List[Dict[str, Any]]:
+        """Okumaları tur tur birleştirerek çalıştır; sonuçlar girdi sırasıyla döner"""
+        results: List[Dict[str, Any]] = []
+        pending: List[int] = []
+        for read in reads:
+            result: Dict[str, Any] = {"id": read.get("id"), "type": read["type"],
+                                      "repository": f"{read['owner']}/{read['name']}"}
+            if read["type"] != "repo":
+                result.update(items=[], total_count=None, cursor=read.get("after"))
+            results.append(result)
+            pending.append(len(results) - 1)
+
+        while pending:
+            current, pending = pending[:self.max_aliases], pending[self.max_aliases:]
+            selections: List[str] = []
+            declarations: List[str] = []
+            variables: Dict[str, Any] = {}
+            for index in current:
+                read = reads[index]
+                selection, declared = self._selection(read, index)
+                selections.append(selection)
+                declarations += declared
+                variables[f"o{index}"] = read["owner"]
+                variables[f"n{index}"] = read["name"]
+                if read["type"] != "repo":
+                    remaining = int(read["limit"]) - len(results[index]["items"])
+                    variables[f"f{index}"] = max(1, min(self.PAGE_SIZE, remaining))
+                    variables[f"a{index}"] = results[index]["cursor"]
+                if read["type"] == "commits":
+                    variables[f"b{index}"] = read.get("branch") or "HEAD"
+            query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+            payload = self.execute(query, variables, priority)
+
+            data = cast(Dict[str, Any], payload.get("data") or {})
+            errors: Dict[str, List[str]] = {}
+            for error in cast(List[Dict[str, Any]], payload.get("errors") or []):
+                path = cast(List[Any], error.get("path") or [])
+                errors.setdefault(str(path[0]) if path else "", []).append(str(error.get("message", "")))
+
+            for index in current:
+                read, result = reads[index], results[index]
+                alias = f"r{index}"
+                node = data.get(alias)
+                if alias in errors or not isinstance(node, dict):
+                    result["error"] = "; ".join(errors.get(alias) or errors.get("") or ["Bulunamadı"])
+                    continue
+                node = cast(Dict[str, Any], node)
+                if read["type"] == "repo":
+                    result["data"] = node
+                    continue
+                connection = self._connection(read["type"], node)
+                if connection is None:
+                    result["error"] = "Revizyon bulunamadı"
+                    continue
+                result["total_count"] = connection.get("totalCount")
+                result["items"].extend(cast(List[Any], connection.get("nodes") or []))
+                page_info = cast(Dict[str, Any], connection.get("pageInfo") or {})
+                result["cursor"] = page_info.get("endCursor")
+                result["has_next_page"] = bool(page_info.get("hasNextPage"))
+                if result["has_next_page"] and len(result["items"]) < int(read["limit"]):
+                    pending.append(index)
+        return results
+
+
+class GitHubIdempotencyLedger:
+    """Toplu GitHub oluşturma işlemleri için diskte idempotency anahtarı defteri
+
+    Her anahtar önce 'pending', başarıdan sonra URL ile 'done' olarak yazılır.
+    Sonucu belirsiz kalan (zaman aşımı, 5xx) istekler 'pending' kalır ve
+    tekrar denemede uzak tarafta aranarak kurtarılır.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS operations ("
+                " scope TEXT, key TEXT, status TEXT, url TEXT, updated REAL,"
+                " PRIMARY KEY (scope, key))"
+            )
+            self._conn = conn
+        return self._conn
+
+    def begin(self, scope: str, key: str) -> Optional[Dict[str, Any]]:
+        """Anahtar yeniyse 'pending' olarak kaydet ve None döndür; değilse mevcut kaydı döndür"""
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT status, url, updated FROM operations WHERE scope = ? AND key = ?", (scope, key)
+            ).fetchone()
+            if row is not None:
+                return {"status": row[0], "url": row[1], "updated": row[2]}
+            db.execute(
+                "INSERT INTO operations VALUES (?, ?, 'pending', NULL, ?)", (scope, key, time.time())
+            )
+            db.commit()
+            return None
+
+    def complete(self, scope: str, key: str, url: str) -> None:
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO operations VALUES (?, ?, 'done', ?, ?)", (scope, key, url, time.time())
+            )
+            db.commit()
+
+    def abandon(self, scope: str, key: str) -> None:
+        """Kesin başarısız olan işlemi sil; tekrar denemede yeniden oluşturulsun"""
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM operations WHERE scope = ? AND key = ?", (scope, key))
+            db.commit()
+
+
+class CFamilyLexer:
+    """JavaScript/TypeScript/Java için tek geçişli, doğrusal zamanlı lexer
+
+    String, template literal (iç içe ${...} dahil), regex literal ve yorumları
+    ayırır; metrikler ve yeniden yazımlar aynı token akışından üretilir.
+    Token: (tür, başlangıç, bitiş, satır). Türler: ws, newline, comment,
+    string, template, regex, number, ident, punct.
+    """
+
+    _TOKEN_RE = re.compile(
+        r'(?P<ws>[ \t\r\f\v]+)'
+        r'|(?P<newline>\n)'
+        r'|(?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))'
+        r'|(?P<ident>[A-Za-z_$][\w$]*)'
+        r'|(?P<number>\.?\d(?:[\w.]|(?<=[eE])[+-])*)'
+        r'|(?P<textblock>"""(?:[^\\]|\\.)*?(?:"""|\Z))'
+        r'|(?P<string>"(?:[^"\\\n]|\\.)*"?|\'(?:[^\'\\\n]|\\.)*\'?)'
+        r'|(?P<punct>>>>=|===|!==|\*\*=|<<=|>>=|>>>|\.\.\.|\?\?=|&&=|\|\|='
+        r'|=>|==|!=|<=|>=|&&|\|\||\?\?|\?\.|\+\+|--|\+=|-=|\*=|/=|%=|&=|\|=|\^=|<<|>>|\*\*|::'
+        r'|[^\s\w$])',
+        re.DOTALL,
+    )
+    _TEMPLATE_RE = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.DOTALL)
+    _REGEX_BODY_RE = re.compile(r'(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+    # Bu kelimelerden sonra gelen '/' bölme değil regex başlangıcıdır
+    _REGEX_PREFIX_KEYWORDS = frozenset({
+        "return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void",
+        "throw", "instanceof", "yield", "await",
+    })
+    _CONTROL_KEYWORDS = frozenset({
+        "if", "for", "while", "switch", "catch", "with", "return", "function", "synchronized",
+        "typeof", "new", "await", "super", "this", "else", "do", "try", "finally",
+    })
+    # Satır sonu bu token'lardan biriyle bitiyor ya da sonraki satır bunlardan biriyle
+    # başlıyorsa ifade sürer; aksi halde ASI yeni deyim başlatır
+    _CONTINUATION_TOKENS = frozenset({
+        ",", "=", "+", "-", "*", "/", "%", "&&", "||", "??", "?", ":", ".", "?.", "(", "[", "{", "=>",
+        "==", "===", "!=", "!==", "<", ">", "<=", ">=", "&", "|", "^", "+=", "-=", "in", "of", "instanceof",
+    })
+    SECURITY_MESSAGES = {
+        "eval": "eval() kullanımı - güvenlik riski",
+        "innerHTML": "innerHTML kullanımı - XSS riski",
+        "document.write": "document.write() kullanımı - güvenlik riski",
+    }
+    # Performans kuralları: döngü gövdeleri for/while/do başlığından sonra gelen ya da
+    # forEach/map... çağrısının parantezi içinde açılan '{' ile izlenir
+    _ITERATION_METHODS = frozenset({
+        "forEach", "map", "filter", "reduce", "reduceRight", "some", "every", "find", "findIndex", "flatMap",
+    })
+    _DOM_QUERIES = frozenset({
+        "getElementById", "querySelector", "querySelectorAll", "getElementsByClassName",
+        "getElementsByTagName", "getElementsByName",
+    })
+    _HTTP_CLIENTS = frozenset({"axios", "$", "jQuery", "http", "https"})
+    _HTTP_METHODS = frozenset({"get", "post", "put", "patch", "delete", "head", "request", "ajax", "getJSON"})
+    _PROCESS_CALLS = frozenset({"execSync", "spawnSync", "execFileSync"})
+
+    @classmethod
+    def tokenize(cls, content: str, language: str = "JavaScript") -> List[Tuple[str, int, int, int]]:
+        is_js = language in ("JavaScript", "TypeScript")
+        tokens: List[Tuple[str, int, int, int]] = []
+        append = tokens.append
+        token_re = cls._TOKEN_RE
+        # Açık '{' yığını: True ise bir template literal içindeki ${ ifadesidir
+        braces: List[bool] = []
+        last_kind, last_text = "", ""
+        position, line, length = 0, 1, len(content)
+
+        def scan_template(start: int, line: int) -> Tuple[int, int, bool]:
+            """start: '`' ya da '}' sonrası; (bitiş, satır, ${ ile mi bitti)"""
+            match = cls._TEMPLATE_RE.match(content, start)
+            end = match.end() if match else start
+            opened = content.startswith("${", end)
+            closed = content.startswith("`", end)
+            end += 2 if opened else (1 if closed else 0)
+            return end, line + content.count("\n", start, end), opened
+
+        while position < length:
+            char = content[position]
+            if is_js and char == "`" or (is_js and char == "}" and braces and braces[-1]):
+                if char == "}":
+                    braces.pop()
+                end, new_line, opened = scan_template(position + 1, line)
+                append(("template", position, end, line))
+                if opened:
+                    braces.append(True)
+                position, line = end, new_line
+                last_kind, last_text = "template", ""
+                continue
+            if is_js and char == "/" and not content.startswith(("//", "/*"), position) and (
+                last_kind in ("", "punct") and last_text not in (")", "]", "}", "++", "--")
+                or last_kind == "ident" and last_text in cls._REGEX_PREFIX_KEYWORDS
+            ):
+                match = cls._REGEX_BODY_RE.match(content, position + 1)
+                if match:
+                    append(("regex", position, match.end(), line))
+                    position = match.end()
+                    last_kind, last_text = "regex", ""
+                    continue
+            match = token_re.match(content, position)
+            if match is None:
+                append(("punct", position, position + 1, line))
+                position += 1
+                continue
+            kind = cast(str, match.lastgroup)
+            end = match.end()
+            if kind == "textblock":
+                kind = "string"
+            append((kind, position, end, line))
+            if kind == "punct":
+                text = content[position:end]
+                if text == "{":
+                    braces.append(False)
+                elif text == "}" and braces:
+                    braces.pop()
+                last_kind, last_text = kind, text
+            elif kind == "newline":
+                line += 1
+            elif kind == "ws":
+                pass
+            else:
+                if kind in ("comment", "string"):
+                    line += content.count("\n", position, end)
+                if kind != "comment":
+                    last_kind, last_text = kind, content[position:end] if kind == "ident" else ""
+            position = end
+        return tokens
+
+    @staticmethod
+    def significant(content: str, tokens: List[Tuple[str, int, int, int]]) -> List[Tuple[str, str, int, int]]:
+        """Boşluk ve yorumlar hariç (tür, metin, token indeksi, satır)"""
+        return [
+            (kind, content[start:end], index, line)
+            for index, (kind, start, end, line) in enumerate(tokens)
+            if kind not in ("ws", "newline", "comment")
+        ]
+
+    @classmethod
+    def metrics(cls, content: str, language: str) -> Dict[str, Any]:
+        tokens = cls.tokenize(content, language)
+        lines = content.split("\n")
+        comment_line_set: set = set()
+        for kind, start, end, line in tokens:
+            if kind == "comment":
+                comment_line_set.update(range(line, line + content.count("\n", start, end) + 1))
+
+        code = cls.significant(content, tokens)
+        is_js = language in ("JavaScript", "TypeScript")
+        function_lines: List[int] = []
+        class_count = 0
+        complexity_score = 0
+        security: List[Dict[str, Any]] = []
+        dom_lookups = 0
+        var_count = 0
+        paren_stack: List[int] = []
+        closed_paren: Dict[int, int] = {}  # ')' konumu -> '(' konumu
+        performance: List[Dict[str, Any]] = []
+        reported: set = set()
+        loop_headers: set = set()  # for/while başlıklarının '(' konumları
+        callback_parens: set = set()  # forEach/map... çağrılarının '(' konumları
+        brace_stack: List[str] = []  # açık '{' türleri: loop, callback veya ''
+        loop_braces: List[int] = []  # açık döngü gövdelerinin '{' konumları
+        statement_loops = 0
+        dom_queries: Dict[Tuple[str, str], int] = {}  # (metot, seçici) -> ilk satır
+
+        def report(code_name: str, line: int, message: str, key: Optional[Tuple[Any, ...]] = None) -> None:
+            if key is not None:
+                if key in reported:
+                    return
+                reported.add(key)
+            performance.append({"code": code_name, "message": message, "line": line})
+
+        def io_call(name: str, line: int) -> None:
+            if statement_loops:
+                category = "subprocess" if name.split(".")[-1] in cls._PROCESS_CALLS else "HTTP"
+                report("io-call-in-loop", line,
+                       f"Döngü içinde {name}() - her turda ayrı {category} gidiş-dönüşü (N+1); "
+                       f"toplu çağrı veya Promise.all ile paralel çalıştırma düşünün")
+
+        for position, (kind, text, _, line) in enumerate(code):
+            previous = code[position - 1][1] if position > 0 else ""
+            following = code[position + 1][1] if position + 1 < len(code) else ""
+            if kind == "ident":
+                if previous == ".":
+                    owner = code[position - 2][1] if position >= 2 else ""
+                    if text in cls._ITERATION_METHODS and following == "(":
+                        callback_parens.add(position + 1)
+                    elif is_js and following == "(" and (
+                            text in cls._PROCESS_CALLS or (owner in cls._HTTP_CLIENTS and text in cls._HTTP_METHODS)):
+                        io_call(f"{owner}.{text}", line)
+                    elif is_js and text in cls._DOM_QUERIES and owner == "document" and following == "(":
+                        if loop_braces:
+                            report("dom-lookup-in-loop", line,
+                                   f"Döngü içinde document.{text}() - elementi döngüden önce bir kez sorgulayın",
+                                   key=("dom", loop_braces[-1], text))
+                        elif position + 3 < len(code) and code[position + 2][0] == "string" and code[position + 3][1] == ")":
+                            first_line = dom_queries.setdefault((text, code[position + 2][1]), line)
+                            if first_line != line:
+                                report("repeated-dom-lookup", line,
+                                       f"document.{text}({code[position + 2][1]}) satır {first_line}'de de sorgulandı - "
+                                       f"elementi bir değişkende tutun")
+                    if is_js and text == "innerHTML":
+                        security.append({"call": "innerHTML", "line": line})
+                    elif is_js and text == "write" and position >= 2 and code[position - 2][1] == "document" and following == "(":
+                        security.append({"call": "document.write", "line": line})
+                    elif is_js and text == "getElementById" and position >= 2 and code[position - 2][1] == "document":
+                        dom_lookups += 1
+                    continue
+                if text in ("for", "while"):
+                    # for await (...) başlığında parantez bir token sonra gelir
+                    loop_headers.add(position + 2 if following == "await" else position + 1)
+                elif is_js and following == "(" and (text == "fetch" or text in cls._PROCESS_CALLS):
+                    io_call(text, line)
+                if text in ("if", "for", "while", "case", "catch"):
+                    complexity_score += 1
+                elif text == "function" and is_js:
+                    function_lines.append(line)
+                elif text == "class" or (text in ("interface", "enum") and language != "JavaScript"):
+                    class_count += 1
+                elif text == "var" and is_js and following not in (":", "=", ".", ",", ")"):
+                    var_count += 1
+                elif text == "eval" and is_js and following == "(":
+                    security.append({"call": "eval", "line": line})
+            elif kind == "punct":
+                if text == "{":
+                    brace_kind = ""
+                    if previous == "do" or (previous == ")" and closed_paren.get(position - 1) in loop_headers):
+                        brace_kind = "loop"
+                        statement_loops += 1
+                    elif paren_stack and paren_stack[-1] in callback_parens:
+                        brace_kind = "callback"
+                    brace_stack.append(brace_kind)
+                    if brace_kind:
+                        loop_braces.append(position)
+                elif text == "}" and brace_stack:
+                    brace_kind = brace_stack.pop()
+                    if brace_kind:
+                        loop_braces.pop()
+                        if brace_kind == "loop":
+                            statement_loops -= 1
+                elif text == "+=" and loop_braces:
+                    # Sağ tarafta ifade sonuna kadar bir string/template varsa birleştirmedir
+                    for ahead in range(position + 1, min(position + 17, len(code))):
+                        ahead_kind, ahead_text = code[ahead][0], code[ahead][1]
+                        if ahead_text in (";", "}", ")"):
+                            break
+                        if ahead_kind in ("string", "template"):
+                            target = previous if code[position - 1][0] == "ident" else "..."
+                            advice = "parçaları dizide toplayıp join('') kullanın" if is_js else "StringBuilder kullanın"
+                            report("string-concat-in-loop", line,
+                                   f"Döngü içinde string birleştirme ({target} += ...) - {advice}",
+                                   key=("concat", loop_braces[-1], target))
+                            break
+                if text in ("&&", "||", "??"):
+                    complexity_score += 1
+                elif text == "?" and previous not in ("<", ",") and following not in (":", ")", ",", "=", ";", ">"):
+                    complexity_score += 1
+                elif text == "=>":
+                    function_lines.append(line)
+                elif text == "(":
+                    paren_stack.append(position)
+                elif text == ")" and paren_stack:
+                    closed_paren[position] = paren_stack.pop()
+                elif text == "{" and position > 0:
+                    # Metot tanımı: isim ( ... ) [throws A, B] {
+                    close = position - 1
+                    while close > 0 and code[close][1] != ")" and (
+                        code[close][0] == "ident" or code[close][1] in (",", ".", ":", "<", ">", "[", "]", "?")
+                    ):
+                        close -= 1
+                    if code[close][1] == ")" and close in closed_paren:
+                        open_index = closed_paren[close]
+                        if open_index > 0:
+                            name_kind, name, _, name_line = code[open_index - 1]
+                            before = code[open_index - 2][1] if open_index >= 2 else ""
+                            if (name_kind == "ident" and name not in cls._CONTROL_KEYWORDS
+                                    and before not in ("function", ".", "new")):
+                                function_lines.append(name_line)
+
+        non_empty_lines = sum(1 for line in lines if line.strip())
+        comment_lines = len(comment_line_set)
+        return {
+            "total_lines": len(lines),
+            "non_empty_lines": non_empty_lines,
+            "comment_lines": comment_lines,
+            "function_count": len(function_lines),
+            "class_count": class_count,
+            "complexity_score": complexity_score,
+            "comment_ratio": (comment_lines / non_empty_lines * 100) if non_empty_lines > 0 else 0,
+            "avg_line_length": sum(len(line) for line in lines) / len(lines) if lines else 0,
+            "function_lines": sorted(set(function_lines)),
+            "security": security,
+            "performance": sorted(performance, key=lambda item: int(item["line"])),
+            "dom_lookups": dom_lookups,
+            "var_count": var_count,
+        }
+
+    @classmethod
+    def modernize(cls, content: str, language: str, convert_var: bool = True,
+                  strict_equality: bool = True) -> Tuple[str, Dict[str, int]]:
+        """Sadece gerçek kod token'larında var -> let ve ==/!= -> ===/!== dönüşümü
+
+        var yalnızca let'in blok kapsamı anlamı değiştirmeyecekse çevrilir: bağlanan
+        isimler bildirimin bloğu dışında, bildirimden önce (TDZ) ya da bloktaki iç
+        içe bir fonksiyonda (döngüde tur başına bağlama) kullanılmamalıdır.
+        """
+        tokens = cls.tokenize(content, language)
+        code = cls.significant(content, tokens)
+        count = len(code)
+        replacements: Dict[int, str] = {}
+        stats = {"var": 0, "equality": 0, "skipped_var": 0, "scoped_var": 0, "skipped_null": 0}
+
+        match: Dict[int, int] = {}
+        enclosing: List[Optional[int]] = []
+        opened: List[int] = []
+        for position, (kind, text, _, _) in enumerate(code):
+            enclosing.append(opened[-1] if opened else None)
+            if kind == "punct":
+                if text in ("(", "{", "["):
+                    opened.append(position)
+                elif text in (")", "}", "]") and opened:
+                    match[opened.pop()] = position
+
+        def text_at(position: int) -> str:
+            return code[position][1] if 0 <= position < count else ""
+
+        def is_reference(position: int) -> bool:
+            kind, text, _, _ = code[position]
+            return kind == "ident" and text_at(position - 1) not in (".", "?.")
+
+        def statement_end(position: int) -> int:
+            """position'dan başlayan deyimin son token'ı (';' ya da kapsayan kapanış öncesi)"""
+            while position < count:
+                text = code[position][1]
+                if text in ("(", "{", "[") and position in match:
+                    position = match[position] + 1
+                    continue
+                if text == ";":
+                    return position
+                if text in (")", "}", "]"):
+                    return position - 1
+                position += 1
+            return count - 1
+
+        def declaration(position: int) -> Optional[List[Tuple[str, int, int]]]:
+            """var'dan sonra bağlanan (isim, isim token'ı, bildiricinin son token'ı); çözülemezse None"""
+            bindings: List[Tuple[str, int, int]] = []
+            position += 1
+            while position < count:
+                declared: List[Tuple[str, int]] = []
+                text = text_at(position)
+                if text in ("{", "[") and position in match:
+                    # Yapı bozma: nesne anahtarları (ardından ':') bağlama değildir
+                    declared.extend(
+                        (code[inner][1], inner) for inner in range(position + 1, match[position])
+                        if code[inner][0] == "ident" and text_at(inner + 1) != ":"
+                    )
+                    position = match[position] + 1
+                elif code[position][0] == "ident":
+                    declared.append((text, position))
+                    position += 1
+                else:
+                    return None
+                # Başlatıcıyı virgüle, ';'a ya da deyim sonuna kadar atla
+                done = False
+                while position < count:
+                    text = text_at(position)
+                    if text in ("(", "{", "[") and position in match:
+                        position = match[position] + 1
+                        continue
+                    if text == ",":
+                        break
+                    if text in (";", ")", "}", "]", "in", "of") or (
+                            code[position][3] != code[position - 1][3]
+                            and text_at(position - 1) not in cls._CONTINUATION_TOKENS
+                            and text not in cls._CONTINUATION_TOKENS):
+                        done = True  # deyim sonu (yeni satırda devam işareti yoksa ASI)
+                        break
+                    position += 1
+                bindings.extend((name, token, position - 1) for name, token in declared)
+                if done or position >= count:
+                    return bindings
+                position += 1
+            return bindings
+
+        def block_range(position: int) -> Optional[Tuple[int, int]]:
+            """var'ın let olunca geçerli olacağı blok: kapsayan {...}, for başlığı + gövde ya da dosya"""
+            outer = enclosing[position]
+            if outer is None:
+                return 0, count - 1
+            if text_at(outer) == "{":
+                return outer, match.get(outer, count - 1)
+            if text_at(outer) == "(" and text_at(outer - 1) == "for" and outer in match:
+                body = match[outer] + 1
+                if text_at(body) == "{" and body in match:
+                    return outer - 1, match[body]
+                return outer - 1, statement_end(body)
+            return None
+
+        declarations: List[Tuple[int, List[Tuple[str, int, int]], Tuple[int, int]]] = []
+        var_names: Dict[str, int] = {}
+        for position, (kind, text, index, _) in enumerate(code):
+            previous = text_at(position - 1)
+            following = text_at(position + 1)
+            if convert_var and kind == "ident" and text == "var" and previous != "." \
+                    and following not in (":", "=", ".", ",", ")"):
+                bindings = declaration(position)
+                scope = block_range(position)
+                if not bindings or scope is None:
+                    stats["scoped_var"] += 1
+                    continue
+                for name, _, _ in bindings:
+                    var_names[name] = var_names.get(name, 0) + 1
+                declarations.append((position, bindings, scope))
+            elif strict_equality and kind == "punct" and text in ("==", "!="):
+                # x == null bilinçli olarak undefined'ı da yakalar; anlamı değişmesin
+                if previous in ("null", "undefined") or following in ("null", "undefined"):
+                    stats["skipped_null"] += 1
+                    continue
+                replacements[index] = text + "="
+                stats["equality"] += 1
+
+        references: Dict[str, List[int]] = {}
+        function_bodies: List[Tuple[int, int]] = []
+        if declarations:
+            for position in range(count):
+                if text_at(position) == "=>":
+                    body = position + 1
+                    if text_at(body) == "{" and body in match:
+                        function_bodies.append((body, match[body]))
+                    else:
+                        function_bodies.append((body, statement_end(body)))
+                elif text_at(position) == "function":
+                    parameters = position + 1
+                    while parameters < count and text_at(parameters) != "(":
+                        parameters += 1
+                    body = match.get(parameters, count) + 1
+                    if text_at(body) == "{" and body in match:
+                        function_bodies.append((parameters, match[body]))
+                elif is_reference(position):
+                    references.setdefault(code[position][1], []).append(position)
+
+        for position, bindings, (first, last) in declarations:
+            # Aynı isim birden çok kez var ile tanımlanmışsa let sözdizimi hatası olur
+            if any(var_names[name] > 1 for name, _, _ in bindings):
+                stats["skipped_var"] += 1
+                continue
+            nested = [(start, stop) for start, stop in function_bodies if first <= start <= last]
+            safe = True
+            for name, token, declarator_end in bindings:
+                for reference in references.get(name, []):
+                    if reference == token:
+                        continue
+                    if not first <= reference <= last or reference <= declarator_end:
+                        # Blok dışında ya da bildirimden önce/kendi başlatıcısında (let'te TDZ)
+                        safe = False
+                    elif any(start <= reference <= stop for start, stop in nested):
+                        # Closure: let blok her girişte (döngü turu) yeni bağlama yapar
+                        safe = False
+                    if not safe:
+                        break
+                if not safe:
+                    break
+            if not safe:
+                stats["scoped_var"] += 1
+                continue
+            replacements[code[position][2]] = "let"
+            stats["var"] += 1
+
+        if not replacements:
+            return content, stats
+        parts: List[str] = []
+        for index, (_, start, end, _) in enumerate(tokens):
+            parts.append(replacements.get(index, content[start:end]))
+        return "".join(parts), stats
+
+    _RESERVED_WORDS = frozenset({
+        "break", "case", "catch", "class", "const", "continue", "debugger", "default", "delete",
+        "do", "else", "export", "extends", "finally", "for", "function", "if", "import", "in",
+        "instanceof", "let", "new", "return", "super", "switch", "this", "throw", "try", "typeof",
+        "var", "void", "while", "with", "yield", "await", "true", "false", "null", "undefined",
+    })
+    _TYPESCRIPT_KEYWORDS = frozenset({
+        "interface", "implements", "enum", "private", "public", "protected", "readonly",
+        "abstract", "declare", "keyof", "infer", "satisfies",
+    })
+    _MEMBER_MODIFIERS = frozenset({
+        "static", "async", "get", "set", "public", "private", "protected", "readonly",
+        "override", "abstract", "declare", "accessor",
+    })
+
+    @classmethod
+    def symbols(cls, content: str,
+                language: str = "JavaScript") -> Tuple[List[Tuple[Any, ...]], Dict[str, List[Tuple[int, int]]]]:
+        """Sembol indeksi için tanımlar ve tanımlayıcı kullanımları (JS/TS)
+
+        Tanım: (isim, tür, kapsayan, satır, bitiş satırı, export, detay). Türler:
+        function, class, method, variable, import, export ve TypeScript için
+        interface, type, enum, namespace. Kullanımlar: isim -> [(satır, sütun)].
+        """
+        tokens = cls.tokenize(content, language)
+        code = cls.significant(content, tokens)
+        count = len(code)
+        is_ts = language == "TypeScript"
+        not_references = cls._RESERVED_WORDS | cls._TYPESCRIPT_KEYWORDS if is_ts else cls._RESERVED_WORDS
+
+        match: Dict[int, int] = {}
+        opened: List[int] = []
+        for position, (kind, text, _, _) in enumerate(code):
+            if kind == "punct":
+                if text in ("(", "{", "["):
+                    opened.append(position)
+                elif text in (")", "}", "]") and opened:
+                    match[opened.pop()] = position
+
+        def text_at(position: int) -> str:
+            return code[position][1] if 0 <= position < count else ""
+
+        def kind_at(position: int) -> str:
+            return code[position][0] if 0 <= position < count else ""
+
+        def column(position: int) -> int:
+            start = tokens[code[position][2]][1]
+            return start - (content.rfind("\n", 0, start) + 1)
+
+        def source(first: int, last: int) -> str:
+            """İki token arasındaki kaynak metin, boşlukları sıkıştırılmış"""
+            start, end = tokens[code[first][2]][1], tokens[code[last][2]][2]
+            return re.sub(r"\s+", " ", content[start:end])[:120]
+
+        def body_after(position: int) -> Optional[int]:
+            """Bildirimin gövdesini açan '{' (parantezler atlanır; ';' görülürse yok)"""
+            while position < count:
+                text = code[position][1]
+                if text == "{":
+                    return position
+                if text in ("(", "[") and position in match:
+                    position = match[position] + 1
+                    continue
+                if text in (";", "}", "=>"):
+                    return None
+                position += 1
+            return None
+
+        def string_value(position: int) -> str:
+            return text_at(position).strip("'\"`")
+
+        symbols: List[Tuple[Any, ...]] = []
+        refs: Dict[str, List[Tuple[int, int]]] = {}
+        # (qualname, tür, açılış '{', kapanış '}')
+        scopes: List[Tuple[str, str, int, int]] = []
+        body_scopes: Dict[int, Tuple[str, str]] = {}
+        brackets: List[int] = []
+        export_next = False
+
+        def bind(position: int) -> None:
+            """Atlanan bağlama token'ını da kullanımlara yaz; tanım satırı eşleşsin"""
+            if kind_at(position) == "ident" and code[position][1] not in not_references:
+                refs.setdefault(code[position][1], []).append((code[position][3], column(position)))
+
+        def add(name: str, kind: str, line: int, body: Optional[int] = None, detail: str = "",
+                exported: bool = False) -> None:
+            container = scopes[-1][0] if scopes else ""
+            end_line = code[match[body]][3] if body is not None and body in match else line
+            symbols.append((name, kind, container, line, end_line, exported, detail))
+            if body is not None:
+                body_scopes[body] = (f"{container}.{name}" if container else name, kind)
+
+        def pattern_names(first: int, last: int) -> List[Tuple[str, int]]:
+            """{a, b: c, ...d} / [a, b] desenindeki yerel isimler (desendeki tüm isimler kullanıma yazılır)"""
+            names: List[Tuple[str, int]] = []
+            for position in range(first + 1, last):
+                kind, text, _, line = code[position]
+                if kind == "ident" and text_at(position - 1) not in (".", "?."):
+                    bind(position)
+                    if text_at(position + 1) != ":" and text_at(position - 1) != "=":
+                        names.append((text, line))
+            return names
+
+        position = 0
+        while position < count:
+            kind, text, _, line = code[position]
+            while scopes and position > scopes[-1][3]:
+                scopes.pop()
+            if position in body_scopes:
+                qualname, scope_kind = body_scopes[position]
+                scopes.append((qualname, scope_kind, position, match.get(position, count)))
+            previous = text_at(position - 1)
+
+            if kind == "punct":
+                if text in ("(", "{", "["):
+                    brackets.append(position)
+                elif text in (")", "}", "]"):
+                    if brackets:
+                        brackets.pop()
+                elif text == ";":
+                    export_next = False
+                position += 1
+                continue
+            if kind != "ident":
+                position += 1
+                continue
+
+            if text not in not_references:
+                refs.setdefault(text, []).append((line, column(position)))
+            if previous in (".", "?."):
+                position += 1
+                continue
+            following = text_at(position + 1)
+            in_class_body = bool(scopes) and scopes[-1][1] == "class" and bool(brackets) \
+                and brackets[-1] == scopes[-1][2]
+
+            if in_class_body and previous != "@" and previous not in ("=", ":", "(", ",") and (
+                following == "(" or (following == "=" and text_at(position + 2) in ("(", "async")
+                                     and text not in cls._MEMBER_MODIFIERS)
+            ) and (text not in cls._MEMBER_MODIFIERS or following == "("):
+                if following == "(":
+                    params = position + 1
+                    body = body_after(match.get(params, params) + 1)
+                    detail = text + (source(params, match[params]) if params in match else "")
+                else:
+                    arrow = position + 2
+                    while arrow < count and text_at(arrow) not in ("=>", ";", "{"):
+                        arrow = match.get(arrow, arrow) + 1
+                    body = arrow + 1 if text_at(arrow) == "=>" and text_at(arrow + 1) == "{" else None
+                    detail = text + " = " + (source(position + 2, arrow) if arrow < count else "")
+                add(text, "method", line, body, detail)
+            elif text == "export":
+                if following == "{" and position + 1 in match:
+                    close = match[position + 1]
+                    origin = string_value(close + 2) if text_at(close + 1) == "from" else ""
+                    entry = position + 2
+                    while entry < close:
+                        if code[entry][0] == "ident":
+                            local = code[entry][1]
+                            if not origin:
+                                bind(entry)  # yerel ismin kullanımı
+                            exported_name = local
+                            if text_at(entry + 1) == "as":
+                                exported_name = text_at(entry + 2)
+                                entry += 2
+                            add(exported_name, "export", code[entry][3], None, origin or local, True)
+                        entry += 1
+                    position = close
+                elif following == "*":
+                    alias = text_at(position + 3) if text_at(position + 2) == "as" else "*"
+                    origin_at = position + 4 if alias != "*" else position + 2
+                    add(alias, "export", line, None,
+                        string_value(origin_at + 1) if text_at(origin_at) == "from" else "", True)
+                elif following == "default" and kind_at(position + 2) == "ident" and text_at(position + 2) not in (
+                    "function", "class", "async", "abstract"
+                ) and text_at(position + 3) in (";", ""):
+                    add(text_at(position + 2), "export", line, None, "default", True)
+                else:
+                    export_next = True
+            elif text == "import" and following not in ("(", ".") and not brackets:
+                names: List[Tuple[str, int]] = []
+                origin = ""
+                entry = position + 1
+                while entry < count:
+                    entry_kind, entry_text, _, entry_line = code[entry]
+                    if entry_kind == "string":
+                        origin = entry_text.strip("'\"`")
+                        break
+                    if entry_text == ";":
+                        break
+                    if entry_kind == "ident":
+                        if entry_text == "as":
+                            names.append((text_at(entry + 1), entry_line))
+                            bind(entry + 1)
+                            entry += 2
+                            continue
+                        if text_at(entry + 1) != "as" and entry_text not in ("from", "require") and not (
+                            entry_text == "type" and entry == position + 1 and text_at(entry + 1) not in ("from", ",", "=")
+                        ):
+                            names.append((entry_text, entry_line))
+                            bind(entry)
+                    entry += 1
+                for name, name_line in names:
+                    add(name, "import", name_line, None, origin)
+                position = entry
+            elif text == "class" and kind_at(position + 1) == "ident" and following not in ("extends", "implements"):
+                body = body_after(position + 2)
+                heritage = source(position, body - 1) if body is not None and body - 1 > position else f"class {following}"
+                add(following, "class", line, body, heritage, export_next)
+                bind(position + 1)
+                export_next = False
+                position += 1
+            elif text == "function":
+                name_at = position + 2 if following == "*" else position + 1
+                if kind_at(name_at) == "ident":
+                    params = name_at + 1
+                    body = body_after(match.get(params, params) + 1) if text_at(params) == "(" else None
+                    signature = source(params, match[params]) if params in match else "()"
+                    prefix = "async " if previous == "async" else ""
+                    add(code[name_at][1], "function", line, body,
+                        f"{prefix}function {code[name_at][1]}{signature}", export_next)
+                    bind(name_at)
+                    position = name_at
+                export_next = False
+            elif text in ("const", "let", "var") and following != ".":
+                target = position + 1
+                if text_at(target) in ("{", "[") and target in match:
+                    close = match[target]
+                    if text_at(close + 1) == "=" and text_at(close + 2) == "require":
+                        for name, name_line in pattern_names(target, close):
+                            add(name, "import", name_line, None, string_value(close + 4))
+                    elif not scopes:
+                        for name, name_line in pattern_names(target, close):
+                            add(name, "variable", name_line, None, text, export_next)
+                    export_next = False
+                    position = close
+                elif kind_at(target) == "ident":
+                    name = code[target][1]
+                    bind(target)
+                    value = target + 1
+                    if text_at(value) == ":":
+                        # TypeScript tip notasyonu: '=' ya da ';' görülene kadar atla
+                        while value < count and text_at(value) not in ("=", ";"):
+                            value = match.get(value, value) + 1
+                    value += 1
+                    head = value + 1 if text_at(value) == "async" else value
+                    if text_at(value) == "require" and text_at(value + 1) == "(":
+                        add(name, "import", line, None, string_value(value + 2))
+                    elif text_at(head) == "function":
+                        params = head + 2 if kind_at(head + 1) == "ident" and text_at(head + 2) == "(" else head + 1
+                        if text_at(params) == "*":
+                            params += 1
+                        body = body_after(match.get(params, params) + 1)
+                        add(name, "function", line, body,
+                            f"{name} = " + (source(value, match[params]) if params in match else "function"),
+                            export_next)
+                    elif (text_at(head) == "(" and head in match and text_at(match[head] + 1) in ("=>", ":")) or (
+                        kind_at(head) == "ident" and text_at(head + 1) == "=>"
+                    ):
+                        arrow = match[head] + 1 if text_at(head) == "(" else head + 1
+                        while arrow < count and text_at(arrow) not in ("=>", ";"):
+                            arrow = match.get(arrow, arrow) + 1
+                        body = arrow + 1 if text_at(arrow + 1) == "{" else None
+                        add(name, "function", line, body,
+                            f"{name} = " + (source(value, arrow) if arrow < count else ""), export_next)
+                    elif not scopes:
+                        add(name, "variable", line, None, text, export_next)
+                    export_next = False
+                    position = target
+            elif text in ("module", "exports") and following == "." and not brackets:
+                member = position + 2 if text == "exports" else position + 4
+                if text == "module" and text_at(position + 2) == "exports" and text_at(position + 3) == "=":
+                    value = position + 4
+                    if text_at(value) == "{" and value in match:
+                        close = match[value]
+                        depth = 0
+                        for key in range(value + 1, close):
+                            key_text = text_at(key)
+                            if key_text in ("(", "{", "["):
+                                depth += 1
+                            elif key_text in (")", "}", "]"):
+                                depth -= 1
+                            elif depth == 0 and kind_at(key) == "ident" and text_at(key - 1) in ("{", ",") \
+                                    and text_at(key + 1) in (",", "}", ":", "("):
+                                # Sadece nesnenin kendi anahtarları: {a, b: c, d() {}}
+                                add(key_text, "export", code[key][3], None, "module.exports", True)
+                    elif kind_at(value) == "ident":
+                        add(code[value][1], "export", line, None, "module.exports", True)
+                elif kind_at(member) == "ident":
+                    if text_at(member + 1) == "=" and (text != "module" or text_at(position + 2) == "exports"):
+                        add(code[member][1], "export", line, None, source(position, member), True)
+            elif is_ts and text in ("interface", "type", "enum", "namespace") and kind_at(position + 1) == "ident":
+                if text == "type" and text_at(position + 2) not in ("=", "<"):
+                    position += 1
+                    continue
+                body = body_after(position + 2) if text != "type" else None
+                add(following, text, line, body, f"{text} {following}", export_next)
+                bind(position + 1)
+                export_next = False
+                position += 1
+            position += 1
+
+        return symbols, refs
+
+
+class PythonSourceAnalyzer:
+    """Python kaynağı için tek ast geçişinde metrik, güvenlik ve performans analizi
+
+    Yorum satırları tokenize yerine tek regex geçişiyle bulunur: string ve yorum
+    token'ları birlikte eşlendiğinden string içindeki '#' yorum sayılmaz.
+    Performans kuralları aynı geçişte, düğümle birlikte taşınan döngü bağlamına
+    bakarak çalışır; bulgular {code, message, line} kayıtlarıdır.
+
+    lexical_metrics aynı dosya metriklerini ast kurmadan, string/yorum ayıklayan
+    tek regex geçişi ve satır başı taramasıyla üretir (fonksiyon listesi ve
+    performans bulguları hariç); ayrıştırılamayan dosyalarda ve açıkça
+    detail='fast' istendiğinde kullanılır.
+    """
+
+    BLOCK_NODES: Tuple[type, ...] = (
+        ast.If, ast.For, ast.AsyncFor, ast.While, ast.With, ast.AsyncWith, ast.Try,
+    ) + tuple(getattr(ast, name) for name in ("TryStar", "Match") if hasattr(ast, name))
+    FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+    SECURITY_CALLS = {
+        "eval": "eval() kullanımı - güvenlik riski",
+        "exec": "exec() kullanımı - güvenlik riski",
+        "os.system": "os.system() kullanımı - güvenlik riski",
+    }
+    # Döngü içinde her turda dış süreç/ağ gidiş-dönüşü yapan çağrılar (N+1)
+    LOOP_IO_CALLS = {
+        **{f"subprocess.{name}": "subprocess" for name in ("run", "call", "check_call", "check_output", "Popen")},
+        **{f"asyncio.create_subprocess_{name}": "subprocess" for name in ("exec", "shell")},
+        "os.system": "subprocess", "os.popen": "subprocess",
+        **{f"{module}.{verb}": "HTTP" for module in ("requests", "httpx")
+           for verb in ("get", "post", "put", "patch", "delete", "head", "options", "request")},
+        "urllib.request.urlopen": "HTTP", "request.urlopen": "HTTP", "urlopen": "HTTP",
+    }
+    # Aynı döngüde bu kadar tekrar eden a.b.c zinciri raporlanır (iç içe döngüde 2)
+    ATTRIBUTE_REPEAT_THRESHOLD = 3
+    MEMBERSHIP_LITERAL_MIN = 5
+
+    # String ve yorum token'ları; dal ilk karakterden sonra geriye bakışla seçilir ve
+    # gövdeler "unrolled" yazıldığından büyük dosyada da tek doğrusal tarama kalır
+    _LEXICAL_RE = re.compile(
+        r"[#'\"](?:"
+        r"(?<=')''[^\\']*(?:(?:\\.|'(?!''))[^\\']*)*(?:'''|\Z)"
+        r'|(?<=")""[^\\"]*(?:(?:\\.|"(?!""))[^\\"]*)*(?:"""|\Z)'
+        r"|(?<=')[^'\\\n]*(?:\\.[^'\\\n]*)*'?"
+        r'|(?<=")[^"\\\n]*(?:\\.[^"\\\n]*)*"?'
+        r"|(?<=\#)[^\n]*)",
+        re.S,
+    )
+    # Desenler bilerek karakter sınıfıyla başlar (regex motoru adayları hızlı atlar);
+    # '(?<!\w.)' ilk harften önce kelime karakteri olmamasını denetler
+    _DECISION_RE = re.compile(
+        r"[aefiow](?<!\w.)(?:(?<=i)f|(?<=e)lif|(?<=f)or|(?<=w)hile|(?<=a)nd|(?<=o)r|(?<=e)xcept)\b"
+    )
+    _SECURITY_RE = re.compile(r"[eo](?<![\w.].)(?:(?<=e)(?:val|xec)|(?<=o)s[ \t]*\.[ \t]*system)[ \t]*\(")
+    _FSTRING_EXPR_RE = re.compile(r"(?<!\{)\{(?!\{)([^{}]*)\}")
+    _STATEMENT_RE = re.compile(r"([ \t]*)(?:async[ \t]+)?([A-Za-z_]\w*)")
+    _STAR_IMPORT_RE = re.compile(r"\bimport[ \t(]*\*")
+    _GUARD_RE = re.compile(r"\bif\b")
+    _NESTING_WORDS = frozenset({"if", "elif", "else", "for", "while", "with", "try", "except", "finally"})
+
+    @staticmethod
+    def _decisions(node: ast.AST) -> int:
+        """Düğümün cyclomatic complexity'ye kattığı karar noktası sayısı"""
+        if isinstance(node, (ast.If, ast.For, ast.AsyncFor, ast.While, ast.IfExp, ast.ExceptHandler)):
+            return 1
+        if isinstance(node, ast.BoolOp):
+            return len(node.values) - 1
+        if isinstance(node, ast.comprehension):
+            return 1 + len(node.ifs)
+        if hasattr(ast, "match_case") and isinstance(node, getattr(ast, "match_case")):
+            return 1
+        return 0
+
+    _KINDS: Optional[Dict[type, str]] = None
+
+    @classmethod
+    def _node_kinds(cls) -> Dict[type, str]:
+        """Düğüm tipi -> işlem türü; ilgisiz düğümler tek sözlük aramasıyla geçilir"""
+        if cls._KINDS is None:
+            kinds: Dict[type, str] = {ast.FunctionDef: "function", ast.AsyncFunctionDef: "function",
+                                      ast.ClassDef: "class", ast.Call: "call", ast.ImportFrom: "import_from",
+                                      ast.IfExp: "decision", ast.ExceptHandler: "decision",
+                                      ast.BoolOp: "decision", ast.comprehension: "decision"}
+            for node_type in cls.BLOCK_NODES:
+                kinds[node_type] = "block"
+            for node_type in (ast.For, ast.AsyncFor, ast.While):
+                kinds[node_type] = "loop"
+            for node_type in (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp):
+                kinds[node_type] = "comprehension"
+            kinds.update({ast.Name: "name", ast.Attribute: "attribute", ast.Assign: "assign",
+                          ast.AnnAssign: "assign", ast.AugAssign: "augassign", ast.Compare: "compare"})
+            if hasattr(ast, "match_case"):
+                kinds[getattr(ast, "match_case")] = "decision"
+            cls._KINDS = kinds
+        return cls._KINDS
+
+    @staticmethod
+    def _call_name(node: ast.Call) -> Optional[str]:
+        func = node.func
+        if isinstance(func, ast.Name):
+            return func.id
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+            return f"{func.value.id}.{func.attr}"
+        return None
+
+    @staticmethod
+    def _dotted_name(node: ast.AST) -> str:
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Attribute):
+            return f"{PythonSourceAnalyzer._dotted_name(node.value)}.{node.attr}"
+        if isinstance(node, ast.Subscript):
+            return PythonSourceAnalyzer._dotted_name(node.value) + "[...]"
+        return "..."
+
+    @staticmethod
+    def _attribute_chain(node: ast.AST) -> Optional[str]:
+        """Sadece isim ve öznitelikten oluşan zincir ('self.a.b'); değilse None"""
+        parts: List[str] = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        parts.append(node.id)
+        return ".".join(reversed(parts))
+
+    @classmethod
+    def _is_str_expr(cls, node: ast.AST) -> bool:
+        """İfadenin değeri sözdiziminden str olduğu belli mi"""
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, str)
+        if isinstance(node, ast.JoinedStr):
+            return True
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Mod)):
+            return cls._is_str_expr(node.left) or (isinstance(node.op, ast.Add) and cls._is_str_expr(node.right))
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name):
+                return func.id in ("str", "repr", "chr")
+            return isinstance(func, ast.Attribute) and cls._is_str_expr(func.value)
+        return False
+
+    @classmethod
+    def _value_kind(cls, node: Optional[ast.AST]) -> str:
+        """Atanan değerin takip edilen türü: 'str', 'list' veya bilinmiyorsa ''"""
+        if node is None:
+            return ""
+        if cls._is_str_expr(node):
+            return "str"
+        if isinstance(node, (ast.List, ast.ListComp)):
+            return "list"
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("list", "sorted"):
+            return "list"
+        return ""
+
+    @staticmethod
+    def _append_only_loop(node: ast.For) -> Optional[str]:
+        """'for x in y: [if k:] liste.append(ifade)' biçimli döngünün liste adı
+
+        Koşul ya da eklenen ifade listenin kendisine bakıyorsa (tekilleştirme,
+        önceki elemana bağlı hesap) comprehension'a çevrilemez.
+        """
+        if node.orelse or len(node.body) != 1:
+            return None
+        statement = node.body[0]
+        condition: Optional[ast.AST] = None
+        if isinstance(statement, ast.If) and not statement.orelse and len(statement.body) == 1:
+            condition, statement = statement.test, statement.body[0]
+        if not (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call)):
+            return None
+        call = statement.value
+        func = call.func
+        if not (isinstance(func, ast.Attribute) and func.attr == "append" and isinstance(func.value, ast.Name)
+                and len(call.args) == 1 and not call.keywords):
+            return None
+        name = func.value.id
+        for part in (call.args[0], condition):
+            if part is not None and any(isinstance(inner, ast.Name) and inner.id == name for inner in ast.walk(part)):
+                return None
+        return name
+
+    _SYMBOL_KINDS: Optional[Dict[type, str]] = None
+
+    @classmethod
+    def _symbol_node_kinds(cls) -> Dict[type, str]:
+        if cls._SYMBOL_KINDS is None:
+            cls._SYMBOL_KINDS = {
+                ast.Name: "name", ast.Attribute: "attribute", ast.FunctionDef: "function",
+                ast.AsyncFunctionDef: "function", ast.ClassDef: "class", ast.Import: "import",
+                ast.ImportFrom: "import", ast.Assign: "assign", ast.AnnAssign: "assign",
+            }
+        return cls._SYMBOL_KINDS
+
+    @classmethod
+    def symbols(cls, content: str) -> Tuple[List[Tuple[Any, ...]], Dict[str, List[Tuple[int, int]]]]:
+        """Sembol indeksi için tanımlar ve tanımlayıcı kullanımları (SyntaxError çağırana bırakılır)
+
+        Tanım: (isim, tür, kapsayan, satır, bitiş satırı, export, detay). Türler:
+        function, method, class, import, variable, attribute. Export: __all__
+        varsa içindekiler, yoksa modül seviyesindeki '_' ile başlamayan tanımlar.
+        """
+        tree = ast.parse(content)
+        lines = content.split("\n")
+        symbols: List[List[Any]] = []
+        refs: Dict[str, List[Tuple[int, int]]] = {}
+        public_names: Optional[set] = None
+
+        def column(line_no: int, byte_offset: int) -> int:
+            # ast sütunları UTF-8 bayt ofsetidir
+            line = lines[line_no - 1] if 0 < line_no <= len(lines) else ""
+            if line.isascii():
+                return byte_offset
+            return len(line.encode("utf-8")[:byte_offset].decode("utf-8", errors="ignore"))
+
+        def bind(name: str, line_no: int, byte_offset: int, skip: int = 0) -> None:
+            """def/class/import ile bağlanan ismin konumu; tanım satırı kullanımlarla eşleşsin"""
+            local = name.split(".")[0]
+            found = re.compile(r"\b%s\b" % re.escape(local)).search(
+                lines[line_no - 1] if 0 < line_no <= len(lines) else "", column(line_no, byte_offset) + skip
+            )
+            if found is not None:
+                refs.setdefault(local, []).append((line_no, found.start()))
+
+        def targets(node: ast.AST) -> List[ast.Name]:
+            if isinstance(node, ast.Name):
+                return [node]
+            if isinstance(node, (ast.Tuple, ast.List)):
+                return [name for element in node.elts for name in targets(element)]
+            return []
+
+        kinds = cls._symbol_node_kinds()
+        ast_node = ast.AST
+        # Kapsamlar ayrı yürünür; kapsam içindeki düğümler bağlam taşımadan yığına girer.
+        # (kök düğüm, kapsayan qualname, kapsam: module/class/function)
+        scopes: List[Tuple[ast.AST, str, str]] = [(tree, "", "module")]
+        while scopes:
+            scope_node, container, scope = scopes.pop()
+            stack: List[Any] = []
+            for field in scope_node._fields:
+                value = getattr(scope_node, field, None)
+                if isinstance(value, ast_node):
+                    stack.append(value)
+                elif type(value) is list and value and isinstance(value[0], ast_node):
+                    stack.extend(value)
+            while stack:
+                node = stack.pop()
+                kind = kinds.get(type(node))
+                if kind is None:
+                    pass
+                elif kind == "name":
+                    refs.setdefault(node.id, []).append((node.lineno, column(node.lineno, node.col_offset)))
+                    continue
+                elif kind == "attribute":
+                    end_line = getattr(node, "end_lineno", None) or node.lineno
+                    end_col = getattr(node, "end_col_offset", None)
+                    col = end_col - len(node.attr) if end_col is not None else node.col_offset
+                    refs.setdefault(node.attr, []).append((end_line, column(end_line, col)))
+                elif kind == "function":
+                    arguments = node.args
+                    names = [arg.arg for arg in arguments.posonlyargs + arguments.args]
+                    if arguments.vararg:
+                        names.append("*" + arguments.vararg.arg)
+                    elif arguments.kwonlyargs:
+                        names.append("*")
+                    names.extend(arg.arg for arg in arguments.kwonlyargs)
+                    if arguments.kwarg:
+                        names.append("**" + arguments.kwarg.arg)
+                    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+                    bind(node.name, node.lineno, node.col_offset, len(prefix))
+                    symbols.append([node.name, "method" if scope == "class" else "function", container, node.lineno,
+                                    getattr(node, "end_lineno", node.lineno), False,
+                                    f"{prefix} {node.name}({', '.join(names)})"])
+                    scopes.append((node, f"{container}.{node.name}" if container else node.name, "function"))
+                    continue
+                elif kind == "class":
+                    bases = ", ".join(cls._dotted_name(base) for base in node.bases)
+                    bind(node.name, node.lineno, node.col_offset, len("class"))
+                    symbols.append([node.name, "class", container, node.lineno,
+                                    getattr(node, "end_lineno", node.lineno), False,
+                                    f"class {node.name}({bases})" if bases else f"class {node.name}"])
+                    scopes.append((node, f"{container}.{node.name}" if container else node.name, "class"))
+                    continue
+                elif kind == "import":
+                    if isinstance(node, ast.Import):
+                        for alias in node.names:
+                            local = alias.asname or alias.name.split(".")[0]
+                            symbols.append([local, "import", container, node.lineno, node.lineno, False, alias.name])
+                            if hasattr(alias, "col_offset"):  # alias konumu Python 3.10+
+                                bind(local, alias.lineno, alias.col_offset, len(alias.name) if alias.asname else 0)
+                    else:
+                        module = "." * node.level + (node.module or "")
+                        for alias in node.names:
+                            if alias.name != "*":
+                                symbols.append([alias.asname or alias.name, "import", container, node.lineno,
+                                                node.lineno, False,
+                                                f"{module}.{alias.name}" if node.module else module + alias.name])
+                                if hasattr(alias, "col_offset"):
+                                    bind(alias.asname or alias.name, alias.lineno, alias.col_offset,
+                                         len(alias.name) if alias.asname else 0)
+                    continue
+                elif kind == "assign" and scope != "function":
+                    assigned = node.targets if isinstance(node, ast.Assign) else [node.target]
+                    for target in assigned:
+                        for name in targets(target):
+                            if scope == "module" and name.id == "__all__" \
+                                    and isinstance(node.value, (ast.List, ast.Tuple)):
+                                public_names = {element.value for element in node.value.elts
+                                                if isinstance(element, ast.Constant) and isinstance(element.value, str)}
+                            symbols.append([name.id, "variable" if scope == "module" else "attribute", container,
+                                            node.lineno, getattr(node, "end_lineno", node.lineno), False,
+                                            "" if scope == "module" else container])
+
+                # ast.iter_child_nodes'un satır içi hali; sıcak döngü
+                for field in node._fields:
+                    value = getattr(node, field, None)
+                    if isinstance(value, ast_node):
+                        stack.append(value)
+                    elif type(value) is list and value and isinstance(value[0], ast_node):
+                        stack.extend(value)
+        for symbol in symbols:
+            name, kind, container = symbol[0], symbol[1], symbol[2]
+            if public_names is not None:
+                symbol[5] = container == "" and name in public_names
+            else:
+                symbol[5] = container == "" and not name.startswith("_") and kind != "import"
+        symbols.sort(key=lambda symbol: int(symbol[3]))
+        for positions in refs.values():
+            positions.sort()
+        return [tuple(symbol) for symbol in symbols], refs
+
+    @classmethod
+    def _strip_source(cls, content: str) -> Tuple[str, int]:
+        """Stringleri boşalt, yorumları at: (kod, yorum satırı sayısı); satır numaraları korunur
+
+        f-string'lerin {ifade} kısımları koda kalır; içlerindeki karar noktaları sayılsın.
+        """
+        pieces: List[str] = []
+        comment_lines = 0
+        position = 0
+        for match in cls._LEXICAL_RE.finditer(content):
+            start, end = match.span()
+            pieces.append(content[position:start])
+            position = end
+            if content[start] == "#":
+                comment_lines += 1
+                continue
+            expressions = ""
+            prefix = content[max(0, start - 2):start]
+            if prefix[-1:] in ("f", "F") or (prefix[-1:] in ("r", "R") and prefix[:1] in ("f", "F")):
+                expressions = "".join(
+                    f"({expression})" for expression in cls._FSTRING_EXPR_RE.findall(content, start, end)
+                ).replace("\n", " ")
+            pieces.append('""' + expressions + "\n" * content.count("\n", start, end))
+        pieces.append(content[position:])
+        return "".join(pieces), comment_lines
+
+    @classmethod
+    def lexical_metrics(cls, content: str) -> Dict[str, Any]:
+        """ast kurmadan dosya metrikleri: yorum, karar noktası, derinlik, fonksiyon/class, güvenlik
+
+        Karar noktaları ast geçişindekiyle aynı anahtar kelimelerden sayılır; soft
+        keyword 'case' yalnızca ':' ile biten deyim başında sayılır.
+        """
+        code, comment_lines = cls._strip_source(content)
+        complexity_score = len(cls._DECISION_RE.findall(code))
+        security: List[Dict[str, Any]] = []
+        for match in cls._SECURITY_RE.finditer(code):
+            call = match.group()
+            name = "os.system" if call.startswith("o") else call[:4]
+            security.append({"call": name, "line": code.count("\n", 0, match.start()) + 1})
+
+        # Yalnızca mantıksal satır başları incelenir: parantez içi ve '\' devamı satırları atlanır
+        function_count = class_count = loop_count = max_nesting = 0
+        star_imports: List[int] = []
+        blocks: List[Tuple[int, int]] = []  # (girinti, gövdenin blok derinliği)
+        open_brackets = 0
+        continued = False
+        for line_no, line in enumerate(code.split("\n"), start=1):
+            if open_brackets <= 0 and not continued:
+                statement = cls._STATEMENT_RE.match(line)
+                if statement is not None:
+                    indent = len(statement.group(1))
+                    word = statement.group(2)
+                    while blocks and blocks[-1][0] >= indent:
+                        blocks.pop()
+                    depth = blocks[-1][1] if blocks else 0
+                    if word in cls._NESTING_WORDS or (word == "match" and line.rstrip().endswith(":")):
+                        if word in ("for", "while"):
+                            loop_count += 1
+                        blocks.append((indent, depth + 1))
+                        max_nesting = max(max_nesting, depth + 1)
+                    elif word == "def":
+                        function_count += 1
+                        blocks.append((indent, 0))  # fonksiyon gövdesi derinliği sıfırlar
+                    elif word == "class":
+                        class_count += 1
+                        blocks.append((indent, depth))
+                    elif word == "case" and line.rstrip().endswith(":"):
+                        # ast guard'ın 'if'ini karar saymaz (yalnızca içindeki and/or'u)
+                        complexity_score += 0 if cls._GUARD_RE.search(line) else 1
+                        blocks.append((indent, depth))
+                    elif word == "from" and cls._STAR_IMPORT_RE.search(line):
+                        star_imports.append(line_no)
+            if "(" in line or "[" in line or "{" in line or ")" in line or "]" in line or "}" in line:
+                open_brackets += (line.count("(") + line.count("[") + line.count("{")
+                                  - line.count(")") - line.count("]") - line.count("}"))
+            continued = line.endswith("\\")
+
+        lines = content.split("\n")
+        non_empty_lines = sum(1 for line in lines if line.strip())
+        return {
+            "total_lines": len(lines),
+            "non_empty_lines": non_empty_lines,
+            "comment_lines": comment_lines,
+            "function_count": function_count,
+            "class_count": class_count,
+            "complexity_score": complexity_score,
+            "comment_ratio": (comment_lines / non_empty_lines * 100) if non_empty_lines > 0 else 0,
+            "avg_line_length": sum(len(line) for line in lines) / len(lines) if lines else 0,
+            "max_nesting_depth": max_nesting,
+            "loop_count": loop_count,
+            "security": security,
+            "star_imports": star_imports,
+        }
+
+    @classmethod
+    def analyze(cls, content: str) -> Dict[str, Any]:
+        """SyntaxError çağırana bırakılır"""
+        tree = ast.parse(content)
+        lines = content.split("\n")
+
+        functions: List[Dict[str, Any]] = []
+        security: List[Dict[str, Any]] = []
+        performance: List[Dict[str, Any]] = []
+        star_imports: List[int] = []
+        class_count = 0
+        loop_count = 0
+        complexity_score = 0
+        max_nesting = 0
+        # Döngü kaydı: line, level (iç içelik), parent, stores (döngüde yazılan isim ve
+        # zincirler), attrs (zincir -> satırlar). Fonksiyon ve class gövdesi bağlamı sıfırlar.
+        loops: List[Dict[str, Any]] = []
+        # Kapsam (fonksiyon kaydının id'si, modül için 0) -> isim -> 'str' | 'list' | ''
+        value_kinds: Dict[int, Dict[str, str]] = {0: {}}
+
+        reported: set = set()
+
+        def report(code: str, line: int, message: str, key: Optional[Tuple[Any, ...]] = None) -> None:
+            # key verilirse aynı döngüdeki aynı hedef için tek bulgu yazılır
+            if key is not None:
+                if key in reported:
+                    return
+                reported.add(key)
+            performance.append({"code": code, "message": message, "line": line})
+
+        def tracked_kind(function: Optional[Dict[str, Any]], name: str) -> str:
+            scope = value_kinds.get(id(function)) if function is not None else None
+            if scope is not None and name in scope:
+                return scope[name]
+            return value_kinds[0].get(name, "")
+
+        def mark_store(loop: Optional[Dict[str, Any]], name: str) -> None:
+            # Dış döngüler için de turdan tura değişen isimdir
+            while loop is not None:
+                loop["stores"].add(name)
+                loop = loop["parent"]
+
+        kinds = cls._node_kinds()
+        iter_fields = ast.iter_fields
+        ast_node, ast_list = ast.AST, list
+        # (düğüm, içindeki fonksiyon kaydı, fonksiyona göre blok derinliği, qualname öneki, döngü kaydı)
+        stack: List[Tuple[ast.AST, Optional[Dict[str, Any]], int, str, Optional[Dict[str, Any]]]] = [
+            (tree, None, 0, "", None)
+        ]
+        while stack:
+            node, function, depth, prefix, loop = stack.pop()
+            child_function, child_depth, child_prefix, child_loop = function, depth, prefix, loop
+            kind = kinds.get(type(node))
+
+            if kind is not None:
+                if kind == "name":
+                    if loop is not None and not isinstance(cast(ast.Name, node).ctx, ast.Load):
+                        mark_store(loop, cast(ast.Name, node).id)
+                    continue
+
+                if kind in ("block", "loop", "decision"):
+                    decisions = cls._decisions(node)
+                    if decisions:
+                        complexity_score += decisions
+                        if function is not None:
+                            function["complexity"] += decisions
+
+                if kind == "function":
+                    func_node = cast(Any, node)
+                    child_function = {
+                        "name": func_node.name,
+                        "qualname": prefix + func_node.name,
+                        "line": func_node.lineno,
+                        "end_line": getattr(func_node, "end_lineno", func_node.lineno),
+                        "is_async": isinstance(node, ast.AsyncFunctionDef),
+                        "complexity": 1,
+                        "max_nesting": 0,
+                    }
+                    functions.append(child_function)
+                    child_depth = 0
+                    child_prefix = f"{prefix}{func_node.name}.<locals>."
+                    child_loop = None
+                    arguments = func_node.args
+                    parameters = arguments.posonlyargs + arguments.args + arguments.kwonlyargs
+                    parameters += [arg for arg in (arguments.vararg, arguments.kwarg) if arg is not None]
+                    # Parametreler modül seviyesindeki aynı isimli değerleri gölgeler
+                    value_kinds[id(child_function)] = {arg.arg: "" for arg in parameters}
+                elif kind == "class":
+                    class_count += 1
+                    child_prefix = f"{prefix}{cast(ast.ClassDef, node).name}."
+                    child_loop = None
+                elif kind in ("block", "loop"):
+                    child_depth = depth + 1
+                    if kind == "loop":
+                        loop_count += 1
+                    max_nesting = max(max_nesting, child_depth)
+                    if function is not None:
+                        function["max_nesting"] = max(function["max_nesting"], child_depth)
+                elif kind == "call":
+                    call_node = cast(ast.Call, node)
+                    name = cls._call_name(call_node)
+                    if name in cls.SECURITY_CALLS:
+                        security.append({"call": name, "line": call_node.lineno})
+                    if loop is not None:
+                        chain = cls._attribute_chain(call_node.func)
+                        category = cls.LOOP_IO_CALLS.get(chain) if chain is not None else None
+                        if category is not None:
+                            report("io-call-in-loop", call_node.lineno,
+                                   f"Döngü içinde {chain}() - her turda ayrı {category} gidiş-dönüşü (N+1); "
+                                   f"toplu çağrı veya paralel çalıştırma düşünün")
+                elif kind == "attribute":
+                    if loop is not None:
+                        attr_node = cast(ast.Attribute, node)
+                        chain = cls._attribute_chain(attr_node)
+                        if chain is not None:
+                            if not isinstance(attr_node.ctx, ast.Load):
+                                mark_store(loop, chain)
+                            elif chain.count(".") >= 2:
+                                loop["attrs"].setdefault(chain, []).append(attr_node.lineno)
+                            # Saf zincirin alt düğümleri yalnızca isim/öznitelik okumasıdır
+                            continue
+                elif kind == "assign":
+                    assign_node = cast(Any, node)
+                    targets = assign_node.targets if isinstance(node, ast.Assign) else [assign_node.target]
+                    value = assign_node.value
+                    scope = value_kinds[id(function)] if function is not None else value_kinds[0]
+                    for target in targets:
+                        if not isinstance(target, ast.Name):
+                            continue
+                        value_kind = cls._value_kind(value)
+                        if (isinstance(value, ast.BinOp) and isinstance(value.op, ast.Add)
+                                and isinstance(value.left, ast.Name) and value.left.id == target.id
+                                and (tracked_kind(function, target.id) == "str" or cls._is_str_expr(value.right))):
+                            value_kind = "str"
+                            if loop is not None:
+                                report("string-concat-in-loop", assign_node.lineno,
+                                       f"Döngü içinde string birleştirme ({target.id} = {target.id} + ...) - "
+                                       f"parçaları listede toplayıp ''.join() kullanın",
+                                       key=("concat", id(loop), target.id))
+                        scope[target.id] = value_kind
+                elif kind == "augassign":
+                    aug_node = cast(ast.AugAssign, node)
+                    if loop is not None and isinstance(aug_node.op, ast.Add):
+                        target_node = aug_node.target
+                        name = target_node.id if isinstance(target_node, ast.Name) else cls._attribute_chain(target_node)
+                        tracked = tracked_kind(function, name) if isinstance(target_node, ast.Name) else ""
+                        if name is not None and tracked != "list" and (
+                                tracked == "str" or cls._is_str_expr(aug_node.value)):
+                            report("string-concat-in-loop", aug_node.lineno,
+                                   f"Döngü içinde string birleştirme ({name} += ...) - "
+                                   f"parçaları listede toplayıp ''.join() kullanın",
+                                   key=("concat", id(loop), name))
+                elif kind == "compare":
+                    if loop is not None:
+                        compare_node = cast(ast.Compare, node)
+                        for operator, comparator in zip(compare_node.ops, compare_node.comparators):
+                            if not isinstance(operator, (ast.In, ast.NotIn)):
+                                continue
+                            keyword_text = "not in" if isinstance(operator, ast.NotIn) else "in"
+                            if isinstance(comparator, ast.Name) and tracked_kind(function, comparator.id) == "list":
+                                report("membership-in-list", compare_node.lineno,
+                                       f"Döngü içinde listede üyelik testi ({keyword_text} {comparator.id}) - "
+                                       f"her kontrol O(n); set kullanın")
+                            elif cls._value_kind(comparator) == "list" and not (
+                                    isinstance(comparator, ast.List)
+                                    and len(comparator.elts) < cls.MEMBERSHIP_LITERAL_MIN):
+                                rebuilt = not isinstance(comparator, ast.List)
+                                report("membership-in-list", compare_node.lineno,
+                                       f"Döngü içinde {'her turda yeniden kurulan ' if rebuilt else ''}listede "
+                                       f"üyelik testi ({keyword_text} [...]) - "
+                                       f"{'döngüden önce set olarak kurun' if rebuilt else 'set literal kullanın'}")
+                elif kind == "import_from":
+                    import_node = cast(ast.ImportFrom, node)
+                    if any(alias.name == "*" for alias in import_node.names):
+                        star_imports.append(import_node.lineno)
+
+                if kind == "block" and isinstance(node, ast.If) and len(node.orelse) == 1:
+                    nested = node.orelse[0]
+                    if isinstance(nested, ast.If) and nested.col_offset == node.col_offset and nested.lineno > node.lineno:
+                        # elif zinciri iç içe If olarak gelir; derinlik artmamalı
+                        stack.append((nested, function, depth, prefix, loop))
+                        children = [child for child in ast.iter_child_nodes(node) if child is not nested]
+                        for child in reversed(children):
+                            stack.append((child, child_function, child_depth, child_prefix, child_loop))
+                        continue
+
+                if kind in ("loop", "comprehension"):
+                    child_loop = {"line": cast(Any, node).lineno, "level": loop["level"] + 1 if loop is not None else 1,
+                                  "parent": loop, "stores": set(), "attrs": {}}
+                    loops.append(child_loop)
+                    # iter ve else bir kez değerlendirilir; hedef, koşul ve gövde her turda
+                    scoped: List[Tuple[ast.AST, Optional[Dict[str, Any]]]] = []
+                    if kind == "loop":
+                        if isinstance(node, ast.For):
+                            list_name = cls._append_only_loop(node)
+                            if list_name is not None:
+                                report("append-loop", node.lineno,
+                                       f"{list_name}.append döngüsü list comprehension "
+                                       f"(veya {list_name}.extend) ile yazılabilir")
+                        for field, value in iter_fields(node):
+                            field_loop = loop if field in ("iter", "orelse") else child_loop
+                            if isinstance(value, ast_node):
+                                scoped.append((value, field_loop))
+                            elif isinstance(value, ast_list):
+                                scoped.extend((item, field_loop) for item in value if isinstance(item, ast_node))
+                    else:
+                        # comprehension düğümleri ayrıca ziyaret edilmez; karar noktaları burada sayılır
+                        comp_node = cast(Any, node)
+                        if isinstance(node, ast.DictComp):
+                            scoped.extend(((comp_node.key, child_loop), (comp_node.value, child_loop)))
+                        else:
+                            scoped.append((comp_node.elt, child_loop))
+                        for index, generator in enumerate(comp_node.generators):
+                            decisions = cls._decisions(generator)
+                            complexity_score += decisions
+                            if function is not None:
+                                function["complexity"] += decisions
+                            scoped.append((generator.target, child_loop))
+                            scoped.append((generator.iter, loop if index == 0 else child_loop))
+                            scoped.extend((condition, child_loop) for condition in generator.ifs)
+                    for child, field_loop in reversed(scoped):
+                        stack.append((child, child_function, child_depth, child_prefix, field_loop))
+                    continue
+
+            # ast.iter_child_nodes'un satır içi hali; sıcak döngü
+            pending: List[ast.AST] = []
+            for _, value in iter_fields(node):
+                if isinstance(value, ast_node):
+                    pending.append(value)
+                elif isinstance(value, ast_list):
+                    pending.extend(item for item in value if isinstance(item, ast_node))
+            for child in reversed(pending):
+                stack.append((child, child_function, child_depth, child_prefix, child_loop))
+
+        for record in loops:
+            threshold = cls.ATTRIBUTE_REPEAT_THRESHOLD if record["level"] == 1 else 2
+            stores = record["stores"]
+            for chain, chain_lines in record["attrs"].items():
+                if len(chain_lines) < threshold:
+                    continue
+                parts = chain.split(".")
+                if any(".".join(parts[:size]) in stores for size in range(1, len(parts) + 1)):
+                    continue
+                report("attribute-in-loop", chain_lines[0],
+                       f"{chain} satır {record['line']} döngüsünde {len(chain_lines)} kez çözümleniyor - "
+                       f"döngüden önce yerel değişkene alın")
+
+        # Yorumlar lexical_metrics ile aynı string/yorum taramasından sayılır
+        _, comment_lines = cls._strip_source(content)
+        non_empty_lines = sum(1 for line in lines if line.strip())
+        functions.sort(key=lambda item: int(item["line"]))
+        security.sort(key=lambda item: int(item["line"]))
+        performance.sort(key=lambda item: int(item["line"]))
+        return {
+            "total_lines": len(lines),
+            "non_empty_lines": non_empty_lines,
+            "comment_lines": comment_lines,
+            "function_count": len(functions),
+            "class_count": class_count,
+            "complexity_score": complexity_score,
+            "comment_ratio": (comment_lines / non_empty_lines * 100) if non_empty_lines > 0 else 0,
+            "avg_line_length": sum(len(line) for line in lines) / len(lines) if lines else 0,
+            "max_nesting_depth": max_nesting,
+            "loop_count": loop_count,
+            "functions": functions,
+            "security": security,
+            "performance": performance,
+            "star_imports": star_imports,
+        }
+
+
+class AnalysisResultCache:
+    """İçerik özetine göre anahtarlanan kalıcı analiz sonucu cache'i (SQLite, WAL)
+
+    Sunucu yeniden başlatmaları ve aynı anda çalışan sunucu/işçi süreçleri
+    arasında paylaşılır. Toplam boyut max_bytes'ı aşınca en eski erişilen
+    kayıtlar silinir.
+    """
+
+    # Analiz çıktısı değiştiğinde artırılır; eski kayıtlar kendiliğinden geçersizleşir
+    ANALYZER_VERSION = 5
+    _EVICT_CHECK_INTERVAL = 64
+    _TOUCH_INTERVAL = 60.0
+    _shared: Optional["AnalysisResultCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str, max_bytes: int = 128 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def shared(cls) -> "AnalysisResultCache":
+        """Süreç başına tek örnek; işçi süreçler de aynı dosyayı kullanır"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    os.environ.get("KAYRADENIZ_ANALYSIS_CACHE")
+                    or os.path.join(os.path.expanduser("~"), ".kayradeniz", "analysis-cache.sqlite"),
+                    max_bytes=int(float(os.environ.get("KAYRADENIZ_ANALYSIS_CACHE_MAX_MB", "128")) * 1024 * 1024),
+                )
+            return cls._shared
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            # Autocommit: açık kalan örtük okuma işlemi diğer süreçlerin yazmasını kilitlemesin
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, value TEXT, size INTEGER, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed)")
+            self._conn = conn
+        return self._conn
+
+    @classmethod
+    def make_key(cls, content: str, kind: str) -> str:
+        digest = hashlib.sha256()
+        # ast çıktısı Python sürümüne göre değişebilir
+        digest.update(f"{cls.ANALYZER_VERSION}\0{sys.version_info[0]}.{sys.version_info[1]}\0{kind}\0".encode("utf-8"))
+        digest.update(content.encode("utf-8", errors="surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            try:
+                db = self._db()
+                row = db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                now = time.time()
+                # Her isabette yazmamak için erişim zamanı seyrek güncellenir
+                db.execute(
+                    "UPDATE results SET accessed = ? WHERE key = ? AND accessed < ?",
+                    (now, key, now - self._TOUCH_INTERVAL),
+                )
+            except sqlite3.Error:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return cast(Dict[str, Any], json.loads(row[0]))
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            try:
+                db = self._db()
+                db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (key, payload, len(payload), time.time()),
+                )
+                self._puts += 1
+                if (self._puts - 1) % self._EVICT_CHECK_INTERVAL == 0:
+                    self._evict(db)
+            except sqlite3.Error:
+                # Cache yazılamazsa (kilit, disk) analiz yine de döner
+                pass
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        total = int(db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        # Her seferinde sınırın biraz altına inilir; sık tetiklenmesin
+        target = int(self.max_bytes * 0.9)
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for key, size in db.execute("SELECT key, size FROM results ORDER BY accessed").fetchall():
+                db.execute("DELETE FROM results WHERE key = ?", (key,))
+                total -= int(size)
+                if total <= target:
+                    break
+            db.execute("COMMIT")
+        except sqlite3.Error:
+            db.execute("ROLLBACK")
+            raise
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, stored = self._db().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "entries": int(entries),
+                "stored_bytes": int(stored),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+class CodeFingerprinter:
+    """Normalize edilmiş token akışından winnowing parmak izleri (kopya kod tespiti)
+
+    Tanımlayıcılar 'V', stringler 'S', sayılar 'N' olur; anahtar kelimeler ve
+    noktalama korunur, yorumlar ve import satırları atılır. Böylece isimleri
+    değiştirilmiş kopyalar da eşleşir. Her K tokenlık pencerenin rolling hash'i
+    alınır; W ardışık hash içinden en küçüğü seçilir. K + W - 1 tokendan uzun
+    her ortak parça en az bir ortak parmak izi üretir.
+    """
+
+    K = 12
+    W = 12
+    _MOD = (1 << 61) - 1
+    _BASE = 1000003
+    _PYTHON_TOKEN_RE = re.compile(
+        r'(?P<newline>\n)'
+        r'|(?P<ws>[ \t\r\f\\]+)'
+        r'|(?P<comment>#[^\n]*)'
+        r'|(?P<string>[rRbBuUfF]{0,2}(?:"""(?:[^\\]|\\.)*?(?:"""|\Z)|\'\'\'(?:[^\\]|\\.)*?(?:\'\'\'|\Z)'
+        r'|"(?:[^"\\\n]|\\.)*"?|\'(?:[^\'\\\n]|\\.)*\'?))'
+        r'|(?P<ident>[^\W\d]\w*)'
+        r'|(?P<number>\.?\d(?:[\w.]|(?<=[eE])[+-])*)'
+        r'|(?P<punct>\*\*=?|//=?|>>=?|<<=?|->|:=|[-+*/%&|^@!=<>]=|\S)',
+        re.DOTALL,
+    )
+    _PYTHON_KEYWORDS = frozenset(keyword.kwlist) | frozenset({"self", "cls", "print", "len", "range"})
+    _NORMALIZED = {"string": "S", "template": "S", "regex": "R", "number": "N"}
+
+    @classmethod
+    def normalized_tokens(cls, content: str, language: str) -> List[Tuple[str, int]]:
+        """(normalize token, satır) listesi"""
+        tokens: List[Tuple[str, int]] = []
+        normalized = cls._NORMALIZED
+        if language == "Python":
+            keywords = cls._PYTHON_KEYWORDS
+            line = 1
+            line_start = True
+            skip_line = False
+            for match in cls._PYTHON_TOKEN_RE.finditer(content):
+                kind = cast(str, match.lastgroup)
+                if kind == "newline":
+                    line += 1
+                    line_start, skip_line = True, False
+                    continue
+                if kind in ("ws", "comment"):
+                    continue
+                text = match.group()
+                if line_start:
+                    skip_line = text in ("import", "from")
+                    line_start = False
+                if not skip_line:
+                    if kind == "ident":
+                        tokens.append((text if text in keywords else "V", line))
+                    else:
+                        tokens.append((normalized.get(kind, text), line))
+                if kind == "string":
+                    line += text.count("\n")
+            return tokens
+
+        keywords = CFamilyLexer._RESERVED_WORDS
+        skip_line = 0
+        for kind, start, end, line in CFamilyLexer.tokenize(content, language):
+            if kind in ("ws", "newline", "comment"):
+                continue
+            text = content[start:end]
+            if text == "import" and (not tokens or tokens[-1][1] != line):
+                skip_line = line
+            if line == skip_line:
+                continue
+            if kind == "ident":
+                tokens.append((text if text in keywords else "V", line))
+            else:
+                tokens.append((normalized.get(kind, text), line))
+        return tokens
+
+    @classmethod
+    def fingerprints(cls, content: str, language: str) -> List[Tuple[int, int, int]]:
+        """Seçilen (hash, başlangıç satırı, bitiş satırı) parmak izleri"""
+        tokens = cls.normalized_tokens(content, language)
+        k, window, mod, base = cls.K, cls.W, cls._MOD, cls._BASE
+        if len(tokens) < k:
+            return []
+        token_hashes: Dict[str, int] = {}
+        values: List[int] = []
+        for text, _ in tokens:
+            value = token_hashes.get(text)
+            if value is None:
+                # Süreçler arası sabit olmalı; str hash'i rastgele tohumludur
+                value = token_hashes[text] = zlib.crc32(text.encode("utf-8")) + 1
+            values.append(value)
+
+        high = pow(base, k - 1, mod)
+        grams: List[int] = []
+        rolling = 0
+        for position, value in enumerate(values):
+            if position >= k:
+                rolling = (rolling - values[position - k] * high) % mod
+            rolling = (rolling * base + value) % mod
+            if position >= k - 1:
+                grams.append(rolling)
+
+        # Winnowing: her pencerede en küçük (eşitlikte en sağdaki) hash; ardışık tekrarlar bir kez
+        selected: List[int] = []
+        candidates: Deque[int] = deque()
+        for position, value in enumerate(grams):
+            while candidates and grams[candidates[-1]] >= value:
+                candidates.pop()
+            candidates.append(position)
+            if candidates[0] <= position - window:
+                candidates.popleft()
+            if position >= window - 1 or position == len(grams) - 1:
+                chosen = candidates[0]
+                if not selected or selected[-1] != chosen:
+                    selected.append(chosen)
+        return [(grams[start], tokens[start][1], tokens[start + k - 1][1]) for start in selected]
+
+    @staticmethod
+    def clone_groups(occurrences: Iterable[Tuple[int, str, int, int]], min_lines: int = 6,
+                     gap: int = 3) -> List[Dict[str, Any]]:
+        """hash'e göre sıralı (hash, yol, başlangıç, bitiş) kayıtlarından kopya grupları
+
+        Aynı hash'i paylaşan parçalar eşlenir; dosya çifti başına birbirine yakın
+        eşleşmeler birleştirilerek bölgeye çevrilir, bölgeler birbirine değen
+        parçalar üzerinden union-find ile gruplanır.
+        """
+        pairs: Dict[Tuple[str, str], List[Tuple[int, int, int, int]]] = {}
+
+        def add_pairs(group: List[Tuple[str, int, int]]) -> None:
+            # Yıldız eşleme: her parça ilk parçaya bağlanır; gruplar union-find ile
+            # yine birleşir, çift sayısı tekrar sayısıyla doğrusal kalır
+            group.sort()
+            path_a, start_a, end_a = group[0]
+            for path_b, start_b, end_b in group[1:]:
+                if path_a == path_b and start_b <= end_a:
+                    continue  # Aynı dosyada çakışan pencereler kopya değil
+                pairs.setdefault((path_a, path_b), []).append((start_a, end_a, start_b, end_b))
+
+        current_hash: Optional[int] = None
+        group: List[Tuple[str, int, int]] = []
+        for fingerprint, path, start, end in occurrences:
+            if fingerprint != current_hash:
+                if len(group) > 1:
+                    add_pairs(group)
+                current_hash, group = fingerprint, []
+            group.append((path, start, end))
+        if len(group) > 1:
+            add_pairs(group)
+
+        # Bölgeler: (yol_a, baş_a, bit_a, yol_b, baş_b, bit_b, eşleşme sayısı)
+        regions: List[Tuple[str, int, int, str, int, int, int]] = []
+        for (path_a, path_b), matches in pairs.items():
+            matches.sort()
+            region: Optional[List[int]] = None
+            for start_a, end_a, start_b, end_b in matches:
+                if region is not None and start_a <= region[1] + gap and region[2] - gap <= start_b <= region[3] + gap:
+                    region[1] = max(region[1], end_a)
+                    region[3] = max(region[3], end_b)
+                    region[4] += 1
+                    continue
+                if region is not None:
+                    regions.append((path_a, region[0], region[1], path_b, region[2], region[3], region[4]))
+                region = [start_a, end_a, start_b, end_b, 1]
+            if region is not None:
+                regions.append((path_a, region[0], region[1], path_b, region[2], region[3], region[4]))
+        regions = [region for region in regions
+                   if min(region[2] - region[1], region[5] - region[4]) + 1 >= min_lines]
+
+        # Aynı dosyada çakışan parçalar tek düğüm olur
+        spans: Dict[str, List[List[int]]] = {}
+        for path_a, start_a, end_a, path_b, start_b, end_b, _ in regions:
+            spans.setdefault(path_a, []).append([start_a, end_a])
+            spans.setdefault(path_b, []).append([start_b, end_b])
+        nodes: Dict[str, List[List[int]]] = {}
+        for path, intervals in spans.items():
+            intervals.sort()
+            merged: List[List[int]] = []
+            for start, end in intervals:
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            nodes[path] = merged
+
+        def node_of(path: str, line: int) -> Tuple[str, int]:
+            intervals = nodes[path]
+            low, high = 0, len(intervals) - 1
+            while low < high:
+                middle = (low + high + 1) // 2
+                if intervals[middle][0] <= line:
+                    low = middle
+                else:
+                    high = middle - 1
+            return path, low
+
+        parent: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+        def find(node: Tuple[str, int]) -> Tuple[str, int]:
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        matches_by_node: Dict[Tuple[str, int], int] = {}
+        for path_a, start_a, _, path_b, start_b, _, count in regions:
+            node_a, node_b = node_of(path_a, start_a), node_of(path_b, start_b)
+            parent[find(node_a)] = find(node_b)
+            matches_by_node[node_a] = matches_by_node.get(node_a, 0) + count
+
+        components: Dict[Tuple[str, int], List[Tuple[str, int]]] = {}
+        for node in parent:
+            components.setdefault(find(node), []).append(node)
+        groups: List[Dict[str, Any]] = []
+        for members in components.values():
+            if len(members) < 2:
+                continue
+            instances = [
+                {"path": path, "start_line": nodes[path][slot][0], "end_line": nodes[path][slot][1]}
+                for path, slot in sorted(members)
+            ]
+            lines = max(instance["end_line"] - instance["start_line"] + 1 for instance in instances)
+            groups.append({
+                "lines": lines,
+                "instances": instances,
+                "matches": sum(matches_by_node.get(member, 0) for member in members),
+            })
+        # Toplam kopyalanmış satıra göre: uzun ve çok tekrarlanan önce
+        groups.sort(key=lambda group: (group["lines"] * (len(group["instances"]) - 1), group["lines"]), reverse=True)
+        return groups
+
+
+class WorkspaceIndex:
+    """Çalışma alanı sembol indeksi (SQLite, WAL) - kök dizin başına bir dosya
+
+    Python ve JS/TS dosyalarındaki tanımları (fonksiyon, class, metot, import,
+    export), tanımlayıcı kullanımlarını ve kopya kod parmak izlerini tutar.
+    Dosyalar mtime/boyut değişince okunur; içerik özeti de değişmişse yalnızca
+    o dosyanın kayıtları yenilenir.
+    """
+
+    # Çıkarım çıktısı değiştiğinde artırılır; indeks baştan kurulur
+    INDEX_VERSION = 3
+    _TABLES = ("files", "symbols", "refs", "fingerprints")
+    LANGUAGES = ("Python", "JavaScript", "TypeScript")
+
+    def __init__(self, root: str, path: str):
+        self.root = root
+        self.path = path
+        self.refreshed_at = 0.0
+        self.lock = threading.Lock()
+        self._dirty: set = set()
+        self._dirty_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def default_path(cls, root: str) -> str:
+        base = os.environ.get("KAYRADENIZ_INDEX_DIR") or os.path.join(os.path.expanduser("~"), ".kayradeniz", "index")
+        digest = hashlib.sha1(os.path.normcase(root).encode("utf-8", errors="surrogatepass")).hexdigest()[:16]
+        return os.path.join(base, f"{os.path.basename(root) or 'root'}-{digest}.sqlite")
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or row[0] != str(self.INDEX_VERSION):
+                for table in self._TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(self.INDEX_VERSION),))
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha TEXT, language TEXT, error TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS symbols ("
+                " path TEXT, name TEXT, kind TEXT, container TEXT, line INTEGER, end_line INTEGER,"
+                " exported INTEGER, detail TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS symbols_name ON symbols(name)")
+            conn.execute("CREATE INDEX IF NOT EXISTS symbols_path ON symbols(path)")
+            # Dosya başına isim başına tek satır; konumlar "satır:sütun,..." olarak sıkıştırılır
+            conn.execute("CREATE TABLE IF NOT EXISTS refs (name TEXT, path TEXT, positions TEXT)")
+            conn.execute("CREATE INDEX IF NOT EXISTS refs_name ON refs(name)")
+            conn.execute("CREATE INDEX IF NOT EXISTS refs_path ON refs(path)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints (hash INTEGER, path TEXT, start_line INTEGER, end_line INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS fingerprints_hash ON fingerprints(hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS fingerprints_path ON fingerprints(path)")
+            self._conn = conn
+        return self._conn
+
+    @classmethod
+    def extract(cls, content: str, language: str) -> Tuple[List[Tuple[Any, ...]], Dict[str, List[Tuple[int, int]]]]:
+        if language == "Python":
+            return PythonSourceAnalyzer.symbols(content)
+        return CFamilyLexer.symbols(content, language)
+
+    def mark_dirty(self, path: str) -> None:
+        with self._dirty_lock:
+            self._dirty.add(path)
+
+    def take_dirty(self) -> List[str]:
+        with self._dirty_lock:
+            dirty, self._dirty = sorted(self._dirty), set()
+        return dirty
+
+    def relative(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def known_files(self) -> Dict[str, Tuple[int, int, str]]:
+        return {
+            path: (int(mtime_ns), int(size), str(sha))
+            for path, mtime_ns, size, sha in self._db().execute("SELECT path, mtime_ns, size, sha FROM files")
+        }
+
+    def apply(self, results: List[Dict[str, Any]], removed: List[str]) -> None:
+        """Çıkarım sonuçlarını ve silinen dosyaları tek işlemde yaz"""
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for path in removed:
+                for table in self._TABLES:
+                    db.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+            for entry in results:
+                path = entry["path"]
+                if entry.get("unchanged"):
+                    db.execute("UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?",
+                               (entry["mtime_ns"], entry["size"], path))
+                    continue
+                for table in self._TABLES[1:]:
+                    db.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+                db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                           (path, entry["mtime_ns"], entry["size"], entry["sha"], entry["language"], entry.get("error")))
+                db.executemany("INSERT INTO symbols VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               [(path,) + tuple(symbol) for symbol in entry.get("symbols", [])])
+                db.executemany("INSERT INTO refs VALUES (?, ?, ?)", [
+                    (name, path, ",".join(f"{line}:{col}" for line, col in positions))
+                    for name, positions in cast(Dict[str, List[Tuple[int, int]]], entry.get("refs", {})).items()
+                ])
+                db.executemany("INSERT INTO fingerprints VALUES (?, ?, ?, ?)",
+                               [(fingerprint, path, start, end)
+                                for fingerprint, start, end in entry.get("fingerprints", [])])
+            db.execute("COMMIT")
+        except sqlite3.Error:
+            db.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _symbol_row(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        path, name, kind, container, line, end_line, exported, detail = row
+        symbol: Dict[str, Any] = {"name": name, "kind": kind, "path": path, "line": line, "end_line": end_line}
+        if container:
+            symbol["container"] = container
+        if exported:
+            symbol["exported"] = True
+        if detail:
+            symbol["detail"] = detail
+        return symbol
+
+    def find_symbols(self, name: str, kind: Optional[str] = None, prefix: bool = False,
+                     limit: int = 50) -> List[Dict[str, Any]]:
+        """İsim (ya da 'Container.isim') ile tanım arama; prefix aralık sorgusuyla indeksi kullanır"""
+        container: Optional[str] = None
+        if "." in name and not prefix:
+            container, name = name.rsplit(".", 1)
+        if prefix:
+            query = "SELECT * FROM symbols WHERE name >= ? AND name < ?"
+            params: List[Any] = [name, name + "\U0010ffff"]
+        else:
+            query = "SELECT * FROM symbols WHERE name = ?"
+            params = [name]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        if container is not None:
+            # 'B.m' hem 'B' hem 'A.B' içindeki m'yi bulur
+            query += " AND (container = ? OR substr(container, ?) = ?)"
+            params.extend([container, -(len(container) + 1), f".{container}"])
+        # Tanımlar importlardan, dışa açık olanlar iç tanımlardan önce
+        query += " ORDER BY kind IN ('import', 'export'), exported DESC, path, line LIMIT ?"
+        params.append(limit)
+        return [self._symbol_row(row) for row in self._db().execute(query, params)]
+
+    def find_references(self, name: str, path_prefix: Optional[str] = None,
+                        limit: int = 200) -> Tuple[List[Dict[str, Any]], int]:
+        """İsmin geçtiği konumlar (toplam sayı ile); tanım satırları işaretlenir"""
+        db = self._db()
+        query = "SELECT path, positions FROM refs WHERE name = ?"
+        params: List[Any] = [name]
+        if path_prefix:
+            query += " AND path >= ? AND path < ?"
+            params.extend([path_prefix, path_prefix + "\U0010ffff"])
+        definitions = {(path, line) for path, line in db.execute(
+            "SELECT path, line FROM symbols WHERE name = ? AND kind NOT IN ('import', 'export')", (name,)
+        )}
+        references: List[Dict[str, Any]] = []
+        total = 0
+        for path, positions in db.execute(query + " ORDER BY path", params):
+            for position in str(positions).split(","):
+                total += 1
+                if len(references) >= limit:
+                    continue
+                line, col = (int(part) for part in position.split(":"))
+                reference: Dict[str, Any] = {"path": path, "line": line, "col": col}
+                if (path, line) in definitions:
+                    reference["definition"] = True
+                references.append(reference)
+        return references, total
+
+    def outline(self, path: str) -> Optional[Dict[str, Any]]:
+        db = self._db()
+        row = db.execute("SELECT language, error FROM files WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            return None
+        symbols = [self._symbol_row(symbol) for symbol in db.execute(
+            "SELECT * FROM symbols WHERE path = ? ORDER BY line, rowid", (path,)
+        )]
+        for symbol in symbols:
+            del symbol["path"]
+        outline: Dict[str, Any] = {"path": path, "language": row[0], "symbols": symbols}
+        if row[1]:
+            outline["error"] = row[1]
+        return outline
+
+    def duplicate_groups(self, min_lines: int = 6, max_occurrences: int = 64,
+                         path_prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+        """İndeksteki ortak parmak izlerinden kopya grupları
+
+        max_occurrences'tan fazla yerde geçen parmak izleri (lisans başlıkları,
+        üretilmiş kalıplar) gürültü sayılıp atlanır.
+        """
+        query = (
+            "SELECT f.hash, f.path, f.start_line, f.end_line FROM fingerprints f"
+            " JOIN (SELECT hash FROM fingerprints GROUP BY hash HAVING COUNT(*) BETWEEN 2 AND ?) shared"
+            " ON f.hash = shared.hash ORDER BY f.hash"
+        )
+        groups = CodeFingerprinter.clone_groups(self._db().execute(query, (max_occurrences,)), min_lines)
+        if path_prefix:
+            groups = [group for group in groups
+                      if any(str(instance["path"]).startswith(path_prefix) for instance in group["instances"])]
+        return groups
+
+    def stats(self) -> Dict[str, Any]:
+        db = self._db()
+        return {
+            "path": self.path,
+            "files": int(db.execute("SELECT COUNT(*) FROM files").fetchone()[0]),
+            "symbols": int(db.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]),
+        }
+
+
+class PythonProfiler:
+    """Python giriş noktasını/test komutunu ayrı süreçte cProfile altında çalıştırıp sıcak noktaları çıkar
+
+    Çocuk süreç bütçe dolunca ana thread'i KeyboardInterrupt ile keser ve o ana
+    kadarki istatistikleri yine yazar; takılan süreç ek süre sonunda öldürülür.
+    cProfile yalnızca ana thread'i ölçer. İstekler sırayla işlendiğinden bütçe
+    MAX_BUDGET_SECONDS ile sınırlıdır; ölçüm süresince sunucu başka isteğe yanıt vermez.
+    """
+
+    MAX_BUDGET_SECONDS = 60.0
+    GRACE_SECONDS = 5.0
+    BOOTSTRAP = r'''
+import _thread, cProfile, json, os, runpy, sys, threading, time, traceback
+stats_path, budget, kind, target = sys.argv[1:5]
+sys.argv = [target] + sys.argv[5:]
+sys.path.insert(0, os.path.dirname(os.path.abspath(target)) if kind == "script" else os.getcwd())
+expired = threading.Event()
+
+def expire():
+    expired.set()
+    _thread.interrupt_main()
+
+timer = threading.Timer(float(budget), expire)
+timer.daemon = True
+profiler = cProfile.Profile()
+meta = {"status": "completed", "exit_code": 0}
+started = time.perf_counter()
+timer.start()
+profiler.enable()
+try:
+    try:
+        if kind == "module":
+            runpy.run_module(target, run_name="__main__", alter_sys=True)
+        else:
+            runpy.run_path(target, run_name="__main__")
+    except SystemExit as exc:
+        meta["exit_code"] = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    except KeyboardInterrupt:
+        meta["exit_code"] = 130
+    except BaseException:
+        meta["status"], meta["exit_code"] = "error", 1
+        traceback.print_exc()
+    finally:
+        timer.cancel()
+except KeyboardInterrupt:
+    pass
+profiler.disable()
+meta["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+if expired.is_set():
+    meta["status"] = "budget"
+profiler.dump_stats(stats_path)
+with open(stats_path + ".json", "w") as handle:
+    json.dump(meta, handle)
+'''
+
+    @staticmethod
+    def parse_command(command: str) -> Tuple[str, str, List[str]]:
+        """'app.py --n 3', '-m paket.cli', 'pytest -q tests' -> (tür, hedef, argümanlar)"""
+        parts = shlex.split(command)
+        if parts and re.fullmatch(r"python[\d.]*(?:\.exe)?", os.path.basename(parts[0])):
+            parts = parts[1:]
+        if not parts:
+            raise ValueError("Profil komutu boş")
+        if parts[0] == "-m":
+            if len(parts) < 2:
+                raise ValueError("-m sonrası modül adı gerekli")
+            return "module", parts[1], parts[2:]
+        if parts[0] in ("pytest", "py.test"):
+            return "module", "pytest", parts[1:]
+        if parts[0].endswith(".py"):
+            return "script", parts[0], parts[1:]
+        raise ValueError(f"Python betiği (.py), '-m modül' ya da pytest komutu bekleniyor: {parts[0]}")
+
+    @classmethod
+    def run(cls, command: str, cwd: str, budget: float,
+            python: Optional[str] = None) -> Tuple[Dict[str, Any], Optional[pstats.Stats], List[str]]:
+        """(durum bilgisi, istatistikler ya da None, çıktının son satırları)"""
+        kind, target, argv = cls.parse_command(command)
+        if kind == "script" and not os.path.isfile(os.path.join(cwd, target)):
+            raise ValueError(f"Betik bulunamadı: {os.path.join(cwd, target)}")
+        handle, stats_path = tempfile.mkstemp(prefix="kayradeniz-profile-", suffix=".prof")
+        os.close(handle)
+        meta: Dict[str, Any] = {"status": "failed", "exit_code": None}
+        started = time.perf_counter()
+        try:
+            try:
+                completed = subprocess.run(
+                    [python or sys.executable, "-c", cls.BOOTSTRAP, stats_path, str(budget), kind, target, *argv],
+                    cwd=cwd, stdin=subprocess.DEVNULL, capture_output=True, timeout=budget + cls.GRACE_SECONDS,
+                )
+                meta["exit_code"] = completed.returncode
+                stdout, stderr = completed.stdout, completed.stderr
+            except subprocess.TimeoutExpired as e:
+                meta["status"] = "timeout"
+                stdout, stderr = e.stdout or b"", e.stderr or b""
+            meta["wall_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            if os.path.exists(stats_path + ".json"):
+                with open(stats_path + ".json", "r", encoding="utf-8") as f:
+                    meta.update(json.load(f))
+            stats = pstats.Stats(stats_path) if os.path.getsize(stats_path) > 0 else None
+        finally:
+            for path in (stats_path, stats_path + ".json"):
+                if os.path.exists(path):
+                    os.remove(path)
+        output = (stdout + stderr).decode("utf-8", errors="replace").splitlines()
+        return meta, stats, [line[:300] for line in output[-20:]]
+
+    @staticmethod
+    def function_ranges(content: str) -> Dict[Tuple[int, str], Tuple[str, int, int]]:
+        """(kod nesnesinin ilk satırı, isim) -> (qualname, def satırı, bitiş satırı)
+
+        co_firstlineno dekoratörlü fonksiyonda ilk dekoratörün satırıdır; iki
+        satır da anahtarlanır.
+        """
+        ranges: Dict[Tuple[int, str], Tuple[str, int, int]] = {
+            (1, "<module>"): ("<module>", 1, content.count("\n") + 1),
+        }
+        stack: List[Tuple[ast.AST, str]] = [(ast.parse(content), "")]
+        while stack:
+            node, prefix = stack.pop()
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    entry = (prefix + child.name, child.lineno, getattr(child, "end_lineno", None) or child.lineno)
+                    ranges[(child.lineno, child.name)] = entry
+                    for decorator in child.decorator_list:
+                        ranges.setdefault((decorator.lineno, child.name), entry)
+                    stack.append((child, f"{prefix}{child.name}.<locals>."))
+                elif isinstance(child, ast.ClassDef):
+                    stack.append((child, f"{prefix}{child.name}."))
+                else:
+                    stack.append((child, prefix))
+        return ranges
+
+    @classmethod
+    def hotspots(cls, stats: pstats.Stats, root: str,
+                 limit: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], float]:
+        """(çalışma alanı sıcak noktaları, en pahalı dış fonksiyonlar, profillenen süre ms)
+
+        Kütüphane/builtin çağrılarının süresi onları doğrudan çağıran çalışma alanı
+        fonksiyonuna 'external' olarak yazılır; sıralama self + external süresiyledir.
+        """
+        raw = cast(Dict[Tuple[str, int, str], Tuple[int, int, float, float, Dict[Any, Any]]], getattr(stats, "stats"))
+        total = float(getattr(stats, "total_tt")) or 1e-9
+        root = os.path.realpath(root)
+        local: Dict[Tuple[str, int, str], Dict[str, Any]] = {}
+        for key, (primitive_calls, calls, own, cumulative, _) in raw.items():
+            filename = key[0]
+            if filename.startswith(("<", "~")):
+                continue
+            path = os.path.realpath(os.path.join(root, filename))
+            if not path.startswith(root + os.sep) or "site-packages" in path or "dist-packages" in path:
+                continue
+            local[key] = {"path": path, "line": key[1], "name": key[2], "calls": calls,
+                          "primitive_calls": primitive_calls, "self": own, "external": 0.0, "cumulative": cumulative}
+        external: List[Tuple[float, Tuple[str, int, str], int]] = []
+        for key, (_, calls, own, _, callers) in raw.items():
+            if key in local:
+                continue
+            external.append((own, key, calls))
+            for caller, caller_stats in callers.items():
+                if caller in local and isinstance(caller_stats, tuple):
+                    # (nc, cc, tt, ct): bu çağırandan gelen çağrıların kümülatif süresi
+                    local[caller]["external"] += caller_stats[3]
+
+        ranked = sorted(local.values(), key=lambda item: item["self"] + min(item["external"], item["cumulative"]),
+                        reverse=True)[:limit]
+        ranges_by_path: Dict[str, Dict[Tuple[int, str], Tuple[str, int, int]]] = {}
+        results: List[Dict[str, Any]] = []
+        for rank, item in enumerate(ranked, start=1):
+            path = item["path"]
+            if path not in ranges_by_path:
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        ranges_by_path[path] = cls.function_ranges(f.read())
+                except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+                    ranges_by_path[path] = {}
+            ranges = ranges_by_path[path]
+            code_key = (item["line"], item["name"])
+            qualname, start_line, end_line = ranges.get(code_key, (item["name"], item["line"], item["line"]))
+            if code_key not in ranges:
+                # comprehension/lambda kod nesneleri en içteki fonksiyona bağlanır
+                enclosing = [entry for entry in ranges.values()
+                             if entry[0] != "<module>" and entry[1] <= item["line"] <= entry[2]]
+                if enclosing:
+                    qualname = f"{max(enclosing, key=lambda entry: entry[1])[0]}.{item['name']}"
+            spent = item["self"] + min(item["external"], item["cumulative"])
+            results.append({
+                "rank": rank,
+                "path": os.path.relpath(path, root).replace(os.sep, "/"),
+                "function": qualname,
+                "start_line": start_line,
+                "end_line": end_line,
+                "calls": item["calls"],
+                "primitive_calls": item["primitive_calls"],
+                "self_ms": round(item["self"] * 1000, 3),
+                "external_ms": round(min(item["external"], item["cumulative"]) * 1000, 3),
+                "cumulative_ms": round(item["cumulative"] * 1000, 3),
+                "percent": round(spent / total * 100, 1),
+            })
+        top_external = [
+            {"function": pstats.func_std_string(key), "calls": calls, "self_ms": round(own * 1000, 3),
+             "percent": round(own / total * 100, 1)}
+            for own, key, calls in heapq.nlargest(5, external, key=lambda item: item[0])
+        ]
+        return results, top_external, round(total * 1000, 1)
+
+
+class KayradenizToolServer:
+    def __init__(self):
+        self.github_token: Optional[str] = None
+        self.github_api_base: str = os.environ.get("KAYRADENIZ_GITHUB_API_BASE", "https://api.github.com")
+        self._github_sessions: Dict[Tuple[str, str], GitHubSession] = {}
+        # (token, api_base, query, per_page, page, text_match) -> (zaman, sayfa)
+        self._search_pages: "OrderedDict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._search_lock = threading.Lock()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._analysis_pool: Optional[ProcessPoolExecutor] = None
+        self._analysis_pool_workers = 0
+        self._workspace_indexes: Dict[str, WorkspaceIndex] = {}
+        self._workspace_indexes_lock = threading.Lock()
+        # Bu süre içinde tam tarama yapılmaz; tool'ların yazdığı dosyalar yine hemen işlenir
+        self.index_ttl = float(os.environ.get("KAYRADENIZ_INDEX_TTL", "2.0"))
+        # Gerçek yol -> son profile_code ölçümünde o dosyadaki sıcak noktalar
+        self._profile_results: Dict[str, Dict[str, Any]] = {}
+        self._profile_lock = threading.Lock()
+        self.github_ledger = GitHubIdempotencyLedger(
+            os.environ.get("KAYRADENIZ_GITHUB_LEDGER")
+            or os.path.join(os.path.expanduser("~"), ".kayradeniz", "github-idempotency.sqlite")
+        )
+        self.github_cache = GitHubHTTPCache(
+            os.environ.get("KAYRADENIZ_GITHUB_CACHE")
+            or os.path.join(os.path.expanduser("~"), ".kayradeniz", "github-http-cache.sqlite"),
+            max_bytes=int(float(os.environ.get("KAYRADENIZ_GITHUB_CACHE_MAX_MB", "64")) * 1024 * 1024),
+        )
+        self.git_user_name: Optional[str] = None
+        self.git_user_email: Optional[str] = None
+        self.path_locks = PathLockManager()
+        self.cat_file_pool = GitCatFilePool()
+        self._git_roots: Dict[str, str] = {}
+        self._object_dbs: Dict[str, GitObjectDatabase] = {}
+        self.repo_info_cache = GitRepoInfoCache()
+        # main() stdout'a yazan fonksiyonu bağlar; akış bildirimleri buradan gider
+        self.notification_sink: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._active_call: Optional[Dict[str, Any]] = None
+        atexit.register(self.cat_file_pool.close_all)
+        atexit.register(self._shutdown_analysis_pool)
+        self.status_service = GitStatusService(
+            max_age=float(os.environ.get("KAYRADENIZ_STATUS_MAX_AGE", "2.0"))
+        )
+        
+        self.tools: Dict[str, Callable[[Dict[str, Any]], str]] = {
+            "hello_world": self.hello_world,
+            "create_file": self.create_file,
+            "read_file": self.read_file,
+            "list_files": self.list_files,
+            "write_code": self.write_code,
+            "generate_project_structure": self.generate_project_structure,
+            "set_github_token": self.set_github_token,
+            "github_clone": self.github_clone,
+            "github_status": self.github_status,
+            "github_commit": self.github_commit,
+            "github_push": self.github_push,
+            "github_create_repo": self.github_create_repo,
+            "github_search_code": self.github_search_code,
+            "github_create_gist": self.github_create_gist,
+            "github_create_issue": self.github_create_issue,
+            "github_create_issues_bulk": self.github_create_issues_bulk,
+            "github_query_batch": self.github_query_batch,
+            "github_create_gists_bulk": self.github_create_gists_bulk,
+            "github_cache_stats": self.github_cache_stats,
+            "github_rate_limits": self.github_rate_limits,
+            "git_init": self.git_init,
+            "git_add": self.git_add,
+            "git_commit": self.git_commit,
+            "git_push": self.git_push,
+            "git_pull": self.git_pull,
+            "git_branch": self.git_branch,
+            "git_pipeline": self.git_pipeline,
+            "git_hotspots": self.git_hotspots,
+            "git_multi": self.git_multi,
+            "git_repo_info": self.git_repo_info,
+            "git_log": self.git_log,
+            "git_diff": self.git_diff,
+            "git_show_file": self.git_show_file,
+            "git_ls_tree": self.git_ls_tree,
+            "git_read_at_revision": self.git_read_at_revision,
+            "code_agent_analyze": self.code_agent_analyze,
+            "code_agent_analyze_project": self.code_agent_analyze_project,
+            "code_agent_edit": self.code_agent_edit,
+            "code_agent_refactor": self.code_agent_refactor,
+            "find_symbol": self.find_symbol,
+            "find_references": self.find_references,
+            "file_outline": self.file_outline,
+            "find_duplicates": self.find_duplicates,
+            "profile_code": self.profile_code
+        }
+
+    @staticmethod
+    def _get_required_str(args: Dict[str, Any], key: str) -> str:
+        value = args.get(key)
+        if value is None:
+            raise ValueError(f"Missing required argument: {key}")
+        return str(value)
+
+    @staticmethod
+    def _get_optional_str(args: Dict[str, Any], key: str) -> Optional[str]:
+        value = args.get(key)
+        return str(value) if value is not None else None
+
+    @staticmethod
+    def _get_bool(args: Dict[str, Any], key: str, default: bool) -> bool:
+        return bool(args.get(key, default))
+
+    @staticmethod
+    def _get_int(args: Dict[str, Any], key: str, default: int) -> int:
+        value = args.get(key)
+        return int(value) if value is not None else default
+
+    @staticmethod
+    def _get_str_list(args: Dict[str, Any], key: str) -> List[str]:
+        value = args.get(key)
+        if value is None:
+            return []
+        if isinstance(value, (list, tuple)):
+            return [str(item) for item in cast(List[Any], value)]
+        return [str(value)]
+
+    @staticmethod
+    def _resolve_path(path: str, working_directory: Optional[str]) -> str:
+        if working_directory and not os.path.isabs(path):
+            return os.path.join(working_directory, path)
+        return path
+
+    @staticmethod
+    def _run_subprocess(cmd: List[str], cwd: Optional[str] = None,
+                        env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, env=env)
+
+    def _git_env(self) -> Optional[Dict[str, str]]:
+        """Commit kimliği: her seferinde `git config` yazmak yerine ortam değişkenleri"""
+        if not (self.git_user_name and self.git_user_email):
+            return None
+        env = dict(os.environ)
+        env["GIT_AUTHOR_NAME"] = env["GIT_COMMITTER_NAME"] = self.git_user_name
+        env["GIT_AUTHOR_EMAIL"] = env["GIT_COMMITTER_EMAIL"] = self.git_user_email
+        return env
+
+    def _git_toplevel(self, repo_path: str) -> str:
+        """Repository kök dizinini bul (yol başına bir kez fork)"""
+        key = os.path.abspath(repo_path)
+        root = self._git_roots.get(key)
+        if root is None:
+            result = self._run_subprocess(["git", "rev-parse", "--show-toplevel"], cwd=key)
+            if result.returncode != 0:
+                raise ValueError(f"Git repository değil: {repo_path}")
+            root = os.path.normpath(result.stdout.strip())
+            self._git_roots[key] = root
+        return root
+
+    def get_tool_descriptions(self) -> Dict[str, Dict[str, Any]]:
+        """Tools açıklamaları"""
+        return {
+            "hello_world": {
+                "name": "hello_world",
+                "description": "Test amaçlı basit merhaba mesajı",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "message": {
+                            "type": "string",
+                            "description": "Göndermek istediğin mesaj"
+                        }
+                    },
+                    "required": ["message"]
+                }
+            },
+            "create_file": {
+                "name": "create_file",
+                "description": "Yeni dosya oluştur ve içeriğini yaz",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "file_path": {
+                            "type": "string",
+                            "description": "Oluşturulacak dosyanın yolu"
+                        },
+                        "content": {
+                            "type": "string", 
+                            "description": "Dosyaya yazılacak içerik"
+                        }
+                    },
+                    "required": ["file_path", "content"]
+                }
+            },
+            "read_file": {
+                "name": "read_file",
+                "description": "Dosya içeriğini oku",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "file_path": {
+                            "type": "string",
+                            "description": "Okunacak dosyanın yolu"
+                        }
+                    },
+                    "required": ["file_path"]
+                }
+            },
+            "list_files": {
+                "name": "list_files",
+                "description": "Dizindeki dosyaları listele",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "directory_path": {
+                            "type": "string",
+                            "description": "Listelenecek dizinin yolu",
+                            "default": "."
+                        }
+                    }
+                }
+            },
+            "write_code": {
+                "name": "write_code",
+                "description": "Kod dosyası oluştur (HTML, CSS, JS, Python vb.)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "file_path": {
+                            "type": "string",
+                            "description": "Kod dosyasının yolu"
+                        },
+                        "content": {
+                            "type": "string",
+                            "description": "Kod içeriği"
+                        },
+                        "language": {
+                            "type": "string",
+                            "description": "Programlama dili (html, css, js, python, etc.)",
+                            "default": "text"
+                        }
+                    },
+                    "required": ["file_path", "content"]
+                }
+            },
+            "generate_project_structure": {
+                "name": "generate_project_structure",
+                "description": "Proje klasör yapısı oluştur",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "project_name": {
+                            "type": "string",
+                            "description": "Proje adı"
+                        },
+                        "project_type": {
+                            "type": "string",
+                            "description": "Proje tipi (web, desktop, mobile, etc.)",
+                            "default": "web"
+                        },
+                        "base_path": {
+                            "type": "string",
+                            "description": "Proje oluşturulacak temel yol",
+                            "default": "."
+                        }
+                    },
+                    "required": ["project_name"]
+                }
+            },
+            "set_github_token": {
+                "name": "set_github_token",
+                "description": "GitHub Fine-grained personal access token ayarla",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "token": {
+                            "type": "string",
+                            "description": "GitHub Fine-grained personal access token"
+                        },
+                        "git_user_name": {
+                            "type": "string",
+                            "description": "Git commit için kullanıcı adı"
+                        },
+                        "git_user_email": {
+                            "type": "string",
+                            "description": "Git commit için email"
+                        }
+                    },
+                    "required": ["token"]
+                }
+            },
+            "github_clone": {
+                "name": "github_clone",
+                "description": "GitHub repository clone et",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "repo_url": {
+                            "type": "string",
+                            "description": "GitHub repository URL"
+                        },
+                        "target_dir": {
+                            "type": "string",
+                            "description": "Hedef dizin",
+                            "default": "./cloned-repo"
+                        },
+                        "depth": {
+                            "type": "integer",
+                            "description": "Shallow clone derinliği (--depth)"
+                        },
+                        "filter": {
+                            "type": "string",
+                            "description": "Partial clone filtresi (örn. blob:none)"
+                        },
+                        "sparse_paths": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Sadece bu dizinleri checkout et (sparse-checkout)"
+                        },
+                        "single_branch": {
+                            "type": "boolean",
+                            "description": "Sadece tek branch'i indir",
+                            "default": False
+                        },
+                        "branch": {
+                            "type": "string",
+                            "description": "Checkout edilecek branch"
+                        },
+                        "use_mirror": {
+                            "type": "boolean",
+                            "description": "Paylaşılan yerel mirror cache'ini kullan",
+                            "default": False
+                        },
+                        "mirror_dir": {
+                            "type": "string",
+                            "description": "Mirror cache dizini (varsayılan: KAYRADENIZ_GIT_MIRROR_DIR veya ~/.kayradeniz/git-mirrors)"
+                        },
+                        "mirror_max_age": {
+                            "type": "number",
+                            "description": "Mirror bu kadar saniye içinde fetch edildiyse ağa gitme (0: her clone'da fetch; varsayılan: KAYRADENIZ_GIT_MIRROR_MAX_AGE veya 300)"
+                        }
+                    },
+                    "required": ["repo_url"]
+                }
+            },
+            "github_status": {
+                "name": "github_status",
+                "description": "Git repository durumunu göster (porcelain v2, cache'li)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Cache'i yok say ve yeniden hesapla",
+                            "default": False
+                        },
+                        "format": {
+                            "type": "string",
+                            "description": "Çıktı formatı (text, json)",
+                            "default": "text"
+                        }
+                    }
+                }
+            },
+            "github_create_repo": {
+                "name": "github_create_repo",
+                "description": "GitHub'da yeni repository oluştur",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Repository adı"
+                        },
+                        "description": {
+                            "type": "string",
+                            "description": "Repository açıklaması"
+                        },
+                        "private": {
+                            "type": "boolean",
+                            "description": "Private repository",
+                            "default": False
+                        }
+                    },
+                    "required": ["name"]
+                }
+            },
+            "github_search_code": {
+                "name": "github_search_code",
+                "description": "GitHub'da kod ara (sayfalı, sonraki sayfalar önceden getirilir ve cache'lenir)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Arama sorgusu"
+                        },
+                        "per_page": {
+                            "type": "integer",
+                            "description": "Sayfa başına sonuç (en fazla 100)",
+                            "default": 30
+                        },
+                        "page": {
+                            "type": "integer",
+                            "description": "Sayfa numarası",
+                            "default": 1
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Önceki yanıttaki sonraki sayfa cursor'ı"
+                        },
+                        "prefetch": {
+                            "type": "integer",
+                            "description": "Arka planda önceden getirilecek sayfa sayısı (0-5)",
+                            "default": 1
+                        },
+                        "text_match": {
+                            "type": "boolean",
+                            "description": "Eşleşen kod parçalarını da döndür",
+                            "default": False
+                        },
+                        "format": {
+                            "type": "string",
+                            "enum": ["text", "json"],
+                            "default": "text"
+                        }
+                    }
+                }
+            },
+            "github_create_gist": {
+                "name": "github_create_gist",
+                "description": "GitHub Gist oluştur ve paylaş",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "filename": {
+                            "type": "string",
+                            "description": "Dosya adı"
+                        },
+                        "content": {
+                            "type": "string",
+                            "description": "Dosya içeriği"
+                        },
+                        "description": {
+                            "type": "string",
+                            "description": "Gist açıklaması",
+                            "default": "KayraDeniz Code Snippet"
+                        },
+                        "public": {
+                            "type": "boolean",
+                            "description": "Public gist",
+                            "default": True
+                        }
+                    },
+                    "required": ["filename", "content"]
+                }
+            },
+            "github_create_issue": {
+                "name": "github_create_issue",
+                "description": "GitHub Issue oluştur",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "owner": {
+                            "type": "string",
+                            "description": "Repository sahibi"
+                        },
+                        "repo": {
+                            "type": "string",
+                            "description": "Repository adı"
+                        },
+                        "title": {
+                            "type": "string",
+                            "description": "Issue başlığı"
+                        },
+                        "body": {
+                            "type": "string",
+                            "description": "Issue içeriği"
+                        }
+                    },
+                    "required": ["owner", "repo", "title"]
+                }
+            },
+            "github_create_issues_bulk": {
+                "name": "github_create_issues_bulk",
+                "description": "Birden çok GitHub Issue'yu eşzamanlı oluştur; idempotency anahtarlarıyla tekrar denemede kopya oluşmaz, sonuçlar öğe öğe akar",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "owner": {
+                            "type": "string",
+                            "description": "Repository sahibi"
+                        },
+                        "repo": {
+                            "type": "string",
+                            "description": "Repository adı"
+                        },
+                        "issues": {
+                            "type": "array",
+                            "description": "Issue listesi: {title, body?, labels?, key?}. key verilmezse içerikten türetilir",
+                            "items": {"type": "object"}
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Aynı anda en fazla istek sayısı",
+                            "default": 3
+                        },
+                        "max_wait": {
+                            "type": "number",
+                            "description": "Rate limit için öğe başına en fazla bekleme (sn)",
+                            "default": 120
+                        }
+                    },
+                    "required": ["owner", "repo", "issues"]
+                }
+            },
+            "github_create_gists_bulk": {
+                "name": "github_create_gists_bulk",
+                "description": "Birden çok Gist'i eşzamanlı oluştur; idempotency anahtarı açıklamanın sonuna ([kd:anahtar]) eklenir, tekrar denemede kopya oluşmaz, sonuçlar öğe öğe akar",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "gists": {
+                            "type": "array",
+                            "description": "Gist listesi: {filename, content, description?, public?, key?}",
+                            "items": {"type": "object"}
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Aynı anda en fazla istek sayısı",
+                            "default": 3
+                        },
+                        "max_wait": {
+                            "type": "number",
+                            "description": "Rate limit için öğe başına en fazla bekleme (sn)",
+                            "default": 120
+                        }
+                    },
+                    "required": ["gists"]
+                }
+            },
+            "github_query_batch": {
+                "name": "github_query_batch",
+                "description": "Birden çok repo için meta veri, açık issue ve son commit okumalarını tek GraphQL sorgusunda birleştir (cursor sayfalamalı)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "reads": {
+                            "type": "array",
+                            "description": "Okuma listesi: {type: repo|issues|commits, repo: 'owner/name', limit?, branch?, after?, id?}",
+                            "items": {"type": "object"}
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "issues/commits için varsayılan en fazla öğe",
+                            "default": 20
+                        }
+                    },
+                    "required": ["reads"]
+                }
+            },
+            "github_cache_stats": {
+                "name": "github_cache_stats",
+                "description": "GitHub HTTP cache istatistikleri (isabet oranı, saklanan boyut); istenirse cache'i temizler",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "clear": {
+                            "type": "boolean",
+                            "description": "Cache'i temizle",
+                            "default": False
+                        }
+                    }
+                }
+            },
+            "github_rate_limits": {
+                "name": "github_rate_limits",
+                "description": "Aktif token için GitHub rate limit bucket'larının durumu ve tahmini bekleme süreleri",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {}
+                }
+            },
+            "git_init": {
+                "name": "git_init",
+                "description": "Git repository başlat",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
+                        }
+                    }
+                }
+            },
+            "git_add": {
+                "name": "git_add",
+                "description": "Git add işlemi",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "files": {
+                            "type": "string",
+                            "description": "Eklenecek dosyalar",
+                            "default": "."
+                        },
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
+                        }
+                    }
+                }
+            },
+            "git_commit": {
+                "name": "git_commit",
+                "description": "Git commit oluştur",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "message": {
+                            "type": "string",
+                            "description": "Commit mesajı"
+                        },
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
+                        }
+                    },
+                    "required": ["message"]
+                }
+            },
+            "git_push": {
+                "name": "git_push",
+                "description": "Git push işlemi",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "remote": {
+                            "type": "string",
+                            "description": "Remote adı",
+                            "default": "origin"
+                        },
+                        "branch": {
+                            "type": "string",
+                            "description": "Branch adı",
+                            "default": "main"
+                        },
+                        "repo_path": {
                             "type": "string",
-                            "description": "Göndermek istediğin mesaj"
+                            "description": "Repository yolu",
+                            "default": "."
                         }
-                    },
-                    "required": ["message"]
+                    }
                 }
             },
-            "create_file": {
-                "name": "create_file",
-                "description": "Yeni dosya oluştur ve içeriğini yaz",
+            "git_pipeline": {
+                "name": "git_pipeline",
+                "description": "Stage, commit, tag ve push adımlarını tek istekte sırayla çalıştır; ilk hatada durur ve adım bazlı süre raporu döner",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "file_path": {
+                        "steps": {
+                            "type": "array",
+                            "description": "Adımlar: {action: stage|commit|tag|push, ...}. stage: paths; commit: message, allow_empty; tag: name, message; push: remote, branch, tags",
+                            "items": {"type": "object"}
+                        },
+                        "paths": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "steps verilmezse: stage edilecek yollar"
+                        },
+                        "message": {
                             "type": "string",
-                            "description": "Oluşturulacak dosyanın yolu"
+                            "description": "steps verilmezse: commit mesajı"
                         },
-                        "content": {
-                            "type": "string", 
-                            "description": "Dosyaya yazılacak içerik"
+                        "tag": {
+                            "type": "string",
+                            "description": "steps verilmezse: oluşturulacak tag"
+                        },
+                        "push": {
+                            "type": "boolean",
+                            "description": "steps verilmezse: sonunda push et",
+                            "default": False
+                        },
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
                         }
-                    },
-                    "required": ["file_path", "content"]
+                    }
                 }
             },
-            "read_file": {
-                "name": "read_file",
-                "description": "Dosya içeriğini oku",
+            "git_multi": {
+                "name": "git_multi",
+                "description": "Bir kök dizin altındaki tüm repository'lerde status/fetch/pull işlemini paralel çalıştır; sonuçlar bitiş sırasıyla akış halinde gelir",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "file_path": {
+                        "action": {
                             "type": "string",
-                            "description": "Okunacak dosyanın yolu"
+                            "description": "status, fetch veya pull",
+                            "default": "status"
+                        },
+                        "root": {
+                            "type": "string",
+                            "description": "Repository'lerin aranacağı kök dizin",
+                            "default": "."
+                        },
+                        "max_depth": {
+                            "type": "integer",
+                            "description": "Arama derinliği",
+                            "default": 3
+                        },
+                        "max_repos": {
+                            "type": "integer",
+                            "description": "En fazla repository sayısı",
+                            "default": 200
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Aynı anda çalışan en fazla işlem",
+                            "default": 8
                         }
-                    },
-                    "required": ["file_path"]
+                    }
                 }
             },
-            "list_files": {
-                "name": "list_files",
-                "description": "Dizindeki dosyaları listele",
+            "git_hotspots": {
+                "name": "git_hotspots",
+                "description": "Git geçmişinden churn/yazar/güncellik tablolarını çıkar ve kompleksite ile birleştirilmiş hotspot sıralaması döndür (artımlı cache)",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "directory_path": {
+                        "repo_path": {
                             "type": "string",
-                            "description": "Listelenecek dizinin yolu",
+                            "description": "Repository yolu",
                             "default": "."
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Döndürülecek hotspot sayısı",
+                            "default": 20
+                        },
+                        "path_prefix": {
+                            "type": "string",
+                            "description": "Sadece bu dizin altındaki dosyalar"
+                        },
+                        "rebuild": {
+                            "type": "boolean",
+                            "description": "Cache'i sıfırdan oluştur",
+                            "default": False
                         }
                     }
                 }
             },
-            "write_code": {
-                "name": "write_code",
-                "description": "Kod dosyası oluştur (HTML, CSS, JS, Python vb.)",
+            "git_repo_info": {
+                "name": "git_repo_info",
+                "description": "HEAD, branch, remote ve upstream ahead/behind bilgisini cache'ten döndür (değişiklik yoksa git çalıştırmaz)",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Kod dosyasının yolu"
-                        },
-                        "content": {
+                        "repo_path": {
                             "type": "string",
-                            "description": "Kod içeriği"
+                            "description": "Repository yolu",
+                            "default": "."
                         },
-                        "language": {
-                            "type": "string",
-                            "description": "Programlama dili (html, css, js, python, etc.)",
-                            "default": "text"
+                        "ahead_behind": {
+                            "type": "boolean",
+                            "description": "Upstream'e göre ahead/behind sayılarını hesapla",
+                            "default": True
                         }
-                    },
-                    "required": ["file_path", "content"]
+                    }
                 }
             },
-            "generate_project_structure": {
-                "name": "generate_project_structure",
-                "description": "Proje klasör yapısı oluştur",
+            "git_log": {
+                "name": "git_log",
+                "description": "Commit geçmişini sayfalı ve akış halinde oku (cursor ile devam)",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "project_name": {
+                        "revision": {
                             "type": "string",
-                            "description": "Proje adı"
+                            "description": "Başlangıç revizyonu",
+                            "default": "HEAD"
                         },
-                        "project_type": {
+                        "paths": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Sadece bu yolları etkileyen commit'ler"
+                        },
+                        "page_size": {
+                            "type": "integer",
+                            "description": "Sayfa başına commit (en fazla 500)",
+                            "default": 50
+                        },
+                        "cursor": {
                             "type": "string",
-                            "description": "Proje tipi (web, desktop, mobile, etc.)",
-                            "default": "web"
+                            "description": "Önceki sayfanın next_cursor değeri"
                         },
-                        "base_path": {
+                        "stat": {
+                            "type": "boolean",
+                            "description": "Dosya bazlı eklenen/silinen satır sayılarını ekle",
+                            "default": False
+                        },
+                        "author": {
                             "type": "string",
-                            "description": "Proje oluşturulacak temel yol",
+                            "description": "Yazar filtresi"
+                        },
+                        "since": {
+                            "type": "string",
+                            "description": "Bu tarihten sonraki commit'ler (örn. 2.weeks)"
+                        },
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
                             "default": "."
                         }
-                    },
-                    "required": ["project_name"]
+                    }
                 }
             },
-            "set_github_token": {
-                "name": "set_github_token",
-                "description": "GitHub Fine-grained personal access token ayarla",
+            "git_diff": {
+                "name": "git_diff",
+                "description": "Değişiklikleri sayfalı ve akış halinde listele (numstat veya sınırlı patch)",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "token": {
+                        "from_revision": {
                             "type": "string",
-                            "description": "GitHub Fine-grained personal access token"
+                            "description": "Karşılaştırma başlangıcı (boşsa çalışma ağacı/index)"
                         },
-                        "git_user_name": {
+                        "to_revision": {
                             "type": "string",
-                            "description": "Git commit için kullanıcı adı"
+                            "description": "Karşılaştırma sonu (boşsa çalışma ağacı)"
                         },
-                        "git_user_email": {
+                        "cached": {
+                            "type": "boolean",
+                            "description": "Stage'deki değişiklikler (--cached)",
+                            "default": False
+                        },
+                        "paths": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Yol filtresi"
+                        },
+                        "mode": {
                             "type": "string",
-                            "description": "Git commit için email"
+                            "description": "numstat (sadece istatistik) veya patch",
+                            "default": "numstat"
+                        },
+                        "page_size": {
+                            "type": "integer",
+                            "description": "Sayfa başına dosya",
+                            "default": 100
+                        },
+                        "max_patch_bytes": {
+                            "type": "integer",
+                            "description": "patch modunda sayfa başına en fazla byte",
+                            "default": 100000
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Önceki sayfanın next_cursor değeri"
+                        },
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
                         }
-                    },
-                    "required": ["token"]
+                    }
                 }
             },
-            "github_clone": {
-                "name": "github_clone",
-                "description": "GitHub repository clone et",
+            "git_show_file": {
+                "name": "git_show_file",
+                "description": "Bir revizyondaki dosya içeriğini oku (kalıcı git cat-file süreci üzerinden)",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "repo_url": {
+                        "file_path": {
                             "type": "string",
-                            "description": "GitHub repository URL"
+                            "description": "Repository köküne göre dosya yolu"
                         },
-                        "target_dir": {
+                        "revision": {
                             "type": "string",
-                            "description": "Hedef dizin",
-                            "default": "./cloned-repo"
+                            "description": "Commit, branch veya tag",
+                            "default": "HEAD"
+                        },
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Döndürülecek en fazla byte",
+                            "default": 200000
                         }
                     },
-                    "required": ["repo_url"]
+                    "required": ["file_path"]
                 }
             },
-            "github_create_repo": {
-                "name": "github_create_repo",
-                "description": "GitHub'da yeni repository oluştur",
+            "git_ls_tree": {
+                "name": "git_ls_tree",
+                "description": "Bir revizyondaki dizin ağacını listele",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "name": {
+                        "revision": {
                             "type": "string",
-                            "description": "Repository adı"
+                            "description": "Commit, branch veya tag",
+                            "default": "HEAD"
                         },
-                        "description": {
+                        "path": {
                             "type": "string",
-                            "description": "Repository açıklaması"
+                            "description": "Listelenecek alt dizin (boşsa kök)",
+                            "default": ""
                         },
-                        "private": {
+                        "show_size": {
                             "type": "boolean",
-                            "description": "Private repository",
+                            "description": "Blob boyutlarını da göster",
                             "default": False
+                        },
+                        "repo_path": {
+                            "type": "string",
+                            "description": "Repository yolu",
+                            "default": "."
                         }
-                    },
-                    "required": ["name"]
+                    }
                 }
             },
-            "github_search_code": {
-                "name": "github_search_code",
-                "description": "GitHub'da kod ara",
+            "git_read_at_revision": {
+                "name": "git_read_at_revision",
+                "description": "Birden fazla dosyayı/revizyonu tek seferde oku (her (revizyon, dosya) çifti)",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "query": {
+                        "paths": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Okunacak dosya yolları"
+                        },
+                        "revisions": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Okunacak revizyonlar",
+                            "default": ["HEAD"]
+                        },
+                        "repo_path": {
                             "type": "string",
-                            "description": "Arama sorgusu"
+                            "description": "Repository yolu",
+                            "default": "."
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Dosya başına döndürülecek en fazla byte",
+                            "default": 20000
+                        },
+                        "max_objects": {
+                            "type": "integer",
+                            "description": "Okunacak en fazla nesne sayısı",
+                            "default": 200
                         }
                     },
-                    "required": ["query"]
+                    "required": ["paths"]
                 }
             },
-            "github_create_gist": {
-                "name": "github_create_gist",
-                "description": "GitHub Gist oluştur ve paylaş",
+            "code_agent_analyze": {
+                "name": "code_agent_analyze",
+                "description": "Kod dosyasını analiz et",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "filename": {
+                        "file_path": {
                             "type": "string",
-                            "description": "Dosya adı"
+                            "description": "Analiz edilecek dosya yolu"
                         },
-                        "content": {
+                        "format": {
                             "type": "string",
-                            "description": "Dosya içeriği"
+                            "description": "Çıktı formatı (text, json); json metin raporu üretmeden tipli sonuç döner",
+                            "default": "text"
                         },
-                        "description": {
+                        "detail": {
                             "type": "string",
-                            "description": "Gist açıklaması",
-                            "default": "KayraDeniz Code Snippet"
-                        },
-                        "public": {
-                            "type": "boolean",
-                            "description": "Public gist",
-                            "default": True
+                            "description": "Python analiz derinliği: full (ast; fonksiyonlar ve performans bulguları), fast (ast'siz metrikler; fonksiyon listesi yok), auto (full ile aynı)",
+                            "default": "auto"
                         }
                     },
-                    "required": ["filename", "content"]
+                    "required": ["file_path"]
                 }
             },
-            "github_create_issue": {
-                "name": "github_create_issue",
-                "description": "GitHub Issue oluştur",
+            "code_agent_analyze_project": {
+                "name": "code_agent_analyze_project",
+                "description": "Projedeki tüm Python/JS/TS/Java dosyalarını süreç havuzunda analiz et; dosya sonuçları akar, sonunda toplamlar ve en sorunlu dosyalar döner",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "owner": {
+                        "root": {
                             "type": "string",
-                            "description": "Repository sahibi"
+                            "description": "Proje kök dizini",
+                            "default": "."
                         },
-                        "repo": {
-                            "type": "string",
-                            "description": "Repository adı"
+                        "workers": {
+                            "type": "integer",
+                            "description": "Süreç sayısı (varsayılan: CPU sayısı)"
                         },
-                        "title": {
-                            "type": "string",
-                            "description": "Issue başlığı"
+                        "chunk_size": {
+                            "type": "integer",
+                            "description": "Bir iş biriminde analiz edilecek dosya sayısı",
+                            "default": 32
                         },
-                        "body": {
-                            "type": "string",
-                            "description": "Issue içeriği"
+                        "max_files": {
+                            "type": "integer",
+                            "description": "En fazla dosya sayısı",
+                            "default": 20000
+                        },
+                        "top": {
+                            "type": "integer",
+                            "description": "Listelenecek en sorunlu dosya/fonksiyon sayısı",
+                            "default": 10
                         }
-                    },
-                    "required": ["owner", "repo", "title"]
+                    }
                 }
             },
-            "git_init": {
-                "name": "git_init",
-                "description": "Git repository başlat",
+            "code_agent_edit": {
+                "name": "code_agent_edit",
+                "description": "Kod düzenleme önerileri",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "repo_path": {
+                        "file_path": {
                             "type": "string",
-                            "description": "Repository yolu",
-                            "default": "."
+                            "description": "Düzenlenecek dosya yolu"
+                        },
+                        "edit_type": {
+                            "type": "string",
+                            "description": "Düzenleme tipi (optimize, refactor, fix)",
+                            "default": "optimize"
+                        },
+                        "profile_command": {
+                            "type": "string",
+                            "description": "optimize için önce bu Python komutunu profille (profile_code ile aynı biçim); verilmezse dosyanın son profile_code ölçümü kullanılır"
+                        },
+                        "budget_seconds": {
+                            "type": "number",
+                            "description": "profile_command için zaman bütçesi (en fazla 60 sn)",
+                            "default": 30
+                        },
+                        "format": {
+                            "type": "string",
+                            "description": "Çıktı formatı (text, json); json metin raporu üretmeden tipli sonuç döner",
+                            "default": "text"
                         }
-                    }
+                    },
+                    "required": ["file_path"]
                 }
             },
-            "git_add": {
-                "name": "git_add",
-                "description": "Git add işlemi",
+            "code_agent_refactor": {
+                "name": "code_agent_refactor",
+                "description": "Kod refactoring yap",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "files": {
+                        "file_path": {
                             "type": "string",
-                            "description": "Eklenecek dosyalar",
-                            "default": "."
+                            "description": "Refactor edilecek dosya yolu"
                         },
-                        "repo_path": {
+                        "refactor_type": {
                             "type": "string",
-                            "description": "Repository yolu",
-                            "default": "."
+                            "description": "Refactor tipi (format, comments, general)",
+                            "default": "general"
+                        },
+                        "format": {
+                            "type": "string",
+                            "description": "Çıktı formatı (text, json); json metin raporu üretmeden tipli sonuç döner",
+                            "default": "text"
                         }
-                    }
+                    },
+                    "required": ["file_path"]
                 }
             },
-            "git_commit": {
-                "name": "git_commit",
-                "description": "Git commit oluştur",
+            "find_symbol": {
+                "name": "find_symbol",
+                "description": "Python/JS/TS sembol indeksinden tanım bul (fonksiyon, class, metot, import, export); indeks değişen dosyalar için artımlı güncellenir",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "message": {
+                        "name": {
                             "type": "string",
-                            "description": "Commit mesajı"
+                            "description": "Sembol adı; 'Class.method' biçimi de kabul edilir"
                         },
-                        "repo_path": {
+                        "kind": {
                             "type": "string",
-                            "description": "Repository yolu",
+                            "description": "Tür filtresi (function, method, class, variable, attribute, import, export, interface, type, enum, namespace)"
+                        },
+                        "match": {
+                            "type": "string",
+                            "description": "Eşleşme (exact, prefix)",
+                            "default": "exact"
+                        },
+                        "root": {
+                            "type": "string",
+                            "description": "İndekslenecek kök dizin",
                             "default": "."
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "En fazla sonuç sayısı",
+                            "default": 50
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Sorgudan önce değişen dosyaları yeniden indeksle",
+                            "default": True
                         }
                     },
-                    "required": ["message"]
+                    "required": ["name"]
                 }
             },
-            "git_push": {
-                "name": "git_push",
-                "description": "Git push işlemi",
+            "find_references": {
+                "name": "find_references",
+                "description": "Sembol indeksinden bir ismin tanımlarını ve geçtiği tüm konumları (dosya, satır, sütun) döndür",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "remote": {
+                        "name": {
                             "type": "string",
-                            "description": "Remote adı",
-                            "default": "origin"
+                            "description": "Tanımlayıcı adı"
                         },
-                        "branch": {
+                        "path": {
                             "type": "string",
-                            "description": "Branch adı",
-                            "default": "main"
+                            "description": "Sadece bu dizin/dosya önekindeki sonuçlar"
                         },
-                        "repo_path": {
+                        "root": {
                             "type": "string",
-                            "description": "Repository yolu",
+                            "description": "İndekslenecek kök dizin",
                             "default": "."
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "En fazla konum sayısı",
+                            "default": 200
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Sorgudan önce değişen dosyaları yeniden indeksle",
+                            "default": True
                         }
-                    }
+                    },
+                    "required": ["name"]
                 }
             },
-            "code_agent_analyze": {
-                "name": "code_agent_analyze",
-                "description": "Kod dosyasını analiz et",
+            "file_outline": {
+                "name": "file_outline",
+                "description": "Dosyanın tanım ağacını (class > metot, fonksiyon, import, export) satır aralıklarıyla döndür",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
                         "file_path": {
                             "type": "string",
-                            "description": "Analiz edilecek dosya yolu"
+                            "description": "Dosya yolu"
+                        },
+                        "root": {
+                            "type": "string",
+                            "description": "Dosyanın ait olduğu indeks kökü (verilmezse working_directory)"
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Dosya değiştiyse indeksi güncelle",
+                            "default": True
                         }
                     },
                     "required": ["file_path"]
                 }
             },
-            "code_agent_edit": {
-                "name": "code_agent_edit",
-                "description": "Kod düzenleme önerileri",
+            "find_duplicates": {
+                "name": "find_duplicates",
+                "description": "Çalışma alanındaki Python/JS/TS kopya kodlarını (isimleri değiştirilmiş olanlar dahil) winnowing parmak izleriyle bul; satır aralıklı kopya grupları döner, indeks değişen dosyalar için artımlı güncellenir",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "file_path": {
+                        "root": {
                             "type": "string",
-                            "description": "Düzenlenecek dosya yolu"
+                            "description": "İndekslenecek kök dizin",
+                            "default": "."
                         },
-                        "edit_type": {
+                        "path": {
                             "type": "string",
-                            "description": "Düzenleme tipi (optimize, refactor, fix)",
-                            "default": "optimize"
+                            "description": "Sadece bu dizin/dosya önekine dokunan gruplar"
+                        },
+                        "min_lines": {
+                            "type": "integer",
+                            "description": "Raporlanacak en kısa kopya (satır)",
+                            "default": 6
+                        },
+                        "max_occurrences": {
+                            "type": "integer",
+                            "description": "Bundan fazla yerde geçen parmak izleri kalıp sayılıp atlanır",
+                            "default": 64
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "En fazla grup sayısı",
+                            "default": 20
+                        },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Sorgudan önce değişen dosyaları yeniden indeksle",
+                            "default": True
                         }
-                    },
-                    "required": ["file_path"]
+                    }
                 }
             },
-            "code_agent_refactor": {
-                "name": "code_agent_refactor",
-                "description": "Kod refactoring yap",
+            "profile_code": {
+                "name": "profile_code",
+                "description": "Python giriş noktasını ya da test komutunu zaman bütçesiyle cProfile altında çalıştır; en sıcak fonksiyonları kaynak satır aralıkları ve o aralıktaki performans bulgularıyla sıralı döndür (sonuç code_agent_edit optimize tarafından kullanılır)",
                 "inputSchema": {
                     "type": "object",
                     "properties": {
-                        "file_path": {
+                        "command": {
                             "type": "string",
-                            "description": "Refactor edilecek dosya yolu"
+                            "description": "Çalıştırılacak komut: 'app.py --n 100', '-m paket.cli', 'pytest -q tests'"
                         },
-                        "refactor_type": {
+                        "budget_seconds": {
+                            "type": "number",
+                            "description": "Zaman bütçesi (en fazla 60 sn); dolunca çalışma kesilir ve o ana kadarki ölçüm raporlanır",
+                            "default": 30
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "En fazla sıcak nokta sayısı",
+                            "default": 15
+                        },
+                        "python": {
                             "type": "string",
-                            "description": "Refactor tipi (format, comments, general)",
-                            "default": "general"
+                            "description": "Kullanılacak Python yorumlayıcısı (örn. proje venv'i); verilmezse sunucunun yorumlayıcısı"
                         }
                     },
-                    "required": ["file_path"]
+                    "required": ["command"]
                 }
             }
         }
@@ -466,13 +5330,14 @@ class KayradenizToolServer:
                 file_path = os.path.join(user_documents, file_path)
                 print(f"INFO: No workspace set, using Documents: '{file_path}'", file=sys.stderr)
             
-            # Klasörü oluştur
-            dir_path = os.path.dirname(file_path)
-            if dir_path:
-                os.makedirs(dir_path, exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with self.path_locks.write(file_path):
+                # Klasörü oluştur
+                dir_path = os.path.dirname(file_path)
+                if dir_path:
+                    os.makedirs(dir_path, exist_ok=True)
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            self._notify_write(file_path)
             
             return f"Dosya başarıyla oluşturuldu: {file_path} ({len(content)} karakter)"
         except Exception as e:
@@ -486,8 +5351,9 @@ class KayradenizToolServer:
             if not os.path.exists(file_path):
                 return f"Hata: Dosya bulunamadı: {file_path}"
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with self.path_locks.read(file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
             total_lines = len(content.splitlines())
 
             return (
@@ -536,9 +5402,11 @@ class KayradenizToolServer:
                     print(f"INFO: Code file relative path '{args['file_path']}' -> Documents: '{file_path}'", file=sys.stderr)
             
             # Dosyayı oluştur
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with self.path_locks.write(file_path):
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            self._notify_write(file_path)
             
             return f"Kod dosyası oluşturuldu: {file_path} ({language}) - {len(content)} karakter"
         except Exception as e:
@@ -594,9 +5462,11 @@ class KayradenizToolServer:
             # Dosyaları oluştur
             for file_path, content in files.items():
                 full_path = os.path.join(project_path, file_path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                with self.path_locks.write(full_path):
+                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                    with open(full_path, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                self._notify_write(full_path)
             
             return f"Proje yapısı oluşturuldu: {project_path}\nTip: {project_type}\nKlasörler: {', '.join(folders)}\nDosyalar: {', '.join(files.keys())}"
         except Exception as e:
@@ -604,20 +5474,35 @@ class KayradenizToolServer:
 
     # === GitHub ve Git İşlevleri ===
     
+    def _github_session(self) -> GitHubSession:
+        """Aktif token için paylaşılan oturumu döndür"""
+        if not self.github_token:
+            raise ValueError("GitHub token ayarlanmamış! Önce set_github_token kullanın.")
+        key = (self.github_token, self.github_api_base)
+        session = self._github_sessions.get(key)
+        if session is None:
+            session = GitHubSession(
+                self.github_token, self.github_api_base, cache=self.github_cache,
+                limiter=GitHubRateLimiter(),
+                max_wait=float(os.environ.get("KAYRADENIZ_GITHUB_MAX_WAIT", "30")),
+            )
+            self._github_sessions[key] = session
+        return session
+
     def set_github_token(self, args: Dict[str, Any]) -> str:
         """GitHub token'ı ayarla"""
         try:
             token = self._get_required_str(args, "token")
+            if token != self.github_token:
+                # Eski token'ın havuzundaki bağlantıları bırak
+                for key in [key for key in self._github_sessions if key[0] == self.github_token]:
+                    self._github_sessions.pop(key).close()
             self.github_token = token
             self.git_user_name = self._get_optional_str(args, "git_user_name")
             self.git_user_email = self._get_optional_str(args, "git_user_email")
             
             # Token'ı test et
-            headers: Dict[str, str] = {
-                'Authorization': f'token {self.github_token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            response = requests.get(f"{self.github_api_base}/user", headers=headers, timeout=15)
+            response = self._github_session().get("/user")
             
             if response.status_code == 200:
                 user_info = response.json()
@@ -627,6 +5512,48 @@ class KayradenizToolServer:
         except Exception as e:
             return f"Hata: {str(e)}"
 
+    @staticmethod
+    def _default_mirror_dir() -> str:
+        return os.environ.get("KAYRADENIZ_GIT_MIRROR_DIR") or os.path.join(
+            os.path.expanduser("~"), ".kayradeniz", "git-mirrors"
+        )
+
+    @staticmethod
+    def _mirror_age(mirror_path: str) -> float:
+        """Mirror'ın son fetch'ten bu yana geçen süre (saniye)"""
+        for name in ("FETCH_HEAD", "HEAD"):
+            stamp = os.path.join(mirror_path, name)
+            if os.path.exists(stamp):
+                return max(0.0, time.time() - os.path.getmtime(stamp))
+        return float("inf")
+
+    def _update_mirror(self, repo_url: str, mirror_dir: str, max_age: float = 0.0) -> Tuple[str, str]:
+        """Bare mirror'ı oluştur veya güncelle; (mirror_yolu, durum) döner"""
+        base_name = repo_url.rstrip("/").split("/")[-1] or "repo"
+        if base_name.endswith(".git"):
+            base_name = base_name[:-4]
+        url_hash = hashlib.sha1(repo_url.encode("utf-8")).hexdigest()[:12]
+        mirror_path = os.path.join(mirror_dir, f"{base_name}-{url_hash}.git")
+        os.makedirs(mirror_dir, exist_ok=True)
+
+        # Aynı mirror'a eşzamanlı clone/fetch yapılmasın
+        with self.path_locks.write(mirror_path):
+            if os.path.isdir(mirror_path):
+                # Yakın zamanda fetch edilen mirror için ağa gitme
+                if max_age > 0 and self._mirror_age(mirror_path) < max_age:
+                    return mirror_path, "güncel"
+                result = self._run_subprocess(["git", "remote", "update", "--prune"], cwd=mirror_path)
+                state = "güncellendi"
+            else:
+                result = self._run_subprocess(["git", "clone", "--mirror", "--quiet", repo_url, mirror_path])
+                state = "oluşturuldu"
+                if result.returncode == 0:
+                    # Mirror'dan partial clone alınabilsin
+                    self._run_subprocess(["git", "config", "uploadpack.allowFilter", "true"], cwd=mirror_path)
+            if result.returncode != 0:
+                raise RuntimeError(f"Mirror hatası: {result.stderr.strip()}")
+        return mirror_path, state
+
     def github_clone(self, args: Dict[str, Any]) -> str:
         """GitHub repository clone et"""
         try:
@@ -634,24 +5561,88 @@ class KayradenizToolServer:
             target_dir_value = args.get("target_dir", "./cloned-repo")
             target_dir = str(target_dir_value)
             working_directory = self._get_optional_str(args, "working_directory")
+            depth = args.get("depth")
+            clone_filter = self._get_optional_str(args, "filter")
+            sparse_paths = self._get_str_list(args, "sparse_paths")
+            single_branch = self._get_bool(args, "single_branch", False)
+            branch = self._get_optional_str(args, "branch")
+            use_mirror = self._get_bool(args, "use_mirror", False)
+            mirror_dir = self._get_optional_str(args, "mirror_dir") or self._default_mirror_dir()
+            mirror_max_age = float(
+                args.get("mirror_max_age", os.environ.get("KAYRADENIZ_GIT_MIRROR_MAX_AGE", "300"))
+            )
 
             resolved_target_dir = target_dir
             # Working directory kullan
             if working_directory and not os.path.isabs(target_dir):
                 resolved_target_dir = os.path.join(working_directory, target_dir)
-            
+
+            options: List[str] = []
+            if depth is not None:
+                options += ["--depth", str(int(depth))]
+            if clone_filter:
+                options.append(f"--filter={clone_filter}")
+            if single_branch:
+                options.append("--single-branch")
+            if branch:
+                options += ["--branch", branch]
+            if sparse_paths:
+                options.append("--sparse")
+
+            details: List[str] = []
+            source = repo_url
+            if use_mirror:
+                mirror_path, mirror_state = self._update_mirror(repo_url, mirror_dir, mirror_max_age)
+                details.append(f"Mirror {mirror_state}: {mirror_path}")
+                if depth is not None or clone_filter:
+                    # Shallow/partial clone: nesneleri yerel mirror'dan çek
+                    source = "file://" + os.path.abspath(mirror_path).replace("\\", "/")
+                else:
+                    options += ["--reference-if-able", mirror_path, "--dissociate"]
+
             # Git clone komutu
-            cmd: List[str] = ["git", "clone", repo_url, resolved_target_dir]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd: List[str] = ["git", "clone"] + options + [source, resolved_target_dir]
+            result = self._run_subprocess(cmd)
             
-            if result.returncode == 0:
-                return f"Repository başarıyla clone edildi: {resolved_target_dir}"
-            else:
+            if result.returncode != 0:
                 return f"Clone hatası: {result.stderr}"
+
+            if source != repo_url:
+                # origin gerçek upstream'i göstersin
+                self._run_subprocess(["git", "remote", "set-url", "origin", repo_url], cwd=resolved_target_dir)
+            if sparse_paths:
+                sparse_result = self._run_subprocess(
+                    ["git", "sparse-checkout", "set"] + sparse_paths, cwd=resolved_target_dir
+                )
+                if sparse_result.returncode != 0:
+                    return f"Sparse-checkout hatası: {sparse_result.stderr}"
+                details.append(f"Sparse: {', '.join(sparse_paths)}")
+            if depth is not None:
+                details.append(f"Depth: {int(depth)}")
+            if clone_filter:
+                details.append(f"Filter: {clone_filter}")
+
+            message = f"Repository başarıyla clone edildi: {resolved_target_dir}"
+            if details:
+                message += "\n" + "\n".join(details)
+            return message
                 
         except Exception as e:
             return f"Hata: {str(e)}"
 
+    @staticmethod
+    def _porcelain_path(path: str) -> str:
+        """-z olmadan git'in yazdığı gibi: özel/ASCII dışı baytlar varsa C tırnaklı yol"""
+        raw = path.encode("utf-8", errors="surrogateescape")
+        if not any(byte < 0x20 or byte >= 0x7f or byte in (0x22, 0x5c) for byte in raw):
+            return path
+        escapes = {0x07: "\\a", 0x08: "\\b", 0x09: "\\t", 0x0a: "\\n", 0x0b: "\\v", 0x0c: "\\f",
+                   0x0d: "\\r", 0x22: '\\"', 0x5c: "\\\\"}
+        quoted = "".join(
+            escapes.get(byte) or (f"\\{byte:03o}" if byte < 0x20 or byte >= 0x7f else chr(byte)) for byte in raw
+        )
+        return f'"{quoted}"'
+
     def github_status(self, args: Dict[str, Any]) -> str:
         """Git repository durumunu kontrol et"""
         try:
@@ -659,18 +5650,32 @@ class KayradenizToolServer:
             repo_path_str = str(repo_path_value)
             working_directory = self._get_optional_str(args, "working_directory")
             repo_path = self._resolve_path(repo_path_str, working_directory)
+            refresh = self._get_bool(args, "refresh", False)
+            output_format = str(args.get("format", "text"))
 
-            # Git status
-            cmd: List[str] = ["git", "status", "--porcelain"]
-            result = self._run_subprocess(cmd, cwd=repo_path)
-            
-            if result.returncode == 0:
-                if result.stdout.strip():
-                    return f"Repository durumu:\n{result.stdout}"
+            try:
+                repo_root = self._git_toplevel(repo_path)
+                status = self.status_service.status(repo_root, refresh=refresh)
+            except (ValueError, RuntimeError) as e:
+                return f"Status hatası: {str(e)}"
+
+            if output_format == "json":
+                return json.dumps(status, ensure_ascii=False)
+
+            entries = cast(List[Dict[str, Any]], status["entries"])
+            if not entries:
+                return "Repository temiz - commit edilecek değişiklik yok"
+
+            # Metin çıktısı `git status --porcelain` (v1) ile aynı biçimdedir
+            lines: List[str] = []
+            for entry in entries:
+                xy = str(entry["xy"]).replace(".", " ")
+                if entry["kind"] == "renamed":
+                    lines.append(f"{xy} {self._porcelain_path(entry['orig_path'])} -> "
+                                 f"{self._porcelain_path(entry['path'])}")
                 else:
-                    return "Repository temiz - commit edilecek değişiklik yok"
-            else:
-                return f"Status hatası: {result.stderr}"
+                    lines.append(f"{xy} {self._porcelain_path(entry['path'])}")
+            return "Repository durumu:\n" + "".join(line + "\n" for line in lines)
                 
         except Exception as e:
             return f"Hata: {str(e)}"
@@ -684,11 +5689,6 @@ class KayradenizToolServer:
             working_directory = self._get_optional_str(args, "working_directory")
             repo_path = self._resolve_path(repo_path_str, working_directory)
             add_all = self._get_bool(args, "add_all", True)
-
-            # Git config kontrol et
-            if self.git_user_name and self.git_user_email:
-                self._run_subprocess(["git", "config", "user.name", self.git_user_name], cwd=repo_path)
-                self._run_subprocess(["git", "config", "user.email", self.git_user_email], cwd=repo_path)
             
             # Tüm dosyaları ekle
             if add_all:
@@ -697,8 +5697,9 @@ class KayradenizToolServer:
                     return f"Add hatası: {add_result.stderr}"
             
             # Commit oluştur
+            # Kimlik ortam değişkenleriyle verilir (git config yazılmaz)
             cmd: List[str] = ["git", "commit", "-m", message]
-            result = self._run_subprocess(cmd, cwd=repo_path)
+            result = self._run_subprocess(cmd, cwd=repo_path, env=self._git_env())
             
             if result.returncode == 0:
                 return f"Commit oluşturuldu: {message}"
@@ -740,20 +5741,13 @@ class KayradenizToolServer:
             description = str(args.get("description", ""))
             private = self._get_bool(args, "private", False)
             
-            headers = {
-                'Authorization': f'token {self.github_token}',
-                'Accept': 'application/vnd.github.v3+json',
-                'Content-Type': 'application/json'
-            }
-            
             data: Dict[str, Any] = {
                 "name": repo_name,
                 "description": description,
                 "private": private
             }
             
-            response = requests.post(f"{self.github_api_base}/user/repos", 
-                                   headers=headers, json=data, timeout=15)
+            response = self._github_session().post("/user/repos", json=data)
             
             if response.status_code == 201:
                 repo_info = response.json()
@@ -764,118 +5758,481 @@ class KayradenizToolServer:
         except Exception as e:
             return f"Hata: {str(e)}"
 
+    _SEARCH_CACHE_TTL = 300.0
+    _SEARCH_CACHE_SIZE = 256
+    # GitHub arama API'si en fazla 1000 sonuç döndürür
+    _SEARCH_MAX_RESULTS = 1000
+
+    def _search_code_page(self, query: str, per_page: int, page: int, text_match: bool,
+                          priority: str = "interactive", max_wait: Optional[float] = None) -> Dict[str, Any]:
+        """Tek arama sayfasını getir; sorgu+sayfa başına cache'lenir"""
+        session = self._github_session()
+        key = (session.token, session.api_base, query, per_page, page, text_match)
+        now = time.time()
+        with self._search_lock:
+            hit = self._search_pages.get(key)
+            if hit is not None and now - hit[0] < self._SEARCH_CACHE_TTL:
+                self._search_pages.move_to_end(key)
+                return dict(hit[1], cached=True)
+
+        headers = {"Accept": "application/vnd.github.text-match+json"} if text_match else None
+        response = session.get(
+            "/search/code",
+            params={"q": query, "per_page": per_page, "page": page},
+            headers=headers,
+            priority=priority,
+            max_wait=max_wait,
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"Arama hatası: {response.status_code} - {response.text}")
+        results = cast(Dict[str, Any], response.json())
+
+        items: List[Dict[str, Any]] = []
+        for raw in cast(List[Dict[str, Any]], results.get("items", [])):
+            repository = raw.get("repository")
+            repo_dict = cast(Dict[str, Any], repository) if isinstance(repository, dict) else {}
+            item: Dict[str, Any] = {
+                "repository": str(repo_dict.get("full_name", "")),
+                "name": str(raw.get("name", "")),
+                "path": str(raw.get("path", "")),
+                "sha": str(raw.get("sha", "")),
+                "url": str(raw.get("html_url", "")),
+                "score": raw.get("score"),
+            }
+            if text_match:
+                item["fragments"] = [
+                    str(match.get("fragment", ""))
+                    for match in cast(List[Dict[str, Any]], raw.get("text_matches", []))
+                    if isinstance(match, dict)
+                ]
+            items.append(item)
+
+        page_data: Dict[str, Any] = {
+            "total_count": int(results.get("total_count", 0)),
+            "incomplete_results": bool(results.get("incomplete_results", False)),
+            "items": items,
+        }
+        with self._search_lock:
+            self._search_pages[key] = (time.time(), page_data)
+            self._search_pages.move_to_end(key)
+            while len(self._search_pages) > self._SEARCH_CACHE_SIZE:
+                self._search_pages.popitem(last=False)
+        return dict(page_data, cached=False)
+
+    def _prefetch_search_pages(self, query: str, per_page: int, pages: List[int], text_match: bool) -> None:
+        """Sonraki sayfaları arka planda, bulk öncelikle cache'e al"""
+        if not pages:
+            return
+        # Kota alt eşikteyse prefetch etkileşimli aramaların payını yemesin
+        limiter = self._github_session().limiter
+        if limiter is not None and limiter.is_low("code_search"):
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gh-prefetch")
+        for page in pages:
+            # Prefetch kotayı beklemez (max_wait=0); limit doluysa sessizce atlanır
+            self._prefetch_executor.submit(
+                self._search_code_page_quiet, query, per_page, page, text_match
+            )
+
+    def _search_code_page_quiet(self, query: str, per_page: int, page: int, text_match: bool) -> None:
+        try:
+            self._search_code_page(query, per_page, page, text_match, priority="bulk", max_wait=0.0)
+        except Exception:
+            pass
+
     def github_search_code(self, args: Dict[str, Any]) -> str:
         """GitHub'da kod ara"""
         try:
             if not self.github_token:
                 return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
             
-            query = self._get_required_str(args, "query")
-            headers = {
-                'Authorization': f'token {self.github_token}',
-                'Accept': 'application/vnd.github.v3+json'
+            cursor = self._decode_cursor(self._get_optional_str(args, "cursor"))
+            query = str(cursor.get("q") or self._get_required_str(args, "query"))
+            per_page = min(100, max(1, int(cursor.get("per_page") or self._get_int(args, "per_page", 30))))
+            page = max(1, int(cursor.get("page") or self._get_int(args, "page", 1)))
+            text_match = bool(cursor.get("text_match", self._get_bool(args, "text_match", False)))
+            prefetch = min(5, max(0, self._get_int(args, "prefetch", 1)))
+            output_format = self._get_optional_str(args, "format") or "text"
+
+            result = self._search_code_page(query, per_page, page, text_match)
+            last_page = (min(result["total_count"], self._SEARCH_MAX_RESULTS) + per_page - 1) // per_page
+            next_pages = [p for p in range(page + 1, page + 1 + prefetch) if p <= last_page]
+            self._prefetch_search_pages(query, per_page, next_pages, text_match)
+
+            next_cursor: Optional[str] = None
+            if page < last_page:
+                next_cursor = self._encode_cursor(
+                    {"q": query, "per_page": per_page, "page": page + 1, "text_match": text_match}
+                )
+
+            if output_format == "json":
+                return json.dumps({
+                    "query": query,
+                    "page": page,
+                    "per_page": per_page,
+                    "total_count": result["total_count"],
+                    "incomplete_results": result["incomplete_results"],
+                    "cached": result["cached"],
+                    "items": result["items"],
+                    "next_cursor": next_cursor,
+                }, ensure_ascii=False)
+
+            output = f"Kod arama sonuçları ({result['total_count']} sonuç bulundu, sayfa {page}/{max(last_page, 1)}):\n\n"
+            for item in result["items"]:
+                output += f"📁 {item['repository']}\n"
+                output += f"📄 {item['name']} ({item['path']})\n"
+                output += f"🔗 {item['url']}\n"
+                for fragment in item.get("fragments", []):
+                    output += "    " + fragment.strip().replace("\n", "\n    ") + "\n"
+                output += "\n"
+            if next_cursor:
+                output += f"Sonraki sayfa cursor: {next_cursor}\n"
+            
+            return output
+                
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def github_create_gist(self, args: Dict[str, Any]) -> str:
+        """GitHub Gist oluştur"""
+        try:
+            if not self.github_token:
+                return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
+            
+            description = str(args.get("description", "KayraDeniz Code Snippet"))
+            filename = self._get_required_str(args, "filename")
+            content = self._get_required_str(args, "content")
+            public = self._get_bool(args, "public", True)
+            
+            data: Dict[str, Any] = {
+                "description": description,
+                "public": public,
+                "files": {
+                    filename: {
+                        "content": content
+                    }
+                }
             }
             
-            response = requests.get(f"{self.github_api_base}/search/code?q={query}", 
-                                  headers=headers)
+            response = self._github_session().post("/gists", json=data)
             
-            if response.status_code == 200:
-                results = cast(Dict[str, Any], response.json())
-                total = int(results.get('total_count', 0))
-                raw_items = results.get('items', [])
-                items = cast(List[Dict[str, Any]], raw_items)[:5]
-                
-                output = f"Kod arama sonuçları ({total} sonuç bulundu):\n\n"
-                for item in items:
-                    repo_info = item.get('repository')
-                    if not isinstance(repo_info, dict):
-                        continue
-                    repo_dict = cast(Dict[str, Any], repo_info)
-                    repository_name = str(repo_dict.get('full_name', ''))
-                    file_name = str(item.get('name', ''))
-                    path = str(item.get('path', ''))
-                    url = str(item.get('html_url', ''))
-                    output += f"📁 {repository_name}\n"
-                    output += f"📄 {file_name} ({path})\n"
-                    output += f"🔗 {url}\n\n"
+            if response.status_code == 201:
+                gist_info = response.json()
+                return f"Gist oluşturuldu: {gist_info['html_url']}"
+            else:
+                return f"Gist oluşturma hatası: {response.status_code} - {response.text}"
                 
-                return output
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def github_create_issue(self, args: Dict[str, Any]) -> str:
+        """GitHub Issue oluştur"""
+        try:
+            if not self.github_token:
+                return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
+            
+            owner = self._get_required_str(args, "owner")
+            repo = self._get_required_str(args, "repo")
+            title = self._get_required_str(args, "title")
+            body = str(args.get("body", ""))
+            
+            data: Dict[str, Any] = {
+                "title": title,
+                "body": body
+            }
+            
+            response = self._github_session().post(f"/repos/{owner}/{repo}/issues", json=data)
+            
+            if response.status_code == 201:
+                issue_info = response.json()
+                return f"Issue oluşturuldu: {issue_info['html_url']}"
             else:
-                return f"Arama hatası: {response.status_code} - {response.text}"
+                return f"Issue oluşturma hatası: {response.status_code} - {response.text}"
                 
         except Exception as e:
             return f"Hata: {str(e)}"
 
-    def github_create_gist(self, args: Dict[str, Any]) -> str:
-        """GitHub Gist oluştur"""
+    _IDEMPOTENCY_MARKER = "<!-- kayradeniz-idempotency-key: {key} -->"
+    _GIST_KEY_SUFFIX = " [kd:{key}]"
+    # Kurtarma aramasında saat kaymasına karşı defter zamanından bu kadar geriye bakılır
+    _RECOVERY_SLACK = 300.0
+
+    @staticmethod
+    def _github_time(value: Any) -> float:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+    @staticmethod
+    def _github_since(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    @staticmethod
+    def _single_recovery(key: str, urls: List[str]) -> Optional[str]:
+        """Birden fazla eşleşme varsa hangisinin bizim olduğu bilinemez: tekrar oluşturmak yerine hata"""
+        if len(urls) > 1:
+            raise RuntimeError(f"Belirsiz kurtarma: '{key}' anahtarı {len(urls)} kayıtla eşleşti: {', '.join(urls)}")
+        return urls[0] if urls else None
+
+    @staticmethod
+    def _idempotency_key(item: Dict[str, Any], fields: Tuple[str, ...]) -> str:
+        """İstemci anahtarı yoksa içerikten kararlı bir anahtar türet"""
+        key = item.get("key")
+        if key:
+            return str(key)
+        payload = json.dumps({field: item.get(field) for field in fields}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def _ledger_scope(self, kind: str) -> str:
+        session = self._github_session()
+        token_digest = hashlib.sha256(session.token.encode("utf-8")).hexdigest()[:16]
+        return f"{token_digest}@{session.api_base}:{kind}"
+
+    def _bulk_create(self, scope: str, entries: List[Tuple[str, Dict[str, Any]]], concurrency: int,
+                     create: Callable[[str, Dict[str, Any]], requests.Response],
+                     recover: Callable[[str, Dict[str, Any], float], Optional[str]]) -> Dict[str, Any]:
+        """Öğeleri sınırlı eşzamanlılıkla oluştur; her sonucu bildirim olarak akıt"""
+
+        def run(index: int, key: str, item: Dict[str, Any]) -> Dict[str, Any]:
+            entry: Dict[str, Any] = {"index": index, "key": key}
+            previous = self.github_ledger.begin(scope, key)
+            if previous is not None and previous["status"] == "done":
+                entry.update(ok=True, status="existing", url=previous["url"])
+                return entry
+            if previous is not None:
+                # Önceki denemenin sonucu belirsiz: ilk denemeden sonra uzak tarafta oluşmuş mu?
+                url = recover(key, item, float(previous["updated"]) - self._RECOVERY_SLACK)
+                if url:
+                    self.github_ledger.complete(scope, key, url)
+                    entry.update(ok=True, status="existing", url=url)
+                    return entry
+            try:
+                response = create(key, item)
+            except GitHubRateLimitWait:
+                # İstek gönderilmedi; anahtar serbest bırakılır
+                self.github_ledger.abandon(scope, key)
+                raise
+            if response.status_code == 201:
+                url = str(response.json().get("html_url", ""))
+                self.github_ledger.complete(scope, key, url)
+                entry.update(ok=True, status="created", url=url)
+            else:
+                if response.status_code < 500:
+                    self.github_ledger.abandon(scope, key)
+                entry.update(ok=False, status="failed", error=f"{response.status_code} - {response.text[:200]}")
+            return entry
+
+        results: List[Dict[str, Any]] = []
+        seen: Dict[str, int] = {}
+        jobs: List[Tuple[int, str, Dict[str, Any]]] = []
+        for index, (key, item) in enumerate(entries):
+            if key in seen:
+                entry = {"index": index, "key": key, "ok": False, "status": "duplicate",
+                         "error": f"Aynı anahtar {seen[key]}. öğede de kullanılmış"}
+                results.append(entry)
+                self._notify_progress(entry)
+                continue
+            seen[key] = index
+            jobs.append((index, key, item))
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+                futures = {executor.submit(run, *job): job for job in jobs}
+                for future in as_completed(futures):
+                    index, key, _ = futures[future]
+                    try:
+                        entry = future.result()
+                    except Exception as e:
+                        entry = {"index": index, "key": key, "ok": False, "status": "failed", "error": str(e)}
+                    results.append(entry)
+                    self._notify_progress(entry)
+
+        results.sort(key=lambda entry: int(entry["index"]))
+        return {
+            "total": len(entries),
+            "created": sum(1 for entry in results if entry["status"] == "created"),
+            "existing": sum(1 for entry in results if entry["status"] == "existing"),
+            "failed": sum(1 for entry in results if not entry["ok"]),
+            "results": results,
+        }
+
+    def github_create_issues_bulk(self, args: Dict[str, Any]) -> str:
+        """Toplu GitHub Issue oluştur"""
+        try:
+            if not self.github_token:
+                return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
+
+            owner = self._get_required_str(args, "owner")
+            repo = self._get_required_str(args, "repo")
+            raw_issues = args.get("issues")
+            if not isinstance(raw_issues, list) or not raw_issues:
+                return "Hata: issues boş olmayan bir liste olmalı"
+            issues = cast(List[Any], raw_issues)
+            concurrency = min(10, max(1, self._get_int(args, "concurrency", 3)))
+            max_wait = float(args.get("max_wait", 120))
+
+            entries: List[Tuple[str, Dict[str, Any]]] = []
+            for raw in issues:
+                if not isinstance(raw, dict) or not cast(Dict[str, Any], raw).get("title"):
+                    return "Hata: Her issue en az 'title' içeren bir nesne olmalı"
+                item = cast(Dict[str, Any], raw)
+                entries.append((self._idempotency_key(item, ("title", "body", "labels")), item))
+
+            session = self._github_session()
+            issues_path = f"/repos/{owner}/{repo}/issues"
+
+            def create(key: str, item: Dict[str, Any]) -> requests.Response:
+                marker = self._IDEMPOTENCY_MARKER.format(key=key)
+                data: Dict[str, Any] = {
+                    "title": str(item["title"]),
+                    "body": f"{item.get('body') or ''}\n\n{marker}".lstrip("\n"),
+                }
+                if item.get("labels"):
+                    data["labels"] = [str(label) for label in cast(List[Any], item["labels"])]
+                return session.post(issues_path, json=data, priority="bulk", max_wait=max_wait)
+
+            def recover(key: str, item: Dict[str, Any], since: float) -> Optional[str]:
+                # Yeniden eskiye sayfa sayfa, defter kaydından eski issue'lara gelene kadar taranır
+                marker = self._IDEMPOTENCY_MARKER.format(key=key)
+                urls: List[str] = []
+                page = 1
+                while True:
+                    response = session.get(
+                        issues_path,
+                        params={"state": "all", "sort": "created", "direction": "desc", "per_page": 100,
+                                "since": self._github_since(since), "page": page},
+                        priority="bulk", max_wait=max_wait,
+                    )
+                    if response.status_code != 200:
+                        raise RuntimeError(f"Kurtarma araması başarısız: {response.status_code}")
+                    batch = cast(List[Dict[str, Any]], response.json())
+                    for issue in batch:
+                        if marker in str(issue.get("body") or ""):
+                            urls.append(str(issue.get("html_url", "")))
+                    if len(batch) < 100 or self._github_time(batch[-1].get("created_at")) < since:
+                        return self._single_recovery(key, urls)
+                    page += 1
+
+            summary = self._bulk_create(self._ledger_scope(f"issue:{owner}/{repo}"), entries, concurrency, create, recover)
+            return json.dumps(summary, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def github_create_gists_bulk(self, args: Dict[str, Any]) -> str:
+        """Toplu GitHub Gist oluştur"""
+        try:
+            if not self.github_token:
+                return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
+
+            raw_gists = args.get("gists")
+            if not isinstance(raw_gists, list) or not raw_gists:
+                return "Hata: gists boş olmayan bir liste olmalı"
+            gists = cast(List[Any], raw_gists)
+            concurrency = min(10, max(1, self._get_int(args, "concurrency", 3)))
+            max_wait = float(args.get("max_wait", 120))
+
+            entries: List[Tuple[str, Dict[str, Any]]] = []
+            for raw in gists:
+                item = cast(Dict[str, Any], raw) if isinstance(raw, dict) else {}
+                if not item.get("filename") or "content" not in item:
+                    return "Hata: Her gist 'filename' ve 'content' içermeli"
+                entries.append((self._idempotency_key(item, ("filename", "content", "description", "public")), item))
+
+            session = self._github_session()
+
+            def description_for(key: str, item: Dict[str, Any]) -> str:
+                # Gist'te gizli işaret yeri yok; anahtar açıklamanın sonuna eklenir
+                description = str(item.get("description") or "KayraDeniz Code Snippet")
+                return description + self._GIST_KEY_SUFFIX.format(key=key)
+
+            def create(key: str, item: Dict[str, Any]) -> requests.Response:
+                data: Dict[str, Any] = {
+                    "description": description_for(key, item),
+                    "public": bool(item.get("public", True)),
+                    "files": {str(item["filename"]): {"content": str(item["content"])}},
+                }
+                return session.post("/gists", json=data, priority="bulk", max_wait=max_wait)
+
+            def recover(key: str, item: Dict[str, Any], since: float) -> Optional[str]:
+                # Açıklamadaki anahtar + dosya adı + içerik boyutu eşleşmeli
+                description = description_for(key, item)
+                filename = str(item["filename"])
+                size = len(str(item["content"]).encode("utf-8"))
+                urls: List[str] = []
+                page = 1
+                while True:
+                    response = session.get(
+                        "/gists", params={"per_page": 100, "since": self._github_since(since), "page": page},
+                        priority="bulk", max_wait=max_wait,
+                    )
+                    if response.status_code != 200:
+                        raise RuntimeError(f"Kurtarma araması başarısız: {response.status_code}")
+                    batch = cast(List[Dict[str, Any]], response.json())
+                    for gist in batch:
+                        files = cast(Dict[str, Any], gist.get("files") or {})
+                        file_info = cast(Dict[str, Any], files.get(filename) or {})
+                        if gist.get("description") == description and file_info.get("size") == size:
+                            urls.append(str(gist.get("html_url", "")))
+                    if len(batch) < 100:
+                        return self._single_recovery(key, urls)
+                    page += 1
+
+            summary = self._bulk_create(self._ledger_scope("gist"), entries, concurrency, create, recover)
+            return json.dumps(summary, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def github_query_batch(self, args: Dict[str, Any]) -> str:
+        """Çoklu GitHub okumalarını GraphQL ile toplu çalıştır"""
+        try:
+            if not self.github_token:
+                return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
+
+            raw_reads = args.get("reads")
+            if not isinstance(raw_reads, list) or not raw_reads:
+                return "Hata: reads boş olmayan bir liste olmalı"
+            default_limit = max(1, self._get_int(args, "limit", 20))
+
+            reads: List[Dict[str, Any]] = []
+            for raw in cast(List[Any], raw_reads):
+                item = cast(Dict[str, Any], raw) if isinstance(raw, dict) else {}
+                kind = str(item.get("type", "repo"))
+                if kind not in ("repo", "issues", "commits"):
+                    return f"Hata: Geçersiz okuma tipi: {kind}"
+                full_name = str(item.get("repo", ""))
+                owner, _, name = full_name.rpartition("/")
+                owner = str(item.get("owner") or owner)
+                if not owner or not name:
+                    return f"Hata: Geçersiz repo: {full_name}"
+                reads.append({
+                    "id": item.get("id"),
+                    "type": kind,
+                    "owner": owner,
+                    "name": name,
+                    "limit": max(1, int(item.get("limit") or default_limit)),
+                    "branch": item.get("branch"),
+                    "after": item.get("after"),
+                })
+
+            client = GitHubGraphQLClient(self._github_session())
+            results = client.batch(reads)
+            return json.dumps({"round_trips": client.round_trips, "results": results}, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def github_cache_stats(self, args: Dict[str, Any]) -> str:
+        """GitHub HTTP cache istatistikleri"""
         try:
-            if not self.github_token:
-                return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
-            
-            description = str(args.get("description", "KayraDeniz Code Snippet"))
-            filename = self._get_required_str(args, "filename")
-            content = self._get_required_str(args, "content")
-            public = self._get_bool(args, "public", True)
-            
-            headers = {
-                'Authorization': f'token {self.github_token}',
-                'Accept': 'application/vnd.github.v3+json',
-                'Content-Type': 'application/json'
-            }
-            
-            data: Dict[str, Any] = {
-                "description": description,
-                "public": public,
-                "files": {
-                    filename: {
-                        "content": content
-                    }
-                }
-            }
-            
-            response = requests.post(f"{self.github_api_base}/gists", 
-                                   headers=headers, json=data, timeout=15)
-            
-            if response.status_code == 201:
-                gist_info = response.json()
-                return f"Gist oluşturuldu: {gist_info['html_url']}"
-            else:
-                return f"Gist oluşturma hatası: {response.status_code} - {response.text}"
-                
+            if self._get_bool(args, "clear", False):
+                self.github_cache.clear()
+            return json.dumps(self.github_cache.stats(), ensure_ascii=False)
         except Exception as e:
             return f"Hata: {str(e)}"
 
-    def github_create_issue(self, args: Dict[str, Any]) -> str:
-        """GitHub Issue oluştur"""
+    def github_rate_limits(self, args: Dict[str, Any]) -> str:
+        """GitHub rate limit durumu"""
         try:
-            if not self.github_token:
-                return "Hata: GitHub token ayarlanmamış! Önce set_github_token kullanın."
-            
-            owner = self._get_required_str(args, "owner")
-            repo = self._get_required_str(args, "repo")
-            title = self._get_required_str(args, "title")
-            body = str(args.get("body", ""))
-            
-            headers = {
-                'Authorization': f'token {self.github_token}',
-                'Accept': 'application/vnd.github.v3+json',
-                'Content-Type': 'application/json'
-            }
-            
-            data: Dict[str, Any] = {
-                "title": title,
-                "body": body
-            }
-            
-            response = requests.post(f"{self.github_api_base}/repos/{owner}/{repo}/issues", 
-                                   headers=headers, json=data, timeout=15)
-            
-            if response.status_code == 201:
-                issue_info = response.json()
-                return f"Issue oluşturuldu: {issue_info['html_url']}"
-            else:
-                return f"Issue oluşturma hatası: {response.status_code} - {response.text}"
-                
+            limiter = self._github_session().limiter
+            return json.dumps(limiter.snapshot() if limiter is not None else {}, ensure_ascii=False)
         except Exception as e:
             return f"Hata: {str(e)}"
 
@@ -929,13 +6286,9 @@ class KayradenizToolServer:
             working_directory = self._get_optional_str(args, "working_directory")
             repo_path = self._resolve_path(repo_path_str, working_directory)
 
-            # Git config kontrol et
-            if self.git_user_name and self.git_user_email:
-                self._run_subprocess(["git", "config", "user.name", self.git_user_name], cwd=repo_path)
-                self._run_subprocess(["git", "config", "user.email", self.git_user_email], cwd=repo_path)
-
+            # Kimlik ortam değişkenleriyle verilir (git config yazılmaz)
             cmd: List[str] = ["git", "commit", "-m", message]
-            result = self._run_subprocess(cmd, cwd=repo_path)
+            result = self._run_subprocess(cmd, cwd=repo_path, env=self._git_env())
             
             if result.returncode == 0:
                 return f"Commit oluşturuldu: {message}"
@@ -999,6 +6352,19 @@ class KayradenizToolServer:
             repo_path = self._resolve_path(repo_path_str, working_directory)
             
             if action == "list":
+                # Meta veri cache'inden cevapla; desteklenmeyen repo'da git'e düş
+                try:
+                    info = self._repo_info(repo_path)
+                    lines = [
+                        f"{'*' if branch['current'] else ' '} {branch['name']}"
+                        for branch in cast(List[Dict[str, Any]], info["branches"])
+                    ]
+                    if info["head"]["detached"]:
+                        lines.insert(0, f"* (HEAD detached at {str(info['head']['oid'])[:7]})")
+                    lines += [f"  remotes/{name}" for name in cast(List[str], info["remote_branches"])]
+                    return "Branch işlemi başarılı:\n" + "\n".join(lines) + "\n"
+                except (GitObjectUnsupported, ValueError):
+                    pass
                 cmd: List[str] = ["git", "branch", "-a"]
             elif action == "create" and branch_name:
                 cmd = ["git", "branch", branch_name]
@@ -1017,108 +6383,950 @@ class KayradenizToolServer:
         except Exception as e:
             return f"Hata: {str(e)}"
 
-    # === Kod Agent İşlevleri ===
-    
-    def code_agent_analyze(self, args: Dict[str, Any]) -> str:
-        """Gelişmiş kod analizi - AI destekli"""
+    _WALK_SKIP_DIRS = {
+        "node_modules", "__pycache__", ".venv", "venv", "dist", "build", "out",
+        ".cache", ".tox", ".nox", ".mypy_cache", ".pytest_cache", "target",
+    }
+
+    @classmethod
+    def _discover_repositories(cls, root: str, max_depth: int, max_repos: int,
+                               max_dirs: int = 20000) -> List[str]:
+        """Sınırlı scandir yürüyüşü: .git içeren dizinler bulunur, içlerine inilmez"""
+        repos: List[str] = []
+        queue: Deque[Tuple[str, int]] = deque([(os.path.abspath(root), 0)])
+        visited = 0
+        while queue and len(repos) < max_repos and visited < max_dirs:
+            directory, depth = queue.popleft()
+            visited += 1
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = list(iterator)
+            except OSError:
+                continue
+            if any(entry.name == ".git" for entry in entries):
+                repos.append(directory)
+                continue
+            if depth >= max_depth:
+                continue
+            for entry in sorted(entries, key=lambda e: e.name):
+                if (entry.name.startswith(".") or entry.name in cls._WALK_SKIP_DIRS
+                        or not entry.is_dir(follow_symlinks=False)):
+                    continue
+                queue.append((entry.path, depth + 1))
+        return repos
+
+    def _notify_write(self, path: str) -> None:
+        """Tool'ların yazdığı yolları status cache'ine ve sembol indekslerine bildir"""
+        self.status_service.notify_write(path)
+        full_path = os.path.abspath(path)
+        for index in list(self._workspace_indexes.values()):
+            if full_path.startswith(index.root + os.sep):
+                index.mark_dirty(full_path)
+
+    def _notify_progress(self, item: Dict[str, Any]) -> None:
+        """Aktif tool çağrısı için ara sonucu JSON-RPC bildirimi olarak gönder"""
+        sink = self.notification_sink
+        call = self._active_call
+        if sink is None or call is None:
+            return
+        sink({
+            "jsonrpc": "2.0",
+            "method": "notifications/tool_progress",
+            "params": {"requestId": call.get("id"), "tool": call.get("tool"), "item": item},
+        })
+
+    def _multi_repo_action(self, repo: str, action: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        entry: Dict[str, Any] = {"repo": repo}
+        if action == "status":
+            status = self.status_service.status(repo)
+            branch = cast(Dict[str, Any], status["branch"])
+            entries = cast(List[Dict[str, Any]], status["entries"])
+            entry.update(
+                ok=True,
+                branch=branch.get("head"),
+                ahead=branch.get("ahead", 0),
+                behind=branch.get("behind", 0),
+                changed=sum(1 for e in entries if e["kind"] in ("changed", "renamed", "unmerged")),
+                untracked=sum(1 for e in entries if e["kind"] == "untracked"),
+            )
+        else:
+            cmd = ["git", "fetch", "--prune"] if action == "fetch" else ["git", "pull", "--ff-only"]
+            result = self._run_subprocess(cmd, cwd=repo)
+            entry["ok"] = result.returncode == 0
+            output = (result.stderr.strip() if result.returncode else result.stdout.strip() or result.stderr.strip())
+            if output:
+                entry["output" if entry["ok"] else "error"] = output.splitlines()[-1]
+        entry["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return entry
+
+    def git_multi(self, args: Dict[str, Any]) -> str:
+        """Çoklu repository status/fetch/pull - sınırlı eşzamanlılıkla"""
         try:
-            file_path_arg = self._get_required_str(args, "file_path")
+            action = str(args.get("action", "status"))
+            if action not in ("status", "fetch", "pull"):
+                return f"Hata: Geçersiz action: {action}"
             working_directory = self._get_optional_str(args, "working_directory")
-            file_path = self._resolve_path(file_path_arg, working_directory)
+            root = self._resolve_path(str(args.get("root", working_directory or ".")), working_directory)
+            max_depth = self._get_int(args, "max_depth", 3)
+            max_repos = self._get_int(args, "max_repos", 200)
+            concurrency = max(1, self._get_int(args, "concurrency", 8))
 
-            if not os.path.exists(file_path):
-                return f"Hata: Dosya bulunamadı: {file_path}"
+            started = time.perf_counter()
+            repos = self._discover_repositories(root, max_depth, max_repos)
+            results: List[Dict[str, Any]] = []
+            if repos:
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(repos))) as executor:
+                    futures = {executor.submit(self._multi_repo_action, repo, action): repo for repo in repos}
+                    for future in as_completed(futures):
+                        try:
+                            entry = future.result()
+                        except Exception as e:
+                            entry = {"repo": futures[future], "ok": False, "error": str(e)}
+                        entry["repo"] = os.path.relpath(str(entry["repo"]), root)
+                        results.append(entry)
+                        self._notify_progress(entry)
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Gelişmiş kod analizi
-            lines: List[str] = content.split('\n')
-            total_lines = len(lines)
-            non_empty_lines = len([line for line in lines if line.strip()])
-            comment_lines = 0
-            function_count = 0
-            class_count = 0
-            complexity_score = 0
-            
-            # Dil-spesifik analiz
-            extension = os.path.splitext(file_path)[1].lower()
-            language_map = {
-                '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-                '.html': 'HTML', '.css': 'CSS', '.java': 'Java',
-                '.cpp': 'C++', '.c': 'C', '.json': 'JSON', '.md': 'Markdown'
+            summary: Dict[str, Any] = {
+                "root": root,
+                "action": action,
+                "repos": len(repos),
+                "ok": sum(1 for entry in results if entry.get("ok")),
+                "failed": sum(1 for entry in results if not entry.get("ok")),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "results": results,
             }
-            language = language_map.get(extension, 'Unknown')
-            
-            # Dil-spesifik pattern'lar
-            if language == 'Python':
-                comment_lines = len([line for line in lines if line.strip().startswith('#')])
-                function_count = len([line for line in lines if line.strip().startswith('def ')])
-                class_count = len([line for line in lines if line.strip().startswith('class ')])
-                complexity_score = content.count('if ') + content.count('for ') + content.count('while ')
-            elif language in ['JavaScript', 'TypeScript']:
-                comment_lines = len([line for line in lines if line.strip().startswith('//') or '/*' in line])
-                function_count = content.count('function ') + content.count('=>')
-                class_count = content.count('class ')
-                complexity_score = content.count('if(') + content.count('if ') + content.count('for(') + content.count('while(')
-            elif language == 'Java':
-                comment_lines = len([line for line in lines if line.strip().startswith('//') or '/*' in line])
-                function_count = content.count('public ') + content.count('private ') + content.count('protected ')
-                class_count = content.count('class ') + content.count('interface ')
-                complexity_score = content.count('if(') + content.count('for(') + content.count('while(')
-            
-            # Kod kalitesi metrikleri
-            comment_ratio = (comment_lines / non_empty_lines * 100) if non_empty_lines > 0 else 0
-            avg_line_length = sum(len(line) for line in lines) / len(lines) if lines else 0
-            
-            # Potansiyel sorunlar
-            issues: List[str] = []
-            if comment_ratio < 10:
-                issues.append("🔸 Düşük comment oranı - daha fazla dokümantasyon gerekli")
-            if avg_line_length > 100:
-                issues.append("🔸 Çok uzun satırlar - okunabilirlik sorunu")
-            if complexity_score > non_empty_lines * 0.3:
-                issues.append("🔸 Yüksek kompleksite - refactoring gerekebilir")
-            if function_count == 0 and non_empty_lines > 20:
-                issues.append("🔸 Fonksiyonlara bölünmemiş kod - modüler yapı eksik")
-            
-            # Güvenlik kontrolleri (basit)
-            security_issues: List[str] = []
-            if language == 'Python':
-                if 'eval(' in content:
-                    security_issues.append("⚠️ eval() kullanımı - güvenlik riski")
-                if 'exec(' in content:
-                    security_issues.append("⚠️ exec() kullanımı - güvenlik riski")
-                if 'os.system(' in content:
-                    security_issues.append("⚠️ os.system() kullanımı - güvenlik riski")
-            elif language in ['JavaScript', 'TypeScript']:
-                if 'eval(' in content:
-                    security_issues.append("⚠️ eval() kullanımı - güvenlik riski")
-                if 'innerHTML' in content:
-                    security_issues.append("⚠️ innerHTML kullanımı - XSS riski")
-                if 'document.write(' in content:
-                    security_issues.append("⚠️ document.write() kullanımı - güvenlik riski")
-            
-            # Performans önerileri
-            performance_tips: List[str] = []
-            if language == 'Python':
-                if content.count('for ') > 5:
-                    performance_tips.append("💨 List comprehension veya generator kullanmayı düşünün")
+            return json.dumps(summary, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    _HOTSPOT_CACHE_VERSION = 1
+
+    def _update_churn_tables(self, repo_root: str, rebuild: bool) -> Dict[str, Any]:
+        """Churn tablolarını son işlenen commit'ten itibaren artımlı güncelle"""
+        cache_dir = os.path.join(self.status_service.git_dir(repo_root), "kayradeniz")
+        cache_path = os.path.join(cache_dir, "hotspots.json")
+        head = self._resolve_commit_oid(repo_root, "HEAD")
+
+        with self.path_locks.write(cache_path):
+            tables: Dict[str, Any] = {"version": self._HOTSPOT_CACHE_VERSION, "head": None, "commits": 0, "files": {}}
+            if not rebuild and os.path.isfile(cache_path):
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    loaded = cast(Dict[str, Any], json.load(f))
+                if loaded.get("version") == self._HOTSPOT_CACHE_VERSION:
+                    tables = loaded
+
+            last = tables.get("head")
+            if last == head:
+                tables["new_commits"] = 0
+                return tables
+            revision_range = head
+            if last:
+                is_ancestor = self._run_subprocess(["git", "merge-base", "--is-ancestor", last, head], cwd=repo_root)
+                if is_ancestor.returncode == 0:
+                    revision_range = f"{last}..{head}"
+                else:
+                    # Geçmiş yeniden yazılmış: sıfırdan hesapla
+                    tables = {"version": self._HOTSPOT_CACHE_VERSION, "head": None, "commits": 0, "files": {}}
+
+            files = cast(Dict[str, Dict[str, Any]], tables["files"])
+            new_commits = 0
+            cmd = ["git", "log", "-z", "--numstat", "--no-renames", "--no-merges",
+                   "--format=%x1e%H%x1f%an%x1f%at", revision_range]
+            with closing(self._stream_git_records(cmd, repo_root, b"\x1e")) as records:
+                for record in records:
+                    if not record:
+                        continue
+                    header, _, stat_part = record.partition(b"\0")
+                    _, author, timestamp = header.decode("utf-8", errors="replace").split("\x1f", 2)
+                    new_commits += 1
+                    for entry in self._parse_numstat_tokens(stat_part.split(b"\0")):
+                        row = files.setdefault(entry["path"], {
+                            "commits": 0, "added": 0, "deleted": 0, "authors": [], "last_commit": 0
+                        })
+                        row["commits"] += 1
+                        row["added"] += entry["added"] or 0
+                        row["deleted"] += entry["deleted"] or 0
+                        if author not in row["authors"]:
+                            row["authors"].append(author)
+                        row["last_commit"] = max(row["last_commit"], int(timestamp))
+
+            tables["head"] = head
+            tables["commits"] = int(tables.get("commits", 0)) + new_commits
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = cache_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(tables, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+            tables["new_commits"] = new_commits
+            return tables
+
+    def git_hotspots(self, args: Dict[str, Any]) -> str:
+        """Churn x kompleksite hotspot sıralaması"""
+        try:
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            repo_root = self._git_toplevel(repo_path)
+            limit = max(1, self._get_int(args, "limit", 20))
+            path_prefix = (self._get_optional_str(args, "path_prefix") or "").replace("\\", "/").strip("/")
+            rebuild = self._get_bool(args, "rebuild", False)
+
+            tables = self._update_churn_tables(repo_root, rebuild)
+            files = cast(Dict[str, Dict[str, Any]], tables["files"])
+
+            # Sadece çalışma ağacında hâlâ var olan dosyalar; kompleksite en çok
+            # değişen adaylar için hesaplanır
+            candidates = sorted(
+                (path for path in files
+                 if (not path_prefix or path.startswith(path_prefix + "/") or path == path_prefix)
+                 and os.path.isfile(os.path.join(repo_root, path))),
+                key=lambda path: (files[path]["commits"], files[path]["added"] + files[path]["deleted"]),
+                reverse=True,
+            )[:limit * 5]
+
+            hotspots: List[Dict[str, Any]] = []
+            for path in candidates:
+                row = files[path]
+                complexity = 0
+                language = self._detect_language(path)
+                if language in ("Python", "JavaScript", "TypeScript", "Java"):
+                    try:
+                        full_path = os.path.join(repo_root, path)
+                        with self.path_locks.read(full_path):
+                            with open(full_path, "r", encoding="utf-8") as f:
+                                content = f.read()
+                        # Yalnızca kompleksite skoru gerekir; ast kurulmaz
+                        analysis = self._build_code_analysis(full_path, content, detail="fast")
+                        complexity = int(cast(Dict[str, Any], analysis["metrics"])["complexity_score"])
+                    except (OSError, UnicodeDecodeError):
+                        complexity = 0
+                hotspots.append({
+                    "path": path,
+                    "commits": row["commits"],
+                    "lines_changed": row["added"] + row["deleted"],
+                    "authors": len(row["authors"]),
+                    "last_commit": time.strftime("%Y-%m-%d", time.localtime(row["last_commit"])),
+                    "complexity": complexity,
+                    "score": row["commits"] * max(complexity, 1),
+                })
+            hotspots.sort(key=lambda item: (item["score"], item["commits"]), reverse=True)
+
+            return json.dumps({
+                "head": tables["head"],
+                "commits_analyzed": tables["commits"],
+                "new_commits": tables["new_commits"],
+                "files_tracked": len(files),
+                "hotspots": hotspots[:limit],
+            }, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def _repo_info(self, repo_path: str) -> Dict[str, Any]:
+        return self.repo_info_cache.info(self._object_db(self._git_toplevel(repo_path)))
+
+    def git_repo_info(self, args: Dict[str, Any]) -> str:
+        """Repository meta verisi (HEAD, branch'ler, remote'lar, ahead/behind)"""
+        try:
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            with_ahead_behind = self._get_bool(args, "ahead_behind", True)
+            repo_root = self._git_toplevel(repo_path)
+            odb = self._object_db(repo_root)
+            info = self.repo_info_cache.info(odb)
+
+            if with_ahead_behind:
+                branches = [dict(branch) for branch in cast(List[Dict[str, Any]], info["branches"])]
+                for branch in branches:
+                    upstream_oid = branch.get("upstream_oid")
+                    if not upstream_oid:
+                        continue
+                    try:
+                        branch["ahead"], branch["behind"] = self.repo_info_cache.ahead_behind(
+                            odb, branch["oid"], upstream_oid
+                        )
+                    except GitObjectUnsupported:
+                        result = self._run_subprocess(
+                            ["git", "rev-list", "--left-right", "--count", f"{branch['oid']}...{upstream_oid}"],
+                            cwd=repo_root,
+                        )
+                        if result.returncode == 0:
+                            ahead, behind = result.stdout.split()
+                            branch["ahead"], branch["behind"] = int(ahead), int(behind)
+                info = dict(info, branches=branches)
+            return json.dumps(info, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def _pipeline_steps(self, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """steps listesini ya da kısa yoldaki (paths/message/tag/push) argümanları adımlara çevir"""
+        raw_steps = args.get("steps")
+        if isinstance(raw_steps, list):
+            return [cast(Dict[str, Any], step) for step in cast(List[Any], raw_steps) if isinstance(step, dict)]
+        steps: List[Dict[str, Any]] = []
+        if "paths" in args or "message" in args:
+            steps.append({"action": "stage", "paths": self._get_str_list(args, "paths") or ["."]})
+        if "message" in args:
+            steps.append({"action": "commit", "message": args["message"]})
+        if args.get("tag"):
+            steps.append({"action": "tag", "name": args["tag"]})
+        if self._get_bool(args, "push", False):
+            steps.append({"action": "push", "remote": args.get("remote", "origin"), "branch": args.get("branch")})
+        return steps
+
+    def _pipeline_step_command(self, step: Dict[str, Any], created_tags: List[str]) -> List[str]:
+        """Bir pipeline adımını git komutuna çevir; eksik/hatalı adımda ValueError"""
+        action = str(step.get("action", ""))
+        if action == "stage":
+            paths = self._get_str_list(step, "paths") or ["."]
+            return ["git", "add", "--"] + paths
+        if action == "commit":
+            cmd = ["git", "commit", "-m", self._get_required_str(step, "message")]
+            if self._get_bool(step, "allow_empty", False):
+                cmd.append("--allow-empty")
+            return cmd
+        if action == "tag":
+            tag_name = self._get_required_str(step, "name")
+            tag_message = self._get_optional_str(step, "message")
+            return ["git", "tag"] + (["-a", "-m", tag_message] if tag_message else []) + [tag_name]
+        if action == "push":
+            remote = str(step.get("remote") or "origin")
+            branch = self._get_optional_str(step, "branch")
+            refspecs = [f"HEAD:{branch}" if branch else "HEAD"]
+            # Bu pipeline'da oluşturulan tag'ler aynı push ile gider
+            if self._get_bool(step, "tags", True):
+                refspecs += [f"refs/tags/{tag}" for tag in created_tags]
+            return ["git", "push", remote] + refspecs
+        raise ValueError(f"Bilinmeyen adım: {action}")
+
+    def git_pipeline(self, args: Dict[str, Any]) -> str:
+        """Stage -> commit -> tag -> push sırasını tek istekte çalıştır"""
+        try:
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            steps = self._pipeline_steps(args)
+            if not steps:
+                return "Hata: Çalıştırılacak adım yok (steps veya message verin)"
+
+            env = self._git_env()
+            created_tags: List[str] = []
+            report: List[Dict[str, Any]] = [
+                {"step": index + 1, "action": str(step.get("action", ""))} for index, step in enumerate(steps)
+            ]
+            failed_at: Optional[int] = None
+            pipeline_started = time.perf_counter()
+
+            # Adımlar çalıştırılmadan önce doğrulanır: hatalı bir adım yarım kalmış bir
+            # pipeline (ör. commit atılmış ama tag'lenmemiş) bırakmaz
+            for index, step in enumerate(steps):
+                try:
+                    self._pipeline_step_command(step, created_tags)
+                except ValueError as e:
+                    report[index].update(status="failed", duration_ms=0.0, error=str(e))
+                    if failed_at is None:
+                        failed_at = index
+
+            for index, step in enumerate(steps):
+                entry = report[index]
+                if failed_at is not None:
+                    entry.setdefault("status", "skipped")
+                    continue
+
+                cmd = self._pipeline_step_command(step, created_tags)
+                started = time.perf_counter()
+                result = self._run_subprocess(cmd, cwd=repo_path, env=env)
+                entry["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                if result.returncode == 0:
+                    entry["status"] = "ok"
+                    output = (result.stdout.strip() or result.stderr.strip()).splitlines()
+                    if output:
+                        entry["output"] = output[0]
+                    if entry["action"] == "tag":
+                        created_tags.append(str(step["name"]))
+                else:
+                    entry["status"] = "failed"
+                    entry["error"] = (result.stderr.strip() or result.stdout.strip())
+                    failed_at = index
+
+            summary: Dict[str, Any] = {
+                "ok": failed_at is None,
+                "failed_step": None if failed_at is None else failed_at + 1,
+                "total_ms": round((time.perf_counter() - pipeline_started) * 1000, 1),
+                "steps": report,
+            }
+            return json.dumps(summary, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    # === Akış Halinde Log/Diff ===
+
+    @staticmethod
+    def _stream_git_records(cmd: List[str], cwd: str, separator: bytes) -> Iterator[bytes]:
+        """git çıktısını parça parça okuyup kayıt kayıt üret; tamamı asla bellekte tutulmaz
+
+        stderr geçici dosyaya yazılır: pipe'ta dolan stderr (ör. dosya başına CRLF
+        uyarıları) stdout okunurken git'i bekletip kilitlenmeye yol açardı.
+        """
+        errors = tempfile.TemporaryFile()
+        try:
+            proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=errors)
+        except BaseException:
+            errors.close()
+            raise
+        stdout = cast(Any, proc.stdout)
+        completed = False
+        try:
+            pending = b""
+            while True:
+                chunk = stdout.read1(65536)
+                if not chunk:
+                    break
+                pending += chunk
+                records = pending.split(separator)
+                pending = records.pop()
+                for record in records:
+                    yield record
+            if pending:
+                yield pending
+            if proc.wait() != 0:
+                errors.seek(0)
+                raise RuntimeError(errors.read().decode("utf-8", errors="replace").strip())
+            completed = True
+        finally:
+            # Sayfa dolduğunda erken çıkılırsa git süreci sonlandırılır
+            if not completed and proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            stdout.close()
+            errors.close()
+
+    @staticmethod
+    def _parse_numstat_tokens(tokens: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+        """`--numstat -z` girdilerini çöz (rename: 'a\\tb\\t' + NUL eski NUL yeni)"""
+        iterator = iter(tokens)
+        for token in iterator:
+            token = token.lstrip(b"\n")
+            if not token:
+                continue
+            added, deleted, path = token.split(b"\t", 2)
+            entry: Dict[str, Any] = {
+                "added": None if added == b"-" else int(added),
+                "deleted": None if deleted == b"-" else int(deleted),
+            }
+            if path:
+                entry["path"] = path.decode("utf-8", errors="replace")
+            else:
+                entry["orig_path"] = next(iterator, b"").decode("utf-8", errors="replace")
+                entry["path"] = next(iterator, b"").decode("utf-8", errors="replace")
+            yield entry
+
+    @staticmethod
+    def _encode_cursor(state: Dict[str, Any]) -> str:
+        raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> Dict[str, Any]:
+        if not cursor:
+            return {}
+        try:
+            return cast(Dict[str, Any], json.loads(base64.urlsafe_b64decode(cursor.encode("ascii"))))
+        except Exception:
+            raise ValueError("Geçersiz cursor")
+
+    def _resolve_commit_oid(self, repo_root: str, revision: str) -> str:
+        """Revizyonu sabit oid'e çevir (sayfalama boyunca aynı geçmiş görülsün)"""
+        try:
+            oid = self._object_db(repo_root).resolve_revision(revision)
+            if oid:
+                return oid
+        except GitObjectUnsupported:
+            pass
+        result = self._run_subprocess(["git", "rev-parse", "--verify", f"{revision}^{{commit}}"], cwd=repo_root)
+        if result.returncode != 0:
+            raise ValueError(f"Revizyon bulunamadı: {revision}")
+        return result.stdout.strip()
+
+    def _log_filters(self, repo_root: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """author/since/until filtrelerini hazırla; tarihler git'in kendi ayrıştırıcısıyla epoch'a çevrilir"""
+        filters: Dict[str, Any] = {}
+        if args.get("author"):
+            filters["author"] = str(args["author"])
+        for key, flag in (("since", "--max-age="), ("until", "--min-age=")):
+            if not args.get(key):
+                continue
+            result = self._run_subprocess(["git", "rev-parse", f"--{key}={args[key]}"], cwd=repo_root)
+            value = result.stdout.strip()
+            if result.returncode != 0 or not value.startswith(flag):
+                raise ValueError(f"Geçersiz tarih: {args[key]}")
+            filters[key] = int(value[len(flag):])
+        return filters
+
+    def git_log(self, args: Dict[str, Any]) -> str:
+        """Sayfalı, akış halinde git log"""
+        try:
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            repo_root = self._git_toplevel(repo_path)
+            page_size = max(1, min(self._get_int(args, "page_size", 50), 500))
+            with_stat = self._get_bool(args, "stat", False)
+            cursor = self._decode_cursor(self._get_optional_str(args, "cursor"))
+
+            if cursor:
+                head = str(cursor["head"])
+                pending = cast(List[str], cursor["pending"])
+                paths = cast(List[str], cursor.get("paths", []))
+                filters = cast(Dict[str, Any], cursor.get("filters", {}))
+            else:
+                head = self._resolve_commit_oid(repo_root, str(args.get("revision", "HEAD")))
+                pending = [head]
+                paths = self._get_str_list(args, "paths")
+                filters = self._log_filters(repo_root, args)
+            author_pattern = re.compile(filters["author"]) if filters.get("author") else None
+
+            # Sayfalama --skip yerine yürüyüşün sınırından devam eder: cursor, gezilmiş
+            # commit'lerin henüz gezilmemiş ebeveynlerini taşır (doğrusal geçmişte `<son oid>^`).
+            # Filtreler Python'da uygulanır ki elenen commit'lerin ebeveynleri de sınıra girsin;
+            # --parents yol filtresinde sadeleştirilmiş (yeniden yazılmış) ebeveynleri verir.
+            # --date-order bir ebeveyni tüm çocuklarından sonra verir; varsayılan sırada
+            # birleştirmeli geçmişte yazılmış bir commit sınıra geri girip tekrar görünürdü.
+            cmd = ["git", "log", "-z", "--parents", "--date-order",
+                   "--format=%x1e%H%x1f%P%x1f%an%x1f%ae%x1f%at%x1f%ct%x1f%s"]
+            if with_stat:
+                cmd += ["--numstat", "--no-renames"]
+            cmd += pending + ["--"] + paths
+
+            commits: List[Dict[str, Any]] = []
+            # İlk sayfada HEAD yol filtresine takılıp görünmeyebilir; o zaman yerini ilk
+            # görünen commit alır. Sonraki sayfaların sınırı hep görünür commit'lerden oluşur.
+            frontier: Dict[str, None] = dict.fromkeys(pending) if cursor else {}
+            has_more = False
+            with closing(self._stream_git_records(cmd, repo_root, b"\x1e")) as records:
+                for record in records:
+                    if not record:
+                        continue
+                    header, _, stat_part = record.partition(b"\0")
+                    oid, parents, author, email, timestamp, commit_time, subject = (
+                        header.decode("utf-8", errors="replace").split("\x1f", 6)
+                    )
+                    if "since" in filters and int(commit_time) < filters["since"]:
+                        break  # tarih sıralı yürüyüşte geri kalanı daha eski
+                    matches = (
+                        ("until" not in filters or int(commit_time) <= filters["until"])
+                        and (author_pattern is None or author_pattern.search(f"{author} <{email}>") is not None)
+                    )
+                    if len(commits) == page_size:
+                        if matches:
+                            has_more = True
+                            break
+                        continue
+                    frontier.pop(oid, None)
+                    frontier.update(dict.fromkeys(parents.split()))
+                    if not matches:
+                        continue
+                    commit: Dict[str, Any] = {
+                        "oid": oid,
+                        "parents": parents.split() if parents else [],
+                        "author": author,
+                        "email": email,
+                        "timestamp": int(timestamp),
+                        "subject": subject,
+                    }
+                    if with_stat:
+                        commit["files"] = list(self._parse_numstat_tokens(stat_part.split(b"\0")))
+                    commits.append(commit)
+
+            page: Dict[str, Any] = {"head": head, "commits": commits, "has_more": has_more}
+            if has_more:
+                page["next_cursor"] = self._encode_cursor(
+                    {"head": head, "pending": list(frontier), "paths": paths, "filters": filters}
+                )
+            return json.dumps(page, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def git_diff(self, args: Dict[str, Any]) -> str:
+        """Sayfalı, akış halinde git diff"""
+        try:
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            repo_root = self._git_toplevel(repo_path)
+            page_size = max(1, self._get_int(args, "page_size", 100))
+            mode = str(args.get("mode", "numstat"))
+            max_patch_bytes = self._get_int(args, "max_patch_bytes", 100000)
+            cursor = self._decode_cursor(self._get_optional_str(args, "cursor"))
+
+            if cursor:
+                revisions = cast(List[str], cursor["revisions"])
+                cached = bool(cursor.get("cached"))
+                paths = cast(List[str], cursor.get("paths", []))
+            else:
+                revisions = [
+                    self._resolve_commit_oid(repo_root, str(args[key]))
+                    for key in ("from_revision", "to_revision") if args.get(key)
+                ]
+                cached = self._get_bool(args, "cached", False)
+                paths = self._get_str_list(args, "paths")
+            skip = int(cursor.get("skip", 0))
+
+            base_cmd = ["git", "diff"] + (["--cached"] if cached else []) + revisions
+            files: List[Dict[str, Any]] = []
+            has_more = False
+            numstat_cmd = base_cmd + ["--numstat", "-z", "--"] + paths
+            with closing(self._stream_git_records(numstat_cmd, repo_root, b"\0")) as tokens:
+                for index, entry in enumerate(self._parse_numstat_tokens(tokens)):
+                    if index < skip:
+                        continue
+                    if len(files) == page_size:
+                        has_more = True
+                        break
+                    files.append(entry)
+
+            page: Dict[str, Any] = {"revisions": revisions, "cached": cached, "files": files, "has_more": has_more}
+            if mode == "patch" and files:
+                # Sayfadaki yollar birebir eşleşmeli: '*', '?' ya da ':' içeren adlar desen sayılmasın
+                page_paths = sorted({f":(literal){p}" for f in files for p in (f["path"], f.get("orig_path")) if p})
+                patch_chunks: List[bytes] = []
+                patch_size = 0
+                truncated = False
+                with closing(self._stream_git_records(base_cmd + ["--"] + page_paths, repo_root, b"\n")) as lines:
+                    for line in lines:
+                        if patch_size + len(line) + 1 > max_patch_bytes:
+                            truncated = True
+                            break
+                        patch_chunks.append(line)
+                        patch_size += len(line) + 1
+                page["patch"] = b"\n".join(patch_chunks).decode("utf-8", errors="replace")
+                page["patch_truncated"] = truncated
+            if has_more:
+                page["next_cursor"] = self._encode_cursor(
+                    {"revisions": revisions, "cached": cached, "paths": paths, "skip": skip + page_size}
+                )
+            return json.dumps(page, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    # === Git Nesne Okuma (cat-file havuzu) ===
+
+    def _object_db(self, repo_root: str) -> GitObjectDatabase:
+        git_dir = self.status_service.git_dir(repo_root)
+        odb = self._object_dbs.get(git_dir)
+        if odb is None:
+            odb = GitObjectDatabase(git_dir)
+            self._object_dbs[git_dir] = odb
+        return odb
+
+    def _read_git_object(self, repo_root: str, spec: str) -> Optional[Dict[str, Any]]:
+        """Önce süreçsiz okuyucu, desteklenmeyen durumda kalıcı cat-file süreci"""
+        try:
+            return self._object_db(repo_root).read_spec(spec)
+        except GitObjectUnsupported as e:
+            print(f"INFO: object reader fallback to git cat-file ({e})", file=sys.stderr)
+            return self.cat_file_pool.read(repo_root, spec)
+
+    def _read_git_object_size(self, repo_root: str, oid: str) -> Optional[int]:
+        try:
+            return self._object_db(repo_root).header(oid)[1]
+        except GitObjectUnsupported:
+            info = self.cat_file_pool.check(repo_root, oid)
+            return int(info["size"]) if info else None
+
+    @staticmethod
+    def _format_blob(label: str, data: bytes, max_bytes: int) -> str:
+        if b"\0" in data[:8000]:
+            return f"{label}: ikili dosya ({len(data)} bytes)"
+        truncated = len(data) > max_bytes
+        text = data[:max_bytes].decode("utf-8", errors="replace")
+        header = f"{label}\nToplam Satır: {len(text.splitlines())}"
+        if truncated:
+            header += f" (ilk {max_bytes} / {len(data)} byte)"
+        return f"{header}\n\n{text}"
+
+    def git_show_file(self, args: Dict[str, Any]) -> str:
+        """Revizyondaki dosyayı oku"""
+        try:
+            file_path = self._get_required_str(args, "file_path").replace("\\", "/").lstrip("/")
+            revision = str(args.get("revision", "HEAD"))
+            max_bytes = self._get_int(args, "max_bytes", 200000)
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            repo_root = self._git_toplevel(repo_path)
+
+            obj = self._read_git_object(repo_root, f"{revision}:{file_path}")
+            if obj is None:
+                return f"Hata: {revision}:{file_path} bulunamadı"
+            if obj["type"] != "blob":
+                return f"Hata: {revision}:{file_path} bir dosya değil ({obj['type']})"
+            return self._format_blob(f"Dosya içeriği ({revision}:{file_path}):", obj["data"], max_bytes)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def git_ls_tree(self, args: Dict[str, Any]) -> str:
+        """Revizyondaki dizin ağacını listele"""
+        try:
+            revision = str(args.get("revision", "HEAD"))
+            tree_path = str(args.get("path", "")).replace("\\", "/").strip("/")
+            show_size = self._get_bool(args, "show_size", False)
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            repo_root = self._git_toplevel(repo_path)
+
+            spec = f"{revision}:{tree_path}" if tree_path else f"{revision}^{{tree}}"
+            obj = self._read_git_object(repo_root, spec)
+            if obj is None:
+                return f"Hata: {spec} bulunamadı"
+            if obj["type"] != "tree":
+                return f"Hata: {spec} bir dizin değil ({obj['type']})"
+
+            entries = GitObjectDatabase.parse_tree(obj["data"], len(obj["oid"]) // 2)
+            lines: List[str] = []
+            for entry in entries:
+                size = ""
+                if show_size:
+                    size = "-"
+                    if entry["type"] == "blob":
+                        blob_size = self._read_git_object_size(repo_root, entry["oid"])
+                        size = str(blob_size) if blob_size is not None else "?"
+                    size = f" {size:>8}"
+                lines.append(f"{entry['mode']} {entry['type']} {entry['oid']}{size}\t{entry['name']}")
+            return f"Ağaç ({spec}) - {len(entries)} girdi:\n" + "\n".join(lines)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def git_read_at_revision(self, args: Dict[str, Any]) -> str:
+        """Birden fazla (revizyon, dosya) çiftini kalıcı süreç üzerinden oku"""
+        try:
+            paths = [path.replace("\\", "/").lstrip("/") for path in self._get_str_list(args, "paths")]
+            if not paths:
+                raise ValueError("Missing required argument: paths")
+            revisions = self._get_str_list(args, "revisions") or ["HEAD"]
+            max_bytes = self._get_int(args, "max_bytes", 20000)
+            max_objects = self._get_int(args, "max_objects", 200)
+            working_directory = self._get_optional_str(args, "working_directory")
+            repo_path = self._resolve_path(str(args.get("repo_path", ".")), working_directory)
+            repo_root = self._git_toplevel(repo_path)
+
+            pairs = [(revision, path) for revision in revisions for path in paths]
+            sections: List[str] = []
+            for revision, path in pairs[:max_objects]:
+                obj = self._read_git_object(repo_root, f"{revision}:{path}")
+                if obj is None:
+                    sections.append(f"=== {revision}:{path} ===\n(bulunamadı)")
+                elif obj["type"] != "blob":
+                    sections.append(f"=== {revision}:{path} ===\n({obj['type']} - dosya değil)")
+                else:
+                    sections.append(self._format_blob(f"=== {revision}:{path} ===", obj["data"], max_bytes))
+
+            output = "\n\n".join(sections)
+            if len(pairs) > max_objects:
+                output += f"\n\n... {len(pairs) - max_objects} nesne atlandı (max_objects={max_objects})"
+            return output
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    # === Kod Agent İşlevleri ===
+
+    _ANALYZE_LANGUAGE_MAP = {
+        '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
+        '.html': 'HTML', '.css': 'CSS', '.java': 'Java',
+        '.cpp': 'C++', '.c': 'C', '.json': 'JSON', '.md': 'Markdown'
+    }
+
+    @classmethod
+    def _detect_language(cls, file_path: str) -> str:
+        extension = os.path.splitext(file_path)[1].lower()
+        return cls._ANALYZE_LANGUAGE_MAP.get(extension, 'Unknown')
+
+    @staticmethod
+    def _analysis_detail(content: str, language: str, detail: str = "auto") -> str:
+        """Python için 'full' (ast) ya da 'fast' (lexical); fast yalnızca açıkça istenirse
+
+        Boyuttan bağımsız olarak ast varsayılandır; lexical_metrics ayrıştırılamayan
+        dosyaların yedeğidir.
+        """
+        if language == 'Python' and detail == "fast":
+            return "fast"
+        return "full"
+
+    @staticmethod
+    def _compute_code_metrics(content: str, language: str, detail: str = "auto") -> Dict[str, Any]:
+        """Satır, yorum, fonksiyon/class ve kompleksite metrikleri"""
+        if language == 'Python':
+            if KayradenizToolServer._analysis_detail(content, language, detail) == "fast":
+                # Fonksiyon listesi ve performans bulguları gerekmiyorsa ast kurulmaz
+                return dict(PythonSourceAnalyzer.lexical_metrics(content), detail="fast")
+            try:
+                return dict(PythonSourceAnalyzer.analyze(content), detail="full")
+            except (SyntaxError, ValueError) as e:
+                # Ayrıştırılamayan dosyada ast'siz metriklere düş
+                metrics = dict(PythonSourceAnalyzer.lexical_metrics(content), detail="fast")
+                metrics["parse_error"] = f"satır {getattr(e, 'lineno', '?')}: {getattr(e, 'msg', str(e))}"
+                return metrics
+        if language in ('JavaScript', 'TypeScript', 'Java'):
+            return CFamilyLexer.metrics(content, language)
+        return KayradenizToolServer._estimate_code_metrics(content, language)
+
+    @staticmethod
+    def _estimate_code_metrics(content: str, language: str) -> Dict[str, Any]:
+        """Satır tabanlı yaklaşık metrikler (ayrı analizcisi olmayan diller için)"""
+        lines: List[str] = content.split('\n')
+        total_lines = len(lines)
+        non_empty_lines = len([line for line in lines if line.strip()])
+        comment_lines = 0
+        function_count = 0
+        class_count = 0
+        complexity_score = 0
+        
+        # Kod kalitesi metrikleri
+        comment_ratio = (comment_lines / non_empty_lines * 100) if non_empty_lines > 0 else 0
+        avg_line_length = sum(len(line) for line in lines) / len(lines) if lines else 0
+        return {
+            "total_lines": total_lines,
+            "non_empty_lines": non_empty_lines,
+            "comment_lines": comment_lines,
+            "function_count": function_count,
+            "class_count": class_count,
+            "complexity_score": complexity_score,
+            "comment_ratio": comment_ratio,
+            "avg_line_length": avg_line_length,
+        }
+    
+    @classmethod
+    def _build_code_analysis(cls, file_path: str, content: str, detail: str = "auto") -> Dict[str, Any]:
+        """Dosya analizini yapılandırılmış sonuç olarak üret (süreç havuzundan da çağrılır)
+
+        Sonuç içerik özeti + analiz sürümüyle cache'lenir; değişmemiş dosya tek
+        bir hash maliyetindedir. detail: auto | full | fast (bkz. _analysis_detail).
+        """
+        language = cls._detect_language(file_path)
+        mode = cls._analysis_detail(content, language, detail)
+        cache = AnalysisResultCache.shared()
+        key = cache.make_key(content, f"{language}:{mode}")
+        cached = cache.get(key)
+        if cached is not None:
+            return dict(cached, file=os.path.basename(file_path), path=file_path, cached=True)
+        result = cls._analyze_content(language, content, mode)
+        cache.put(key, result)
+        return dict(result, file=os.path.basename(file_path), path=file_path, cached=False)
+
+    @classmethod
+    def _analyze_content(cls, language: str, content: str, detail: str = "auto") -> Dict[str, Any]:
+        """Sadece içeriğe bağlı analiz (dosya adı/yolu içermez; cache'lenebilir)"""
+        metrics = cls._compute_code_metrics(content, language, detail)
+        non_empty_lines = int(metrics["non_empty_lines"])
+        function_count = int(metrics["function_count"])
+        complexity_score = int(metrics["complexity_score"])
+        comment_ratio = float(metrics["comment_ratio"])
+        avg_line_length = float(metrics["avg_line_length"])
+
+        # Potansiyel sorunlar: {code, message, line?}
+        issues: List[Dict[str, Any]] = []
+        if metrics.get("parse_error"):
+            issues.append({"code": "parse-error",
+                           "message": f"Sözdizimi hatası ({metrics['parse_error']}) - metrikler yaklaşık"})
+        if comment_ratio < 10:
+            issues.append({"code": "low-comment-ratio",
+                           "message": "Düşük comment oranı - daha fazla dokümantasyon gerekli"})
+        if avg_line_length > 100:
+            issues.append({"code": "long-lines", "message": "Çok uzun satırlar - okunabilirlik sorunu"})
+        if complexity_score > non_empty_lines * 0.3:
+            issues.append({"code": "high-complexity", "message": "Yüksek kompleksite - refactoring gerekebilir"})
+        if function_count == 0 and non_empty_lines > 20:
+            issues.append({"code": "no-functions",
+                           "message": "Fonksiyonlara bölünmemiş kod - modüler yapı eksik"})
+        functions = cast(List[Dict[str, Any]], metrics.get("functions", []))
+        for function in functions:
+            if function["complexity"] > 10:
+                issues.append({
+                    "code": "complex-function",
+                    "message": f"{function['qualname']} kompleksitesi {function['complexity']} - bölünmesi önerilir",
+                    "line": function["line"],
+                })
+            if function["max_nesting"] > 4:
+                issues.append({
+                    "code": "deep-nesting",
+                    "message": f"{function['qualname']} {function['max_nesting']} seviye iç içe blok içeriyor",
+                    "line": function["line"],
+                })
+
+        # Güvenlik kontrolleri
+        security_issues: List[Dict[str, Any]] = []
+        if language == 'Python':
+            if "security" in metrics:
+                for finding in cast(List[Dict[str, Any]], metrics["security"]):
+                    security_issues.append({"code": finding["call"], "line": finding["line"],
+                                            "message": PythonSourceAnalyzer.SECURITY_CALLS[finding["call"]]})
+            else:
+                for call, message in PythonSourceAnalyzer.SECURITY_CALLS.items():
+                    if f"{call}(" in content:
+                        security_issues.append({"code": call, "message": message})
+        elif language in ['JavaScript', 'TypeScript']:
+            for finding in cast(List[Dict[str, Any]], metrics["security"]):
+                security_issues.append({"code": finding["call"], "line": finding["line"],
+                                        "message": CFamilyLexer.SECURITY_MESSAGES[finding["call"]]})
+
+        # Performans önerileri: ast/token geçişindeki kuralların konumlu bulguları
+        performance_tips: List[Dict[str, Any]] = list(metrics.get("performance", []))
+        if language == 'Python':
+            star_imports = metrics.get("star_imports")
+            if star_imports is None:
                 if 'import *' in content:
-                    performance_tips.append("💨 Spesifik import'lar kullanın (from x import y)")
-            elif language in ['JavaScript', 'TypeScript']:
-                if content.count('document.getElementById') > 3:
-                    performance_tips.append("💨 DOM elementlerini cache'leyin")
-                if 'var ' in content:
-                    performance_tips.append("💨 let/const kullanın, var yerine")
-            
-            analysis = f"""
+                    performance_tips.append({"code": "star-import",
+                                             "message": "Spesifik import'lar kullanın (from x import y)"})
+            else:
+                for line_no in cast(List[int], star_imports):
+                    performance_tips.append({"code": "star-import", "line": line_no,
+                                             "message": "Spesifik import'lar kullanın (from x import y)"})
+        elif language in ['JavaScript', 'TypeScript']:
+            if int(metrics["var_count"]) > 0:
+                performance_tips.append({"code": "var-declaration", "message": "let/const kullanın, var yerine"})
+        performance_tips.sort(key=lambda item: int(item.get("line", 0)))
+
+        return {
+            "language": language,
+            "size_bytes": len(content.encode('utf-8')),
+            "metrics": {key: value for key, value in metrics.items()
+                        if key not in ("functions", "security", "function_lines", "performance")},
+            "functions": functions,
+            "issues": issues,
+            "security_issues": security_issues,
+            "performance_tips": performance_tips,
+        }
+
+    @staticmethod
+    def _render_code_analysis(result: Dict[str, Any]) -> str:
+        """Analiz sonucunu metin raporuna çevir"""
+        metrics = cast(Dict[str, Any], result["metrics"])
+        language = result["language"]
+        total_lines = int(metrics["total_lines"])
+        non_empty_lines = int(metrics["non_empty_lines"])
+        comment_lines = int(metrics["comment_lines"])
+        function_count = int(metrics["function_count"])
+        class_count = int(metrics["class_count"])
+        complexity_score = int(metrics["complexity_score"])
+        comment_ratio = float(metrics["comment_ratio"])
+        avg_line_length = float(metrics["avg_line_length"])
+        issues = cast(List[Dict[str, Any]], result["issues"])
+        security_issues = cast(List[Dict[str, Any]], result["security_issues"])
+        performance_tips = cast(List[Dict[str, Any]], result["performance_tips"])
+
+        def finding(icon: str, item: Dict[str, Any]) -> str:
+            where = f" (satır {item['line']})" if item.get("line") else ""
+            return f"   {icon} {item['message']}{where}\n"
+
+        nesting_line = ""
+        if "max_nesting_depth" in metrics:
+            nesting_line = f"├─ Maks. iç içe blok derinliği: {metrics['max_nesting_depth']}\n"
+        if metrics.get("detail") == "fast" and not metrics.get("parse_error"):
+            nesting_line += ("├─ Hızlı analiz (ast'siz): fonksiyon ve performans bulguları için "
+                             "detail='full' kullanın\n")
+
+        analysis = f"""
 🎯 KayraDeniz Kod Analizi Raporu
 {'='*50}
 
-📁 **Dosya:** {os.path.basename(file_path)}
+📁 **Dosya:** {result['file']}
 🔤 **Dil:** {language}
-📊 **Boyut:** {os.path.getsize(file_path)} bytes
+📊 **Boyut:** {result['size_bytes']} bytes
 
 📈 **Kod Metrikleri:**
 ├─ Toplam satır: {total_lines}
@@ -1127,7 +7335,7 @@ class KayradenizToolServer:
 ├─ Fonksiyon sayısı: {function_count}
 ├─ Class sayısı: {class_count}
 ├─ Ortalama satır uzunluğu: {avg_line_length:.1f} karakter
-└─ Kompleksite skoru: {complexity_score}
+{nesting_line}└─ Kompleksite skoru: {complexity_score}
 
 📊 **Kod Kalitesi Değerlendirmesi:**
 ├─ Comment Coverage: {'✅ İyi' if comment_ratio >= 15 else '⚠️ Düşük' if comment_ratio >= 5 else '❌ Yetersiz'}
@@ -1136,22 +7344,33 @@ class KayradenizToolServer:
 └─ Modularity: {'✅ İyi' if function_count > 0 or non_empty_lines <= 50 else '⚠️ Geliştirilmeli'}
 """
 
-            if issues:
-                analysis += f"\n🔍 **Tespit Edilen Sorunlar:**\n"
-                for issue in issues:
-                    analysis += f"   {issue}\n"
-            
-            if security_issues:
-                analysis += f"\n🛡️ **Güvenlik Uyarıları:**\n"
-                for issue in security_issues:
-                    analysis += f"   {issue}\n"
-            
-            if performance_tips:
-                analysis += f"\n⚡ **Performans Önerileri:**\n"
-                for tip in performance_tips:
-                    analysis += f"   {tip}\n"
-            
-            analysis += f"""
+        functions = cast(List[Dict[str, Any]], result.get("functions", []))
+        if functions:
+            ranked = sorted(functions, key=lambda item: int(item["complexity"]), reverse=True)[:5]
+            analysis += f"\n🧩 **En Karmaşık Fonksiyonlar:**\n"
+            for function in ranked:
+                prefix = "async " if function.get("is_async") else ""
+                analysis += (
+                    f"   {prefix}{function['qualname']} (satır {function['line']}): "
+                    f"kompleksite {function['complexity']}, derinlik {function['max_nesting']}\n"
+                )
+
+        if issues:
+            analysis += f"\n🔍 **Tespit Edilen Sorunlar:**\n"
+            for issue in issues:
+                analysis += finding("🔸", issue)
+        
+        if security_issues:
+            analysis += f"\n🛡️ **Güvenlik Uyarıları:**\n"
+            for issue in security_issues:
+                analysis += finding("⚠️", issue)
+        
+        if performance_tips:
+            analysis += f"\n⚡ **Performans Önerileri:**\n"
+            for tip in performance_tips:
+                analysis += finding("💨", tip)
+        
+        analysis += f"""
 💡 **İyileştirme Önerileri:**
    🔸 Kod tekrarlarını azaltın (DRY principle)
    🔸 Anlamlı değişken ve fonksiyon isimleri kullanın
@@ -1162,82 +7381,240 @@ class KayradenizToolServer:
 
 🚀 **Next Steps:**
    1. Priority: {'Güvenlik sorunlarını düzeltin' if security_issues else 'Kod kalitesini artırın'}
-   2. Refactoring: {'Gerekli' if complexity_score > non_empty_lines * 0.3 else 'Opsiyonel'}
-   3. Documentation: {'Kritik' if comment_ratio < 10 else 'İyileştirilebilir' if comment_ratio < 20 else 'Yeterli'}
-"""
-
-            return analysis
-            
-        except Exception as e:
-            return f"Hata: {str(e)}"
+   2. Refactoring: {'Gerekli' if complexity_score > non_empty_lines * 0.3 else 'Opsiyonel'}
+   3. Documentation: {'Kritik' if comment_ratio < 10 else 'İyileştirilebilir' if comment_ratio < 20 else 'Yeterli'}
+"""
+        return analysis
 
-    def code_agent_edit(self, args: Dict[str, Any]) -> str:
-        """Gelişmiş kod düzenleme önerileri"""
+    def code_agent_analyze(self, args: Dict[str, Any]) -> str:
+        """Gelişmiş kod analizi - AI destekli"""
         try:
             file_path_arg = self._get_required_str(args, "file_path")
-            edit_type = str(args.get("edit_type", "optimize"))  # optimize, refactor, fix, modernize
+            output_format = self._get_optional_str(args, "format") or "text"
+            detail = self._get_optional_str(args, "detail") or "auto"
+            if detail not in ("auto", "full", "fast"):
+                return f"Hata: Geçersiz detail: {detail} (auto, full, fast)"
             working_directory = self._get_optional_str(args, "working_directory")
             file_path = self._resolve_path(file_path_arg, working_directory)
 
             if not os.path.exists(file_path):
                 return f"Hata: Dosya bulunamadı: {file_path}"
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            lines = content.splitlines()
-            total_lines = len(lines)
-            preview_line_count = min(5, total_lines)
-            preview_snippet = lines[:preview_line_count]
-            
-            extension = os.path.splitext(file_path)[1].lower()
-            language_map = {
-                '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-                '.html': 'HTML', '.css': 'CSS', '.java': 'Java'
-            }
-            language = language_map.get(extension, 'Unknown')
+            with self.path_locks.read(file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
-            suggestions: List[str] = []
-            code_examples: List[str] = []
+            result = self._build_code_analysis(file_path, content, detail)
+            if output_format == "json":
+                return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+            return self._render_code_analysis(result)
             
-            if edit_type == "optimize":
-                suggestions = [
-                    "🚀 **Performans Optimizasyonu**",
-                    "├─ Gereksiz döngüleri optimize edin",
-                    "├─ Caching mekanizmaları ekleyin",
-                    "├─ Database sorgularını optimize edin",
-                    "├─ Memory kullanımını azaltın",
-                    "└─ Asynchronous operations kullanın"
-                ]
-                
-                if language == 'Python':
-                    code_examples.append("""
-🐍 **Python Optimizasyon Örneği:**
-```python
-# Önce (Yavaş)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    _PROJECT_LANGUAGES = ('Python', 'JavaScript', 'TypeScript', 'Java')
+    # Üretilmiş/minify edilmiş dev dosyalar analiz edilmez
+    _PROJECT_MAX_FILE_BYTES = 1024 * 1024
+
+    @classmethod
+    def _discover_source_files(cls, root: str, max_files: int,
+                               languages: Optional[Tuple[str, ...]] = None) -> List[Tuple[str, int, int]]:
+        """Filtreli scandir yürüyüşü; (yol, boyut, mtime_ns) listesi"""
+        extensions = {ext for ext, language in cls._ANALYZE_LANGUAGE_MAP.items()
+                      if language in (languages or cls._PROJECT_LANGUAGES)}
+        files: List[Tuple[str, int, int]] = []
+        stack: List[str] = [os.path.abspath(root)]
+        while stack and len(files) < max_files:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirectories: List[str] = []
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in cls._WALK_SKIP_DIRS:
+                            subdirectories.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    name = entry.name.lower()
+                    if os.path.splitext(name)[1] not in extensions or name.endswith(".min.js"):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if stat.st_size <= cls._PROJECT_MAX_FILE_BYTES:
+                    files.append((entry.path, stat.st_size, stat.st_mtime_ns))
+                    if len(files) >= max_files:
+                        break
+            stack.extend(reversed(subdirectories))
+        return files
+
+    def _shutdown_analysis_pool(self) -> None:
+        """Süreç havuzunu bekletmeden kapatır (atexit'e bir kez bağlanır)"""
+        pool, self._analysis_pool = self._analysis_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _project_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Süreç havuzu çağrılar arasında yeniden kullanılır"""
+        if self._analysis_pool is None or self._analysis_pool_workers != workers:
+            self._shutdown_analysis_pool()
+            # spawn: thread'li süreçte fork kilitleri kopyalayabilir; her platformda aynı davranış
+            self._analysis_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            self._analysis_pool_workers = workers
+        return self._analysis_pool
+
+    def code_agent_analyze_project(self, args: Dict[str, Any]) -> str:
+        """Proje genelinde paralel kod analizi"""
+        try:
+            working_directory = self._get_optional_str(args, "working_directory")
+            root = self._resolve_path(str(args.get("root", working_directory or ".")), working_directory)
+            if not os.path.isdir(root):
+                return f"Hata: Dizin bulunamadı: {root}"
+            workers = max(1, self._get_int(args, "workers", os.cpu_count() or 1))
+            chunk_size = max(1, self._get_int(args, "chunk_size", 32))
+            max_files = max(1, self._get_int(args, "max_files", 20000))
+            top = max(1, self._get_int(args, "top", 10))
+
+            started = time.perf_counter()
+            files = self._discover_source_files(root, max_files)
+            # Büyük dosyalar önce: son iş birimleri küçük kalır, süreçler birlikte biter
+            files.sort(key=lambda item: item[1], reverse=True)
+            chunks: List[List[str]] = [[] for _ in range((len(files) + chunk_size - 1) // chunk_size)]
+            for index, (path, _, _) in enumerate(files):
+                chunks[index % len(chunks)].append(path)
+
+            results: List[Dict[str, Any]] = []
+
+            def collect(chunk_results: List[Dict[str, Any]]) -> None:
+                for entry in chunk_results:
+                    entry["path"] = os.path.relpath(str(entry["path"]), root)
+                    results.append(entry)
+                    self._notify_progress(entry)
+
+            if workers == 1 or len(chunks) <= 1:
+                # Tek çekirdekte süreç başlatma maliyeti kazançtan büyük
+                for chunk in chunks:
+                    collect(_analyze_source_chunk(chunk))
+            else:
+                pool = self._project_pool(workers)
+                futures: Dict[Future, List[str]] = {pool.submit(_analyze_source_chunk, chunk): chunk for chunk in chunks}
+                for future in as_completed(futures):
+                    try:
+                        collect(future.result())
+                    except Exception as e:
+                        if isinstance(e, BrokenExecutor):
+                            # Ölen bir süreç havuzu bozar; sonraki çağrı yenisini kurar
+                            self._analysis_pool = None
+                        collect([{"path": path, "ok": False, "error": str(e)} for path in futures[future]])
+
+            analyzed = [entry for entry in results if entry.get("ok")]
+            totals: Dict[str, Any] = {
+                key: sum(int(entry[key]) for entry in analyzed)
+                for key in ("total_lines", "non_empty_lines", "comment_lines", "function_count",
+                            "class_count", "complexity_score", "security_count", "issue_count")
+            }
+            by_language: Dict[str, Dict[str, int]] = {}
+            for entry in analyzed:
+                bucket = by_language.setdefault(str(entry["language"]), {"files": 0, "lines": 0})
+                bucket["files"] += 1
+                bucket["lines"] += int(entry["total_lines"])
+            worst_files = sorted(
+                analyzed,
+                key=lambda entry: (int(entry["security_count"]), int(entry["complexity_score"]), int(entry["issue_count"])),
+                reverse=True,
+            )[:top]
+            worst_functions = sorted(
+                (dict(function, path=entry["path"]) for entry in analyzed for function in entry.get("top_functions", [])),
+                key=lambda function: int(function["complexity"]),
+                reverse=True,
+            )[:top]
+
+            return json.dumps({
+                "root": root,
+                "files": len(files),
+                "analyzed": len(analyzed),
+                "failed": len(results) - len(analyzed),
+                "cache_hits": sum(1 for entry in analyzed if entry.get("cached")),
+                "workers": workers if len(chunks) > 1 else 1,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "totals": totals,
+                "languages": by_language,
+                "worst_files": [
+                    {key: entry[key] for key in ("path", "language", "total_lines", "complexity_score",
+                                                 "security_count", "issue_count")}
+                    for entry in worst_files
+                ],
+                "worst_functions": worst_functions,
+            }, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    _EDIT_GUIDES: Dict[str, Dict[str, Any]] = {
+        "optimize": {
+            "icon": "🚀",
+            "title": "Performans Optimizasyonu",
+            "items": [
+                "Gereksiz döngüleri optimize edin",
+                "Caching mekanizmaları ekleyin",
+                "Database sorgularını optimize edin",
+                "Memory kullanımını azaltın",
+                "Asynchronous operations kullanın",
+            ],
+        },
+        "refactor": {
+            "icon": "♻️",
+            "title": "Code Refactoring",
+            "items": [
+                "Fonksiyonları küçük parçalara bölün",
+                "Code duplications'ı kaldırın",
+                "Design patterns uygulayın",
+                "SOLID principles'ı takip edin",
+                "Clean Code practices kullanın",
+            ],
+        },
+        "fix": {
+            "icon": "🐛",
+            "title": "Bug Fixes & Error Handling",
+            "items": [
+                "Null/undefined check'ler ekleyin",
+                "Try-catch blokları kullanın",
+                "Input validation yapın",
+                "Edge case'leri handle edin",
+                "Logging mekanizması ekleyin",
+            ],
+        },
+        "modernize": {
+            "icon": "🆕",
+            "title": "Modern Code Practices",
+            "items": [
+                "ES6+ features kullanın (JS/TS)",
+                "Type annotations ekleyin",
+                "Async/await patterns kullanın",
+                "Modern framework features kullanın",
+                "Best practices'a güncelleyin",
+            ],
+        },
+    }
+    # (düzenleme tipi, diller (boşsa hepsi), ikon, başlık, kod dili, kod)
+    _EDIT_EXAMPLES: List[Tuple[str, Tuple[str, ...], str, str, str, str]] = [
+        ("optimize", ("Python",), "🐍", "Python Optimizasyon Örneği", "python", """# Önce (Yavaş)
 result = []
 for item in large_list:
     if item > 10:
         result.append(item * 2)
 
 # Sonra (Hızlı)
-result = [item * 2 for item in large_list if item > 10]
-```""")
-                    
-            elif edit_type == "refactor":
-                suggestions = [
-                    "♻️ **Code Refactoring**",
-                    "├─ Fonksiyonları küçük parçalara bölün",
-                    "├─ Code duplications'ı kaldırın",
-                    "├─ Design patterns uygulayın",
-                    "├─ SOLID principles'ı takip edin",
-                    "└─ Clean Code practices kullanın"
-                ]
-                
-                if language == 'JavaScript':
-                    code_examples.append("""
-🔧 **JavaScript Refactoring Örneği:**
-```javascript
-// Önce (Karmaşık)
+result = [item * 2 for item in large_list if item > 10]"""),
+        ("refactor", ("JavaScript",), "🔧", "JavaScript Refactoring Örneği", "javascript", """// Önce (Karmaşık)
 function processUser(user) {
     if (user && user.name && user.email) {
         // lots of code here
@@ -1254,23 +7631,8 @@ function processUser(user) {
     if (!validateUser(user)) return null;
     // clean processing logic
     return result;
-}
-```""")
-                    
-            elif edit_type == "fix":
-                suggestions = [
-                    "🐛 **Bug Fixes & Error Handling**",
-                    "├─ Null/undefined check'ler ekleyin",
-                    "├─ Try-catch blokları kullanın",
-                    "├─ Input validation yapın",
-                    "├─ Edge case'leri handle edin",
-                    "└─ Logging mekanizması ekleyin"
-                ]
-                
-                code_examples.append("""
-🛡️ **Error Handling Örneği:**
-```python
-# Güvenli kod örneği
+}"""),
+        ("fix", (), "🛡️", "Error Handling Örneği", "python", """# Güvenli kod örneği
 def safe_divide(a, b):
     try:
         if b == 0:
@@ -1278,24 +7640,8 @@ def safe_divide(a, b):
         return a / b
     except (TypeError, ValueError) as e:
         print(f"Error: {e}")
-        return None
-```""")
-                
-            elif edit_type == "modernize":
-                suggestions = [
-                    "🆕 **Modern Code Practices**",
-                    "├─ ES6+ features kullanın (JS/TS)",
-                    "├─ Type annotations ekleyin",
-                    "├─ Async/await patterns kullanın",
-                    "├─ Modern framework features kullanın",
-                    "└─ Best practices'a güncelleyin"
-                ]
-                
-                if language in ['JavaScript', 'TypeScript']:
-                    code_examples.append("""
-🌟 **Modern JavaScript Örneği:**
-```javascript
-// Eski stil
+        return None"""),
+        ("modernize", ("JavaScript", "TypeScript"), "🌟", "Modern JavaScript Örneği", "javascript", """// Eski stil
 function getUsers(callback) {
     fetch('/api/users')
         .then(response => response.json())
@@ -1312,55 +7658,165 @@ async function getUsers() {
         console.error('Failed to fetch users:', error);
         throw error;
     }
-}
-```""")
-            
-            result = f"""
+}"""),
+    ]
+    _EDIT_LANGUAGE_TIPS: Dict[str, Tuple[str, str, List[str]]] = {
+        'Python': ("🐍", "Python Spesifik Öneriler", [
+            "PEP 8 style guide'ı takip edin",
+            "Type hints kullanın (Python 3.5+)",
+            "f-string formatting kullanın",
+            "Context managers (with statements) kullanın",
+            "Virtual environment kullanın",
+        ]),
+        'JavaScript': ("🌐", "JavaScript/TypeScript Öneriler", [
+            "ESLint/Prettier kullanın",
+            "const/let kullanın, var yerine",
+            "Arrow functions kullanın",
+            "Destructuring assignment kullanın",
+            "Module system kullanın (import/export)",
+        ]),
+    }
+    _EDIT_LANGUAGE_TIPS['TypeScript'] = _EDIT_LANGUAGE_TIPS['JavaScript']
+
+    @staticmethod
+    def _measured_suggestions(measurements: Dict[str, Any]) -> List[str]:
+        """Ölçülen sıcak noktalardan öneri satırları (bulgu yoksa süre dağılımından)"""
+        items: List[str] = []
+        # Toplam sürenin %1'inden azını alan fonksiyonlar öneri üretmez
+        hotspots = [hotspot for hotspot in cast(List[Dict[str, Any]], measurements["hotspots"])
+                    if hotspot["percent"] >= 1.0]
+        for hotspot in hotspots[:5]:
+            name = hotspot["function"]
+            start_line, end_line = hotspot["start_line"], hotspot["end_line"]
+            span = f"{start_line}-{end_line}" if end_line != start_line else f"{start_line}"
+            external = f" + dış çağrılar {hotspot['external_ms']} ms" if hotspot["external_ms"] else ""
+            items.append(
+                f"{name} (satır {span}): sürenin %{hotspot['percent']}'i, "
+                f"{hotspot['calls']} çağrı, kendi {hotspot['self_ms']} ms{external}"
+            )
+            findings = cast(List[Dict[str, Any]], hotspot.get("findings", []))
+            for finding in findings:
+                items.append(f"{name}: {finding['message']} (satır {finding['line']})")
+            if findings:
+                continue
+            if hotspot["primitive_calls"] < hotspot["calls"]:
+                items.append(f"{name}: özyinelemeli ({hotspot['calls']} çağrı) - memoization (functools.lru_cache) düşünün")
+            elif hotspot["external_ms"] > hotspot["self_ms"]:
+                items.append(f"{name}: süre çoğunlukla çağrılan kütüphane/builtin fonksiyonlarında - "
+                             f"çağrı sayısını azaltın ya da sonucu cache'leyin")
+            elif hotspot["calls"] >= 1000:
+                items.append(f"{name}: {hotspot['calls']} kez çağrılıyor - çağıran döngüde toplu işlem ya da cache düşünün")
+            else:
+                items.append(f"{name}: süre fonksiyonun kendi kodunda - döngüleri ve veri yapılarını gözden geçirin")
+        if not items:
+            elsewhere = ", ".join(f"{item['path']}:{item['function']} (%{item['percent']})"
+                                  for item in cast(List[Dict[str, Any]], measurements.get("elsewhere", [])))
+            items.append("Ölçümde bu dosyada anlamlı sıcak nokta yok" + (f"; en sıcak: {elsewhere}" if elsewhere else ""))
+        return items
+
+    @classmethod
+    def _build_edit_guide(cls, file_path: str, content: str, edit_type: str,
+                          measurements: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Düzenleme rehberini yapılandırılmış sonuç olarak üret
+
+        optimize için profile_code ölçümü varsa öneriler ve örnek kod hazır
+        listeden değil ölçülen sıcak noktalardan gelir.
+        """
+        lines = content.splitlines()
+        language = cls._detect_language(file_path)
+        guide = cls._EDIT_GUIDES.get(edit_type)
+        tips = cls._EDIT_LANGUAGE_TIPS.get(language)
+        result: Dict[str, Any] = {
+            "file": os.path.basename(file_path),
+            "path": file_path,
+            "edit_type": edit_type,
+            "language": language,
+            "total_lines": len(lines),
+            "preview": lines[:5],
+            "suggestions": {
+                "icon": guide["icon"], "title": guide["title"], "items": list(guide["items"]),
+            } if guide else None,
+            "examples": [
+                {"icon": icon, "title": title, "code_language": code_language, "code": code}
+                for example_type, languages, icon, title, code_language, code in cls._EDIT_EXAMPLES
+                if example_type == edit_type and (not languages or language in languages)
+            ],
+            "language_tips": {"icon": tips[0], "title": tips[1], "items": list(tips[2])} if tips else None,
+        }
+        if edit_type == "optimize":
+            result["measurements"] = measurements
+        if edit_type == "optimize" and measurements is not None:
+            result["suggestions"] = {"icon": "📈", "title": "Ölçüme Dayalı Optimizasyon",
+                                     "items": cls._measured_suggestions(measurements)}
+            hotspots = cast(List[Dict[str, Any]], measurements["hotspots"])
+            result["examples"] = []
+            if hotspots and hotspots[0]["percent"] >= 1.0:
+                hottest = hotspots[0]
+                start, end = int(hottest["start_line"]), int(hottest["end_line"])
+                excerpt = lines[start - 1:min(end, start + 29)]
+                if end > start + 29:
+                    excerpt.append(f"# ... ({end - start - 29} satır daha)")
+                result["examples"].append({
+                    "icon": "🔥", "title": f"En Sıcak Fonksiyon: {hottest['function']} (%{hottest['percent']})",
+                    "code_language": "python", "code": "\n".join(excerpt),
+                })
+        return result
+
+    @staticmethod
+    def _tree_lines(items: List[str]) -> List[str]:
+        return [("└─ " if index == len(items) - 1 else "├─ ") + item for index, item in enumerate(items)]
+
+    @classmethod
+    def _render_edit_guide(cls, result: Dict[str, Any]) -> str:
+        """Düzenleme rehberini metin raporuna çevir"""
+        language = result["language"]
+        preview = cast(List[str], result["preview"])
+        output = f"""
 🛠️ KayraDeniz Kod Düzenleme Rehberi
 {'='*50}
 
-📁 **Dosya:** {os.path.basename(file_path)}
-🎯 **Düzenleme Tipi:** {edit_type.title()}
+📁 **Dosya:** {result['file']}
+🎯 **Düzenleme Tipi:** {str(result['edit_type']).title()}
 🔤 **Dil:** {language}
-📏 **Satır Sayısı:** {total_lines}
+📏 **Satır Sayısı:** {result['total_lines']}
 """
 
-            if preview_snippet:
-                result += (
-                    f"\n� **Kod Önizleme (ilk {preview_line_count} satır):**\n"
+        if preview:
+            output += (
+                f"\n� **Kod Önizleme (ilk {len(preview)} satır):**\n"
+            )
+            for idx, line in enumerate(preview, start=1):
+                output += f"   {idx:02d}: {line if line else ' '}\n"
+
+        output += "\n💡 **Öneriler:**\n"
+        suggestions = cast(Optional[Dict[str, Any]], result["suggestions"])
+        if suggestions:
+            output += f"   {suggestions['icon']} **{suggestions['title']}**\n"
+            for line in cls._tree_lines(cast(List[str], suggestions["items"])):
+                output += f"   {line}\n"
+        if "measurements" in result:
+            measurements = cast(Optional[Dict[str, Any]], result["measurements"])
+            if measurements is None:
+                output += "   ℹ️ Ölçüme dayalı öneriler için önce profile_code çalıştırın ya da profile_command verin\n"
+            else:
+                output += (
+                    f"   📏 Ölçüm: `{measurements['command']}` ({measurements['status']}, "
+                    f"profillenen süre {measurements['profiled_ms']} ms)\n"
                 )
-                for idx, line in enumerate(preview_snippet, start=1):
-                    result += f"   {idx:02d}: {line if line else ' '}\n"
 
-            result += "\n💡 **Öneriler:**\n"
-            
-            for suggestion in suggestions:
-                result += f"   {suggestion}\n"
-            
-            for example in code_examples:
-                result += f"\n{example}\n"
-            
-            # Dil-spesifik öneriler
-            if language == 'Python':
-                result += """
-🐍 **Python Spesifik Öneriler:**
-   ├─ PEP 8 style guide'ı takip edin
-   ├─ Type hints kullanın (Python 3.5+)
-   ├─ f-string formatting kullanın
-   ├─ Context managers (with statements) kullanın
-   └─ Virtual environment kullanın
-"""
-            elif language in ['JavaScript', 'TypeScript']:
-                result += """
-🌐 **JavaScript/TypeScript Öneriler:**
-   ├─ ESLint/Prettier kullanın
-   ├─ const/let kullanın, var yerine
-   ├─ Arrow functions kullanın
-   ├─ Destructuring assignment kullanın
-   └─ Module system kullanın (import/export)
-"""
-            
-            result += f"""
+        for example in cast(List[Dict[str, str]], result["examples"]):
+            output += (
+                f"\n\n{example['icon']} **{example['title']}:**\n"
+                f"```{example['code_language']}\n{example['code']}\n```\n"
+            )
+
+        tips = cast(Optional[Dict[str, Any]], result["language_tips"])
+        if tips:
+            output += f"\n{tips['icon']} **{tips['title']}:**\n"
+            for line in cls._tree_lines(cast(List[str], tips["items"])):
+                output += f"   {line}\n"
+
+        output += f"""
 🔧 **Uygulama Adımları:**
    1. 📋 Önce backup alın
    2. 🎯 Bir defada tek değişiklik yapın
@@ -1374,8 +7830,46 @@ async function getUsers() {
    ├─ Testing: Unit test'ler yazın
    └─ Documentation: Inline comments ve README güncelleyin
 """
-            
-            return result
+        return output
+
+    def code_agent_edit(self, args: Dict[str, Any]) -> str:
+        """Gelişmiş kod düzenleme önerileri"""
+        try:
+            file_path_arg = self._get_required_str(args, "file_path")
+            edit_type = str(args.get("edit_type", "optimize"))  # optimize, refactor, fix, modernize
+            output_format = self._get_optional_str(args, "format") or "text"
+            working_directory = self._get_optional_str(args, "working_directory")
+            file_path = self._resolve_path(file_path_arg, working_directory)
+
+            if not os.path.exists(file_path):
+                return f"Hata: Dosya bulunamadı: {file_path}"
+
+            measurements: Optional[Dict[str, Any]] = None
+            if edit_type == "optimize":
+                profile_command = self._get_optional_str(args, "profile_command")
+                if profile_command:
+                    cwd = os.path.abspath(working_directory or os.getcwd())
+                    budget = min(PythonProfiler.MAX_BUDGET_SECONDS, max(1.0, float(args.get("budget_seconds", 30))))
+                    report = self._profile(profile_command, cwd, budget, 15, self._get_optional_str(args, "python"))
+                    measurements = self._profile_measurements(file_path) or {
+                        "command": profile_command, "cwd": cwd, "status": report["status"],
+                        "profiled_ms": report["profiled_ms"], "hotspots": [],
+                    }
+                    measurements["elsewhere"] = [
+                        {"path": item["path"], "function": item["function"], "percent": item["percent"]}
+                        for item in cast(List[Dict[str, Any]], report["hotspots"])[:3]
+                    ]
+                else:
+                    measurements = self._profile_measurements(file_path)
+
+            with self.path_locks.read(file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+
+            result = self._build_edit_guide(file_path, content, edit_type, measurements)
+            if output_format == "json":
+                return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+            return self._render_edit_guide(result)
             
         except Exception as e:
             return f"Hata: {str(e)}"
@@ -1385,187 +7879,260 @@ async function getUsers() {
         try:
             file_path_arg = self._get_required_str(args, "file_path")
             refactor_type = str(args.get("refactor_type", "general"))  # format, comments, general, optimize
+            output_format = self._get_optional_str(args, "format") or "text"
             working_directory = self._get_optional_str(args, "working_directory")
             create_backup = self._get_bool(args, "create_backup", True)
             file_path = self._resolve_path(file_path_arg, working_directory)
 
-            if not os.path.exists(file_path):
-                return f"Hata: Dosya bulunamadı: {file_path}"
+            # Varlık kontrolü + backup + okuma + yazma tek bir yazma kilidi altında yapılır;
+            # dosyanın backup'larını yalnızca bu kilidin sahibi oluşturur
+            with self.path_locks.write(file_path):
+                if not os.path.exists(file_path):
+                    return f"Hata: Dosya bulunamadı: {file_path}"
+                backup_path = self._unique_backup_path(file_path) if create_backup else None
+                result = self._refactor_file_locked(file_path, refactor_type, backup_path)
+            if output_format == "json":
+                return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+            return self._render_refactor_result(result)
 
-            backup_path: Optional[str] = None
-            if create_backup:
-                backup_path = f"{file_path}.backup.{int(__import__('time').time())}"
-                import shutil
-                shutil.copy2(file_path, backup_path)
+        except Exception as e:
+            return f"Hata: {str(e)}"
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-            
-            refactored_content = original_content
-            changes_made: List[str] = []
-            
-            # Dil detection
-            extension = os.path.splitext(file_path)[1].lower()
-            language_map = {
-                '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-                '.html': 'HTML', '.css': 'CSS', '.java': 'Java'
-            }
-            language = language_map.get(extension, 'Unknown')
-            
-            if refactor_type == "format":
-                # Temel formatting
-                lines = original_content.split('\n')
-                formatted_lines: List[str] = []
-                
-                for line in lines:
-                    # Trailing whitespace kaldır
-                    formatted_line = line.rstrip()
-                    
-                    # Tab'ları space'e çevir (4 space)
-                    formatted_line = formatted_line.expandtabs(4)
-                    
-                    formatted_lines.append(formatted_line)
-                
-                # Dosya sonunda boş satır olsun
-                if formatted_lines and formatted_lines[-1].strip():
-                    formatted_lines.append('')
-                
-                refactored_content = '\n'.join(formatted_lines)
-                changes_made.append("✅ Trailing whitespace kaldırıldı")
-                changes_made.append("✅ Tab'lar space'e çevrildi")
-                changes_made.append("✅ Dosya sonu düzeltildi")
-                
-            elif refactor_type == "comments":
-                # Comment ve dokümantasyon iyileştirme
-                lines = original_content.split('\n')
-                commented_lines: List[str] = []
-                
-                for i, line in enumerate(lines):
-                    commented_lines.append(line)
-                    
-                    # Fonksiyon tanımlarından sonra comment ekle
-                    if language == 'Python':
-                        if line.strip().startswith('def ') and ':' in line:
-                            if i + 1 < len(lines) and not lines[i + 1].strip().startswith('"""'):
-                                commented_lines.append('    """TODO: Add function documentation"""')
-                        elif line.strip().startswith('class ') and ':' in line:
-                            if i + 1 < len(lines) and not lines[i + 1].strip().startswith('"""'):
-                                commented_lines.append('    """TODO: Add class documentation"""')
-                    
-                    elif language in ['JavaScript', 'TypeScript']:
-                        if ('function ' in line or '=>' in line) and '{' in line:
-                            if i + 1 < len(lines) and not lines[i + 1].strip().startswith('//'):
-                                indent = len(line) - len(line.lstrip())
-                                commented_lines.append(' ' * (indent + 2) + '// TODO: Add function documentation')
-                
-                refactored_content = '\n'.join(commented_lines)
-                changes_made.append("✅ Eksik dokümantasyon noktaları işaretlendi")
-                
-            elif refactor_type == "optimize":
-                # Basit optimizasyonlar
-                optimizations = 0
-                
+    @staticmethod
+    def _unique_backup_path(file_path: str) -> str:
+        """Aynı saniyedeki yazmalar birbirinin backup'ını ezmesin diye ns damgalı ad"""
+        stamp = time.time_ns()
+        while os.path.exists(f"{file_path}.backup.{stamp}"):
+            stamp += 1
+        return f"{file_path}.backup.{stamp}"
+
+    def _refactor_file_locked(self, file_path: str, refactor_type: str,
+                              backup_path: Optional[str]) -> Dict[str, Any]:
+        """code_agent_refactor çekirdeği - çağıran yol kilitlerini tutar
+
+        Sonuç yapılandırılmış döner; metin raporunu _render_refactor_result üretir.
+        Değişiklikler {code, message, count?, status} kayıtlarıdır; status "applied"
+        ya da bilerek dokunulmayan durumlar için "kept" olur.
+        """
+        if backup_path:
+            import shutil
+            shutil.copy2(file_path, backup_path)
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            original_content = f.read()
+
+        refactored_content = original_content
+        changes_made: List[Dict[str, Any]] = []
+
+        # Dil detection
+        extension = os.path.splitext(file_path)[1].lower()
+        language_map = {
+            '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
+            '.html': 'HTML', '.css': 'CSS', '.java': 'Java'
+        }
+        language = language_map.get(extension, 'Unknown')
+
+        if refactor_type == "format":
+            # Temel formatting
+            lines = original_content.split('\n')
+            formatted_lines: List[str] = []
+
+            for line in lines:
+                # Trailing whitespace kaldır
+                formatted_line = line.rstrip()
+
+                # Tab'ları space'e çevir (4 space)
+                formatted_line = formatted_line.expandtabs(4)
+
+                formatted_lines.append(formatted_line)
+
+            # Dosya sonunda boş satır olsun
+            if formatted_lines and formatted_lines[-1].strip():
+                formatted_lines.append('')
+
+            refactored_content = '\n'.join(formatted_lines)
+            changes_made.append({"code": "trailing-whitespace", "message": "Trailing whitespace kaldırıldı", "status": "applied"})
+            changes_made.append({"code": "tabs", "message": "Tab'lar space'e çevrildi", "status": "applied"})
+            changes_made.append({"code": "final-newline", "message": "Dosya sonu düzeltildi", "status": "applied"})
+
+        elif refactor_type == "comments":
+            # Comment ve dokümantasyon iyileştirme
+            lines = original_content.split('\n')
+            commented_lines: List[str] = []
+            js_function_lines: set = set()
+            if language in ['JavaScript', 'TypeScript']:
+                # Sadece gerçek kod token'larındaki fonksiyonlar (string/yorum içindekiler değil)
+                js_function_lines = set(CFamilyLexer.metrics(original_content, language)["function_lines"])
+
+            for i, line in enumerate(lines):
+                commented_lines.append(line)
+
+                # Fonksiyon tanımlarından sonra comment ekle
                 if language == 'Python':
-                    # String concatenation optimizations
-                    if '+=' in refactored_content and 'str' in refactored_content:
-                        refactored_content = refactored_content.replace(
-                            "result += str(",
-                            "result += f'"  # Promote f-string usage
-                        )
-                        optimizations += 1
-                        changes_made.append("✅ String concatenation optimize edildi")
-                    
-                    # Import organization (basic)
-                    lines = refactored_content.split('\n')
-                    import_lines: List[str] = []
-                    other_lines: List[str] = []
-                    
-                    for line in lines:
-                        if line.strip().startswith(('import ', 'from ')):
-                            import_lines.append(line)
-                        else:
-                            other_lines.append(line)
-                    
-                    if import_lines:
-                        # Sort imports
-                        import_lines.sort()
-                        refactored_content = '\n'.join(import_lines + [''] + other_lines)
-                        changes_made.append("✅ Import'lar düzenlendi")
-                
+                    if line.strip().startswith('def ') and ':' in line:
+                        if i + 1 < len(lines) and not lines[i + 1].strip().startswith('"""'):
+                            commented_lines.append('    """TODO: Add function documentation"""')
+                    elif line.strip().startswith('class ') and ':' in line:
+                        if i + 1 < len(lines) and not lines[i + 1].strip().startswith('"""'):
+                            commented_lines.append('    """TODO: Add class documentation"""')
+
                 elif language in ['JavaScript', 'TypeScript']:
-                    # var -> let/const conversion
-                    var_count = refactored_content.count('var ')
-                    refactored_content = refactored_content.replace('var ', 'let ')
-                    if var_count > 0:
-                        changes_made.append(f"✅ {var_count} adet 'var' -> 'let' çevrildi")
-                    
-                    # == -> === conversion
-                    equality_count = refactored_content.count(' == ')
-                    refactored_content = refactored_content.replace(' == ', ' === ')
-                    refactored_content = refactored_content.replace(' != ', ' !== ')
-                    if equality_count > 0:
-                        changes_made.append(f"✅ {equality_count} adet '==' -> '===' çevrildi")
-            
-            elif refactor_type == "general":
-                # Genel refactoring (yukarıdakilerin kombinasyonu)
-                
-                # 1. Formatting
+                    if i + 1 in js_function_lines and line.rstrip().endswith('{'):
+                        if i + 1 < len(lines) and not lines[i + 1].strip().startswith('//'):
+                            indent = len(line) - len(line.lstrip())
+                            commented_lines.append(' ' * (indent + 2) + '// TODO: Add function documentation')
+
+            refactored_content = '\n'.join(commented_lines)
+            changes_made.append({"code": "doc-placeholders", "message": "Eksik dokümantasyon noktaları işaretlendi",
+                                 "status": "applied"})
+
+        elif refactor_type == "optimize":
+            # Basit optimizasyonlar
+            optimizations = 0
+
+            if language == 'Python':
+                # String concatenation optimizations
+                if '+=' in refactored_content and 'str' in refactored_content:
+                    refactored_content = refactored_content.replace(
+                        "result += str(",
+                        "result += f'"  # Promote f-string usage
+                    )
+                    optimizations += 1
+                    changes_made.append({"code": "string-concat", "message": "String concatenation optimize edildi",
+                                         "status": "applied"})
+
+                # Import organization (basic)
                 lines = refactored_content.split('\n')
-                formatted_lines = [line.rstrip().expandtabs(4) for line in lines]
-                refactored_content = '\n'.join(formatted_lines)
-                changes_made.append("✅ Genel formatting uygulandı")
-                
-                # 2. Language-specific improvements
-                if language == 'Python':
-                    # f-string conversion (simple cases)
-                    if '".format(' in refactored_content:
-                        changes_made.append("✅ String formatting iyileştirmesi mevcut")
-                
-                elif language in ['JavaScript', 'TypeScript']:
-                    # Modern JS features
-                    if 'var ' in refactored_content:
-                        var_count = refactored_content.count('var ')
-                        refactored_content = refactored_content.replace('var ', 'let ')
-                        changes_made.append(f"✅ {var_count} adet var->let çevrimi")
-            
-            # Değişiklik var mı kontrol et
-            if refactored_content != original_content:
-                # Refactored dosyayı kaydet
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(refactored_content)
-                
-                # Stats
-                original_lines = len(original_content.split('\n'))
-                new_lines = len(refactored_content.split('\n'))
-                size_change = len(refactored_content) - len(original_content)
-                
-                backup_line = ""
-                if create_backup and backup_path:
-                    backup_line = f"💾 **Backup:** {os.path.basename(backup_path)}"
+                import_lines: List[str] = []
+                other_lines: List[str] = []
+
+                for line in lines:
+                    if line.strip().startswith(('import ', 'from ')):
+                        import_lines.append(line)
+                    else:
+                        other_lines.append(line)
+
+                if import_lines:
+                    # Sort imports
+                    import_lines.sort()
+                    refactored_content = '\n'.join(import_lines + [''] + other_lines)
+                    changes_made.append({"code": "sort-imports", "message": "Import'lar düzenlendi", "status": "applied"})
+
+            elif language in ['JavaScript', 'TypeScript']:
+                # var -> let ve == -> === (string, yorum, regex ve template metinlerine dokunmadan)
+                refactored_content, stats = CFamilyLexer.modernize(refactored_content, language)
+                if stats["var"] > 0:
+                    changes_made.append({"code": "var-to-let", "count": stats["var"],
+                                         "message": f"{stats['var']} adet 'var' -> 'let' çevrildi", "status": "applied"})
+                if stats["skipped_var"] > 0:
+                    changes_made.append({"code": "var-redeclared", "count": stats["skipped_var"],
+                                         "message": f"{stats['skipped_var']} adet tekrar tanımlanan 'var' korundu",
+                                         "status": "kept"})
+                if stats["scoped_var"] > 0:
+                    changes_made.append({"code": "var-scoped", "count": stats["scoped_var"],
+                                         "message": f"{stats['scoped_var']} adet blok dışında/closure içinde "
+                                                    f"kullanılan 'var' korundu",
+                                         "status": "kept"})
+                if stats["equality"] > 0:
+                    changes_made.append({"code": "strict-equality", "count": stats["equality"],
+                                         "message": f"{stats['equality']} adet '==' -> '===' çevrildi", "status": "applied"})
+                if stats["skipped_null"] > 0:
+                    changes_made.append({"code": "null-equality", "count": stats["skipped_null"],
+                                         "message": f"{stats['skipped_null']} adet '== null' karşılaştırması korundu",
+                                         "status": "kept"})
+
+        elif refactor_type == "general":
+            # Genel refactoring (yukarıdakilerin kombinasyonu)
+
+            # 1. Formatting
+            lines = refactored_content.split('\n')
+            formatted_lines = [line.rstrip().expandtabs(4) for line in lines]
+            refactored_content = '\n'.join(formatted_lines)
+            changes_made.append({"code": "format", "message": "Genel formatting uygulandı", "status": "applied"})
+
+            # 2. Language-specific improvements
+            if language == 'Python':
+                # f-string conversion (simple cases)
+                if '".format(' in refactored_content:
+                    changes_made.append({"code": "string-format", "message": "String formatting iyileştirmesi mevcut",
+                                         "status": "applied"})
 
-                result = f"""
+            elif language in ['JavaScript', 'TypeScript']:
+                # Modern JS features
+                refactored_content, stats = CFamilyLexer.modernize(
+                    refactored_content, language, strict_equality=False
+                )
+                if stats["var"] > 0:
+                    changes_made.append({"code": "var-to-let", "count": stats["var"],
+                                         "message": f"{stats['var']} adet var->let çevrimi", "status": "applied"})
+
+        # Değişiklik var mı kontrol et
+        changed = refactored_content != original_content
+        if changed:
+            # Refactored dosyayı kaydet
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(refactored_content)
+            self._notify_write(file_path)
+
+        return {
+            "file": os.path.basename(file_path),
+            "path": file_path,
+            "refactor_type": refactor_type,
+            "language": language,
+            "changed": changed,
+            "backup": os.path.basename(backup_path) if backup_path else None,
+            "original_lines": len(original_content.split('\n')),
+            "new_lines": len(refactored_content.split('\n')),
+            "size_change": len(refactored_content) - len(original_content),
+            "changes": changes_made if changed else [],
+        }
+
+    @staticmethod
+    def _render_refactor_result(result: Dict[str, Any]) -> str:
+        """Refactoring sonucunu metin raporuna çevir"""
+        if not result["changed"]:
+            return f"""
+✨ Kod Zaten Optimum Durumda!
+{'='*30}
+
+📁 **Dosya:** {result['file']}
+🎯 **Sonuç:** Bu dosyada {result['refactor_type']} refactoring için değişiklik gerekmedi.
+
+💡 **Öneriler:**
+   ├─ Başka refactor tiplerini deneyin
+   ├─ Manuel code review yapın
+   └─ Unit test'ler ekleyin
+"""
+
+        original_lines = int(result["original_lines"])
+        new_lines = int(result["new_lines"])
+        changes = cast(List[Dict[str, Any]], result["changes"])
+        backup_line = f"💾 **Backup:** {result['backup']}" if result["backup"] else ""
+
+        output = f"""
 ♻️ KayraDeniz Refactoring Tamamlandı!
 {'='*50}
 
-📁 **Dosya:** {os.path.basename(file_path)}
-🔄 **Refactor Tipi:** {refactor_type.title()}
-🔤 **Dil:** {language}
+📁 **Dosya:** {result['file']}
+🔄 **Refactor Tipi:** {str(result['refactor_type']).title()}
+🔤 **Dil:** {result['language']}
 {backup_line}
 
 📊 **Değişiklik İstatistikleri:**
 ├─ Orijinal satır sayısı: {original_lines}
 ├─ Yeni satır sayısı: {new_lines}
 ├─ Satır farkı: {new_lines - original_lines:+d}
-├─ Boyut değişimi: {size_change:+d} bytes
-└─ Toplam değişiklik: {len(changes_made)} işlem
+├─ Boyut değişimi: {int(result['size_change']):+d} bytes
+└─ Toplam değişiklik: {len(changes)} işlem
 
 ✅ **Yapılan İyileştirmeler:**
 """
-                
-                for change in changes_made:
-                    result += f"   {change}\n"
-                
-                result += f"""
+
+        for change in changes:
+            icon = "✅" if change["status"] == "applied" else "ℹ️"
+            output += f"   {icon} {change['message']}\n"
+
+        output += f"""
 🎯 **Sonraki Adımlar:**
    1. 🧪 Kodu test edin
    2. 📋 Code review yaptırın
@@ -1575,23 +8142,339 @@ async function getUsers() {
 💡 **İpucu:** Daha ileri refactoring için IDE extension'ları veya
    özel refactoring tool'ları kullanabilirsiniz.
 """
-                
+        return output
+
+    # === Sembol İndeksi ===
+
+    _INDEX_MAX_FILES = 200000
+    # Daha az dosya/bayt değiştiyse süreç başlatma maliyeti kazançtan büyük
+    _INDEX_POOL_MIN_FILES = 256
+    _INDEX_POOL_MIN_BYTES = 4 * 1024 * 1024
+    _INDEX_CHUNK_SIZE = 64
+
+    def _workspace_index(self, root: str) -> WorkspaceIndex:
+        root = os.path.abspath(root)
+        with self._workspace_indexes_lock:
+            index = self._workspace_indexes.get(root)
+            if index is None:
+                index = WorkspaceIndex(root, WorkspaceIndex.default_path(root))
+                self._workspace_indexes[root] = index
+            return index
+
+    def _indexable(self, index: WorkspaceIndex, path: str) -> bool:
+        """Tam taramanın da seçeceği dosya mı (gizli/atlanan dizinler, dil, .min.js)"""
+        parts = index.relative(path).split("/")
+        if parts[0] == ".." or any(part.startswith(".") or part in self._WALK_SKIP_DIRS for part in parts[:-1]):
+            return False
+        name = parts[-1].lower()
+        return not name.startswith(".") and not name.endswith(".min.js") \
+            and self._detect_language(name) in WorkspaceIndex.LANGUAGES
+
+    def _refresh_workspace_index(self, index: WorkspaceIndex, workers: Optional[int] = None,
+                                 force: bool = False) -> Dict[str, Any]:
+        """Değişen dosyaları yeniden indeksle
+
+        TTL dolduysa (ya da indeks boşsa) kök dizin taranır ve mtime/boyutu değişen
+        dosyalar okunur; TTL içinde sadece tool'ların yazdığı dosyalara bakılır.
+        İçerik özeti aynı kalan dosyaların sembolleri yeniden çıkarılmaz.
+        """
+        with index.lock:
+            started = time.perf_counter()
+            known = index.known_files()
+            dirty = index.take_dirty()
+            full_scan = force or not known or time.monotonic() - index.refreshed_at >= self.index_ttl
+            removed: List[str] = []
+            if full_scan:
+                files = self._discover_source_files(index.root, self._INDEX_MAX_FILES, WorkspaceIndex.LANGUAGES)
+                seen = {index.relative(path) for path, _, _ in files}
+                removed = [path for path in known if path not in seen]
             else:
-                result = f"""
-✨ Kod Zaten Optimum Durumda!
-{'='*30}
+                files = []
+                for path in dirty:
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        if index.relative(path) in known:
+                            removed.append(index.relative(path))
+                        continue
+                    if self._indexable(index, path) and stat.st_size <= self._PROJECT_MAX_FILE_BYTES:
+                        files.append((path, stat.st_size, stat.st_mtime_ns))
 
-📁 **Dosya:** {os.path.basename(file_path)}
-🎯 **Sonuç:** Bu dosyada {refactor_type} refactoring için değişiklik gerekmedi.
+            stale: List[Tuple[str, Optional[str], int, int]] = []
+            for path, size, mtime_ns in files:
+                previous = known.get(index.relative(path))
+                if previous is None or previous[0] != mtime_ns or previous[1] != size:
+                    stale.append((path, previous[2] if previous else None, mtime_ns, size))
+            results = self._index_files(stale, workers)
+            for entry in results:
+                entry["path"] = index.relative(str(entry["path"]))
+            if results or removed:
+                index.apply(results, removed)
+            if full_scan:
+                index.refreshed_at = time.monotonic()
+            return {
+                "full_scan": full_scan,
+                "files": len(known) - len(removed) + sum(1 for entry in results if entry["path"] not in known),
+                "reindexed": sum(1 for entry in results if not entry.get("unchanged")),
+                "removed": len(removed),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
 
-💡 **Öneriler:**
-   ├─ Başka refactor tiplerini deneyin
-   ├─ Manuel code review yapın
-   └─ Unit test'ler ekleyin
-"""
-            
-            return result
-            
+    def _index_files(self, stale: List[Tuple[str, Optional[str], int, int]],
+                     workers: Optional[int]) -> List[Dict[str, Any]]:
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or (len(stale) < self._INDEX_POOL_MIN_FILES
+                            and sum(item[3] for item in stale) < self._INDEX_POOL_MIN_BYTES):
+            return _index_source_chunk(stale)
+        # Büyük dosyalar önce; iş birimleri süreçlere dengeli dağılır
+        stale.sort(key=lambda item: item[3], reverse=True)
+        chunk_count = (len(stale) + self._INDEX_CHUNK_SIZE - 1) // self._INDEX_CHUNK_SIZE
+        chunks: List[List[Tuple[str, Optional[str], int, int]]] = [[] for _ in range(chunk_count)]
+        for position, item in enumerate(stale):
+            chunks[position % chunk_count].append(item)
+        pool = self._project_pool(workers)
+        futures: Dict[Future, List[Tuple[str, Optional[str], int, int]]] = {
+            pool.submit(_index_source_chunk, chunk): chunk for chunk in chunks
+        }
+        results: List[Dict[str, Any]] = []
+        for future in as_completed(futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                if isinstance(e, BrokenExecutor):
+                    self._analysis_pool = None
+                # İndeks eksik kalmasın: başarısız iş birimi bu süreçte işlenir
+                results.extend(_index_source_chunk(futures[future]))
+            self._notify_progress({"phase": "index", "done": len(results), "total": len(stale)})
+        return results
+
+    def _index_for_args(self, args: Dict[str, Any]) -> Tuple[WorkspaceIndex, Dict[str, Any]]:
+        working_directory = self._get_optional_str(args, "working_directory")
+        root = self._resolve_path(str(args.get("root", working_directory or ".")), working_directory)
+        if not os.path.isdir(root):
+            raise ValueError(f"Dizin bulunamadı: {root}")
+        index = self._workspace_index(root)
+        refresh = self._get_bool(args, "refresh", True)
+        stats = self._refresh_workspace_index(index) if refresh else {"full_scan": False, "reindexed": 0}
+        return index, stats
+
+    def find_symbol(self, args: Dict[str, Any]) -> str:
+        """Sembol indeksinden tanım arama"""
+        try:
+            name = self._get_required_str(args, "name")
+            kind = self._get_optional_str(args, "kind")
+            match = self._get_optional_str(args, "match") or "exact"
+            if match not in ("exact", "prefix"):
+                return "Hata: match 'exact' ya da 'prefix' olmalı"
+            limit = max(1, self._get_int(args, "limit", 50))
+            index, stats = self._index_for_args(args)
+            symbols = index.find_symbols(name, kind, prefix=match == "prefix", limit=limit)
+            return json.dumps({
+                "root": index.root,
+                "query": name,
+                "count": len(symbols),
+                "symbols": symbols,
+                "index": stats,
+            }, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def find_references(self, args: Dict[str, Any]) -> str:
+        """Sembol indeksinden bir ismin tanımları ve kullanım yerleri"""
+        try:
+            name = self._get_required_str(args, "name")
+            limit = max(1, self._get_int(args, "limit", 200))
+            path_arg = self._get_optional_str(args, "path")
+            index, stats = self._index_for_args(args)
+            path_prefix = index.relative(os.path.join(index.root, path_arg)) if path_arg else None
+            references, total = index.find_references(
+                name, None if path_prefix in (None, ".") else path_prefix, limit
+            )
+            return json.dumps({
+                "root": index.root,
+                "name": name,
+                "definitions": [symbol for symbol in index.find_symbols(name, limit=20)
+                                if symbol["kind"] not in ("import", "export")],
+                "total": total,
+                "truncated": total > len(references),
+                "references": references,
+                "index": stats,
+            }, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    @staticmethod
+    def _nest_outline(symbols: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Düz tanım listesini container'a göre ağaca çevir"""
+        tree: List[Dict[str, Any]] = []
+        by_qualname: Dict[str, Dict[str, Any]] = {}
+        for symbol in symbols:
+            node = dict(symbol)
+            container = node.pop("container", "")
+            parent = by_qualname.get(container) if container else None
+            (parent.setdefault("children", []) if parent is not None else tree).append(node)
+            if node["kind"] in ("class", "function", "method", "interface", "namespace", "enum"):
+                by_qualname[f"{container}.{node['name']}" if container else node["name"]] = node
+        return tree
+
+    def file_outline(self, args: Dict[str, Any]) -> str:
+        """Dosyanın tanım ağacı (indeksten; kök dışındaki dosyalar anında çıkarılır)"""
+        try:
+            file_path_arg = self._get_required_str(args, "file_path")
+            working_directory = self._get_optional_str(args, "working_directory")
+            file_path = os.path.abspath(self._resolve_path(file_path_arg, working_directory))
+            if not os.path.exists(file_path):
+                return f"Hata: Dosya bulunamadı: {file_path}"
+
+            outline: Optional[Dict[str, Any]] = None
+            stats: Dict[str, Any] = {}
+            root = args.get("root", working_directory)
+            if root is not None:
+                index = self._workspace_index(self._resolve_path(str(root), working_directory))
+                if self._indexable(index, file_path):
+                    index.mark_dirty(file_path)
+                    stats = self._refresh_workspace_index(index) if self._get_bool(args, "refresh", True) else {}
+                    outline = index.outline(index.relative(file_path))
+            if outline is None:
+                language = self._detect_language(file_path)
+                if language not in WorkspaceIndex.LANGUAGES:
+                    return f"Hata: Desteklenmeyen dil: {language}"
+                with self.path_locks.read(file_path):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                symbols, _ = WorkspaceIndex.extract(content, language)
+                outline = {"path": file_path, "language": language, "symbols": [
+                    WorkspaceIndex._symbol_row(("",) + tuple(symbol)) for symbol in symbols
+                ]}
+                for symbol in outline["symbols"]:
+                    del symbol["path"]
+            outline["symbols"] = self._nest_outline(cast(List[Dict[str, Any]], outline["symbols"]))
+            if stats:
+                outline["index"] = stats
+            return json.dumps(outline, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def find_duplicates(self, args: Dict[str, Any]) -> str:
+        """Çalışma alanında winnowing parmak izleriyle kopya kod grupları"""
+        try:
+            min_lines = max(1, self._get_int(args, "min_lines", 6))
+            max_occurrences = max(2, self._get_int(args, "max_occurrences", 64))
+            limit = max(1, self._get_int(args, "limit", 20))
+            path_arg = self._get_optional_str(args, "path")
+            index, stats = self._index_for_args(args)
+            started = time.perf_counter()
+            path_prefix = index.relative(os.path.join(index.root, path_arg)) if path_arg else None
+            groups = index.duplicate_groups(min_lines, max_occurrences,
+                                            None if path_prefix in (None, ".") else path_prefix)
+            return json.dumps({
+                "root": index.root,
+                "groups": len(groups),
+                "duplicated_lines": sum(group["lines"] * (len(group["instances"]) - 1) for group in groups),
+                "clones": groups[:limit],
+                "truncated": len(groups) > limit,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "index": stats,
+            }, ensure_ascii=False)
+        except Exception as e:
+            return f"Hata: {str(e)}"
+
+    def _profile(self, command: str, cwd: str, budget: float, limit: int,
+                 python: Optional[str] = None) -> Dict[str, Any]:
+        """Komutu profille, sıcak noktalara performans bulgularını ekle ve dosya bazında sakla"""
+        meta, stats, output_tail = PythonProfiler.run(command, cwd, budget, python)
+        if stats is None:
+            detail = "\n".join(output_tail[-5:])
+            raise RuntimeError(f"Profil verisi alınamadı ({meta['status']}, çıkış kodu {meta['exit_code']})\n{detail}")
+        hotspots, external, profiled_ms = PythonProfiler.hotspots(stats, cwd, limit)
+
+        # Bulgu yalnızca onu en içten kapsayan aralığın sıcak noktasına yazılır;
+        # <module> sadece fonksiyon dışındaki satırların bulgularını alır
+        findings_by_path: Dict[str, List[Dict[str, Any]]] = {}
+        ranges_by_path: Dict[str, set] = {}
+        for hotspot in hotspots:
+            path = os.path.realpath(os.path.join(cwd, hotspot["path"]))
+            if path not in findings_by_path:
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        content = f.read()
+                    findings_by_path[path] = PythonSourceAnalyzer.analyze(content)["performance"]
+                    ranges_by_path[path] = {(entry[1], entry[2])
+                                            for entry in PythonProfiler.function_ranges(content).values()}
+                except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+                    findings_by_path[path], ranges_by_path[path] = [], set()
+            # lambda/comprehension sıcak noktaları kendi satırlarını kapsar
+            ranges_by_path[path].add((hotspot["start_line"], hotspot["end_line"]))
+        for hotspot in hotspots:
+            path = os.path.realpath(os.path.join(cwd, hotspot["path"]))
+            ranges = ranges_by_path[path]
+            hotspot["findings"] = [
+                finding for finding in findings_by_path[path]
+                if hotspot["start_line"] <= finding["line"] <= hotspot["end_line"]
+                and min((span for span in ranges if span[0] <= finding["line"] <= span[1]),
+                        key=lambda span: (-span[0], span[1])) == (hotspot["start_line"], hotspot["end_line"])
+            ][:5]
+
+        report = {
+            "command": command,
+            "cwd": cwd,
+            "python": python or sys.executable,
+            "status": meta["status"],
+            "exit_code": meta["exit_code"],
+            "budget_seconds": budget,
+            "wall_ms": meta.get("wall_ms"),
+            "profiled_ms": profiled_ms,
+            "functions": len(getattr(stats, "stats")),
+            "hotspots": hotspots,
+            "external": external,
+            "output_tail": output_tail,
+        }
+
+        by_path: Dict[str, List[Dict[str, Any]]] = {}
+        for hotspot in hotspots:
+            by_path.setdefault(os.path.realpath(os.path.join(cwd, hotspot["path"])), []).append(hotspot)
+        with self._profile_lock:
+            # Aynı komutun önceki ölçümü artık sıcak olmayan dosyalarda kalmasın
+            for path in [path for path, entry in self._profile_results.items()
+                         if entry["command"] == command and entry["cwd"] == cwd]:
+                del self._profile_results[path]
+            for path, file_hotspots in by_path.items():
+                try:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                self._profile_results[path] = {
+                    "command": command, "cwd": cwd, "status": meta["status"], "profiled_ms": profiled_ms,
+                    "profiled_at": time.time(), "mtime_ns": mtime_ns, "hotspots": file_hotspots,
+                }
+        return report
+
+    def _profile_measurements(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Dosyanın son ölçümü; dosya ölçümden sonra değiştiyse None"""
+        path = os.path.realpath(file_path)
+        with self._profile_lock:
+            entry = self._profile_results.get(path)
+        if entry is None:
+            return None
+        try:
+            if os.stat(path).st_mtime_ns != entry["mtime_ns"]:
+                return None
+        except OSError:
+            return None
+        return {key: value for key, value in entry.items() if key != "mtime_ns"}
+
+    def profile_code(self, args: Dict[str, Any]) -> str:
+        """Python komutunu cProfile altında çalıştırıp sıralı sıcak nokta raporu döndür"""
+        try:
+            command = self._get_required_str(args, "command")
+            working_directory = self._get_optional_str(args, "working_directory")
+            budget = min(PythonProfiler.MAX_BUDGET_SECONDS, max(1.0, float(args.get("budget_seconds", 30))))
+            limit = max(1, self._get_int(args, "limit", 15))
+            python = self._get_optional_str(args, "python")
+            cwd = os.path.abspath(working_directory or os.getcwd())
+            if not os.path.isdir(cwd):
+                return f"Hata: Dizin bulunamadı: {cwd}"
+            return json.dumps(self._profile(command, cwd, budget, limit, python), ensure_ascii=False)
         except Exception as e:
             return f"Hata: {str(e)}"
 
@@ -1622,7 +8505,11 @@ async function getUsers() {
                         }
                     }
                 
-                result = self.tools[tool_name](arguments)
+                self._active_call = {"id": request.get("id"), "tool": tool_name}
+                try:
+                    result = self.tools[tool_name](arguments)
+                finally:
+                    self._active_call = None
                 
                 return {
                     "jsonrpc": "2.0",
@@ -1657,6 +8544,75 @@ async function getUsers() {
                 }
             }
 
+def _analyze_source_chunk(paths: List[str]) -> List[Dict[str, Any]]:
+    """Süreç havuzu iş birimi: dosyaları okuyup özet analiz sonuçları döndürür"""
+    results: List[Dict[str, Any]] = []
+    for path in paths:
+        entry: Dict[str, Any] = {"path": path}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            analysis = KayradenizToolServer._build_code_analysis(path, content)
+        except Exception as e:
+            # Tek dosyadaki beklenmedik hata (ör. RecursionError) iş biriminin tamamını düşürmesin
+            entry.update(ok=False, error=f"{type(e).__name__}: {e}")
+            results.append(entry)
+            continue
+        metrics = cast(Dict[str, Any], analysis["metrics"])
+        functions = cast(List[Dict[str, Any]], analysis["functions"])
+        entry.update(
+            ok=True,
+            language=analysis["language"],
+            total_lines=metrics["total_lines"],
+            non_empty_lines=metrics["non_empty_lines"],
+            comment_lines=metrics["comment_lines"],
+            function_count=metrics["function_count"],
+            class_count=metrics["class_count"],
+            complexity_score=metrics["complexity_score"],
+            security_count=len(analysis["security_issues"]),
+            issue_count=len(analysis["issues"]),
+            cached=analysis["cached"],
+            top_functions=[
+                {"qualname": function["qualname"], "line": function["line"], "complexity": function["complexity"]}
+                for function in sorted(functions, key=lambda item: int(item["complexity"]), reverse=True)[:3]
+            ],
+        )
+        results.append(entry)
+    return results
+
+
+def _index_source_chunk(items: List[Tuple[str, Optional[str], int, int]]) -> List[Dict[str, Any]]:
+    """Süreç havuzu iş birimi: değişmiş görünen dosyaların tanım, kullanım ve parmak izlerini çıkarır
+
+    Öğe: (yol, indeksteki içerik özeti, mtime_ns, boyut). Özet değişmemişse
+    sadece "unchanged" döner.
+    """
+    results: List[Dict[str, Any]] = []
+    for path, known_sha, mtime_ns, size in items:
+        language = KayradenizToolServer._detect_language(path)
+        entry: Dict[str, Any] = {"path": path, "mtime_ns": mtime_ns, "size": size, "language": language}
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            entry.update(sha="", error=str(e))
+            results.append(entry)
+            continue
+        entry["sha"] = hashlib.sha256(raw).hexdigest()
+        if entry["sha"] == known_sha:
+            entry["unchanged"] = True
+            results.append(entry)
+            continue
+        try:
+            content = raw.decode("utf-8")
+            entry["fingerprints"] = CodeFingerprinter.fingerprints(content, language)
+            entry["symbols"], entry["refs"] = WorkspaceIndex.extract(content, language)
+        except (UnicodeDecodeError, SyntaxError, ValueError, RecursionError) as e:
+            entry["error"] = f"{type(e).__name__}: {e}"
+        results.append(entry)
+    return results
+
+
 def main():
     """Ana döngü - stdin'den gelen JSON-RPC isteklerini işle"""
     server = KayradenizToolServer()
@@ -1675,6 +8631,15 @@ def main():
         if callable(stderr_reconfigure):
             stderr_reconfigure(encoding='utf-8')
     
+    # Yanıtlar ve worker thread'lerden gelen bildirimler satır satır karışmasın
+    output_lock = threading.Lock()
+
+    def write_message(message: Dict[str, Any]) -> None:
+        with output_lock:
+            print(json.dumps(message, ensure_ascii=False), flush=True)
+
+    server.notification_sink = write_message
+    
     print("KayraDeniz Tool Server started", file=sys.stderr, flush=True)
     
     try:
@@ -1687,7 +8652,7 @@ def main():
                 request = json.loads(line)
                 response = server.handle_request(request)
                 
-                print(json.dumps(response, ensure_ascii=False), flush=True)
+                write_message(response)
                 
             except json.JSONDecodeError as e:
                 error_response: Dict[str, Any] = {
@@ -1698,7 +8663,7 @@ def main():
                         "message": f"Parse error: {str(e)}"
                     }
                 }
-                print(json.dumps(error_response, ensure_ascii=False), flush=True)
+                write_message(error_response)
             
             except Exception as e:
                 print(f"Unexpected error: {str(e)}", file=sys.stderr, flush=True)
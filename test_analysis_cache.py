@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+AnalysisResultCache testleri
+Değişmeyen içerik cache'ten gelmeli; ANALYZER_VERSION değişince kayıtlar geçersizleşmeli;
+boyut sınırında en eski erişilenler silinmeli
+"""
+import importlib.util
+import json
+import os
+import tempfile
+from unittest import mock
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+Cache = server.AnalysisResultCache
+
+
+def analyze(tool_server, path):
+    return json.loads(tool_server.code_agent_analyze({"file_path": path, "format": "json"}))
+
+
+def test_hit_on_unchanged_content_and_version_bump():
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.dict(os.environ, {"KAYRADENIZ_ANALYSIS_CACHE": os.path.join(tmp, "cache.sqlite")}), \
+            mock.patch.object(Cache, "_shared", None):
+        path = os.path.join(tmp, "modul.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("def f(x):\n    return x if x else 0\n")
+        tool_server = server.KayradenizToolServer()
+
+        first = analyze(tool_server, path)
+        assert first["cached"] is False
+        second = analyze(tool_server, path)
+        assert second["cached"] is True and second["metrics"] == first["metrics"]
+
+        # Sadece içerik önemli: aynı içerikli başka dosya da isabet alır, yol yanıtta güncellenir
+        copy = os.path.join(tmp, "kopya.py")
+        with open(path, encoding="utf-8") as src, open(copy, "w", encoding="utf-8") as dst:
+            dst.write(src.read())
+        copied = analyze(tool_server, copy)
+        assert copied["cached"] is True and copied["file"] == "kopya.py"
+
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n\nclass A:\n    pass\n")
+        changed = analyze(tool_server, path)
+        assert changed["cached"] is False and changed["metrics"]["class_count"] == 1
+
+        # Analiz sürümü artınca eski kayıtlar kullanılmaz
+        with mock.patch.object(Cache, "ANALYZER_VERSION", Cache.ANALYZER_VERSION + 1):
+            assert analyze(tool_server, copy)["cached"] is False
+            assert analyze(tool_server, copy)["cached"] is True
+        assert analyze(tool_server, copy)["cached"] is True
+
+        # detail modu anahtarın parçasıdır
+        fast = json.loads(tool_server.code_agent_analyze({"file_path": copy, "format": "json", "detail": "fast"}))
+        assert fast["cached"] is False and fast["metrics"]["detail"] == "fast"
+
+        # Kayıtlar kalıcıdır: yeni örnek (ör. yeniden başlatılan sunucu) aynı dosyayı okur
+        with open(copy, encoding="utf-8") as f:
+            key = Cache.make_key(f.read(), "Python:full")
+        reopened = Cache(os.path.join(tmp, "cache.sqlite"))
+        assert reopened.get(key)["metrics"] == first["metrics"]
+        assert reopened.stats()["hits"] == 1
+
+
+def test_size_capped_eviction():
+    with tempfile.TemporaryDirectory() as tmp:
+        value = {"veri": "x" * 1000}
+        entry_size = len(json.dumps(value, separators=(",", ":")))
+        cache = Cache(os.path.join(tmp, "cache.sqlite"), max_bytes=entry_size * 5)
+        cache._EVICT_CHECK_INTERVAL = 1
+        cache._TOUCH_INTERVAL = 0.0
+
+        for i in range(5):
+            cache.put(f"k{i}", value)
+        assert cache.stats()["entries"] == 5
+        # k0'a erişildi: en eski erişilen artık k1
+        assert cache.get("k0") == value
+        cache.put("k5", value)
+        stats = cache.stats()
+        # Sınır aşılınca %90'ın altına inilir: 6 kayıttan 2'si silinir
+        assert stats["entries"] == 4 and stats["stored_bytes"] <= stats["max_bytes"] * 0.9
+        assert cache.get("k1") is None and cache.get("k2") is None
+        assert all(cache.get(key) == value for key in ("k0", "k3", "k4", "k5"))
+
+
+def test_eviction_is_checked_periodically():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Cache(os.path.join(tmp, "cache.sqlite"), max_bytes=100)
+        value = {"v": "y" * 40}
+        # İlk yazım sınırı kontrol eder; sonraki kontrol _EVICT_CHECK_INTERVAL yazım sonra
+        cache.put("ilk", value)
+        for i in range(1, Cache._EVICT_CHECK_INTERVAL):
+            cache.put(f"k{i}", value)
+        assert cache.stats()["entries"] == Cache._EVICT_CHECK_INTERVAL
+        cache.put("son", value)
+        assert cache.stats()["stored_bytes"] <= 90
+
+
+if __name__ == "__main__":
+    test_hit_on_unchanged_content_and_version_bump()
+    test_size_capped_eviction()
+    test_eviction_is_checked_periodically()
+    print("✅ Analiz cache testleri geçti")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+code_agent_analyze_project testleri
+workers=1 ve workers=2 aynı toplamları ve en kötü dosya/fonksiyon listesini vermeli
+"""
+import importlib
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+
+# spawn işçileri iş birimini modül adıyla içe aktarır: dosya yolundan değil, sys.path'ten yüklenir
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'mcp-tools'))
+server = importlib.import_module("server")
+
+FILES = {
+    "app/guvensiz.py": "import os\n\n\ndef calistir(kod):\n    if kod:\n        for _ in range(3):\n"
+                       "            if kod.strip():\n                return eval(kod)\n    return None\n",
+    "app/basit.py": "# yardımcı\ndef topla(a, b):\n    return a + b\n",
+    "app/bozuk.py": "def f(:\n    if x:\n        pass\n",
+    "web/index.js": "function sec(x) {\n  if (x > 1 && x < 5) { return 1; }\n  return x ? 2 : 3;\n}\n",
+    "web/tip.ts": "export class Kutu {\n  al(): number { return 1; }\n}\n",
+    "web/paket.min.js": "function a(){if(x){}}\n",
+    "node_modules/lib/index.js": "function z() {}\n",
+    ".gizli/x.py": "x = 1\n",
+    "notlar.txt": "analiz edilmez\n",
+}
+
+
+def write_tree(root):
+    for name, content in FILES.items():
+        path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+    with open(os.path.join(root, "app", "ikili.py"), "wb") as f:
+        f.write(b"x = '\xff\xfe'\n")
+
+
+def analyze(tool_server, root, workers):
+    return json.loads(tool_server.code_agent_analyze_project({"root": root, "workers": workers, "chunk_size": 2}))
+
+
+def test_project_totals_match_for_one_and_two_workers():
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.dict(os.environ, {"KAYRADENIZ_ANALYSIS_CACHE": os.path.join(tmp, "cache.sqlite")}), \
+            mock.patch.object(server.AnalysisResultCache, "_shared", None):
+        root = os.path.join(tmp, "proje")
+        write_tree(root)
+        tool_server = server.KayradenizToolServer()
+        try:
+            single = analyze(tool_server, root, 1)
+            double = analyze(tool_server, root, 2)
+        finally:
+            tool_server._shutdown_analysis_pool()
+
+        assert single["files"] == double["files"] == 6
+        assert single["analyzed"] == double["analyzed"] == 5
+        assert single["failed"] == double["failed"] == 1
+        assert single["workers"] == 1 and double["workers"] == 2
+        # İkinci çalıştırma işçi süreçlerde de paylaşılan cache'ten okur
+        assert single["cache_hits"] == 0 and double["cache_hits"] == 5
+        assert single["totals"] == double["totals"]
+        assert single["languages"] == double["languages"] == {
+            "Python": {"files": 3, "lines": single["languages"]["Python"]["lines"]},
+            "JavaScript": {"files": 1, "lines": 5},
+            "TypeScript": {"files": 1, "lines": 4},
+        }
+
+        # Toplamlar dosya bazlı analizlerin toplamıdır
+        expected = {key: 0 for key in single["totals"]}
+        for name in ("app/guvensiz.py", "app/basit.py", "app/bozuk.py", "web/index.js", "web/tip.ts"):
+            result = json.loads(tool_server.code_agent_analyze({"file_path": os.path.join(root, name),
+                                                                "format": "json"}))
+            for key in ("total_lines", "non_empty_lines", "comment_lines", "function_count",
+                        "class_count", "complexity_score"):
+                expected[key] += result["metrics"][key]
+            expected["security_count"] += len(result["security_issues"])
+            expected["issue_count"] += len(result["issues"])
+        assert single["totals"] == expected and expected["security_count"] == 1
+
+        for summary in (single, double):
+            worst = summary["worst_files"][0]
+            assert worst["path"] == os.path.join("app", "guvensiz.py") and worst["security_count"] == 1
+            assert summary["worst_functions"][0] == {"qualname": "calistir", "line": 4, "complexity": 4,
+                                                     "path": os.path.join("app", "guvensiz.py")}
+        assert sorted(map(json.dumps, single["worst_files"])) == sorted(map(json.dumps, double["worst_files"]))
+
+
+def test_missing_root_is_reported():
+    with tempfile.TemporaryDirectory() as tmp:
+        result = server.KayradenizToolServer().code_agent_analyze_project({"root": os.path.join(tmp, "yok")})
+        assert result.startswith("Hata: Dizin bulunamadı")
+
+
+if __name__ == "__main__":
+    test_project_totals_match_for_one_and_two_workers()
+    test_missing_root_is_reported()
+    print("✅ Proje analizi testleri geçti")
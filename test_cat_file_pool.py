@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+GitCatFilePool testleri
+Süreçler yeniden kullanılmalı, depo başına sınır aşılmamalı
+"""
+import importlib.util
+import os
+import subprocess
+import tempfile
+import threading
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True).stdout
+
+
+def test_pool_reuses_processes_and_reads_objects():
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q')
+        with open(os.path.join(repo, 'a.txt'), 'wb') as f:
+            f.write(b"satir\n\0ikili\n")
+        git(repo, 'add', '.')
+        git(repo, '-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'ilk')
+
+        pool = server.GitCatFilePool(max_per_repo=2)
+        try:
+            blob = pool.read(repo, "HEAD:a.txt")
+            assert blob["type"] == "blob" and blob["data"] == b"satir\n\0ikili\n"
+            assert pool.check(repo, "HEAD")["type"] == "commit"
+            assert pool.read(repo, "HEAD:yok.txt") is None
+            try:
+                pool.read(repo, "HEAD\nHEAD")
+                raise AssertionError("satır sonu içeren ad reddedilmeli")
+            except ValueError:
+                pass
+
+            spawned = pool.spawned
+            errors = []
+
+            def reader():
+                try:
+                    for _ in range(20):
+                        assert pool.read(repo, "HEAD:a.txt")["size"] == 13
+                except Exception as e:  # thread içindeki hata ana teste taşınsın
+                    errors.append(e)
+
+            threads = [threading.Thread(target=reader) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+            assert not errors
+            # 6 thread 120 okuma yapar ama depo başına en fazla 2 okuma süreci açılır
+            assert pool.spawned - spawned <= 2
+            assert pool._counts[(repo, False)] <= 2 and len(pool._idle[(repo, False)]) <= 2
+        finally:
+            pool.close_all()
+
+
+def test_dead_process_is_replaced():
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q')
+        git(repo, '-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-q', '--allow-empty', '-m', 'ilk')
+        pool = server.GitCatFilePool(max_per_repo=1)
+        try:
+            assert pool.check(repo, "HEAD") is not None
+            idle = pool._idle[(repo, True)][0]
+            idle.proc.kill()
+            idle.proc.wait()
+            assert pool.check(repo, "HEAD") is not None
+            assert pool.spawned == 2
+        finally:
+            pool.close_all()
+
+
+if __name__ == "__main__":
+    test_pool_reuses_processes_and_reads_objects()
+    test_dead_process_is_replaced()
+    print("✅ cat-file havuzu testleri geçti")
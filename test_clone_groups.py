@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+CodeFingerprinter.clone_groups testleri
+İsimleri değiştirilmiş kopyalar tek grupta, doğru satır aralıklarıyla bulunmalı
+"""
+import importlib.util
+import os
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+Fingerprinter = server.CodeFingerprinter
+
+BODY = """def {name}(items, limit):
+    total = 0
+    seen = set()
+    for item in items:
+        if item in seen:
+            continue
+        seen.add(item)
+        if item > limit:
+            total += item * 2
+        else:
+            total -= 1
+    return total, len(seen)
+"""
+
+
+def occurrences(files):
+    """WorkspaceIndex.duplicate_groups sorgusu gibi hash'e göre sıralı kayıtlar"""
+    return sorted(
+        (fingerprint, path, start, end)
+        for path, content in files.items()
+        for fingerprint, start, end in Fingerprinter.fingerprints(content, "Python")
+    )
+
+
+def spans(group):
+    return [(instance["path"], instance["start_line"], instance["end_line"]) for instance in group["instances"]]
+
+
+def test_renamed_copies_form_one_group():
+    files = {
+        "a.py": "import os\n\n" + BODY.format(name="alpha") + "\n\nX = 1\n",
+        "b.py": "# kopya\n" + BODY.format(name="beta").replace("total", "acc").replace("seen", "known"),
+        "c.py": "import sys\n" * 4 + BODY.format(name="gamma"),
+        "d.py": "def other():\n    return [x for x in range(10) if x % 3 == 0]\n\n\nclass Z:\n    pass\n",
+    }
+    groups = Fingerprinter.clone_groups(occurrences(files))
+    assert len(groups) == 1
+    assert spans(groups[0]) == [("a.py", 3, 14), ("b.py", 2, 13), ("c.py", 5, 16)]
+    assert groups[0]["lines"] == 12 and groups[0]["matches"] > 0
+
+
+def test_min_lines_and_same_file_copies():
+    files = {"a.py": BODY.format(name="a"), "b.py": BODY.format(name="b")}
+    assert Fingerprinter.clone_groups(occurrences(files), min_lines=20) == []
+
+    same = {"s.py": BODY.format(name="a") + "\n" + BODY.format(name="b")}
+    groups = Fingerprinter.clone_groups(occurrences(same))
+    assert len(groups) == 1 and spans(groups[0]) == [("s.py", 1, 12), ("s.py", 14, 25)]
+
+
+CONFIG = """class Config:
+    def __init__(self, path):
+        self.path = path
+        self.values = {}
+
+    def load(self):
+        with open(self.path) as handle:
+            for raw in handle:
+                key, _, value = raw.partition("=")
+                self.values[key.strip()] = value.strip()
+        return self.values
+"""
+
+
+def test_partial_copies_join_and_groups_are_ordered():
+    partial = "\n".join(BODY.format(name="s").split("\n")[:8]) + "\n"
+    files = {
+        "a.py": BODY.format(name="a"),
+        "b.py": BODY.format(name="b") + "\n\n" + CONFIG,
+        "c.py": "import re\n" + partial,
+        "e.py": CONFIG.replace("Config", "Settings"),
+    }
+    groups = Fingerprinter.clone_groups(occurrences(files))
+    # Kısmi kopya tam kopyalarla aynı gruba girer; aynı dosyadaki ikinci kopya ayrı gruptur
+    assert [spans(group) for group in groups] == [
+        [("a.py", 1, 12), ("b.py", 1, 12), ("c.py", 2, 9)],
+        [("b.py", 15, 24), ("e.py", 1, 10)],
+    ]
+    assert [group["lines"] for group in groups] == [12, 10]
+
+
+if __name__ == "__main__":
+    test_renamed_copies_form_one_group()
+    test_min_lines_and_same_file_copies()
+    test_partial_copies_join_and_groups_are_ordered()
+    print("✅ Kopya kod gruplama testleri geçti")
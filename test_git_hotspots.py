@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+git_hotspots testleri
+Churn tabloları son işlenen HEAD'den artımlı güncellenmeli; geçmiş yeniden yazılınca baştan kurulmalı
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+GIT_ENV = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t",
+               GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@t")
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, env=GIT_ENV,
+                          text=True).stdout.strip()
+
+
+def commit(repo, name, content, message, author="t"):
+    with open(os.path.join(repo, name), 'w', encoding='utf-8') as f:
+        f.write(content)
+    git(repo, 'add', name)
+    git(repo, '-c', f'user.name={author}', 'commit', '-qm', message, f'--author={author} <{author}@t>')
+
+
+def hotspots(tool_server, repo, **extra):
+    return json.loads(tool_server.git_hotspots(dict({"repo_path": repo}, **extra)))
+
+
+def test_incremental_update_and_rewrite():
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q', '-b', 'main')
+        commit(repo, 'a.py', "def f(x):\n    return x\n", "a1")
+        commit(repo, 'b.py', "y = 1\n", "b1")
+        commit(repo, 'a.py', "def f(x):\n    if x:\n        return x\n    return 0\n", "a2", author="ayse")
+        tool_server = server.KayradenizToolServer()
+
+        result = hotspots(tool_server, repo)
+        assert result["commits_analyzed"] == 3 and result["new_commits"] == 3
+        by_path = {item["path"]: item for item in result["hotspots"]}
+        assert by_path["a.py"]["commits"] == 2 and by_path["a.py"]["authors"] == 2
+        assert by_path["a.py"]["complexity"] >= 1 and result["hotspots"][0]["path"] == "a.py"
+        assert os.path.isfile(os.path.join(repo, '.git', 'kayradeniz', 'hotspots.json'))
+
+        # HEAD değişmedi: git log çalıştırılmaz
+        assert hotspots(tool_server, repo)["new_commits"] == 0
+
+        # Sadece son HEAD'den sonraki commit'ler işlenir; birleştirme commit'leri sayılmaz
+        git(repo, 'checkout', '-qb', 'yan')
+        commit(repo, 'b.py', "y = 2\n", "b2")
+        git(repo, 'checkout', '-q', 'main')
+        commit(repo, 'a.py', "def f(x):\n    return 1\n", "a3")
+        git(repo, 'merge', '-q', '--no-edit', 'yan')
+        result = hotspots(tool_server, repo)
+        assert result["new_commits"] == 2 and result["commits_analyzed"] == 5
+        by_path = {item["path"]: item for item in result["hotspots"]}
+        assert by_path["a.py"]["commits"] == 3 and by_path["b.py"]["commits"] == 2
+
+        # Geçmiş yeniden yazıldı: eski HEAD yeni HEAD'in atası değil, tablolar baştan kurulur
+        git(repo, 'reset', '-q', '--hard', 'HEAD~2')
+        commit(repo, 'c.py', "z = 1\n", "c1")
+        result = hotspots(tool_server, repo)
+        assert result["new_commits"] == result["commits_analyzed"] == 4
+        by_path = {item["path"]: item for item in result["hotspots"]}
+        assert by_path["a.py"]["commits"] == 2 and by_path["b.py"]["commits"] == 1 and "c.py" in by_path
+
+        # rebuild=true cache'i yok sayar
+        result = hotspots(tool_server, repo, rebuild=True)
+        assert result["new_commits"] == result["commits_analyzed"] == 4
+
+
+def test_path_prefix_and_deleted_files():
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q', '-b', 'main')
+        os.makedirs(os.path.join(repo, 'src'))
+        commit(repo, 'src/a.py', "x = 1\n", "a1")
+        commit(repo, 'kok.py', "x = 1\n", "k1")
+        commit(repo, 'silinen.py', "x = 1\n", "s1")
+        git(repo, 'rm', '-q', 'silinen.py')
+        git(repo, 'commit', '-qm', 'sil')
+        tool_server = server.KayradenizToolServer()
+
+        result = hotspots(tool_server, repo)
+        assert {item["path"] for item in result["hotspots"]} == {"src/a.py", "kok.py"}
+        assert result["files_tracked"] == 3
+        assert [item["path"] for item in hotspots(tool_server, repo, path_prefix="src")["hotspots"]] == ["src/a.py"]
+
+
+if __name__ == "__main__":
+    test_incremental_update_and_rewrite()
+    test_path_prefix_and_deleted_files()
+    print("✅ hotspot testleri geçti")
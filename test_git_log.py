@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+git_log / git_diff sayfalama testleri
+Sayfalar art arda eklendiğinde git'in kendi çıktısıyla aynı olmalı
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+# Tüm commit'ler aynı saniyede: sıralama yalnızca geçmişin şekline kalır
+GIT_ENV = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t", GIT_COMMITTER_NAME="t",
+               GIT_COMMITTER_EMAIL="t@t", GIT_AUTHOR_DATE="1700000000 +0000",
+               GIT_COMMITTER_DATE="1700000000 +0000")
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, env=GIT_ENV).stdout
+
+
+def commit(repo, name, content, message):
+    with open(os.path.join(repo, name), 'w', encoding='utf-8') as f:
+        f.write(content)
+    git(repo, 'add', '--', name)
+    git(repo, 'commit', '-qm', message)
+
+
+def make_merge_repo(repo):
+    git(repo, 'init', '-q', '-b', 'master')
+    commit(repo, 'a.txt', '0\n', 'c0')
+    commit(repo, 'a.txt', '1\n', 'c1')
+    git(repo, 'checkout', '-qb', 'side')
+    for i in range(3):
+        commit(repo, 'b.txt', f'{i}\n', f's{i}')
+    git(repo, 'checkout', '-q', 'master')
+    for i in range(2):
+        commit(repo, 'a.txt', f'm{i}\n', f'm{i}')
+    git(repo, 'merge', '-q', '--no-ff', '-m', 'merge', 'side')
+    commit(repo, 'a.txt', 'son\n', 'c2')
+
+
+def all_pages(tool, args):
+    results, cursor = [], None
+    while True:
+        page = json.loads(tool(dict(args, cursor=cursor) if cursor else args))
+        results.append(page)
+        if not page["has_more"]:
+            return results
+        cursor = page["next_cursor"]
+
+
+def test_log_pages_match_git_log_with_merges():
+    with tempfile.TemporaryDirectory() as repo:
+        make_merge_repo(repo)
+        tool_server = server.KayradenizToolServer()
+        expected = git(repo, 'log', '--format=%H').decode().split()
+        for page_size in (1, 2, 3, 50):
+            pages = all_pages(tool_server.git_log, {"repo_path": repo, "page_size": page_size})
+            oids = [c["oid"] for page in pages for c in page["commits"]]
+            assert len(oids) == len(set(oids)) == len(expected)
+            assert set(oids) == set(expected)
+            assert oids == git(repo, 'log', '--date-order', '--format=%H').decode().split()
+
+
+def test_diff_literal_paths_and_pages():
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q')
+        names = ['a*.txt', 'ab.txt', 'q?.txt', 'qx.txt', 'c:d.txt']
+        for name in names:
+            commit(repo, name, 'ilk\n', name)
+        base = git(repo, 'rev-parse', 'HEAD').decode().strip()
+        for name in names:
+            with open(os.path.join(repo, name), 'w', encoding='utf-8') as f:
+                f.write(f'ilk\n{name}\n')
+        git(repo, 'commit', '-qam', 'hepsi')
+
+        tool_server = server.KayradenizToolServer()
+        args = {"repo_path": repo, "from_revision": base, "to_revision": "HEAD", "page_size": 2, "mode": "patch"}
+        pages = all_pages(tool_server.git_diff, args)
+        assert sorted(f["path"] for page in pages for f in page["files"]) == sorted(names)
+        for page in pages:
+            # Her sayfanın yaması yalnızca o sayfadaki dosyaları içerir
+            patched = {line[len('+++ b/'):] for line in page["patch"].split("\n") if line.startswith('+++ b/')}
+            assert patched == {f["path"] for f in page["files"]}
+
+
+def test_stream_survives_large_stderr():
+    # Pipe tamponundan büyük stderr, stdout okunurken süreci bekletmemeli
+    script = "import sys; sys.stderr.write('x' * 1000000); sys.stderr.flush(); print('a\\nb')"
+    records = list(server.KayradenizToolServer._stream_git_records([sys.executable, '-c', script], '.', b"\n"))
+    assert records == [b"a", b"b"]
+    failing = "import sys; sys.stderr.write('bozuk'); sys.exit(3)"
+    try:
+        list(server.KayradenizToolServer._stream_git_records([sys.executable, '-c', failing], '.', b"\n"))
+    except RuntimeError as e:
+        assert str(e) == "bozuk"
+    else:
+        raise AssertionError("hata bekleniyordu")
+
+
+if __name__ == "__main__":
+    test_log_pages_match_git_log_with_merges()
+    test_diff_literal_paths_and_pages()
+    test_stream_survives_large_stderr()
+    print("✅ git_log/git_diff testleri geçti")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+git_multi testleri
+Repository keşfi derinlik/sayı sınırlarına uymalı; repo içine ve atlanan dizinlere inilmemeli
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def make_repo(root, relpath):
+    path = os.path.join(root, relpath)
+    os.makedirs(path)
+    git(path, 'init', '-q', '-b', 'main')
+    return path
+
+
+def make_tree(root):
+    make_repo(root, 'a')
+    make_repo(root, 'a/ic-ice')          # repo içindeki repo'ya inilmez
+    make_repo(root, 'grup/b')
+    make_repo(root, 'grup/derin/x/c')    # derinlik 4
+    make_repo(root, 'node_modules/d')
+    make_repo(root, '.gizli/e')
+    # Worktree/submodule gibi .git dosyası olan dizin de repo sayılır
+    os.makedirs(os.path.join(root, 'grup', 'wt'))
+    with open(os.path.join(root, 'grup', 'wt', '.git'), 'w') as f:
+        f.write('gitdir: ../b/.git\n')
+
+
+def discover(root, max_depth, max_repos=200):
+    repos = server.KayradenizToolServer._discover_repositories(root, max_depth, max_repos)
+    return [os.path.relpath(repo, root).replace(os.sep, '/') for repo in repos]
+
+
+def test_discovery_depth_and_limits():
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root)
+        assert discover(root, 3) == ['a', 'grup/b', 'grup/wt']
+        assert discover(root, 4) == ['a', 'grup/b', 'grup/wt', 'grup/derin/x/c']
+        assert discover(root, 1) == ['a']
+        assert discover(root, 0) == []
+        assert discover(root, 4, max_repos=2) == ['a', 'grup/b']
+        # Kökün kendisi repo ise altına inilmez
+        assert discover(os.path.join(root, 'a'), 3) == ['.']
+
+
+def test_status_over_discovered_repos():
+    with tempfile.TemporaryDirectory() as root:
+        first = make_repo(root, 'bir')
+        second = make_repo(root, 'grup/iki')
+        make_repo(root, 'grup/derin/x/uc')
+        with open(os.path.join(first, 'yeni.txt'), 'w') as f:
+            f.write('x\n')
+        with open(os.path.join(second, 'a.txt'), 'w') as f:
+            f.write('a\n')
+        git(second, 'add', 'a.txt')
+
+        tool_server = server.KayradenizToolServer()
+        progress = []
+        tool_server.notification_sink = progress.append
+        tool_server._active_call = {"id": 7, "tool": "git_multi"}
+        summary = json.loads(tool_server.git_multi({"root": root, "max_depth": 2, "concurrency": 2}))
+        assert summary["repos"] == 2 and summary["ok"] == 2 and summary["failed"] == 0
+        by_repo = {entry["repo"]: entry for entry in summary["results"]}
+        assert set(by_repo) == {'bir', os.path.join('grup', 'iki')}
+        assert by_repo['bir']["untracked"] == 1 and by_repo['bir']["changed"] == 0
+        assert by_repo[os.path.join('grup', 'iki')]["changed"] == 1
+        # Her repo sonucu bittiği anda bildirim olarak da gönderilir
+        assert len(progress) == 2 and all(item["params"]["requestId"] == 7 for item in progress)
+
+        assert tool_server.git_multi({"root": root, "action": "sil"}).startswith("Hata:")
+
+
+if __name__ == "__main__":
+    test_discovery_depth_and_limits()
+    test_status_over_discovered_repos()
+    print("✅ git_multi testleri geçti")
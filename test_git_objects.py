@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+GitObjectDatabase testleri
+Pack/delta okuyucu git cat-file ile aynı sonucu vermeli
+"""
+import hashlib
+import importlib.util
+import os
+import struct
+import subprocess
+import tempfile
+import zlib
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+GitObjectDatabase = server.GitObjectDatabase
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True).stdout
+
+
+def blob_oid(data):
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).digest()
+
+
+def varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        out.append(byte | (0x80 if value else 0))
+        if not value:
+            return bytes(out)
+
+
+def entry_header(obj_type, size):
+    byte = (obj_type << 4) | (size & 0x0F)
+    size >>= 4
+    out = bytearray()
+    while size:
+        out.append(byte | 0x80)
+        byte = size & 0x7F
+        size >>= 7
+    out.append(byte)
+    return bytes(out)
+
+
+def ofs_distance(distance):
+    out = bytearray([distance & 0x7F])
+    distance >>= 7
+    while distance:
+        distance -= 1
+        out.insert(0, 0x80 | (distance & 0x7F))
+        distance >>= 7
+    return bytes(out)
+
+
+def make_delta(base, extra):
+    # Tabanın tamamını kopyala, sonuna extra ekle
+    size = len(base)
+    copy = bytearray([0x80])
+    for bit in range(3):
+        if (size >> (8 * bit)) & 0xFF:
+            copy[0] |= 1 << (4 + bit)
+            copy.append((size >> (8 * bit)) & 0xFF)
+    return varint(len(base)) + varint(len(base) + len(extra)) + bytes(copy) + bytes([len(extra)]) + extra
+
+
+def write_pack(base_path, entries):
+    """entries: (oid, tip, payload, ek) - ek OFS için önceki girdinin indeksi, REF için oid"""
+    body = bytearray(b"PACK" + struct.pack(">II", 2, len(entries)))
+    offsets = []
+    for oid, obj_type, payload, extra in entries:
+        offset = len(body)
+        offsets.append((oid, offset))
+        body += entry_header(obj_type, len(payload))
+        if obj_type == GitObjectDatabase.OFS_DELTA:
+            body += ofs_distance(offset - offsets[extra][1])
+        elif obj_type == GitObjectDatabase.REF_DELTA:
+            body += extra
+        body += zlib.compress(payload)
+    body += hashlib.sha1(body).digest()
+    with open(base_path + ".pack", "wb") as f:
+        f.write(body)
+
+    ordered = sorted(offsets)
+    fanout = [sum(1 for oid, _ in ordered if oid[0] <= i) for i in range(256)]
+    idx = bytearray(b"\xfftOc" + struct.pack(">I", 2) + struct.pack(">256I", *fanout))
+    for oid, _ in ordered:
+        idx += oid
+    idx += b"\0\0\0\0" * len(ordered)
+    for _, offset in ordered:
+        idx += struct.pack(">I", offset)
+    idx += body[-20:]
+    idx += hashlib.sha1(idx).digest()
+    with open(base_path + ".idx", "wb") as f:
+        f.write(idx)
+    return dict(offsets)
+
+
+def test_packed_objects_match_cat_file():
+    # Gerçek git repack çıktısındaki OFS_DELTA zincirleri doğru çözülmeli
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q')
+        lines = [f"satır {i}\n" for i in range(200)]
+        for version in range(12):
+            lines[version * 7] = f"değişti {version}\n"
+            with open(os.path.join(repo, 'dosya.txt'), 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            git(repo, 'add', '.')
+            git(repo, '-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', f"v{version}")
+        git(repo, 'repack', '-adq', '--depth=50', '--window=50')
+
+        db = GitObjectDatabase(os.path.join(repo, '.git'))
+        try:
+            oids = git(repo, 'rev-list', '--objects', '--all').decode().split()
+            oids = [oid for oid in oids if len(oid) == 40]
+            for oid in oids:
+                obj_type = git(repo, 'cat-file', '-t', oid).decode().strip()
+                data = git(repo, 'cat-file', obj_type, oid)
+                assert db.read(oid) == (obj_type, data)
+                assert db.header(oid) == (obj_type, len(data))
+        finally:
+            db.close()
+
+
+def test_ref_delta_across_packs_caches_under_base_pack():
+    # B paketindeki REF_DELTA, A paketindeki OFS_DELTA zincirine atlar;
+    # A'daki ara tabanlar B'nin yolu ile cache'lenmemeli
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q')
+        pack_dir = os.path.join(repo, '.git', 'objects', 'pack')
+
+        base = b"temel icerik\n" * 20
+        middle = base + b"orta\n"
+        top = middle + b"ust\n"
+        pack_a = os.path.join(pack_dir, 'pack-a')
+        offsets_a = write_pack(pack_a, [
+            (blob_oid(base), 3, base, None),
+            (blob_oid(middle), GitObjectDatabase.OFS_DELTA, make_delta(base, b"orta\n"), 0),
+        ])
+        pack_b = os.path.join(pack_dir, 'pack-b')
+        write_pack(pack_b, [
+            (blob_oid(top), GitObjectDatabase.REF_DELTA, make_delta(middle, b"ust\n"), blob_oid(middle)),
+        ])
+
+        db = GitObjectDatabase(os.path.join(repo, '.git'))
+        try:
+            assert db.header(blob_oid(top).hex()) == ("blob", len(top))
+            assert db.read(blob_oid(top).hex()) == ("blob", top)
+            middle_offset = offsets_a[blob_oid(middle)]
+            assert db._cache_get((pack_a, middle_offset)) == ("blob", middle)
+            assert db._cache_get((pack_b, middle_offset)) is None
+            assert db.read(blob_oid(middle).hex()) == ("blob", middle)
+        finally:
+            db.close()
+
+
+def test_peel_tags_to_any_object():
+    # '^{}' yalnızca tag'leri açar: ağaca/blob'a işaret eden tag de çözülmeli
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q')
+        with open(os.path.join(repo, 'a.txt'), 'w', encoding='utf-8') as f:
+            f.write("a\n")
+        git(repo, 'add', '.')
+        git(repo, '-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-qm', 'ilk')
+        tagger = ['-c', 'user.name=t', '-c', 'user.email=t@t']
+        git(repo, *tagger, 'tag', '-a', '-m', 'ağaç', 'tree-tag', 'HEAD^{tree}')
+        git(repo, *tagger, 'tag', '-a', '-m', 'blob', 'blob-tag', 'HEAD:a.txt')
+        git(repo, *tagger, 'tag', '-a', '-m', 'iç içe', 'nested', 'tree-tag')
+
+        db = GitObjectDatabase(os.path.join(repo, '.git'))
+        try:
+            for revision in ('tree-tag^{}', 'blob-tag^{}', 'nested^{}', 'HEAD^{}', 'HEAD^{tree}', 'nested^{tree}'):
+                expected = git(repo, 'rev-parse', revision).decode().strip()
+                assert db.resolve_revision(revision) == expected, revision
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    test_packed_objects_match_cat_file()
+    test_ref_delta_across_packs_caches_under_base_pack()
+    test_peel_tags_to_any_object()
+    print("✅ GitObjectDatabase testleri geçti")
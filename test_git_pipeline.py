@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+git_pipeline testleri
+İlk hatalı adımda durmalı; doğrulanamayan adım varsa hiçbir komut çalışmamalı
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+def git(cwd, *args, check=True):
+    return subprocess.run(['git', *args], cwd=cwd, check=check, capture_output=True, text=True).stdout.strip()
+
+
+def write(repo, name, content):
+    with open(os.path.join(repo, name), 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def make_repo(tmp):
+    remote = os.path.join(tmp, 'remote.git')
+    repo = os.path.join(tmp, 'repo')
+    git(tmp, 'init', '-q', '--bare', remote)
+    os.makedirs(repo)
+    git(repo, 'init', '-q', '-b', 'main')
+    git(repo, 'remote', 'add', 'origin', remote)
+    tool_server = server.KayradenizToolServer()
+    tool_server.git_user_name, tool_server.git_user_email = "t", "t@t"
+    return tool_server, repo, remote
+
+
+def run(tool_server, repo, steps):
+    return json.loads(tool_server.git_pipeline({"repo_path": repo, "steps": steps}))
+
+
+def test_pipeline_runs_all_steps():
+    with tempfile.TemporaryDirectory() as tmp:
+        tool_server, repo, remote = make_repo(tmp)
+        write(repo, 'a.txt', 'a\n')
+        summary = run(tool_server, repo, [
+            {"action": "stage", "paths": ["a.txt"]},
+            {"action": "commit", "message": "ilk"},
+            {"action": "tag", "name": "v1", "message": "sürüm 1"},
+            {"action": "push", "branch": "main"},
+        ])
+        assert summary["ok"] is True and summary["failed_step"] is None
+        assert [step["status"] for step in summary["steps"]] == ["ok"] * 4
+        # Pipeline'da oluşturulan tag aynı push ile gider
+        assert git(remote, 'rev-parse', 'main') == git(repo, 'rev-parse', 'HEAD')
+        assert git(remote, 'rev-parse', 'v1^{commit}') == git(repo, 'rev-parse', 'HEAD')
+
+
+def test_pipeline_stops_at_first_failure():
+    with tempfile.TemporaryDirectory() as tmp:
+        tool_server, repo, remote = make_repo(tmp)
+        # Commit edilecek değişiklik yok: commit adımı başarısız olur
+        summary = run(tool_server, repo, [
+            {"action": "stage", "paths": ["."]},
+            {"action": "commit", "message": "boş"},
+            {"action": "tag", "name": "v1"},
+            {"action": "push"},
+        ])
+        assert summary["ok"] is False and summary["failed_step"] == 2
+        assert [step["status"] for step in summary["steps"]] == ["ok", "failed", "skipped", "skipped"]
+        assert summary["steps"][1]["error"]
+        assert git(repo, 'tag', '--list') == ""
+        assert git(remote, 'for-each-ref') == ""
+
+
+def test_invalid_step_fails_before_anything_runs():
+    with tempfile.TemporaryDirectory() as tmp:
+        tool_server, repo, remote = make_repo(tmp)
+        write(repo, 'a.txt', 'a\n')
+        summary = run(tool_server, repo, [
+            {"action": "stage", "paths": ["a.txt"]},
+            {"action": "commit", "message": "ilk"},
+            {"action": "tag"},
+            {"action": "yayinla"},
+        ])
+        assert summary["ok"] is False and summary["failed_step"] == 3
+        statuses = [step["status"] for step in summary["steps"]]
+        assert statuses == ["skipped", "skipped", "failed", "failed"]
+        assert "Bilinmeyen adım" in summary["steps"][3]["error"]
+        # stage bile çalışmadı: index ve geçmiş boş
+        assert git(repo, 'ls-files') == ""
+        assert git(repo, 'rev-parse', '--verify', 'HEAD', check=False) == ""
+
+
+if __name__ == "__main__":
+    test_pipeline_runs_all_steps()
+    test_pipeline_stops_at_first_failure()
+    test_invalid_step_fails_before_anything_runs()
+    print("✅ git_pipeline testleri geçti")
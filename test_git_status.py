@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+GitStatusService testleri
+porcelain=v2 -z çıktısı (rename, unmerged, untracked) doğru çözülmeli; cache değişince yenilenmeli
+"""
+import importlib.util
+import os
+import subprocess
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+GIT_ENV = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t",
+               GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@t")
+
+
+def git(cwd, *args, check=True):
+    return subprocess.run(['git', *args], cwd=cwd, check=check, capture_output=True, env=GIT_ENV).stdout
+
+
+def write(repo, name, content):
+    with open(os.path.join(repo, name), 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def test_parse_handcrafted_records():
+    output = (
+        b"# branch.oid 1111111111111111111111111111111111111111\0# branch.head main\0"
+        b"# branch.upstream origin/main\0# branch.ab +2 -3\0"
+        b"1 .M N... 100644 100644 100644 aaa bbb dosya adi.txt\0"
+        b"2 R. N... 100644 100644 100644 aaa bbb R100 yeni ad.txt\0eski ad.txt\0"
+        b"u UU N... 100644 100644 100644 100644 aaa bbb ccc catisma.txt\0"
+        b"? satir\nsonu.txt\0! build/\0"
+    )
+    status = server.GitStatusService.parse_porcelain_v2(output)
+    assert status["branch"] == {"oid": "1" * 40, "head": "main", "upstream": "origin/main", "ahead": 2, "behind": 3}
+    assert status["entries"] == [
+        {"kind": "changed", "xy": ".M", "submodule": "N...", "path": "dosya adi.txt"},
+        {"kind": "renamed", "xy": "R.", "submodule": "N...", "score": "R100", "path": "yeni ad.txt",
+         "orig_path": "eski ad.txt"},
+        {"kind": "unmerged", "xy": "UU", "submodule": "N...", "path": "catisma.txt"},
+        {"kind": "untracked", "xy": "??", "path": "satir\nsonu.txt"},
+        {"kind": "ignored", "xy": "!!", "path": "build/"},
+    ]
+
+
+def test_status_of_real_repo_and_cache():
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q', '-b', 'main')
+        write(repo, 'catisma.txt', 'taban\n')
+        write(repo, 'eski ad.txt', 'aynı içerik\n' * 5)
+        git(repo, 'add', '.')
+        git(repo, 'commit', '-qm', 'taban')
+        git(repo, 'checkout', '-qb', 'yan')
+        write(repo, 'catisma.txt', 'yan\n')
+        git(repo, 'commit', '-qam', 'yan')
+        git(repo, 'checkout', '-q', 'main')
+        write(repo, 'catisma.txt', 'ana\n')
+        git(repo, 'commit', '-qam', 'ana')
+        git(repo, 'merge', 'yan', check=False)
+        git(repo, 'mv', 'eski ad.txt', 'yeni ad.txt')
+        write(repo, 'takip edilmeyen.txt', 'x\n')
+
+        service = server.GitStatusService(max_age=60)
+        status = service.status(repo)
+        assert status["cached"] is False and status["branch"]["head"] == "main"
+        by_path = {entry["path"]: entry for entry in status["entries"]}
+        assert by_path["catisma.txt"]["kind"] == "unmerged" and by_path["catisma.txt"]["xy"] == "UU"
+        assert by_path["yeni ad.txt"]["kind"] == "renamed" and by_path["yeni ad.txt"]["orig_path"] == "eski ad.txt"
+        assert by_path["takip edilmeyen.txt"]["kind"] == "untracked"
+
+        # status index'i yeniden yazmaz: ikinci çağrı cache'ten gelir
+        assert service.status(repo)["cached"] is True
+        # Araçların yazdığı yol ve index değişikliği cache'i geçersiz kılar
+        service.notify_write(os.path.join(repo, 'takip edilmeyen.txt'))
+        assert service.status(repo)["cached"] is False
+        git(repo, 'add', 'takip edilmeyen.txt')
+        status = service.status(repo)
+        assert status["cached"] is False
+        assert {entry["path"]: entry["kind"] for entry in status["entries"]}["takip edilmeyen.txt"] == "changed"
+
+
+if __name__ == "__main__":
+    test_parse_handcrafted_records()
+    test_status_of_real_repo_and_cache()
+    print("✅ git status testleri geçti")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+github_clone testleri
+file:// depolarla shallow, partial, sparse, tek branch ve mirror yeniden kullanımı
+"""
+import importlib.util
+import os
+import subprocess
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+GIT_ENV = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t",
+               GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@t")
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, env=GIT_ENV,
+                          text=True).stdout.strip()
+
+
+def write(repo, name, content):
+    path = os.path.join(repo, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def make_source(tmp):
+    source = os.path.join(tmp, 'kaynak')
+    os.makedirs(source)
+    git(source, 'init', '-q', '-b', 'main')
+    git(source, 'config', 'uploadpack.allowFilter', 'true')
+    for i in range(3):
+        write(source, 'docs/readme.md', f'surum {i}\n')
+        write(source, 'src/app.py', f'x = {i}\n')
+        git(source, 'add', '.')
+        git(source, 'commit', '-qm', f'commit {i}')
+    git(source, 'branch', 'yan')
+    return source, "file://" + source
+
+
+def test_shallow_partial_sparse_single_branch():
+    with tempfile.TemporaryDirectory() as tmp:
+        _, url = make_source(tmp)
+        tool_server = server.KayradenizToolServer()
+
+        shallow = os.path.join(tmp, 'shallow')
+        result = tool_server.github_clone({"repo_url": url, "target_dir": shallow, "depth": 1})
+        assert "başarıyla" in result and "Depth: 1" in result, result
+        assert git(shallow, 'rev-list', '--count', 'HEAD') == "1"
+        assert git(shallow, 'rev-parse', '--is-shallow-repository') == "true"
+
+        partial = os.path.join(tmp, 'partial')
+        result = tool_server.github_clone({"repo_url": url, "target_dir": partial, "filter": "blob:none"})
+        assert "Filter: blob:none" in result, result
+        assert git(partial, 'config', 'remote.origin.partialclonefilter') == "blob:none"
+        assert git(partial, 'rev-list', '--count', 'HEAD') == "3"
+
+        sparse = os.path.join(tmp, 'sparse')
+        result = tool_server.github_clone({"repo_url": url, "target_dir": sparse, "sparse_paths": ["src"]})
+        assert "Sparse: src" in result, result
+        assert os.path.exists(os.path.join(sparse, 'src', 'app.py'))
+        assert not os.path.exists(os.path.join(sparse, 'docs'))
+
+        single = os.path.join(tmp, 'single')
+        tool_server.github_clone({"repo_url": url, "target_dir": single, "single_branch": True,
+                                  "branch": "main"})
+        assert git(single, 'config', 'remote.origin.fetch') == "+refs/heads/main:refs/remotes/origin/main"
+        assert "origin/yan" not in git(single, 'branch', '-r')
+
+
+def test_mirror_is_reused_and_dissociated():
+    with tempfile.TemporaryDirectory() as tmp:
+        source, url = make_source(tmp)
+        mirror_dir = os.path.join(tmp, 'mirrors')
+        tool_server = server.KayradenizToolServer()
+
+        first = os.path.join(tmp, 'ilk')
+        result = tool_server.github_clone({"repo_url": url, "target_dir": first, "use_mirror": True,
+                                           "mirror_dir": mirror_dir})
+        assert "Mirror oluşturuldu" in result, result
+        # --dissociate: clone mirror'a alternates ile bağlı kalmaz
+        assert not os.path.exists(os.path.join(first, '.git', 'objects', 'info', 'alternates'))
+        assert git(first, 'remote', 'get-url', 'origin') == url
+        assert git(first, 'fsck', '--connectivity-only') == ""
+
+        # Yeni upstream commit'i: taze mirror ağa gitmez, max_age=0 ile fetch edilir
+        write(source, 'src/app.py', 'x = 99\n')
+        git(source, 'commit', '-qam', 'yeni')
+        head = git(source, 'rev-parse', 'HEAD')
+        second = os.path.join(tmp, 'ikinci')
+        result = tool_server.github_clone({"repo_url": url, "target_dir": second, "use_mirror": True,
+                                           "mirror_dir": mirror_dir})
+        assert "Mirror güncel" in result, result
+        assert git(second, 'rev-parse', 'HEAD') == head
+
+        shallow = os.path.join(tmp, 'shallow')
+        result = tool_server.github_clone({"repo_url": url, "target_dir": shallow, "use_mirror": True,
+                                           "mirror_dir": mirror_dir, "mirror_max_age": 0, "depth": 1})
+        assert "Mirror güncellendi" in result, result
+        # Shallow clone mirror'dan alınır ama origin gerçek upstream'i gösterir
+        assert git(shallow, 'remote', 'get-url', 'origin') == url
+        assert git(shallow, 'rev-parse', 'HEAD') == head
+        mirror_path = result.split("Mirror güncellendi: ")[1].splitlines()[0]
+        assert git(mirror_path, 'rev-parse', 'main') == head
+
+
+if __name__ == "__main__":
+    test_shallow_partial_sparse_single_branch()
+    test_mirror_is_reused_and_dissociated()
+    print("✅ github_clone testleri geçti")
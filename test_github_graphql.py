@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+GitHubGraphQLClient / github_query_batch testleri
+Yerel GraphQL taklidine karşı: aliaslı sorgu birleştirme, cursor sayfalama,
+sonuçların okuma sırasına eşlenmesi ve tek aliasın hatası
+"""
+import importlib.util
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+ALIAS_RE = re.compile(r"(r\d+): repository\(owner: \$(o\d+), name: \$(n\d+)\) \{ (issues\(|object\(|nameWithOwner)")
+
+
+class FakeGraphQL(BaseHTTPRequestHandler):
+    """Aliasları sorgu metninden çözer; repo başına sabit sayıda issue/commit döner"""
+
+    protocol_version = "HTTP/1.1"
+    repos = {"o/a": {"issues": 120, "commits": 3}, "o/b": {"issues": 4, "commits": 70}}
+    log = []
+    fail_all = False
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        query, variables = request["query"], request["variables"]
+        aliases = ALIAS_RE.findall(query)
+        self.log.append({"path": self.path, "auth": self.headers.get("Authorization"),
+                         "aliases": [alias for alias, *_ in aliases], "variables": variables})
+        data, errors = {}, []
+        for alias, owner_var, name_var, kind in aliases:
+            full_name = f"{variables[owner_var]}/{variables[name_var]}"
+            repo = self.repos.get(full_name)
+            index = alias[1:]
+            if repo is None:
+                data[alias] = None
+                errors.append({"path": [alias], "message": f"Could not resolve to a Repository: {full_name}"})
+            elif kind == "nameWithOwner":
+                data[alias] = {"nameWithOwner": full_name, "openIssues": {"totalCount": repo["issues"]}}
+            elif kind == "issues(":
+                data[alias] = {"issues": self._page(repo["issues"], variables, index, "number")}
+            else:
+                data[alias] = {"object": {"history": self._page(repo["commits"], variables, index, "oid")}}
+        payload = {"data": None, "errors": [{"message": "boom"}]} if self.fail_all else {"data": data}
+        if errors and not self.fail_all:
+            payload["errors"] = errors
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def _page(total, variables, index, key):
+        start = int(variables.get(f"a{index}") or 0)
+        end = min(total, start + int(variables[f"f{index}"]))
+        return {"totalCount": total, "pageInfo": {"hasNextPage": end < total, "endCursor": str(end)},
+                "nodes": [{key: n} for n in range(start, end)]}
+
+    def log_message(self, *args):
+        pass
+
+
+def start():
+    FakeGraphQL.log = []
+    FakeGraphQL.fail_all = False
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeGraphQL)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    with mock.patch.dict(os.environ, {"KAYRADENIZ_GITHUB_API_BASE": base}):
+        tool_server = server.KayradenizToolServer()
+    tool_server.github_cache = None
+    tool_server.github_token = "t"
+    return httpd, tool_server
+
+
+def test_query_batch_merges_paginates_and_maps_results():
+    httpd, tool_server = start()
+    try:
+        result = json.loads(tool_server.github_query_batch({"reads": [
+            {"id": "meta", "type": "repo", "repo": "o/a"},
+            {"id": "tum-issue", "type": "issues", "repo": "o/a", "limit": 120},
+            {"id": "gecmis", "type": "commits", "repo": "o/b", "branch": "main", "limit": 30},
+            {"id": "yok", "type": "repo", "repo": "o/yok"},
+            {"id": "az", "type": "issues", "owner": "o", "repo": "b", "limit": 10},
+        ]}))
+        # İlk tur beş okumayı tek istekte birleştirir; sadece sayfası süren okuma tekrar sorgulanır
+        assert result["round_trips"] == 3
+        assert [entry["aliases"] for entry in FakeGraphQL.log] == [["r0", "r1", "r2", "r3", "r4"], ["r1"], ["r1"]]
+        assert [entry["variables"]["f1"] for entry in FakeGraphQL.log] == [50, 50, 20]
+        assert [entry["variables"]["a1"] for entry in FakeGraphQL.log] == [None, "50", "100"]
+        assert FakeGraphQL.log[0]["variables"]["b2"] == "main"
+        assert {entry["path"] for entry in FakeGraphQL.log} == {"/graphql"}
+        assert {entry["auth"] for entry in FakeGraphQL.log} == {"token t"}
+
+        meta, issues, history, missing, small = result["results"]
+        assert [r["id"] for r in result["results"]] == ["meta", "tum-issue", "gecmis", "yok", "az"]
+        assert meta["data"]["nameWithOwner"] == "o/a" and "error" not in meta
+        assert [node["number"] for node in issues["items"]] == list(range(120))
+        assert issues["total_count"] == 120 and issues["has_next_page"] is False and issues["cursor"] == "120"
+        assert [node["oid"] for node in history["items"]] == list(range(30))
+        assert history["has_next_page"] is True and history["cursor"] == "30"
+        # Tek aliasın hatası sadece o okumaya yazılır
+        assert missing["error"].startswith("Could not resolve to a Repository: o/yok")
+        assert small["repository"] == "o/b" and len(small["items"]) == 4 and "error" not in small
+    finally:
+        httpd.shutdown()
+
+
+def test_alias_limit_cursor_and_query_error():
+    httpd, tool_server = start()
+    try:
+        client = server.GitHubGraphQLClient(tool_server._github_session(), max_aliases=2)
+        reads = [{"id": i, "type": "repo", "owner": "o", "name": name} for i, name in enumerate("ababa")]
+        results = client.batch(reads)
+        assert client.round_trips == 3
+        assert [len(entry["aliases"]) for entry in FakeGraphQL.log] == [2, 2, 1]
+        assert [r["data"]["nameWithOwner"] for r in results] == ["o/a", "o/b", "o/a", "o/b", "o/a"]
+
+        # Çağıranın verdiği cursor'dan devam edilir
+        result = json.loads(tool_server.github_query_batch({"reads": [
+            {"type": "commits", "repo": "o/b", "after": "60", "limit": 50},
+        ]}))
+        commits = result["results"][0]
+        assert [node["oid"] for node in commits["items"]] == list(range(60, 70))
+        assert result["round_trips"] == 1 and commits["has_next_page"] is False
+
+        # Yolu olmayan sorgu hatası tüm okumalara yazılır
+        FakeGraphQL.fail_all = True
+        result = json.loads(tool_server.github_query_batch({"reads": [
+            {"type": "repo", "repo": "o/a"}, {"type": "issues", "repo": "o/b"},
+        ]}))
+        assert [r["error"] for r in result["results"]] == ["boom", "boom"]
+
+        assert tool_server.github_query_batch({"reads": [{"type": "pr", "repo": "o/a"}]}).startswith("Hata:")
+        assert tool_server.github_query_batch({"reads": [{"type": "repo", "repo": "yalniz"}]}).startswith("Hata:")
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    test_query_batch_merges_paginates_and_maps_results()
+    test_alias_limit_cursor_and_query_error()
+    print("✅ GraphQL toplu sorgu testleri geçti")
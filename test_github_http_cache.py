@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+GitHubHTTPCache testleri
+ETag ile koşullu istek, 304'te gövdenin cache'ten sunulması ve boyut sınırında LRU silme
+"""
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+class EtagServer(BaseHTTPRequestHandler):
+    """Kaynak sürümüne göre ETag üretir; eşleşen If-None-Match'e 304 döner"""
+
+    protocol_version = "HTTP/1.1"
+    versions = {}
+    log = []
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        version = self.versions.get(path, 1)
+        etag = f'"{path}-v{version}"'
+        self.log.append({"path": path, "if_none_match": self.headers.get("If-None-Match")})
+        rate = {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(5000 - len(self.log)),
+                "X-RateLimit-Reset": "9999999999"}
+        if path == "/etagsiz":
+            self._send(200, {}, {"path": path})
+        elif self.headers.get("If-None-Match") == etag:
+            self._send(304, dict(rate, ETag=etag), None)
+        else:
+            self._send(200, dict(rate, ETag=etag), {"path": path, "version": version, "pad": "x" * 200})
+
+    def _send(self, status, headers, payload):
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    EtagServer.versions = {}
+    EtagServer.log = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), EtagServer)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def test_etag_revalidation():
+    httpd, base = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = server.GitHubHTTPCache(os.path.join(tmp, 'http.sqlite'))
+            session = server.GitHubSession("token-a", base, cache=cache)
+
+            first = session.get("/repos/o/r")
+            assert first.status_code == 200 and not getattr(first, "from_cache", False)
+            assert EtagServer.log[-1]["if_none_match"] is None
+
+            # Kaynak değişmedi: koşullu istek 304 alır, gövde cache'ten gelir
+            second = session.get("/repos/o/r")
+            assert EtagServer.log[-1]["if_none_match"] == '"/repos/o/r-v1"'
+            assert second.status_code == 200 and getattr(second, "from_cache", False) is True
+            assert second.json() == first.json()
+            # Rate limit başlıkları 304 yanıtından güncellenir
+            assert second.headers["X-RateLimit-Remaining"] == "4998"
+            assert cache.hits == 1 and cache.misses == 1
+
+            # Kaynak değişti: yeni gövde saklanır, sonraki istek yeni ETag'i gönderir
+            EtagServer.versions["/repos/o/r"] = 2
+            third = session.get("/repos/o/r")
+            assert not getattr(third, "from_cache", False) and third.json()["version"] == 2
+            assert session.get("/repos/o/r").json()["version"] == 2
+            assert EtagServer.log[-1]["if_none_match"] == '"/repos/o/r-v2"'
+
+            # Yanıtlar token'a özeldir; başka token koşulsuz istek atar
+            other = server.GitHubSession("token-b", base, cache=cache)
+            other.get("/repos/o/r")
+            assert EtagServer.log[-1]["if_none_match"] is None
+
+            # ETag/Last-Modified olmayan yanıt saklanmaz
+            session.get("/etagsiz")
+            session.get("/etagsiz")
+            assert EtagServer.log[-1]["if_none_match"] is None
+            assert cache.stats()["entries"] == 2
+    finally:
+        httpd.shutdown()
+
+
+def test_lru_eviction_by_size():
+    httpd, base = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            probe = server.GitHubHTTPCache(os.path.join(tmp, 'probe.sqlite'))
+            server.GitHubSession("t", base, cache=probe).get("/a")
+            entry_size = probe.stats()["stored_bytes"]
+
+            cache = server.GitHubHTTPCache(os.path.join(tmp, 'http.sqlite'), max_bytes=entry_size * 3)
+            session = server.GitHubSession("t", base, cache=cache)
+            for path in ("/a", "/b", "/c"):
+                session.get(path)
+            # /a'ya tekrar erişildi (304): en eski erişilen artık /b
+            assert getattr(session.get("/a"), "from_cache", False) is True
+            session.get("/d")
+            stats = cache.stats()
+            assert stats["entries"] == 3 and stats["evictions"] == 1
+            assert stats["stored_bytes"] <= stats["max_bytes"]
+
+            accept = "application/vnd.github.v3+json"
+            kept = {path for path in ("/a", "/b", "/c", "/d")
+                    if cache.validators(cache.make_key("t", base + path, accept))}
+            assert kept == {"/a", "/c", "/d"}
+
+            cache.clear()
+            assert cache.stats()["entries"] == 0
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    test_etag_revalidation()
+    test_lru_eviction_by_size()
+    print("✅ GitHub HTTP cache testleri geçti")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+GitHub idempotency defteri testleri
+Ağ yok: oturum sahte yanıtlar döndürür
+"""
+import importlib.util
+import json
+import os
+import tempfile
+import time
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = json.dumps(payload)
+        self.headers = {}
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    token = "test-token"
+    api_base = "https://api.github.com"
+
+    def __init__(self, post_responses, get_pages):
+        self.post_responses = list(post_responses)
+        self.get_pages = get_pages
+        self.posts = []
+        self.gets = []
+
+    def post(self, path, json=None, **kwargs):
+        self.posts.append((path, json))
+        return self.post_responses.pop(0)
+
+    def get(self, path, params=None, **kwargs):
+        self.gets.append((path, dict(params or {})))
+        page = int((params or {}).get("page", 1))
+        return FakeResponse(200, self.get_pages[page - 1] if page <= len(self.get_pages) else [])
+
+
+def make_server(tmp, session):
+    tool_server = server.KayradenizToolServer()
+    tool_server.github_token = session.token
+    tool_server.github_ledger = server.GitHubIdempotencyLedger(os.path.join(tmp, 'ledger.sqlite'))
+    tool_server._github_session = lambda: session
+    return tool_server
+
+
+def iso(timestamp):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+def test_ledger_states():
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = server.GitHubIdempotencyLedger(os.path.join(tmp, 'ledger.sqlite'))
+        assert ledger.begin("scope", "a") is None
+        pending = ledger.begin("scope", "a")
+        assert pending["status"] == "pending" and pending["updated"] <= time.time()
+        ledger.complete("scope", "a", "https://example/1")
+        assert ledger.begin("scope", "a")["url"] == "https://example/1"
+        assert ledger.begin("other", "a") is None
+        ledger.abandon("scope", "a")
+        assert ledger.begin("scope", "a") is None
+
+
+def test_issue_recovery_paginates_to_ledger_time():
+    with tempfile.TemporaryDirectory() as tmp:
+        now = time.time()
+        session = FakeSession([FakeResponse(502, {"message": "Bad Gateway"})], [])
+        tool_server = make_server(tmp, session)
+        args = {"owner": "o", "repo": "r", "issues": [{"title": "Hata", "key": "k1"}]}
+
+        # 5xx: sonuç belirsiz, anahtar 'pending' kalır
+        first = json.loads(tool_server.github_create_issues_bulk(args))
+        assert first["failed"] == 1 and len(session.posts) == 1
+        marker = tool_server._IDEMPOTENCY_MARKER.format(key="k1")
+
+        # İstek aslında oluşmuş: ikinci sayfada bulunmalı, yeniden POST edilmemeli
+        newer = [{"body": "başka", "created_at": iso(now), "html_url": f"https://x/{i}"} for i in range(100)]
+        session.get_pages = [newer, [{"body": f"Hata\n\n{marker}", "created_at": iso(now),
+                                      "html_url": "https://x/ours"}]]
+        second = json.loads(tool_server.github_create_issues_bulk(args))
+        assert second["results"][0]["status"] == "existing"
+        assert second["results"][0]["url"] == "https://x/ours"
+        assert [params["page"] for _, params in session.gets] == [1, 2]
+        assert all("since" in params for _, params in session.gets)
+        assert len(session.posts) == 1
+
+        # Artık 'done': hiçbir istek gönderilmez
+        session.gets.clear()
+        third = json.loads(tool_server.github_create_issues_bulk(args))
+        assert third["results"][0]["url"] == "https://x/ours" and not session.gets
+
+
+def test_gist_recovery_requires_key_and_rejects_ambiguity():
+    with tempfile.TemporaryDirectory() as tmp:
+        session = FakeSession([FakeResponse(503, {})], [])
+        tool_server = make_server(tmp, session)
+        gist = {"filename": "a.py", "content": "print(1)\n", "key": "g1"}
+        args = {"gists": [gist]}
+
+        json.loads(tool_server.github_create_gists_bulk(args))
+        posted = session.posts[0][1]
+        assert posted["description"] == "KayraDeniz Code Snippet [kd:g1]"
+
+        ours = {"description": posted["description"], "files": {"a.py": {"size": 9}}}
+        same_default = {"description": "KayraDeniz Code Snippet", "files": {"a.py": {"size": 9}}}
+        session.get_pages = [[dict(ours, html_url="https://g/1"), dict(ours, html_url="https://g/2"),
+                              dict(same_default, html_url="https://g/3")]]
+        result = json.loads(tool_server.github_create_gists_bulk(args))["results"][0]
+        assert result["ok"] is False and "Belirsiz" in result["error"]
+        assert len(session.posts) == 1
+
+        session.get_pages = [[dict(ours, html_url="https://g/1"), dict(same_default, html_url="https://g/3")]]
+        result = json.loads(tool_server.github_create_gists_bulk(args))["results"][0]
+        assert result["status"] == "existing" and result["url"] == "https://g/1"
+
+
+if __name__ == "__main__":
+    test_ledger_states()
+    test_issue_recovery_paginates_to_ledger_time()
+    test_gist_recovery_requires_key_and_rejects_ambiguity()
+    print("✅ Idempotency defteri testleri geçti")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+GitHubRateLimiter testleri
+Bekleme max_wait'i aşarsa beklemeden GitHubRateLimitWait; aşmıyorsa reset'e kadar beklenir
+"""
+import importlib.util
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+def rate_headers(limit, remaining, reset, resource=None):
+    headers = {"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining),
+               "X-RateLimit-Reset": str(reset)}
+    if resource:
+        headers["X-RateLimit-Resource"] = resource
+    return headers
+
+
+def expect_wait(limiter, bucket, max_wait, **kwargs):
+    started = time.monotonic()
+    try:
+        limiter.acquire(bucket, max_wait=max_wait, **kwargs)
+    except server.GitHubRateLimitWait as e:
+        # Aşılacağı belli olan bekleme hiç yapılmaz
+        assert time.monotonic() - started < 0.5
+        return e
+    raise AssertionError("GitHubRateLimitWait bekleniyordu")
+
+
+def test_wait_over_max_wait_raises():
+    now = 1_000_000.0
+    limiter = server.GitHubRateLimiter(clock=lambda: now)
+    limiter.update("core", rate_headers(5000, 0, now + 120))
+    error = expect_wait(limiter, "core", 30)
+    assert error.bucket == "core" and error.wait_seconds == 120
+    assert "120 sn" in str(error)
+    # Kuyruktan çıkarılır; başka bucket etkilenmez
+    assert limiter.snapshot()["core"]["waiting"] == 0
+    assert limiter.acquire("search", max_wait=0) == 0
+
+    # İkincil limit: bucket Retry-After süresince kapalı
+    limiter.block("search", 10)
+    assert expect_wait(limiter, "search", 5).wait_seconds == 10
+
+    # Kota alt eşikte: istekler reset'e kadar eşit aralıklara yayılır
+    limiter.update("graphql", rate_headers(100, 4, now + 50))
+    limiter.acquire("graphql", max_wait=0)
+    assert abs(expect_wait(limiter, "graphql", 1).wait_seconds - 50 / 4) < 1e-6
+
+
+def test_wait_within_max_wait_completes():
+    limiter = server.GitHubRateLimiter()
+    limiter.update("core", rate_headers(5000, 0, time.time() + 0.3))
+    waited = limiter.acquire("core", max_wait=5)
+    assert 0.2 <= waited < 2
+
+
+class LimitedGitHub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    reset = 0
+    count = 0
+
+    def do_GET(self):
+        type(self).count += 1
+        data = json.dumps({"message": "API rate limit exceeded"}).encode("utf-8")
+        self.send_response(403)
+        for name, value in rate_headers(10, 0, self.reset, "code_search").items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_primary_limit_surfaces_wait_error():
+    LimitedGitHub.reset = int(time.time()) + 600
+    LimitedGitHub.count = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), LimitedGitHub)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        with mock.patch.dict(os.environ, {"KAYRADENIZ_GITHUB_API_BASE": base, "KAYRADENIZ_GITHUB_MAX_WAIT": "2"}):
+            tool_server = server.KayradenizToolServer()
+            tool_server.github_cache = None
+            tool_server.github_token = "t"
+            started = time.monotonic()
+            result = tool_server.github_search_code({"query": "x", "prefetch": 0})
+        # Reset 600 sn sonra: istek tekrar gönderilmez, kullanıcıya bekleme süresi söylenir
+        assert result.startswith("Hata: GitHub 'code_search' rate limit doldu"), result
+        assert time.monotonic() - started < 1.5 and LimitedGitHub.count == 1
+        snapshot = json.loads(tool_server.github_rate_limits({}))["code_search"]
+        assert snapshot["remaining"] == 0 and snapshot["expected_wait"] > 500
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    test_wait_over_max_wait_raises()
+    test_wait_within_max_wait_completes()
+    test_primary_limit_surfaces_wait_error()
+    print("✅ Rate limiter testleri geçti")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+github_search_code sayfa cache'i ve prefetch testleri
+Sonraki sayfalar arka planda cache'e alınmalı; cursor ile gelen sayfa ağa gitmeden sunulmalı
+"""
+import importlib.util
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+class SearchServer(BaseHTTPRequestHandler):
+    """45 sonuçlu sahte kod arama; her istek (sorgu, sayfa, token) olarak kaydedilir"""
+
+    protocol_version = "HTTP/1.1"
+    total = 45
+    remaining = 29
+    log = []
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        query, page, per_page = params["q"][0], int(params["page"][0]), int(params["per_page"][0])
+        self.log.append((query, page, self.headers.get("Authorization")))
+        start = (page - 1) * per_page
+        items = [{"name": f"f{i}.py", "path": f"src/f{i}.py", "sha": str(i), "html_url": f"https://x/{i}",
+                  "repository": {"full_name": "o/r"}}
+                 for i in range(start, min(start + per_page, self.total))]
+        data = json.dumps({"total_count": self.total, "incomplete_results": False, "items": items}).encode()
+        self.send_response(200)
+        for name, value in {"X-RateLimit-Limit": "30", "X-RateLimit-Remaining": str(self.remaining),
+                            "X-RateLimit-Reset": str(int(time.time()) + 60),
+                            "X-RateLimit-Resource": "code_search"}.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start(remaining=29):
+    SearchServer.log = []
+    SearchServer.remaining = remaining
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SearchServer)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    with mock.patch.dict(os.environ, {"KAYRADENIZ_GITHUB_API_BASE": base}):
+        tool_server = server.KayradenizToolServer()
+    tool_server.github_cache = None
+    tool_server.github_token = "t"
+    return httpd, tool_server
+
+
+def search(tool_server, **args):
+    return json.loads(tool_server.github_search_code(dict({"format": "json"}, **args)))
+
+
+def wait_for_requests(count, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while len(SearchServer.log) < count:
+        if time.monotonic() > deadline:
+            raise AssertionError(f"{count} istek bekleniyordu: {SearchServer.log}")
+        time.sleep(0.01)
+
+
+def test_prefetch_fills_next_pages():
+    httpd, tool_server = start()
+    try:
+        first = search(tool_server, query="foo", per_page=10, prefetch=2)
+        assert first["cached"] is False and len(first["items"]) == 10 and first["next_cursor"]
+        # Sayfa 2 ve 3 arka planda, bulk öncelikle alınır
+        wait_for_requests(3)
+        tool_server._prefetch_executor.shutdown(wait=True)
+        tool_server._prefetch_executor = None
+        assert sorted(page for _, page, _ in SearchServer.log) == [1, 2, 3]
+
+        second = search(tool_server, cursor=first["next_cursor"], prefetch=0)
+        assert second["page"] == 2 and second["cached"] is True
+        assert second["items"][0]["path"] == "src/f10.py" and len(SearchServer.log) == 3
+
+        # Son sayfanın ötesi prefetch edilmez (45 sonuç / 10 = 5 sayfa)
+        search(tool_server, query="foo", per_page=10, page=4, prefetch=5)
+        wait_for_requests(5)
+        tool_server._prefetch_executor.shutdown(wait=True)
+        assert sorted(page for _, page, _ in SearchServer.log) == [1, 2, 3, 4, 5]
+        last = search(tool_server, query="foo", per_page=10, page=5, prefetch=5)
+        assert last["cached"] is True and last["next_cursor"] is None and len(last["items"]) == 5
+    finally:
+        httpd.shutdown()
+
+
+def test_page_cache_key_ttl_and_size():
+    httpd, tool_server = start()
+    try:
+        search(tool_server, query="foo", prefetch=0)
+        assert search(tool_server, query="foo", prefetch=0)["cached"] is True
+        # Sorgu, sayfa boyutu ve token anahtarın parçasıdır
+        assert search(tool_server, query="bar", prefetch=0)["cached"] is False
+        assert search(tool_server, query="foo", per_page=5, prefetch=0)["cached"] is False
+        tool_server.github_token = "baska"
+        assert search(tool_server, query="foo", prefetch=0)["cached"] is False
+        assert SearchServer.log[-1][2] == "token baska"
+        tool_server.github_token = "t"
+
+        # Sınır aşılınca en eski erişilen sayfa düşer
+        tool_server._SEARCH_CACHE_SIZE = 2
+        search(tool_server, query="foo", prefetch=0)
+        search(tool_server, query="yeni", prefetch=0)
+        assert len(tool_server._search_pages) == 2
+        assert search(tool_server, query="foo", prefetch=0)["cached"] is True
+        assert search(tool_server, query="bar", prefetch=0)["cached"] is False
+
+        # TTL dolunca sayfa yeniden istenir
+        tool_server._SEARCH_CACHE_TTL = 0.0
+        assert search(tool_server, query="bar", prefetch=0)["cached"] is False
+    finally:
+        httpd.shutdown()
+
+
+def test_prefetch_skipped_when_quota_is_low():
+    # 30'luk kotada 2 istek kaldı: prefetch etkileşimli aramaların payını yemez
+    httpd, tool_server = start(remaining=2)
+    try:
+        search(tool_server, query="foo", per_page=10, prefetch=3)
+        time.sleep(0.2)
+        assert [page for _, page, _ in SearchServer.log] == [1]
+        assert tool_server._prefetch_executor is None
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    test_prefetch_fills_next_pages()
+    test_page_cache_key_ttl_and_size()
+    test_prefetch_skipped_when_quota_is_low()
+    print("✅ Arama cache testleri geçti")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+GitHubSession testleri
+Yerel HTTP sunucusuna karşı: varsayılan timeout, 5xx'te jitter'lı geri çekilme,
+ikincil rate limit'te Retry-After ve token başına tek (keep-alive) oturum
+"""
+import importlib.util
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Yol başına sıralı yanıt listesi döner; son yanıt tekrarlanır"""
+
+    protocol_version = "HTTP/1.1"
+    routes = {}
+    log = []
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.log.append({"method": self.command, "path": self.path, "port": self.client_address[1],
+                         "auth": self.headers.get("Authorization"), "time": time.monotonic(), "body": body})
+        responses = self.routes.get(self.path.split("?")[0], [(404, {}, {"message": "Not Found"})])
+        status, headers, payload = responses.pop(0) if len(responses) > 1 else responses[0]
+        if callable(payload):
+            payload = payload()
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(routes):
+    FakeGitHub.routes = routes
+    FakeGitHub.log = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def test_default_timeout_is_applied():
+    sent = []
+    httpd, base = start_server({"/user": [(200, {}, {"login": "t"})]})
+    try:
+        session = server.GitHubSession("t", base)
+        assert session.timeout == (5.0, 30.0)
+        original = session.session.request
+        with mock.patch.object(session.session, "request",
+                               side_effect=lambda *a, **kw: sent.append(kw) or original(*a, **kw)):
+            session.get("/user")
+            session.get("/user", timeout=1.5)
+    finally:
+        httpd.shutdown()
+    assert sent[0]["timeout"] == (5.0, 30.0) and sent[1]["timeout"] == 1.5
+
+    # Yanıt vermeyen sunucuda okuma timeout'u dolar; GET yeniden denenir, sonra hata yükselir
+    def slow():
+        time.sleep(0.3)
+        return {}
+
+    httpd, base = start_server({"/yavas": [(200, {}, slow)]})
+    delays = []
+    try:
+        session = server.GitHubSession("t", base, timeout=(1.0, 0.1), max_retries=1, sleep=delays.append)
+        try:
+            session.get("/yavas")
+            raise AssertionError("okuma timeout'u yükselmeli")
+        except requests.Timeout:
+            pass
+        assert len(delays) == 1 and session.retries == 1
+    finally:
+        httpd.shutdown()
+
+
+def test_jittered_backoff_on_5xx():
+    httpd, base = start_server({
+        "/repos/o/r": [(502, {}, {}), (503, {}, {}), (200, {}, {"ok": True})],
+        "/repos/o/r/issues": [(500, {}, {}), (201, {}, {"number": 1})],
+    })
+    delays = []
+    try:
+        session = server.GitHubSession("t", base, backoff_base=0.5, sleep=delays.append)
+        with mock.patch.object(server.random, "uniform", side_effect=lambda low, high: high / 2) as uniform:
+            response = session.get("/repos/o/r")
+        assert response.status_code == 200 and response.json() == {"ok": True}
+        # Full jitter: uniform(0, base * 2**attempt)
+        assert [call.args for call in uniform.call_args_list] == [(0, 0.5), (0, 1.0)]
+        assert delays == [0.25, 0.5] and session.retries == 2
+
+        # POST idempotent değil: 5xx'te tekrar edilmez
+        assert session.post("/repos/o/r/issues", json={"title": "x"}).status_code == 500
+        assert sum(1 for entry in FakeGitHub.log if entry["method"] == "POST") == 1
+
+        # Jitter gerçekten rastgele ve üst sınırı aşmaz
+        samples = {session._backoff_delay(3) for _ in range(50)}
+        assert len(samples) > 1 and all(0 <= sample <= 4.0 for sample in samples)
+        assert session._backoff_delay(10) <= session.backoff_cap
+    finally:
+        httpd.shutdown()
+
+
+def test_secondary_rate_limit_uses_retry_after():
+    httpd, base = start_server({
+        "/a": [(429, {"Retry-After": "2"}, {}), (200, {}, {})],
+        "/b": [(403, {}, {"message": "You have exceeded a secondary rate limit"}), (200, {}, {})],
+        "/c": [(403, {}, {"message": "Resource not accessible"})],
+    })
+    delays = []
+    try:
+        session = server.GitHubSession("t", base, sleep=delays.append)
+        assert session.get("/a").status_code == 200
+        assert delays == [2.0]
+        with mock.patch.object(server.random, "uniform", return_value=0.3):
+            assert session.get("/b").status_code == 200
+        assert delays == [2.0, 0.3]
+        # Sıradan 403 yeniden denenmez
+        assert session.get("/c").status_code == 403 and len(delays) == 2
+
+        # Limiter varken bucket Retry-After süresince kapanır; sonraki istek o kadar bekler
+        FakeGitHub.routes["/a"] = [(429, {"Retry-After": "1"}, {}), (200, {}, {})]
+        FakeGitHub.log = []
+        limited = server.GitHubSession("t", base, limiter=server.GitHubRateLimiter(), sleep=delays.append)
+        assert limited.get("/a").status_code == 200
+        first, second = FakeGitHub.log
+        assert second["time"] - first["time"] >= 0.9 and len(delays) == 2
+    finally:
+        httpd.shutdown()
+
+
+def test_one_reused_session_per_token():
+    httpd, base = start_server({
+        "/user": [(200, {}, {"login": "t"})],
+        "/repos/o/r": [(200, {}, {"full_name": "o/r"})],
+    })
+    try:
+        with mock.patch.dict(os.environ, {"KAYRADENIZ_GITHUB_API_BASE": base}):
+            tool_server = server.KayradenizToolServer()
+        # Disk cache'i bu testin konusu değil; ETag'siz yanıtlar zaten saklanmaz
+        tool_server.github_cache = None
+        assert "başarıyla" in tool_server.set_github_token({"token": "birinci"})
+        session = tool_server._github_session()
+        assert tool_server._github_session() is session
+        for _ in range(3):
+            session.get("/repos/o/r")
+        # Keep-alive: tüm istekler aynı TCP bağlantısından gider
+        assert len({entry["port"] for entry in FakeGitHub.log}) == 1
+        assert {entry["auth"] for entry in FakeGitHub.log} == {"token birinci"}
+
+        tool_server.set_github_token({"token": "ikinci"})
+        assert tool_server._github_session() is not session
+        assert list(tool_server._github_sessions) == [("ikinci", base)]
+        assert FakeGitHub.log[-1]["auth"] == "token ikinci"
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    test_default_timeout_is_applied()
+    test_jittered_backoff_on_5xx()
+    test_secondary_rate_limit_uses_retry_after()
+    test_one_reused_session_per_token()
+    print("✅ GitHub oturum testleri geçti")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+format: "json" testleri
+code_agent_analyze, code_agent_edit ve code_agent_refactor çıktıları ayrıştırılabilir JSON olmalı;
+metin raporu aynı yapılandırılmış sonuçtan üretilmeli
+"""
+import importlib.util
+import json
+import os
+import tempfile
+from unittest import mock
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+PYTHON_SOURCE = "import os\n\n\ndef oku(yol):\n    if yol:\n        return eval(yol)\n    return None\n"
+JS_SOURCE = "var a = 1;\nif (a == 2) { a = 3; }\nif (a == null) { a = 4; }\nconst s = \"var x == y\";\n"
+
+
+def write(root, name, content):
+    path = os.path.join(root, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def parse_compact(output):
+    """Çıktı tek satır, boşluksuz ayırıcılı JSON olmalı"""
+    assert not output.startswith("Hata"), output
+    result = json.loads(output)
+    assert output == json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+    return result
+
+
+def test_analyze_edit_refactor_json():
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.dict(os.environ, {"KAYRADENIZ_ANALYSIS_CACHE": os.path.join(tmp, "cache.sqlite")}), \
+            mock.patch.object(server.AnalysisResultCache, "_shared", None):
+        tool_server = server.KayradenizToolServer()
+        py_path = write(tmp, "modul.py", PYTHON_SOURCE)
+        js_path = write(tmp, "eski.js", JS_SOURCE)
+
+        analysis = parse_compact(tool_server.code_agent_analyze({"file_path": py_path, "format": "json"}))
+        assert analysis["language"] == "Python" and analysis["file"] == "modul.py"
+        assert analysis["metrics"]["function_count"] == 1 and analysis["metrics"]["detail"] == "full"
+        assert analysis["functions"][0]["qualname"] == "oku" and analysis["functions"][0]["complexity"] == 2
+        assert [issue["code"] for issue in analysis["security_issues"]] == ["eval"]
+        assert all({"code", "message"} <= set(issue) for issue in analysis["issues"])
+        text = tool_server.code_agent_analyze({"file_path": py_path})
+        assert text == tool_server._render_code_analysis(dict(analysis, cached=True))
+
+        edit = parse_compact(tool_server.code_agent_edit({"file_path": js_path, "edit_type": "refactor",
+                                                          "format": "json"}))
+        assert edit["edit_type"] == "refactor" and edit["language"] == "JavaScript"
+        assert edit["total_lines"] == 4 and edit["preview"][0] == "var a = 1;"
+        assert edit["suggestions"]["items"] and all("code" in example for example in edit["examples"])
+        assert tool_server.code_agent_edit({"file_path": js_path, "edit_type": "refactor"}) == \
+            tool_server._render_edit_guide(edit)
+        optimize = parse_compact(tool_server.code_agent_edit({"file_path": py_path, "format": "json"}))
+        assert optimize["edit_type"] == "optimize" and "measurements" in optimize
+
+        refactor = parse_compact(tool_server.code_agent_refactor({"file_path": js_path, "refactor_type": "optimize",
+                                                                  "format": "json"}))
+        assert refactor["changed"] is True and refactor["language"] == "JavaScript"
+        changes = {change["code"]: change for change in refactor["changes"]}
+        assert changes["var-to-let"]["count"] == 1 and changes["var-to-let"]["status"] == "applied"
+        assert changes["strict-equality"]["count"] == 1
+        assert changes["null-equality"]["status"] == "kept"
+        assert os.path.exists(os.path.join(tmp, refactor["backup"]))
+        with open(js_path, encoding="utf-8") as f:
+            assert f.read().startswith("let a = 1;\nif (a === 2)")
+
+        # Değişiklik yoksa changes boş; hata durumları düz metin kalır
+        again = parse_compact(tool_server.code_agent_refactor({"file_path": js_path, "refactor_type": "optimize",
+                                                               "format": "json", "create_backup": False}))
+        assert again["changed"] is False and again["changes"] == [] and again["backup"] is None
+        for tool in (tool_server.code_agent_analyze, tool_server.code_agent_edit, tool_server.code_agent_refactor):
+            assert tool({"file_path": os.path.join(tmp, "yok.py"), "format": "json"}).startswith("Hata:")
+
+
+if __name__ == "__main__":
+    test_analyze_edit_refactor_json()
+    print("✅ JSON çıktı testleri geçti")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+PathLockManager testleri
+Okuyucu/yazıcı kilidi FIFO: sıradaki yazıcıyı sonradan gelen okuyucu geçemez
+"""
+import importlib.util
+import os
+import threading
+import time
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("koşul zamanında gerçekleşmedi")
+        time.sleep(0.005)
+
+
+def test_writer_is_not_starved_by_later_readers():
+    locks = server.PathLockManager()
+    order = []
+    first_reader_release = threading.Event()
+
+    def reader(name, hold=None):
+        with locks.read("/tmp/a.txt"):
+            order.append(name)
+            if hold is not None:
+                hold.wait(2)
+
+    def writer():
+        with locks.write("/tmp/a.txt"):
+            order.append("writer")
+
+    first = threading.Thread(target=reader, args=("reader-1", first_reader_release))
+    first.start()
+    wait_until(lambda: order == ["reader-1"])
+    lock = locks._locks[locks.normalize("/tmp/a.txt")][0]
+
+    write_thread = threading.Thread(target=writer)
+    write_thread.start()
+    wait_until(lambda: len(lock._queue) == 1)
+    late = threading.Thread(target=reader, args=("reader-2",))
+    late.start()
+    wait_until(lambda: len(lock._queue) == 2)
+    # Yazıcı sırada beklerken yeni okuyucu kilidi alamaz
+    assert order == ["reader-1"]
+
+    first_reader_release.set()
+    for thread in (first, write_thread, late):
+        thread.join(2)
+    assert order == ["reader-1", "writer", "reader-2"]
+    assert locks.active_paths() == []
+
+
+def test_readers_share_and_timeout_releases_queue():
+    locks = server.PathLockManager()
+    with locks.read("/tmp/b.txt"), locks.read("/tmp/b.txt"):
+        # Sırada bekleyen yazıcı zaman aşımına uğrayınca arkasındaki okuyucu beklemez
+        try:
+            with locks.locked(["/tmp/b.txt"], "write", timeout=0.05):
+                raise AssertionError("yazıcı okuyucular varken kilit almamalı")
+        except TimeoutError:
+            pass
+        with locks.locked(["/tmp/b.txt"], "read", timeout=0.05):
+            pass
+    assert locks.active_paths() == []
+
+
+def test_multi_path_locks_are_ordered():
+    # Ters sırayla istenen iki yol kilitlenmeden (deadlock) tamamlanmalı
+    locks = server.PathLockManager()
+    done = []
+
+    def worker(paths):
+        for _ in range(200):
+            with locks.write(*paths):
+                pass
+        done.append(paths)
+
+    threads = [threading.Thread(target=worker, args=(paths,))
+               for paths in (("/tmp/x", "/tmp/y"), ("/tmp/y", "/tmp/x"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len(done) == 2 and locks.active_paths() == []
+
+
+if __name__ == "__main__":
+    test_writer_is_not_starved_by_later_readers()
+    test_readers_share_and_timeout_releases_queue()
+    test_multi_path_locks_are_ordered()
+    print("✅ Yol kilidi testleri geçti")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Performans kuralı testleri
+Her kural doğru satırda bir kez raporlanmalı; temiz kodda bulgu olmamalı
+"""
+import importlib.util
+import os
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+PYTHON_SOURCE = '''import subprocess
+
+def build(rows, config):
+    out = ""
+    result = []
+    allowed = [1, 2, 3]
+    for row in rows:
+        out += str(row)
+        if row in allowed:
+            subprocess.run(["echo", row])
+        x = config.db.host
+        y = config.db.host
+        z = config.db.host
+    for row in rows:
+        result.append(row * 2)
+    for row in rows:
+        text = "a"
+        text = text + "b"
+    return out, result
+'''
+
+PYTHON_CLEAN = '''def ok(rows, config):
+    total = 0
+    allowed = {1, 2, 3}
+    for row in rows:
+        total += row
+        if row in allowed:
+            config.db = row
+            print(config.db.host, config.db.host, config.db.host)
+    return [r for r in rows], total
+'''
+
+JS_SOURCE = '''function f(items) {
+  let html = "";
+  for (let i = 0; i < items.length; i++) {
+    html += "<li>" + items[i] + "</li>";
+    const el = document.querySelector("#list");
+    fetch("/api/" + i);
+  }
+  items.forEach(item => {
+    document.getElementById("x");
+  });
+  let n = 0;
+  n += 1;
+  document.getElementById("title").textContent = "a";
+  document.getElementById("title").className = "b";
+}
+'''
+
+
+def findings(performance):
+    return [(item["code"], item["line"]) for item in performance]
+
+
+def test_python_rules():
+    performance = server.PythonSourceAnalyzer.analyze(PYTHON_SOURCE)["performance"]
+    assert findings(performance) == [
+        ("string-concat-in-loop", 8),
+        ("membership-in-list", 9),
+        ("io-call-in-loop", 10),
+        ("attribute-in-loop", 11),
+        ("append-loop", 14),
+        ("string-concat-in-loop", 18),
+    ]
+    assert all(item["message"] for item in performance)
+
+
+def test_python_clean_code_has_no_findings():
+    # Sayısal +=, set üyeliği ve döngüde yazılan zincir kural dışıdır
+    assert server.PythonSourceAnalyzer.analyze(PYTHON_CLEAN)["performance"] == []
+
+
+def test_js_rules():
+    performance = server.CFamilyLexer.metrics(JS_SOURCE, "JavaScript")["performance"]
+    assert findings(performance) == [
+        ("string-concat-in-loop", 4),
+        ("dom-lookup-in-loop", 5),
+        ("io-call-in-loop", 6),
+        ("dom-lookup-in-loop", 9),
+        ("repeated-dom-lookup", 14),
+    ]
+
+
+def test_java_concat_advice():
+    source = 'class A {\n  String f(List<String> xs) {\n    String s = "";\n' \
+             '    for (String x : xs) { s += "," + x; }\n    return s;\n  }\n}\n'
+    performance = server.CFamilyLexer.metrics(source, "Java")["performance"]
+    assert findings(performance) == [("string-concat-in-loop", 4)]
+    assert "StringBuilder" in performance[0]["message"]
+
+
+if __name__ == "__main__":
+    test_python_rules()
+    test_python_clean_code_has_no_findings()
+    test_js_rules()
+    test_java_concat_advice()
+    print("✅ Performans kuralı testleri geçti")
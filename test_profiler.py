@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+profile_code testleri
+Bulgular yalnızca en içten kapsayan fonksiyonun sıcak noktasına yazılmalı
+"""
+import importlib.util
+import json
+import os
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+APP = '''def work(rows):
+    out = ""
+    for row in rows:
+        out += str(row)
+    return out
+
+
+out = ""
+for k in range(2000):
+    out += str(k)
+work(range(20000))
+'''
+
+
+def test_findings_attach_to_innermost_range_and_budget_is_capped():
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, 'app.py'), 'w', encoding='utf-8') as f:
+            f.write(APP)
+        tool_server = server.KayradenizToolServer()
+        report = json.loads(tool_server.profile_code(
+            {"command": "app.py", "working_directory": tmp, "budget_seconds": 10000}
+        ))
+        assert report["budget_seconds"] == server.PythonProfiler.MAX_BUDGET_SECONDS
+        findings = {hotspot["function"]: [finding["line"] for finding in hotspot["findings"]]
+                    for hotspot in report["hotspots"]}
+        assert findings["work"] == [4]
+        assert findings["<module>"] == [10]
+
+
+if __name__ == "__main__":
+    test_findings_attach_to_innermost_range_and_budget_is_capped()
+    print("✅ Profil testleri geçti")
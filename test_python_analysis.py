@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Python analiz yolu testleri
+Varsayılan her boyutta ast geçişidir; lexical yol ast ile aynı dosya metriklerini vermeli
+"""
+import importlib.util
+import io
+import os
+import tokenize
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+Analyzer = server.PythonSourceAnalyzer
+compute = server.KayradenizToolServer._compute_code_metrics
+
+SAMPLE = '''"""Modül # yorum değil"""
+import os  # yorum
+
+
+def route(x, items):
+    # gövde yorumu
+    match x:
+        case 1 if items and x:
+            return "#"
+        case [a, b]:
+            return f"{a if b else 0}"
+        case _:
+            pass
+    for item in items:
+        while item or x:
+            try:
+                item -= 1
+            except ValueError:
+                break
+    return [i for i in items if i if i > 1]
+
+
+class Box:
+    def get(self):
+        return eval("1") if os.sep else None
+'''
+
+SHARED_METRICS = ("total_lines", "non_empty_lines", "comment_lines", "function_count", "class_count",
+                  "complexity_score", "max_nesting_depth", "loop_count")
+
+
+def tokenize_comment_lines(content):
+    return len({token.start[0] for token in tokenize.generate_tokens(io.StringIO(content).readline)
+                if token.type == tokenize.COMMENT})
+
+
+def test_lexical_matches_ast():
+    full, fast = Analyzer.analyze(SAMPLE), Analyzer.lexical_metrics(SAMPLE)
+    for key in SHARED_METRICS:
+        assert full[key] == fast[key], key
+    assert [item["call"] for item in full["security"]] == [item["call"] for item in fast["security"]]
+    # Regex yorum sayımı tokenize ile aynı
+    assert full["comment_lines"] == tokenize_comment_lines(SAMPLE) == 2
+    guard = "match x:\n    case 1 if y:\n        pass\n"
+    assert Analyzer.analyze(guard)["complexity_score"] == Analyzer.lexical_metrics(guard)["complexity_score"] == 1
+
+
+def test_large_files_use_ast_by_default():
+    content = "\n\n".join(f"def f{i}(x):\n    return x if x else {i}" for i in range(3500)) + "\n"
+    assert content.count("\n") > 10000
+    for detail in ("auto", "full"):
+        metrics = compute(content, "Python", detail)
+        assert metrics["detail"] == "full" and len(metrics["functions"]) == 3500
+    fast = compute(content, "Python", "fast")
+    assert fast["detail"] == "fast" and "functions" not in fast
+    assert fast["complexity_score"] == 3500 and fast["function_count"] == 3500
+
+
+def test_unparsable_file_falls_back_to_lexical():
+    metrics = compute("def f(:\n    if x:  # yorum\n        pass\n", "Python")
+    assert metrics["detail"] == "fast" and metrics["parse_error"].startswith("satır 1")
+    assert metrics["comment_lines"] == 1 and metrics["complexity_score"] == 1
+
+
+if __name__ == "__main__":
+    test_lexical_matches_ast()
+    test_large_files_use_ast_by_default()
+    test_unparsable_file_falls_back_to_lexical()
+    print("✅ Python analiz testleri geçti")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+git_repo_info / GitRepoInfoCache testleri
+Ref, packed-refs, HEAD veya config değişince cache yenilenmeli
+"""
+import importlib.util
+import itertools
+import json
+import os
+import subprocess
+import tempfile
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+GIT_ENV = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t",
+               GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@t")
+
+
+def git(cwd, *args):
+    return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, env=GIT_ENV,
+                          text=True).stdout.strip()
+
+
+def info(tool_server, repo):
+    return json.loads(tool_server.git_repo_info({"repo_path": repo}))
+
+
+def test_cache_invalidated_by_refs_packed_refs_and_config():
+    with tempfile.TemporaryDirectory() as repo:
+        git(repo, 'init', '-q', '-b', 'main')
+        for i in range(3):
+            git(repo, 'commit', '-q', '--allow-empty', '-m', f'c{i}')
+        git(repo, 'tag', 'v1')
+        git(repo, 'tag', 'v2')
+        tool_server = server.KayradenizToolServer()
+
+        first = info(tool_server, repo)
+        assert first["cached"] is False and first["head"]["branch"] == "main"
+        assert first["tags_count"] == 2 and [b["name"] for b in first["branches"]] == ["main"]
+        assert info(tool_server, repo)["cached"] is True
+
+        # Yeni loose ref (alt dizinde)
+        git(repo, 'branch', 'ozellik/a', 'HEAD~2')
+        result = info(tool_server, repo)
+        assert result["cached"] is False
+        assert [b["name"] for b in result["branches"]] == ["main", "ozellik/a"]
+        assert info(tool_server, repo)["cached"] is True
+
+        # Var olan ref'in yerinde güncellenmesi
+        git(repo, 'update-ref', 'refs/heads/ozellik/a', 'HEAD~1')
+        result = info(tool_server, repo)
+        assert result["cached"] is False
+        assert {b["name"]: b["oid"] for b in result["branches"]}["ozellik/a"] == git(repo, 'rev-parse', 'HEAD~1')
+
+        # Sadece packed-refs değişir: paketlenmiş tag'i silmek loose ref'lere dokunmaz
+        git(repo, 'pack-refs', '--all')
+        assert info(tool_server, repo)["tags_count"] == 2
+        assert info(tool_server, repo)["cached"] is True
+        git(repo, 'tag', '-d', 'v1')
+        result = info(tool_server, repo)
+        assert result["cached"] is False and result["tags_count"] == 1
+
+        # HEAD ve config değişikliği
+        git(repo, 'checkout', '-q', 'ozellik/a')
+        result = info(tool_server, repo)
+        assert result["cached"] is False and result["head"]["branch"] == "ozellik/a"
+        git(repo, 'remote', 'add', 'origin', 'https://example.com/r.git')
+        git(repo, 'update-ref', 'refs/remotes/origin/main', 'main')
+        git(repo, 'config', 'branch.ozellik/a.remote', 'origin')
+        git(repo, 'config', 'branch.ozellik/a.merge', 'refs/heads/main')
+        result = info(tool_server, repo)
+        assert result["cached"] is False and result["remotes"]["origin"]["url"] == 'https://example.com/r.git'
+        branch = {b["name"]: b for b in result["branches"]}["ozellik/a"]
+        assert branch["upstream"] == "origin/main" and (branch["ahead"], branch["behind"]) == (0, 1)
+        assert tool_server.repo_info_cache.hits == 3
+
+
+class FakeOdb:
+    """Aynı saniyede atılmış commit'lerden oluşan bellek içi nesne veritabanı"""
+
+    def __init__(self, parents):
+        self.parents = parents
+
+    def read(self, oid):
+        header = "".join(f"parent {parent}\n" for parent in self.parents[oid])
+        return "commit", f"{header}committer t <t@t> 1700000000 +0000\n\nm".encode()
+
+    parse_commit = staticmethod(server.GitObjectDatabase.parse_commit)
+
+
+def reachable(parents, oid):
+    seen, stack = set(), [oid]
+    while stack:
+        current = stack.pop()
+        if current not in seen:
+            seen.add(current)
+            stack.extend(parents[current])
+    return seen
+
+
+def test_ahead_behind_with_equal_timestamps():
+    # a <- b <- c <- d (upstream), b <- e <- f (local), c <- f (merge)
+    shape = {"a": [], "b": ["a"], "c": ["b"], "d": ["c"], "e": ["b"], "f": ["e", "c"]}
+    # oid sırası heap'teki eşitlik bozucudur: tüm adlandırmalar denenir
+    for names in itertools.permutations("uvwxyz"):
+        rename = dict(zip(sorted(shape), names))
+        parents = {rename[oid]: [rename[p] for p in shape[oid]] for oid in shape}
+        local, upstream = rename["f"], rename["d"]
+        left, right = reachable(parents, local), reachable(parents, upstream)
+        expected = (len(left - right), len(right - left))
+        cache = server.GitRepoInfoCache()
+        assert cache.ahead_behind(FakeOdb(parents), local, upstream) == expected == (2, 1), names
+
+
+if __name__ == "__main__":
+    test_cache_invalidated_by_refs_packed_refs_and_config()
+    test_ahead_behind_with_equal_timestamps()
+    print("✅ repo info cache testleri geçti")
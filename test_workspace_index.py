@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Çalışma alanı sembol indeksi testleri
+Tanım satırları kullanım listesinde işaretlenmeli
+"""
+import importlib.util
+import json
+import os
+import tempfile
+from unittest import mock
+
+SERVER_PATH = os.path.join(os.path.dirname(__file__), 'src', 'mcp-tools', 'server.py')
+spec = importlib.util.spec_from_file_location("mcp_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(server)
+
+
+def write(root, name, content):
+    with open(os.path.join(root, name), 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def references(tool_server, root, name):
+    result = json.loads(tool_server.find_references({"name": name, "root": root}))
+    return {(ref["path"], ref["line"], ref["col"], ref.get("definition", False)) for ref in result["references"]}
+
+
+def test_definition_and_import_positions():
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.dict(os.environ, {"KAYRADENIZ_INDEX_DIR": os.path.join(tmp, 'index')}):
+        root = os.path.join(tmp, 'src')
+        os.makedirs(root)
+        write(root, 'lib.py', "class Parser:\n    pass\n\n\nasync def  load(path):\n    return Parser()\n")
+        write(root, 'app.py', "from lib import load as fetch, Parser\n\nfetch('x')\n")
+        write(root, 'util.js', "import { helper as h } from './h';\nexport function run() { return h(); }\n"
+                               "const limit = 3;\nclass Box {}\n")
+        tool_server = server.KayradenizToolServer()
+
+        assert references(tool_server, root, "Parser") == {
+            ("lib.py", 1, 6, True), ("lib.py", 6, 11, False), ("app.py", 1, 31, False),
+        }
+        assert ("lib.py", 5, 11, True) in references(tool_server, root, "load")
+        assert references(tool_server, root, "fetch") == {("app.py", 1, 24, False), ("app.py", 3, 0, False)}
+        assert references(tool_server, root, "h") == {("util.js", 1, 19, False), ("util.js", 2, 31, False)}
+        assert references(tool_server, root, "run") == {("util.js", 2, 16, True)}
+        assert references(tool_server, root, "limit") == {("util.js", 3, 6, True)}
+        assert references(tool_server, root, "Box") == {("util.js", 4, 6, True)}
+
+
+if __name__ == "__main__":
+    test_definition_and_import_positions()
+    print("✅ Sembol indeksi testleri geçti")